@@ -0,0 +1,518 @@
+"""Local CI gauntlet with concurrent lint steps (``agentive ci-check``).
+
+``scripts/core/ci-check.sh`` runs its seven steps strictly one after
+another, and every formatter and linter re-walks the whole tree. This
+runner executes the same steps, but:
+
+- the independent lint steps (Black, isort, flake8, ruff, pattern lint,
+  cross-repo config) run CONCURRENTLY, then the test suite runs;
+- each lint step's output is printed as one block the moment it
+  finishes, headed by its verdict and wall time (blocks never
+  interleave); the test suite streams live, line by line;
+- ``--changed`` scopes the formatters and linters to the Python files
+  changed since the merge base with ``--base`` (default ``origin/main``,
+  else ``main``): ``git diff --name-only`` against it, plus untracked
+  files. Steps with nothing in scope are skipped. The test suite and
+  the cross-repo check always run whole;
+- ``--fail-fast`` stops at the first failing step: the other running
+  steps are terminated and the test suite is skipped;
+- ``--impact`` runs only the tests affected by what changed since the
+  last ``--impact`` run (``agentive_kit.impact``; the map lives in
+  ``.kit/.cache/test-impact/``). It falls back to the whole suite when
+  it cannot tell, and it collects no coverage.
+
+Full mode (the default) runs CI's invocations byte for byte — the
+commands below are the ``run:`` lines of ``.github/workflows/test.yml``
+(pinned by ``tests/agentive_kit/test_ci_check_pkg.py``). The two steps CI
+does not run, pattern lint and cross-repo config, are ``ci-check.sh``'s.
+
+The project-owned hook keeps its contract (KIT-0050): when
+``scripts/local/checks.sh`` exists it OWNS the checks, and this runner
+only delegates to it (``--mode ci``) and passes its exit code through.
+
+Error strategy matches ``worktree_inventory``: refusals print to stderr
+and exit nonzero; a step whose tool is missing fails, it never raises.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable
+
+from agentive_kit import gitio
+
+HOOK = Path("scripts") / "local" / "checks.sh"
+
+# Tried in order when --base is not given.
+DEFAULT_BASES = ("origin/main", "main")
+
+# The per-test map agentive_kit.impact records and selects from.
+IMPACT_DIR = Path(".kit") / ".cache" / "test-impact"
+
+_RULE = "━" * 40
+
+_USAGE = """\
+Usage: agentive ci-check [--changed [--base REF]] [--fail-fast] [--jobs N]
+                         [--impact]
+
+  Run the local CI gauntlet: Black, isort, flake8, ruff, pattern lint
+  and the cross-repo config check concurrently, then the test suite.
+  Without flags every command is byte-identical to CI's.
+
+  --changed     Scope formatters and linters to the Python files changed
+                since the merge base with REF (tests still run whole)
+  --base REF    Merge-base ref for --changed (default: origin/main,
+                else main)
+  --fail-fast   Stop at the first failing step
+  --jobs N      Lint steps run at once (default: all of them)
+  --impact      Run only the tests affected by changes since the last
+                --impact run (no coverage; the whole suite on a cache
+                miss or a conftest/packaging change)
+
+Exit codes: 0 all passed, 1 a step failed (or usage error).
+"""
+
+
+@dataclass(frozen=True)
+class Step:
+    """One gauntlet step: ``(*command, *targets, *options)``.
+
+    *targets* are CI's path arguments. Under ``--changed`` they become
+    the scope filter and are replaced by the changed files under them
+    (``"."`` admits any); a step with ``scoped=False`` always runs as-is.
+    The step passes when its exit code is one of *ok_codes*.
+    """
+
+    name: str
+    icon: str
+    command: tuple[str, ...]
+    targets: tuple[str, ...] = ()
+    options: tuple[str, ...] = ()
+    scoped: bool = True
+    hint: str = ""
+    ok_codes: tuple[int, ...] = (0,)
+
+    @property
+    def argv(self) -> list[str]:
+        return [*self.command, *self.targets, *self.options]
+
+
+@dataclass(frozen=True)
+class StepResult:
+    """How one step ended; ``verdict`` is PASS, FAIL, SKIP or CANCELLED."""
+
+    name: str
+    verdict: str
+    seconds: float
+    output: str = ""
+
+
+def lint_steps(root: Path) -> list[Step]:
+    """The concurrent steps, in ``ci-check.sh`` order."""
+    steps = [
+        Step(
+            "black",
+            "🎨",
+            ("black", "--check", "--diff"),
+            (".",),
+            hint="Run: black . to fix",
+        ),
+        Step(
+            "isort",
+            "📋",
+            ("isort", "--check-only", "--diff"),
+            (".",),
+            hint="Run: isort . to fix",
+        ),
+        Step(
+            "flake8",
+            "🔎",
+            ("flake8",),
+            ("scripts/", "tests/"),
+            (
+                "--exclude=scripts/optional",
+                "--max-line-length=88",
+                "--extend-ignore=E203,W503",
+                "--select=E9,F63,F7,F82",
+            ),
+        ),
+        Step(
+            "ruff",
+            "🦀",
+            ("ruff", "check"),
+            ("scripts/", "tests/"),
+            hint="Run: ruff check scripts/ tests/ --fix for auto-fixable ones",
+        ),
+    ]
+    if (root / "scripts" / "core" / "pattern_lint.py").is_file():
+        steps.append(
+            Step(
+                "pattern-lint",
+                "🔍",
+                ("python3", "scripts/core/pattern_lint.py", "--tree"),
+                ("scripts/", "tests/"),
+                hint="Fix violations or add # noqa: DKxxx to suppress",
+            )
+        )
+    if (root / "scripts" / "core" / "check_cross_repo_config.py").is_file():
+        steps.append(
+            Step(
+                "cross-repo",
+                "🧭",
+                ("python3", "scripts/core/check_cross_repo_config.py", str(root)),
+                scoped=False,
+                hint="Fix CLAUDE.md's ## Target Repository section.",
+            )
+        )
+    return steps
+
+
+TEST_STEP = Step(
+    "pytest",
+    "🧪",
+    ("pytest",),
+    ("tests/",),
+    (
+        "-v",
+        "--cov=scripts",
+        "--cov-report=xml",
+        "--cov-report=term-missing",
+        "--cov-fail-under=80",
+    ),
+    scoped=False,
+)
+
+
+def impact_step(root: Path) -> Step:
+    """The test step under ``--impact``: selected tests, no coverage.
+
+    Exit 5 (every test deselected: nothing affected) is a pass.
+    """
+    return Step(
+        "pytest",
+        "🧪",
+        ("pytest",),
+        ("tests/",),
+        ("-v", "-p", "agentive_kit.impact", f"--impact={root / IMPACT_DIR}"),
+        scoped=False,
+        ok_codes=(0, 5),
+    )
+
+
+def resolve_base(root: Path, base: str | None) -> str | None:
+    """*base*, or the first of :data:`DEFAULT_BASES` that exists."""
+    for ref in (base,) if base else DEFAULT_BASES:
+        result = gitio.run_git(root, "rev-parse", "--verify", "--quiet", ref)
+        if result is not None and result.returncode == 0:
+            return ref
+    return None
+
+
+def changed_files(root: Path, base: str) -> list[str] | None:
+    """Files changed since the merge base of HEAD and *base*.
+
+    The working tree against the merge base (committed, staged and
+    unstaged edits; deletions dropped) plus untracked, not-ignored
+    files — repo-relative, sorted. None when git cannot answer.
+    """
+    merge_base = gitio.run_git(root, "merge-base", "HEAD", base)
+    if merge_base is None or merge_base.returncode != 0:
+        return None
+    diff = gitio.run_git(
+        root,
+        "diff",
+        "--name-only",
+        "--diff-filter=d",
+        "-z",
+        merge_base.stdout.strip(),
+    )
+    untracked = gitio.run_git(root, "ls-files", "-z", "--others", "--exclude-standard")
+    if diff is None or diff.returncode != 0:
+        return None
+    names = set(diff.stdout.split("\0"))
+    if untracked is not None and untracked.returncode == 0:
+        names.update(untracked.stdout.split("\0"))
+    names.discard("")
+    return sorted(names)
+
+
+def scope(step: Step, files: list[str]) -> Step | None:
+    """*step* narrowed to the Python *files* under its targets.
+
+    Unscoped steps come back unchanged; None when nothing is in scope.
+    """
+    if not step.scoped:
+        return step
+    picked = tuple(
+        path
+        for path in files
+        if path.endswith(".py")
+        and any(target == "." or path.startswith(target) for target in step.targets)
+    )
+    if not picked:
+        return None
+    return replace(step, targets=picked)
+
+
+def _env(root: Path) -> dict[str, str]:
+    """The child environment: the project's ``.venv`` first on PATH
+    when no virtualenv is active (``ci-check.sh`` sources it)."""
+    env = os.environ.copy()
+    if not env.get("VIRTUAL_ENV"):
+        for name in (".venv", "venv"):
+            bin_dir = root / name / "bin"
+            if (bin_dir / "activate").is_file():
+                env["VIRTUAL_ENV"] = str(root / name)
+                env["PATH"] = os.pathsep.join([str(bin_dir), env.get("PATH", "")])
+                break
+    return env
+
+
+class _Runner:
+    """Runs steps as child processes; ``stop()`` terminates the rest."""
+
+    def __init__(self, root: Path, env: dict[str, str]):
+        self.root = root
+        self.env = env
+        self.stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._procs: set[subprocess.Popen] = set()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        with self._lock:
+            for proc in self._procs:
+                proc.terminate()
+
+    def run(self, step: Step, on_line: Callable[[str], None] | None = None):
+        """Run *step* to completion; *on_line* streams its output."""
+        start = time.monotonic()
+        if self.stopped.is_set():
+            return StepResult(step.name, "CANCELLED", 0.0)
+        try:
+            proc = subprocess.Popen(
+                step.argv,
+                cwd=self.root,
+                env=self.env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+            )
+        except OSError as e:
+            detail = f"{step.command[0]}: {e.strerror or e} (pip install -e '.[dev]')"
+            return StepResult(step.name, "FAIL", time.monotonic() - start, detail)
+        with self._lock:
+            self._procs.add(proc)
+        if self.stopped.is_set():
+            proc.terminate()
+        lines = []
+        for line in proc.stdout:
+            lines.append(line)
+            if on_line is not None:
+                on_line(line)
+        proc.wait()
+        with self._lock:
+            self._procs.discard(proc)
+        seconds = time.monotonic() - start
+        if proc.returncode in step.ok_codes:
+            verdict = "PASS"
+        elif self.stopped.is_set() and proc.returncode < 0:
+            verdict = "CANCELLED"
+        else:
+            verdict = "FAIL"
+        return StepResult(step.name, verdict, seconds, "".join(lines))
+
+
+def _mark(verdict: str) -> str:
+    return {"PASS": "✅", "FAIL": "❌", "SKIP": "⏭️ ", "CANCELLED": "⏹️ "}[verdict]
+
+
+def _block(step: Step, result: StepResult) -> str:
+    """One finished step as a printable block."""
+    head = f"{_mark(result.verdict)} {step.icon} {step.name} — {result.verdict}"
+    if result.verdict != "SKIP":
+        head += f" ({result.seconds:.1f}s)"
+    parts = [_RULE, head, _RULE]
+    if result.output.strip():
+        parts.append(result.output.rstrip("\n"))
+    if result.verdict == "FAIL" and step.hint:
+        parts.append(f"   {step.hint}")
+    return "\n".join(parts) + "\n"
+
+
+def run_steps(
+    root: Path,
+    steps: list[Step],
+    jobs: int | None = None,
+    fail_fast: bool = False,
+    emit: Callable[[str], None] = print,
+    runner: _Runner | None = None,
+) -> list[StepResult]:
+    """Run *steps* concurrently; results come back in *steps* order.
+
+    Each block goes to *emit* as its step finishes. With *fail_fast*,
+    the first failure terminates every step still running.
+    """
+    runner = runner or _Runner(root, _env(root))
+    lock = threading.Lock()
+
+    def one(step: Step) -> StepResult:
+        result = runner.run(step)
+        if result.verdict == "FAIL" and fail_fast:
+            runner.stop()
+        with lock:
+            emit(_block(step, result))
+        return result
+
+    if not steps:
+        return []
+    with ThreadPoolExecutor(max_workers=jobs or len(steps)) as pool:
+        return list(pool.map(one, steps))
+
+
+def ci_check(
+    root: Path,
+    changed: bool = False,
+    base: str | None = None,
+    fail_fast: bool = False,
+    jobs: int | None = None,
+    impact: bool = False,
+) -> int:
+    """One gauntlet run (see module doc). Returns the exit code."""
+    started = time.monotonic()
+    steps = lint_steps(root)
+    test_step = impact_step(root) if impact else TEST_STEP
+    skipped: list[StepResult] = []
+    if changed:
+        ref = resolve_base(root, base)
+        files = changed_files(root, ref) if ref else None
+        if files is None:
+            print(
+                f"❌ No merge base with {base or ' or '.join(DEFAULT_BASES)}"
+                " — cannot scope to changed files",
+                file=sys.stderr,
+            )
+            return 1
+        print(
+            f"Scoping to {len(files)} file(s) changed since the merge base with {ref}"
+        )
+        scoped = []
+        for step in steps:
+            narrowed = scope(step, files)
+            if narrowed is None:
+                skipped.append(StepResult(step.name, "SKIP", 0.0, "no changed files"))
+            else:
+                scoped.append(narrowed)
+        steps = scoped
+    print(_RULE)
+    print(f"🔍 Running local CI checks ({len(steps)} lint step(s) concurrently)")
+    print(_RULE)
+    print()
+    env = _env(root)
+    if impact:
+        # The child pytest must import the plugin from this very package.
+        package_parent = str(Path(__file__).resolve().parent.parent)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (package_parent, env.get("PYTHONPATH")) if p
+        )
+    runner = _Runner(root, env)
+    results = run_steps(root, steps, jobs, fail_fast, emit=print, runner=runner)
+    if runner.stopped.is_set():
+        results.append(StepResult(test_step.name, "CANCELLED", 0.0))
+    else:
+        what = "the affected tests" if impact else "the full suite"
+        print(_RULE)
+        print(f"{test_step.icon} {test_step.name} — running {what}")
+        print(_RULE)
+        result = runner.run(test_step, on_line=lambda line: print(line, end=""))
+        print(
+            _block(test_step, StepResult(result.name, result.verdict, result.seconds))
+        )
+        results.append(result)
+
+    print(_RULE)
+    for result in skipped + results:
+        timing = "" if result.verdict == "SKIP" else f"{result.seconds:6.1f}s"
+        print(f"{_mark(result.verdict)} {result.name:<13} {result.verdict:<9} {timing}")
+    failed = [r.name for r in results if r.verdict == "FAIL"]
+    print(f"   wall time {time.monotonic() - started:.1f}s")
+    if failed:
+        print(f"❌ CI checks failed: {', '.join(failed)}")
+    else:
+        print("✅ All CI checks passed!")
+    print(_RULE)
+    return 1 if failed else 0
+
+
+def run_hook(root: Path) -> int | None:
+    """Delegate to the project's check hook; None when there is none.
+
+    A hook that is present but unusable is an error (1), never a silent
+    fall-through to the built-in gauntlet (the ``ci-check.sh`` rule).
+    """
+    hook = root / HOOK
+    if not hook.exists() and not hook.is_symlink():
+        return None
+    if not hook.is_file() or not os.access(hook, os.X_OK):
+        print(
+            f"❌ ERROR: {HOOK} exists but is not an executable file.", file=sys.stderr
+        )
+        print(
+            "   Fix it (chmod +x, or repair the symlink) or remove it to",
+            file=sys.stderr,
+        )
+        print("   fall back to the built-in gauntlet.", file=sys.stderr)
+        return 1
+    return subprocess.run([str(hook), "--mode", "ci"], cwd=root).returncode
+
+
+def main(argv: list[str], project_dir: Path) -> None:
+    """``agentive ci-check`` dispatcher; always exits."""
+    args = list(argv)
+    if any(a in ("help", "-h", "--help") for a in args):
+        print(_USAGE)
+        sys.exit(0)
+    base = None
+    jobs = None
+    for flag in ("--base", "--jobs"):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                print(_USAGE, file=sys.stderr)
+                sys.exit(1)
+            value = args[i + 1]
+            del args[i : i + 2]
+            if flag == "--base":
+                base = value
+            elif value.isdigit() and int(value) > 0:
+                jobs = int(value)
+            else:
+                print(_USAGE, file=sys.stderr)
+                sys.exit(1)
+    if not set(args) <= {"--changed", "--fail-fast", "--impact"} or (
+        base and "--changed" not in args
+    ):
+        print(_USAGE, file=sys.stderr)
+        sys.exit(1)
+    code = run_hook(project_dir)
+    if code is not None:
+        sys.exit(code)
+    sys.exit(
+        ci_check(
+            project_dir,
+            changed="--changed" in args,
+            base=base,
+            fail_fast="--fail-fast" in args,
+            jobs=jobs,
+            impact="--impact" in args,
+        )
+    )
@@ -0,0 +1,106 @@
+"""CLAUDE.md, read once per change: the parsed model every reader shares.
+
+Four readers need something from CLAUDE.md:
+
+- ``target_repo.resolve`` reads the ``## Target Repository`` section.
+- preflight reads the ``bots:`` line of the ``kit-install`` region.
+- doctor reads the install record (shape, profile and bots).
+- ``scripts/core/check_cross_repo_config.py`` validates the target
+  section.
+
+Each used to read the file and scan it with its own patterns. Now
+:func:`load` reads the file once and returns a frozen
+:class:`~agentive_kit.models.ClaudeMd`, holding every level-2 section
+and every KIT-LOCAL region. The readers keep their own line rules for
+the values inside.
+
+Section grammar: a heading is a line ``##`` + spaces/tabs + a title,
+with trailing whitespace (and a CRLF's ``\\r``) ignored. ``###`` and
+deeper are body text. Regions are those of
+:func:`agentive_kit.markers.region_index`.
+
+Caching: one entry per path, reused while the file's ``mtime_ns``,
+size and inode are unchanged. A file modified less than
+``_RACY_NS`` before it was read is not cached, because a rewrite
+within the same timestamp tick would keep all three (the racy-git
+rule). A freshly edited CLAUDE.md is therefore simply re-read.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+from agentive_kit import markers
+from agentive_kit.models import ClaudeMd
+
+_HEADING_RE = re.compile(r"^##[ \t]+(\S.*?)[ \t]*\r?$")
+
+# Filesystem timestamp granularity is up to 2s (FAT); newer reads wait.
+_RACY_NS = 2_000_000_000
+
+# path -> (stat key, model)
+_cache: dict[Path, tuple[tuple[int, int, int], ClaudeMd]] = {}
+
+
+def load(root: Path | str) -> ClaudeMd:
+    """The parsed CLAUDE.md of the project at *root*.
+
+    Never raises. A missing file gives ``exists=False``. An unreadable
+    one gives ``exists=True`` with ``error`` set to the exception's
+    class name. In both cases the text and mappings are empty.
+    """
+    path = Path(root) / "CLAUDE.md"
+    try:
+        st = os.stat(path)
+    except OSError:
+        _cache.pop(path, None)
+        return ClaudeMd(path)
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    hit = _cache.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    read_at = time.time_ns()
+    try:
+        model = parse(path.read_text(encoding="utf-8"), path)
+    except (OSError, UnicodeDecodeError) as exc:
+        _cache.pop(path, None)
+        return ClaudeMd(path, exists=True, error=exc.__class__.__name__)
+    if read_at - st.st_mtime_ns >= _RACY_NS:
+        _cache[path] = (key, model)
+    else:
+        _cache.pop(path, None)
+    return model
+
+
+def parse(text: str, path: Path | str = "CLAUDE.md") -> ClaudeMd:
+    """Scan *text* once into a :class:`ClaudeMd` (no file access)."""
+    sections: dict[str, str] = {}
+    title: str | None = None
+    body: list[str] = []
+    for line in text.split("\n"):
+        heading = _HEADING_RE.match(line)
+        if heading is None:
+            if title is not None:
+                body.append(line)
+            continue
+        if title is not None:
+            sections.setdefault(title, "\n".join(body))
+        title, body = heading.group(1), []
+    if title is not None:
+        sections.setdefault(title, "\n".join(body))
+
+    regions = {
+        name: text[spans[0].body_start : spans[0].body_end]
+        for name, spans in markers.region_index(text).items()
+    }
+    return ClaudeMd(
+        Path(path),
+        exists=True,
+        text=text,
+        sections=MappingProxyType(sections),
+        regions=MappingProxyType(regions),
+    )
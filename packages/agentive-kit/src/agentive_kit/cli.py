@@ -17,14 +17,14 @@ import sys
 from pathlib import Path
 
 import agentive_kit
-from agentive_kit import lifecycle
-from agentive_kit.root import RootNotFoundError, find_project_root
+from agentive_kit import lifecycle, procstats, trace
+from agentive_kit.root import ProjectContext, RootNotFoundError
 
 _USAGE = f"""\
 agentive-kit v{agentive_kit.__version__}
 ==================================
 
-Usage: agentive <command> [options]
+Usage: agentive [--stats] <command> [options]
 
 Project Creation:
   new <dir> [flags]    Create a packaged agentive project (the setup
@@ -39,6 +39,7 @@ Task Management:
   start <id>           Move task to in-progress (shorthand)
   block <id>           Move task to blocked (shorthand)
   validate             Validate all task statuses match folders
+                       (--staged: the index's copy of the staged ones)
 
 Gates:
   preflight [flags]         Run the 7 completion gates for the current PR
@@ -49,6 +50,12 @@ Gates:
   review-helper <sub> ...   gh review helper (reply/resolve/threads/
                             comments/summary; --repo owner/name)
 
+Checks:
+  ci-check [flags]          Local CI gauntlet: lint steps concurrently,
+                            then the test suite (--changed [--base REF]
+                            --fail-fast --jobs N; see
+                            'agentive ci-check --help')
+
 Environment:
   doctor [flags]            Run the environment checks (repo-local
                             doctor.d wins when present, else the
@@ -56,12 +63,29 @@ Environment:
                             --dir=<path>, --root=<path>)
   install-evaluators [...]  Install the evaluator library (pin from
                             .adversarial/config.yml) + the adversarial
-                            CLI (--force, --ref <tag>)
+                            CLI (--force, --ref <tag>, --no-cache)
+
+Linear:
+  linear pull [--dry-run]   Move task files to match Linear issue states
+                            changed since the last pull (conflicts with
+                            local moves are reported, not applied)
+
+Worktrees:
+  worktrees list            Task worktrees with task status + venv size
+  worktrees gc [--dry-run]  Remove worktrees (and pushed branches) whose
+                            task is done or canceled
+  worktree-pool <sub>       Pre-warmed task worktrees (status/size N/
+                            refill/release <id>/gc; see
+                            'agentive worktree-pool --help')
 
 Other:
   help                 Show this help message
   version              Show version information
 
+  --stats              Before any command: print how many git/gh/claude
+                       processes it ran, and how long they took, to
+                       stderr at the end
+
 Valid statuses for 'move':
   {', '.join(lifecycle.STATUS_FOLDER_MAP.keys())}
 
@@ -71,10 +95,10 @@ yet migrated from ./scripts/core/project remain available there.
 """
 
 
-def _project_root() -> Path:
-    """Discover the project root or exit loudly (never guess)."""
+def _project_root(ctx: ProjectContext) -> Path:
+    """The run's project root, or exit loudly (never guess)."""
     try:
-        return find_project_root()
+        return ctx.root
     except RootNotFoundError as exc:
         print(exc)
         sys.exit(1)
@@ -82,6 +106,27 @@ def _project_root() -> Path:
 
 def main(argv: list[str] | None = None) -> None:
     args = sys.argv[1:] if argv is None else argv
+    if args[:1] == ["--stats"]:
+        # Subprocess accounting for the whole run; the table goes to
+        # stderr so a command's stdout contract is untouched.
+        with procstats.counting() as stats:
+            try:
+                _traced_main(args[1:])
+            finally:
+                print(stats.summary(), file=sys.stderr)
+        return
+    _traced_main(args)
+
+
+def _traced_main(args: list[str]) -> None:
+    # AGENTIVE_TRACE: the whole command is the outermost span.
+    with trace.span(" ".join(["agentive", *args[:1]]), "command"):
+        _main(args)
+
+
+def _main(args: list[str]) -> None:
+    # One root discovery per run, shared by whichever subcommand needs it.
+    ctx = ProjectContext()
 
     if not args:
         print(_USAGE)
@@ -109,7 +154,7 @@ def main(argv: list[str] | None = None) -> None:
             valid = ", ".join(lifecycle.STATUS_FOLDER_MAP.keys())
             print(f"       Valid statuses: {valid}")
             sys.exit(1)
-        result = lifecycle.move_task(args[1], args[2], _project_root())
+        result = lifecycle.move_task(args[1], args[2], _project_root(ctx))
         sys.exit(0 if result and not result.status_update_failed else 1)
 
     # Shorthands for common moves
@@ -123,7 +168,7 @@ def main(argv: list[str] | None = None) -> None:
             print(f"Usage: agentive {command} <task-id>")
             sys.exit(1)
         result = lifecycle.move_task(
-            args[1], shorthand_targets[command], _project_root()
+            args[1], shorthand_targets[command], _project_root(ctx)
         )
         sys.exit(0 if result and not result.status_update_failed else 1)
 
@@ -144,26 +189,33 @@ def main(argv: list[str] | None = None) -> None:
         # entry behave identically.
         from agentive_kit import preflight
 
-        preflight.main(args[1:])
+        preflight.main(args[1:], ctx)
         return  # unreachable — preflight.main() always sys.exit()s
 
     if command == "review-input":
         from agentive_kit import review_input
 
-        review_input.main(args[1:])
+        review_input.main(args[1:], ctx)
         return  # unreachable — review_input.main() always sys.exit()s
 
     if command == "review-helper":
         from agentive_kit import review_input
 
-        review_input.helper_main(args[1:])
+        review_input.helper_main(args[1:], ctx)
         return  # unreachable — helper_main() always sys.exit()s
 
     if command == "validate":
+        if len(args) > 1 and args[1] == "--staged":
+            # The pre-commit form: the index's copy of the staged task
+            # files (or of the files named, relative to the current
+            # directory like any other file argument).
+            paths = [str(Path(arg).absolute()) for arg in args[2:]] or None
+            report = lifecycle.validate_staged_tasks(_project_root(ctx), paths)
+            sys.exit(0 if report is not None and report.ok else 1)
         if len(args) != 1:
-            print("Usage: agentive validate")
+            print("Usage: agentive validate [--staged [FILE ...]]")
             sys.exit(1)
-        report = lifecycle.validate_all_tasks(_project_root())
+        report = lifecycle.validate_all_tasks(_project_root(ctx))
         sys.exit(0 if report.ok else 1)
 
     if command == "doctor":
@@ -172,14 +224,47 @@ def main(argv: list[str] | None = None) -> None:
         # (0/1/2/3) is the caller's interface.
         from agentive_kit import doctor
 
-        sys.exit(doctor.cmd_doctor(args[1:], _project_root()))
+        sys.exit(doctor.cmd_doctor(args[1:], _project_root(ctx)))
+
+    if command == "ci-check":
+        # Flags pass through verbatim — ci_check owns its parsing
+        # (including --help), and runs from the project root like the
+        # script it mirrors.
+        from agentive_kit import ci_check
+
+        ci_check.main(args[1:], _project_root(ctx))
+        return  # unreachable — ci_check.main() always sys.exit()s
 
     if command == "install-evaluators":
         from agentive_kit import evaluators
 
-        evaluators.cmd_install_evaluators(args[1:], _project_root())
+        evaluators.cmd_install_evaluators(args[1:], _project_root(ctx))
         sys.exit(0)
 
+    if command == "linear":
+        from agentive_kit import linear_pull
+
+        linear_pull.main(args[1:], _project_root(ctx))
+        return  # unreachable — linear_pull.main() always sys.exit()s
+
+    if command == "worktrees":
+        # Primary-rooted like worktree-pool below (task status is read
+        # from the primary's tree, where the planner closes tasks).
+        from agentive_kit import worktree_inventory
+
+        worktree_inventory.main(args[1:])
+        return  # unreachable — worktree_inventory.main() always sys.exit()s
+
+    if command == "worktree-pool":
+        # Resolves the PRIMARY clone through the shared git common dir
+        # (worktree.resolve_primary_root), not _project_root(): the pool
+        # lives beside the primary and must be reachable from any
+        # worktree.
+        from agentive_kit import worktree_pool
+
+        worktree_pool.main(args[1:])
+        return  # unreachable — worktree_pool.main() always sys.exit()s
+
     print(f"❌ Unknown command: {command}")
     print("Run 'agentive help' for available commands.")
     print("Commands not yet migrated remain in ./scripts/core/project.")
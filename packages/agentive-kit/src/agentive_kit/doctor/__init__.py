@@ -30,7 +30,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from agentive_kit import gitio
+from agentive_kit import gitio, trace
 
 
 def default_checks_dir(project_dir: Path) -> Path:
@@ -87,9 +87,12 @@ def _doctor_install(project_dir):
     never two).
 
     The record lives in CLAUDE.md's ``kit-install`` KIT-LOCAL region and
-    kit_markers.py is its only reader (N4: one extract, runtime-read, no
-    cache). Returns ``(shape, profile, bots, errors)`` where ``errors``
-    is a list of ``(record, detail)`` pairs, ``record`` in
+    kit_markers.py is its only reader (N4: one extract, runtime-read).
+    The packaged path shares the ``claude_md`` model with preflight and
+    target_repo. The model's cache re-checks the file's stat on every
+    call, so the record is still read as it is at runtime. Returns
+    ``(shape, profile, bots, errors)`` where ``errors`` is a list of
+    ``(record, detail)`` pairs, ``record`` in
     {"shape-record", "profile-record", "bots-record"}:
 
     - anything absent (kit_markers, CLAUDE.md, region) ->
@@ -107,23 +110,24 @@ def _doctor_install(project_dir):
       fall back.
     """
     kit_markers = project_dir / "scripts" / "local" / "kit_markers.py"
-    claude_md = project_dir / "CLAUDE.md"
-    if not claude_md.exists():
+    claude_path = project_dir / "CLAUDE.md"
+    if not claude_path.exists():
         return "single", "python", None, []
     if not kit_markers.exists():
         # Packaged repos (KIT-0093) ship no kit_markers.py copy — the
-        # reader travels with the package (agentive_kit.markers).
+        # reader travels with the package (the shared claude_md model,
+        # whose regions come from agentive_kit.markers).
         # Absent region keeps the single/python back-compat default;
         # an unreadable file or unbalanced markers fail loud, exactly
         # like the script path (BugBot, PR #116).
-        from agentive_kit import markers
+        from agentive_kit import claude_md
 
-        try:
-            text = claude_md.read_text(encoding="utf-8")
-        except OSError as exc:
-            detail = f"shape record unreadable ({exc.__class__.__name__})"
+        doc = claude_md.load(project_dir)
+        if doc.error is not None:
+            detail = f"shape record unreadable ({doc.error})"
             return None, None, None, [("shape-record", detail)]
-        region = markers.extract_region(text, "kit-install")
+        text = doc.text
+        region = doc.region("kit-install")
         if region is None:
             # EITHER exact marker comment alone means a corrupted
             # record, not absence (CodeRabbit: a lone END is just as
@@ -155,7 +159,7 @@ def _doctor_install(project_dir):
                 sys.executable,
                 str(kit_markers),
                 "extract",
-                str(claude_md),
+                str(claude_path),
                 "kit-install",
             ],
             capture_output=True,
@@ -598,7 +602,8 @@ def cmd_doctor(args, project_dir):
     # `# shapes:` / `# profiles:` headers; the driver reads the install
     # record once and stays otherwise declaration-driven. A malformed
     # record runs everything AND fails loud via the record lines below.
-    shape, profile, bots, record_errors = _doctor_install(project_dir)
+    with trace.span("install record", "scan"):
+        shape, profile, bots, record_errors = _doctor_install(project_dir)
 
     # Scrub ambient GIT_* so a leaked GIT_DIR (the KIT-0043 incident
     # class — e.g. doctor invoked from a pre-commit hook in a worktree)
@@ -644,14 +649,15 @@ def cmd_doctor(args, project_dir):
                 continue
             argv = [*interp, str(check)]
         try:
-            result = subprocess.run(
-                argv,
-                cwd=project_dir,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            with trace.span(name, "check"):
+                result = subprocess.run(
+                    argv,
+                    cwd=project_dir,
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
         except subprocess.TimeoutExpired:
             print(f"DOCTOR:{name}:FAIL:check timed out after 30s")
             verdicts.append("FAIL")
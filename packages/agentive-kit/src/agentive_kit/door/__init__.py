@@ -70,7 +70,7 @@ import tempfile
 from pathlib import Path
 
 import agentive_kit
-from agentive_kit import markers
+from agentive_kit import markers, procstats
 
 _DOOR_DIR = Path(__file__).resolve().parent
 _ENGINES_DIR = _DOOR_DIR / "engines"
@@ -851,7 +851,8 @@ def _run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
     sys.stdout.flush()
     sys.stderr.flush()
     kwargs.setdefault("env", _scrubbed_env())
-    return subprocess.run(cmd, **kwargs)
+    with procstats.call(cmd):
+        return subprocess.run(cmd, **kwargs)
 
 
 def ensure_git_identity() -> None:
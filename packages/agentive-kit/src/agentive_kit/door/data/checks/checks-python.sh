@@ -146,19 +146,32 @@ echo
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 echo "5/7 🔍 Running pattern lint (DK rules)..."
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-PY_FILES=$(find scripts/ tests/ -name '*.py' 2>/dev/null)
-if [ ! -f "$CORE_DIR/pattern_lint.py" ]; then
-    echo "⚠️  pattern_lint.py not present (packaged repo) — step skipped"
-elif [ -n "$PY_FILES" ]; then
-    if python3 "$CORE_DIR/pattern_lint.py" $PY_FILES 2>&1; then
-        echo "✅ Pattern lint: No DK violations"
+# --tree: git ls-files discovers the files (tracked + not ignored).
+# Outside a git checkout (an exported tarball, a scaffold before git
+# init), find lists them instead. Exit 1 is violations; exit 2 means
+# the lint could not run at all (an unloadable project rule).
+PATTERN_RC=0
+if [ -f "$CORE_DIR/pattern_lint.py" ]; then
+    if git rev-parse --is-inside-work-tree >/dev/null 2>&1; then
+        python3 "$CORE_DIR/pattern_lint.py" --tree scripts/ tests/ 2>&1 || PATTERN_RC=$?
     else
-        echo "❌ Pattern lint: DK violations found"
-        echo "   Fix violations or add # noqa: DKxxx to suppress"
-        FAILED=1
+        PY_FILES=$(find scripts/ tests/ -name '*.py' 2>/dev/null)
+        if [ -n "$PY_FILES" ]; then
+            python3 "$CORE_DIR/pattern_lint.py" $PY_FILES 2>&1 || PATTERN_RC=$?
+        fi
     fi
+fi
+if [ ! -f "$CORE_DIR/pattern_lint.py" ]; then
+    echo "⚠️  pattern_lint.py not present (packaged repo) — step skipped"
+elif [ "$PATTERN_RC" -eq 0 ]; then
+    echo "✅ Pattern lint: No DK violations"
+elif [ "$PATTERN_RC" -eq 1 ]; then
+    echo "❌ Pattern lint: DK violations found"
+    echo "   Fix violations or add # noqa: DKxxx to suppress"
+    FAILED=1
 else
-    echo "⚠️  No Python files found in scripts/ or tests/"
+    echo "❌ Pattern lint: could not run (exit $PATTERN_RC; see above)"
+    FAILED=1
 fi
 echo
 
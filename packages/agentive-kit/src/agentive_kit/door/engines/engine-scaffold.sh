@@ -238,7 +238,7 @@ repos:
     hooks:
       - id: validate-task-status
         name: Validate task status matches folder
-        entry: agentive validate
+        entry: agentive validate --staged
         language: system
         files: ^\.kit/tasks/.*\.md$
         pass_filenames: false
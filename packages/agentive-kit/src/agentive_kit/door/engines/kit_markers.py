@@ -33,9 +33,12 @@ CLI:
 from __future__ import annotations
 
 import argparse
+import functools
 import re
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
 
 # Markers are matched as whole lines, tolerating benign whitespace drift
 # inside the comment ([ \t] only — never \s, so tolerance can't cross a
@@ -48,6 +51,35 @@ BEGIN_RE = re.compile(
 )
 
 
+# Any BEGIN/END marker line, with everything after the colon. One
+# finditer over a document yields every marker; region_index pairs them
+# per name with the same rules _region_pattern encodes.
+_MARKER_LINE_RE = re.compile(
+    r"^[ \t]*<!--[ \t]*(?P<kind>BEGIN|END)[ \t]+KIT-LOCAL:[ \t]*(?P<rest>[^\n]*)",
+    re.MULTILINE,
+)
+# A BEGIN marker's rest is exactly name + "-->" (a newline must follow);
+# an END marker's rest is name + "-->" + anything.
+_BEGIN_TAIL_RE = re.compile(r"(?P<name>.*?)[ \t]*-->[ \t]*\r?")
+_END_TAIL_RE = re.compile(r"[ \t]*-->")
+
+
+class Region(NamedTuple):
+    """Offsets of one BEGIN/END pair in its document.
+
+    ``text[start:body_start]`` is the BEGIN line with its newline,
+    ``text[body_start:body_end]`` the body, and ``text[body_end:end]``
+    the newline before END plus the END marker — the begin/body/end
+    groups of :func:`_region_pattern`.
+    """
+
+    start: int
+    body_start: int
+    body_end: int
+    end: int
+
+
+@functools.lru_cache(maxsize=64)
 def _region_pattern(name: str) -> re.Pattern[str]:
     """Compile a DOTALL pattern capturing the inner content of one region.
 
@@ -55,6 +87,10 @@ def _region_pattern(name: str) -> re.Pattern[str]:
     newline before END — never the marker lines themselves — so an
     extract/replace round-trip is byte-identical. Drifted marker lines are
     captured and re-emitted verbatim, never normalized.
+
+    This is the reference grammar: :func:`region_index` must find exactly
+    the spans this pattern's ``finditer`` does, and serves the names it
+    cannot index (see :func:`_indexable`).
     """
     esc = re.escape(name)
     # \r?\n so files with CRLF line endings (Windows / git autocrlf) parse
@@ -70,6 +106,80 @@ def _region_pattern(name: str) -> re.Pattern[str]:
     )
 
 
+def _indexable(name: str) -> bool:
+    """Whether :func:`region_index` can answer for *name*.
+
+    A name with edge whitespace or a line break is ambiguous once the
+    marker's own ``[ \\t]*`` padding has been stripped; those (never
+    used in practice) go through :func:`_region_pattern` instead.
+    """
+    return name == name.strip(" \t") and "\n" not in name and "\r" not in name
+
+
+@functools.lru_cache(maxsize=16)
+def region_index(text: str) -> Mapping[str, tuple[Region, ...]]:
+    """Every BEGIN/END pair in *text*, by region name, from one scan.
+
+    Names appear in first-BEGIN order; a name whose BEGIN has no
+    matching END is absent. Pairing follows :func:`_region_pattern`
+    exactly: a BEGIN line must end in a newline, the body runs to the
+    FIRST later END of the same name (never the line right after BEGIN
+    — that newline belongs to BEGIN), and repeated regions are
+    non-overlapping, left to right. Read-only and cached per text, so
+    several lookups against one document scan it once.
+    """
+    begins: dict[str, list[tuple[int, int]]] = {}
+    ends: list[tuple[int, int, str]] = []  # (line start, rest start, rest)
+    for match in _MARKER_LINE_RE.finditer(text):
+        rest = match.group("rest")
+        if match.group("kind") == "END":
+            if match.start() > 0:  # END needs the newline before it
+                ends.append((match.start(), match.start("rest"), rest))
+            continue
+        tail = _BEGIN_TAIL_RE.fullmatch(rest)
+        if tail is None or match.end() == len(text):
+            continue  # not a well-formed BEGIN, or no newline after it
+        begins.setdefault(tail.group("name"), []).append(
+            (match.start(), match.end() + 1)
+        )
+
+    index: dict[str, tuple[Region, ...]] = {}
+    for name, lines in begins.items():
+        closers = []
+        for line_start, rest_start, rest in ends:
+            tail = _END_TAIL_RE.match(rest, len(name))
+            if tail is None or not rest.startswith(name):
+                continue
+            body_end = line_start - 1
+            if text[body_end - 1 : body_end] == "\r":
+                body_end -= 1
+            closers.append((body_end, rest_start + tail.end()))
+        regions = []
+        pos = 0
+        for start, body_start in lines:
+            if start < pos:
+                continue
+            closer = next((c for c in closers if c[0] >= body_start), None)
+            if closer is None:
+                break  # no END after this BEGIN, so none after later ones
+            regions.append(Region(start, body_start, *closer))
+            pos = closer[1]
+        if regions:
+            index[name] = tuple(regions)
+    return MappingProxyType(index)
+
+
+def _regions(text: str, name: str) -> tuple[Region, ...]:
+    """Every region *name* spans in *text*, in order."""
+    if _indexable(name):
+        return region_index(text).get(name, ())
+    return tuple(
+        Region(m.start(), m.end("begin"), m.start("end"), m.end())
+        for m in _region_pattern(name).finditer(text)
+    )
+
+
+@functools.lru_cache(maxsize=64)
 def _begin_marker_line_re(name: str) -> re.Pattern[str]:
     """Loose, line-anchored detector for a BEGIN marker of region *name*.
 
@@ -107,10 +217,21 @@ def find_regions(text: str) -> list[str]:
 
 def extract_region(text: str, name: str) -> str | None:
     """Return the inner content of region *name*, or None if absent."""
-    match = _region_pattern(name).search(text)
-    if match is None:
+    regions = _regions(text, name)
+    if not regions:
         return None
-    return match.group("body")
+    return text[regions[0].body_start : regions[0].body_end]
+
+
+def _splice(text: str, edits: list[tuple[Region, str]]) -> str:
+    """*text* with each region's body replaced; *edits* in document order."""
+    parts = []
+    pos = 0
+    for region, content in edits:
+        parts += [text[pos : region.body_start], content]
+        pos = region.body_end
+    parts.append(text[pos:])
+    return "".join(parts)
 
 
 def replace_region(text: str, name: str, new_content: str) -> str:
@@ -121,14 +242,10 @@ def replace_region(text: str, name: str, new_content: str) -> str:
     not be silently skipped). Raises KeyError if the region is absent so
     callers fail loudly rather than silently no-op.
     """
-    pattern = _region_pattern(name)
-    if pattern.search(text) is None:
+    regions = _regions(text, name)
+    if not regions:
         raise KeyError(f"region not found: {name}")
-
-    def _sub(match: re.Match[str]) -> str:
-        return match.group("begin") + new_content + match.group("end")
-
-    return pattern.sub(_sub, text)
+    return _splice(text, [(region, new_content) for region in regions])
 
 
 def merge(
@@ -144,9 +261,17 @@ def merge(
     - else if a *placeholder* is supplied for it, use that (fresh
       bootstrap);
     - else leave the upstream content untouched.
+
+    Replacements are staged against the one index of *upstream* and
+    spliced in a single pass. A region overlapping a staged one, or any
+    edit after a content that itself carries a marker, could see regions
+    an earlier edit moved; from there on edits apply one at a time, so
+    the result is always that of replacing region by region.
     """
     placeholders = placeholders or {}
-    result = upstream
+    edits: list[tuple[Region, str]] = []
+    marked = False  # a staged content carries a marker line
+    result: str | None = None  # set once edits must go one at a time
     for name in find_regions(upstream):
         if consumer is not None:
             preserved = extract_region(consumer, name)
@@ -163,11 +288,31 @@ def merge(
                     "missing/mismatched END marker or damaged BEGIN marker?)"
                 )
             if preserved is not None:
-                result = replace_region(result, name, preserved)
+                content = preserved
+            elif name in placeholders:
+                content = placeholders[name]
+            else:
+                continue
+        elif name in placeholders:
+            content = placeholders[name]
+        else:
+            continue
+        if result is None and not marked:
+            regions = _regions(upstream, name)
+            if not regions:
+                raise KeyError(f"region not found: {name}")
+            if not any(
+                region.start < other.end and other.start < region.end
+                for region in regions
+                for other, _ in edits
+            ):
+                edits += [(region, content) for region in regions]
+                marked = "KIT-LOCAL" in content
                 continue
-        if name in placeholders:
-            result = replace_region(result, name, placeholders[name])
-    return result
+        if result is None:
+            result = _splice(upstream, sorted(edits))
+        result = replace_region(result, name, content)
+    return result if result is not None else _splice(upstream, sorted(edits))
 
 
 def default_placeholders(project_name: str) -> dict[str, str]:
@@ -16,11 +16,16 @@ change (it guarded the two-home state).
 
 from __future__ import annotations
 
+import json
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -42,7 +47,7 @@ def _is_tag_like(value):
     )
 
 
-def _get_evaluator_library_version(project_dir):
+def _read_evaluator_library_pin(project_dir):
     """Read the evaluator-library pin: config.yml first, pyproject mirror.
 
     Canonical home is ``.adversarial/config.yml`` →
@@ -54,7 +59,10 @@ def _get_evaluator_library_version(project_dir):
 
     There is deliberately no baked-in default: a silent fallback
     installed a five-minor-versions-old library once (KIT-0068 A08).
-    Exits naming both sources when no pin is readable.
+    Returns ``(version, [])`` or ``(None, error_lines)`` naming both
+    sources; it never exits, so the installer can resolve the pin
+    before starting the background fetch and still report a bad pin
+    only after the CLI step.
     """
     config_yml = Path(project_dir) / ".adversarial" / "config.yml"
     try:
@@ -75,11 +83,12 @@ def _get_evaluator_library_version(project_dir):
         # evaluator, PR 3; same reasoning as _is_version_like for the
         # CLI pin, but git tags may start with a letter, e.g. v0.10.0).
         if _is_tag_like(candidate):
-            return candidate
-        print(f"❌ Invalid evaluator_library_version pin: {candidate!r}")
-        print(f"   Source: {config_yml} — fix the pin (a git tag like v0.10.0),")
-        print("   or pass an explicit version with --ref <tag>.")
-        sys.exit(1)
+            return candidate, []
+        return None, [
+            f"❌ Invalid evaluator_library_version pin: {candidate!r}",
+            f"   Source: {config_yml} — fix the pin (a git tag like v0.10.0),",
+            "   or pass an explicit version with --ref <tag>.",
+        ]
 
     pyproject = Path(project_dir) / "pyproject.toml"
     try:
@@ -117,16 +126,28 @@ def _get_evaluator_library_version(project_dir):
         version = None
 
     if not version:
-        print("❌ Could not read the evaluator-library version pin")
-        print(f"   Source: {config_yml} → evaluator_library_version")
-        print(f"   Mirror: {pyproject} → [tool.adversarial] library_version")
-        print("   Fix the config.yml pin, or pass --ref <tag>.")
-        sys.exit(1)
+        return None, [
+            "❌ Could not read the evaluator-library version pin",
+            f"   Source: {config_yml} → evaluator_library_version",
+            f"   Mirror: {pyproject} → [tool.adversarial] library_version",
+            "   Fix the config.yml pin, or pass --ref <tag>.",
+        ]
     if not _is_tag_like(version):
         # The mirror is hand-edited too — same gate as config.yml
         # (CodeRabbit, PR #110).
-        print(f"❌ Invalid library_version pin in pyproject.toml: {version!r}")
-        print("   Expected a git tag (e.g. v0.10.0); fix the pin or pass --ref.")
+        return None, [
+            f"❌ Invalid library_version pin in pyproject.toml: {version!r}",
+            "   Expected a git tag (e.g. v0.10.0); fix the pin or pass --ref.",
+        ]
+    return version, []
+
+
+def _get_evaluator_library_version(project_dir):
+    """The library pin, or exit 1 naming what is wrong with it."""
+    version, errors = _read_evaluator_library_pin(project_dir)
+    if version is None:
+        for line in errors:
+            print(line)
         sys.exit(1)
     return version
 
@@ -143,6 +164,83 @@ ADVERSARIAL_CLI_DIST = "adversarial-workflow"
 # "working" to one surface and FAIL to the other (CodeRabbit round 1).
 CLI_PROBE_TIMEOUT = 20
 
+# A passing probe is remembered for this long per (binary, mtime, size).
+# Reinstalling or upgrading the CLI rewrites the binary and so misses
+# the cache; the TTL bounds the one case the key cannot see — a shim
+# whose target venv broke underneath it. Failures are never cached: a
+# broken CLI is re-probed every run, so the installer cannot report ✅
+# on the strength of a stale miss, nor ❌ after the user fixed it.
+CLI_PROBE_TTL = 3600
+
+# Evaluator library refs that name an immutable release (v0.10.0,
+# 1.2.3-rc1). Only these are cached: a branch ref like `main` moves, and
+# serving it from cache would silently pin whatever it was last week.
+_RELEASE_REF = re.compile(r"v?[0-9]+(\.[0-9]+)+([-+][0-9A-Za-z.\-]+)?")
+
+
+def cache_root():
+    """User-level cache shared by every project on this machine.
+
+    ``AGENTIVE_KIT_CACHE_DIR`` wins (tests, CI caches); otherwise
+    ``$XDG_CACHE_HOME/agentive-kit``, defaulting to
+    ``~/.cache/agentive-kit``. Per-user rather than per-project on
+    purpose: the point is that the tenth project installing v0.10.0
+    copies what the first one downloaded.
+    """
+    override = os.environ.get("AGENTIVE_KIT_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "agentive-kit"
+
+
+def _library_cache_entry(version):
+    """Cache directory for a release *version*; None for moving refs."""
+    if not _RELEASE_REF.fullmatch(version):
+        return None
+    return cache_root() / "evaluator-library" / version
+
+
+def _cli_probe_key(binary):
+    try:
+        real = os.path.realpath(binary)
+        st = os.stat(real)
+    except OSError:
+        return None
+    return f"{real}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _cli_probe_cached(key):
+    try:
+        probes = json.loads(
+            (cache_root() / "cli-probe.json").read_text(encoding="utf-8")
+        )
+        return time.time() - float(probes[key]) < CLI_PROBE_TTL
+    except (OSError, ValueError, TypeError, KeyError):
+        return False
+
+
+def _record_cli_probe(key):
+    """Remember a passing probe. Best effort — a read-only or racing
+    cache costs one extra probe next time, never a failed install."""
+    path = cache_root() / "cli-probe.json"
+    try:
+        probes = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(probes, dict):
+            probes = {}
+    except (OSError, ValueError):
+        probes = {}
+    now = time.time()
+    probes = {k: v for k, v in probes.items() if now - v < CLI_PROBE_TTL}
+    probes[key] = now
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".cli-probe.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(probes, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
 
 def _is_version_like(value):
     """True for a plausible PEP 440-ish version string.
@@ -218,12 +316,20 @@ def _adversarial_cli_works():
 
     Probes the EXIT CODE, never the output: a healthy CLI prints
     "Unknown fields in evaluator.yml" warnings to stderr.
+
+    A pass is cached per resolved binary path + mtime + size (see
+    CLI_PROBE_TTL); a reinstall changes the key, so a fresh install is
+    always probed for real.
     """
-    if not shutil.which("adversarial"):
+    binary = shutil.which("adversarial")
+    if not binary:
         return False
+    key = _cli_probe_key(binary)
+    if key and _cli_probe_cached(key):
+        return True
     try:
         probe = subprocess.run(
-            ["adversarial", "--version"],
+            [binary, "--version"],
             capture_output=True,
             text=True,
             timeout=CLI_PROBE_TIMEOUT,
@@ -236,7 +342,11 @@ def _adversarial_cli_works():
     except (subprocess.TimeoutExpired, OSError):
         # A hanging or unexecutable binary is not a working one.
         return False
-    return probe.returncode == 0
+    if probe.returncode != 0:
+        return False
+    if key:
+        _record_cli_probe(key)
+    return True
 
 
 def _ensure_adversarial_cli(project_dir):
@@ -334,10 +444,170 @@ def _ensure_adversarial_cli(project_dir):
         print('     export PATH="$HOME/.local/bin:$PATH"')
 
 
+@dataclass
+class _LibraryFetch:
+    """What the background library fetch hands back to the installer.
+
+    The fetch runs on a worker thread while the CLI step prints, so it
+    never prints itself — failures come back as lines to print in order.
+    """
+
+    source: Path | None = None  # the directory holding evaluators/
+    commit_hash: str = "unknown"
+    from_cache: bool = False
+    git_missing: bool = False
+    errors: list[str] = field(default_factory=list)
+
+
+def _git_available():
+    try:
+        git_check = subprocess.run(
+            ["git", "--version"],
+            capture_output=True,
+            text=True,
+            # Bounded and stdin-closed for the same reasons as the CLI
+            # probe: a wedged git (prompting credential helper, hung
+            # filesystem) would otherwise hang install-evaluators
+            # indefinitely, and an open stdin lets it consume input the
+            # user typed for the surrounding flow (CodeRabbit round 2).
+            timeout=CLI_PROBE_TIMEOUT,
+            stdin=subprocess.DEVNULL,
+        )
+    except subprocess.TimeoutExpired:
+        # A git that never answers is not a usable git — same guidance.
+        return False
+    except (FileNotFoundError, OSError):
+        # A genuinely absent git raises rather than returning non-zero;
+        # without this the intended message never prints and the user
+        # gets a raw traceback instead (found reproducing BugBot round 1).
+        return False
+    return git_check.returncode == 0
+
+
+def _clone_library(version, dest):
+    """Shallow-clone *version* into *dest*; returns (commit_hash, errors)."""
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "clone",
+                "--depth",
+                "1",
+                "--branch",
+                version,
+                EVALUATOR_LIBRARY_REPO,
+                str(dest),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            stdin=subprocess.DEVNULL,
+        )
+    except subprocess.TimeoutExpired:
+        return "unknown", [
+            "❌ Clone timed out (network issue?)",
+            "   Check your internet connection and try again",
+        ]
+    except OSError as exc:
+        return "unknown", [f"❌ Failed to clone: {exc}"]
+
+    if result.returncode != 0:
+        if "Could not resolve host" in result.stderr:
+            return "unknown", ["❌ Network error - check your internet connection"]
+        if "not found" in result.stderr.lower():
+            return "unknown", [
+                f"❌ Version '{version}' not found",
+                "   Available versions: "
+                "https://github.com/movito/adversarial-evaluator-library/tags",
+            ]
+        return "unknown", [f"❌ Failed to clone: {result.stderr.strip()}"]
+
+    # Get actual commit hash for reproducibility
+    # Bounded + stdin-closed like every other git call; a wedged or
+    # failing rev-parse degrades to an unknown hash — it must never
+    # abort an install whose clone already succeeded (BugBot +
+    # CodeRabbit, PR #110).
+    try:
+        hash_result = subprocess.run(
+            ["git", "-C", str(dest), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=CLI_PROBE_TIMEOUT,
+            stdin=subprocess.DEVNULL,
+        )
+        commit_hash = (
+            hash_result.stdout.strip()[:8] if hash_result.returncode == 0 else "unknown"
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        commit_hash = "unknown"
+    return commit_hash, []
+
+
+def _store_cache_entry(entry, evaluators_src, commit_hash):
+    """Publish a fetched library into the cache, atomically.
+
+    Staged beside the entry and renamed into place, with the ``commit``
+    file written last: an entry either has everything or is not there,
+    so an interrupted install or a concurrent one in another project
+    can never leave a half-copied library for the next reader. Best
+    effort — any failure just means the next install clones again.
+    """
+    stage = entry.parent / f".{entry.name}.{os.getpid()}.tmp"
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copytree(
+            evaluators_src,
+            stage / "evaluators",
+            ignore=shutil.ignore_patterns(".git", "__pycache__"),
+        )
+        (stage / "commit").write_text(commit_hash + "\n", encoding="utf-8")
+        if entry.exists():  # --no-cache refresh replaces the old copy
+            shutil.rmtree(entry)
+        os.rename(stage, entry)
+    except OSError:
+        shutil.rmtree(stage, ignore_errors=True)
+
+
+def _fetch_library(version, workdir, use_cache=True):
+    """Resolve *version* to a local evaluators tree: cache, else clone.
+
+    Release refs are served from ``cache_root()/evaluator-library/``
+    when present (no git, no network) and stored there after a clone.
+    ``use_cache=False`` skips the lookup but still refreshes the entry.
+    """
+    entry = _library_cache_entry(version)
+    if use_cache and entry is not None:
+        try:
+            commit_hash = (entry / "commit").read_text(encoding="utf-8").strip()
+        except OSError:
+            commit_hash = None
+        if commit_hash and (entry / "evaluators").is_dir():
+            return _LibraryFetch(entry, commit_hash, from_cache=True)
+
+    if not _git_available():
+        return _LibraryFetch(git_missing=True)
+    clone_dir = Path(workdir) / "library"
+    commit_hash, errors = _clone_library(version, clone_dir)
+    if errors:
+        return _LibraryFetch(errors=errors)
+    if not (clone_dir / "evaluators").exists():
+        return _LibraryFetch(errors=["❌ No evaluators directory in library"])
+    if entry is not None:
+        _store_cache_entry(entry, clone_dir / "evaluators", commit_hash)
+    return _LibraryFetch(clone_dir, commit_hash)
+
+
 def cmd_install_evaluators(args, project_dir):
-    """Install evaluators from adversarial-evaluator-library."""
+    """Install evaluators from adversarial-evaluator-library.
+
+    Release refs come from the per-user cache when another project
+    already fetched them (``--no-cache`` re-downloads and refreshes the
+    entry), and the fetch runs in the background while the CLI step
+    probes or installs — the two have independent prerequisites.
+    """
     # Parse arguments
     force = "--force" in args
+    use_cache = "--no-cache" not in args
 
     # Check for --ref flag (e.g., --ref v0.3.0 or --ref main) BEFORE
     # reading the pyproject pin: an explicit --ref must work even where
@@ -363,138 +633,80 @@ def cmd_install_evaluators(args, project_dir):
     print("📦 Adversarial Evaluator Library Installer")
     print("=" * 50)
 
-    # 1. Ensure the CLI FIRST — before both gates below.
-    #
-    # It must precede the already-installed early return, because the
-    # #103 shape is precisely "library present, CLI absent" and a rerun
-    # there must still fix the CLI.
-    #
-    # It must ALSO precede the git gate: the CLI path needs only `uv`,
-    # never git, and doctor.d/31 tells users to run THIS COMMAND to fix
-    # a missing CLI. With git absent or broken, that advice would exit
-    # 1 without ever attempting the thing it was recommended for
-    # (BugBot round 1). The two installs have independent
-    # prerequisites, so neither gate may own the other's path.
-    _ensure_adversarial_cli(project_dir)
-    print()
-
-    # 2. Check for git (required for CLONING the library — not for the
-    # CLI step above)
-    try:
-        git_check = subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            # Bounded and stdin-closed for the same reasons as the CLI
-            # probe: a wedged git (prompting credential helper, hung
-            # filesystem) would otherwise hang install-evaluators
-            # indefinitely, and an open stdin lets it consume input the
-            # user typed for the surrounding flow (CodeRabbit round 2).
-            timeout=CLI_PROBE_TIMEOUT,
-            stdin=subprocess.DEVNULL,
-        )
-        git_ok = git_check.returncode == 0
-    except subprocess.TimeoutExpired:
-        # A git that never answers is not a usable git — same guidance.
-        git_ok = False
-    except (FileNotFoundError, OSError):
-        # A genuinely absent git raises rather than returning non-zero;
-        # without this the intended message below never prints and the
-        # user gets a raw traceback instead (found reproducing the
-        # BugBot finding above).
-        git_ok = False
-    if not git_ok:
-        print("❌ Git is required but not found")
-        print()
-        print("Install git:")
-        print("  macOS:  brew install git")
-        print("  Ubuntu: sudo apt install git")
-        print("  Windows: https://git-scm.com/download/win")
-        sys.exit(1)
-
-    # 3. Check if already installed — BEFORE resolving the version pin:
-    # the no-op rerun path must keep working on repos with no readable
-    # pyproject pin (planning shape, or installs done only with --ref);
-    # the pin is only needed to clone (BugBot round 2, KIT-0068).
+    # Decide up front whether the library is needed at all — the no-op
+    # rerun path must keep working on repos with no readable pin
+    # (planning shape, or installs done only with --ref); the pin is
+    # only needed to fetch (BugBot round 2, KIT-0068). A pin problem is
+    # REPORTED after the CLI step, exactly as before; it only decides
+    # whether a background fetch can start.
     version_file = evaluators_dir / ".installed-version"
-    if version_file.exists() and not force:
-        installed = version_file.read_text(encoding="utf-8").strip()
-        print(f"⚠️  Evaluators already installed (version: {installed})")
-        print("   Use --force to reinstall")
-        print("   Use --ref <version> to install a different version")
-        return
-
-    if version is None:
-        version = _get_evaluator_library_version(project_dir)
-    print(f"   Version: {version}")
-    print()
+    needs_library = force or not version_file.exists()
+    pin_errors = []
+    if needs_library and version is None:
+        version, pin_errors = _read_evaluator_library_pin(project_dir)
 
-    # 4. Clone specific version
     with tempfile.TemporaryDirectory() as tmpdir:
-        print(f"📥 Cloning evaluator library @ {version}...")
-        try:
-            result = subprocess.run(
-                [
-                    "git",
-                    "clone",
-                    "--depth",
-                    "1",
-                    "--branch",
-                    version,
-                    EVALUATOR_LIBRARY_REPO,
-                    tmpdir,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-        except subprocess.TimeoutExpired:
-            print("❌ Clone timed out (network issue?)")
-            print("   Check your internet connection and try again")
+        # 1. Ensure the CLI FIRST — before every gate below — while the
+        # library fetch (cache copy or clone) runs on a worker thread.
+        #
+        # It must precede the already-installed early return, because
+        # the #103 shape is precisely "library present, CLI absent" and
+        # a rerun there must still fix the CLI.
+        #
+        # It must ALSO precede the git gate: the CLI path needs only
+        # `uv`, never git, and doctor.d/31 tells users to run THIS
+        # COMMAND to fix a missing CLI. With git absent or broken, that
+        # advice would exit 1 without ever attempting the thing it was
+        # recommended for (BugBot round 1). The two installs have
+        # independent prerequisites, so neither gate may own the
+        # other's path — and neither has to wait for the other either.
+        fetch = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            if needs_library and version:
+                fetch = pool.submit(_fetch_library, version, tmpdir, use_cache)
+            _ensure_adversarial_cli(project_dir)
+            print()
+            library = fetch.result() if fetch is not None else None
+
+        # 2. Already installed — nothing to fetch.
+        if not needs_library:
+            installed = version_file.read_text(encoding="utf-8").strip()
+            print(f"⚠️  Evaluators already installed (version: {installed})")
+            print("   Use --force to reinstall")
+            print("   Use --ref <version> to install a different version")
+            return
+
+        if library is None:
+            for line in pin_errors:
+                print(line)
             sys.exit(1)
 
-        if result.returncode != 0:
-            if "Could not resolve host" in result.stderr:
-                print("❌ Network error - check your internet connection")
-            elif "not found" in result.stderr.lower():
-                print(f"❌ Version '{version}' not found")
-                print(
-                    "   Available versions: "
-                    "https://github.com/movito/adversarial-evaluator-library/tags"
-                )
-            else:
-                print(f"❌ Failed to clone: {result.stderr.strip()}")
+        # 3. Git is required for CLONING the library — not for the CLI
+        # step above, and not for a cache hit.
+        if library.git_missing:
+            print("❌ Git is required but not found")
+            print()
+            print("Install git:")
+            print("  macOS:  brew install git")
+            print("  Ubuntu: sudo apt install git")
+            print("  Windows: https://git-scm.com/download/win")
             sys.exit(1)
 
-        # Get actual commit hash for reproducibility
-        # Bounded + stdin-closed like every other git call; a wedged or
-        # failing rev-parse degrades to an unknown hash — it must never
-        # abort an install whose clone already succeeded (BugBot +
-        # CodeRabbit, PR #110).
-        try:
-            hash_result = subprocess.run(
-                ["git", "-C", tmpdir, "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=CLI_PROBE_TIMEOUT,
-                stdin=subprocess.DEVNULL,
-            )
-            commit_hash = (
-                hash_result.stdout.strip()[:8]
-                if hash_result.returncode == 0
-                else "unknown"
-            )
-        except (subprocess.TimeoutExpired, OSError):
-            commit_hash = "unknown"
-
-        # Copy evaluators
-        src = Path(tmpdir) / "evaluators"
-        if not src.exists():
-            print("❌ No evaluators directory in library")
+        print(f"   Version: {version}")
+        print()
+        if library.errors:
+            for line in library.errors:
+                print(line)
             sys.exit(1)
+        if library.from_cache:
+            print(f"📦 Using cached evaluator library @ {version}")
+        else:
+            print(f"📥 Cloned evaluator library @ {version}")
 
+        # 4. Copy evaluators
+        commit_hash = library.commit_hash
         installed_count = 0
-        for provider_dir in src.iterdir():
+        for provider_dir in sorted((library.source / "evaluators").iterdir()):
             if provider_dir.is_dir() and provider_dir.name not in (
                 "__pycache__",
                 ".git",
@@ -38,6 +38,8 @@ from __future__ import annotations
 import shutil
 import subprocess
 
+from agentive_kit import procstats, trace
+
 # Seconds allowed for any single gh call. Network-bound (API round
 # trips, GraphQL), so far more generous than gitio's plumbing bound —
 # but still finite: a wedged gh (auth prompt swallowed by the closed
@@ -75,13 +77,17 @@ def run_gh(
         cmd += ["--repo", repo]
     cmd += list(args)
     try:
-        return subprocess.run(
-            cmd,
-            capture_output=capture,
-            text=True,
-            timeout=timeout,
-            stdin=subprocess.DEVNULL,
-        )
+        with (
+            trace.span(" ".join(["gh", *args[:2]]), "gh", argv=list(args)),
+            procstats.call(cmd),
+        ):
+            return subprocess.run(
+                cmd,
+                capture_output=capture,
+                text=True,
+                timeout=timeout,
+                stdin=subprocess.DEVNULL,
+            )
     except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
         return None
 
@@ -33,8 +33,12 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
 from pathlib import Path
 
+from agentive_kit import procstats, trace
+from agentive_kit.models import WorktreeEntry
+
 # Seconds allowed for any single plumbing call (branch lookup,
 # rev-parse, remote read). Generous for plumbing, short enough that a
 # wedged git fails the command instead of hanging it.
@@ -84,17 +88,326 @@ def run_git(
     shapes are deliberately distinct so callers can tell "no git" from
     "git said no".
     """
-    try:
-        return subprocess.run(
-            ["git", "-C", str(repo_dir), *args],
-            capture_output=capture,
-            text=True,
-            timeout=timeout,
-            stdin=subprocess.DEVNULL,
-            env=clean_git_env(),
+    return GitSession(repo_dir).run(*args, timeout=timeout, capture=capture)
+
+
+class GitSession:
+    """One repository's read-only git work, in as few forks as possible.
+
+    A command that asks git five questions used to pay five
+    ``os.environ.copy()`` scrubs and five process spawns. A session
+    scrubs the environment ONCE and answers through three channels:
+
+    - ``rev_parse(*args)``: one ``rev-parse`` with every argument, one
+      output line per argument.
+    - ``head_and_refs(names)``: the current branch and which of *names*
+      resolve, from that same single ``rev-parse``.
+    - ``batch_check(names)``: a single long-lived ``git cat-file
+      --batch-check`` pipe resolving any number of revision
+      expressions (``origin/main``, ``HEAD~3``, ``<base>^{commit}``)
+      — the pipe is started on first use and reused for every later
+      call in the session.
+    - ``read_blobs(names)``: the contents of any number of objects
+      (``:<path>`` is a path's staged copy) from ONE ``git cat-file
+      --batch`` run.
+    - ``run(*args)``: anything else, with the cached env and the same
+      bounds as ``run_git``.
+
+    The derived answers (``current_branch``, ``git_common_dir``,
+    ``repo_url``) are memoized: a session is for ONE command's view of
+    the repository, not a long-lived cache — build a new one after
+    anything that moves HEAD or changes the remote.
+
+    Same error strategy as the module functions: ``None`` on failure,
+    never an exception for git being absent, wedged or not pointed at
+    a repository. Use as a context manager (or call ``close()``) so
+    the batch pipe is reaped.
+    """
+
+    def __init__(
+        self,
+        repo_dir: Path | str,
+        timeout: int = GIT_TIMEOUT,
+        index_file: Path | str | None = None,
+    ):
+        self.repo_dir = Path(repo_dir)
+        self.timeout = timeout
+        self.env = clean_git_env()
+        # The one location var a caller may put back: a hook reading
+        # what the commit will contain must see the index git handed it
+        # (``git commit <paths>`` stages into a temporary index).
+        if index_file:
+            self.env["GIT_INDEX_FILE"] = os.path.abspath(index_file)
+        self._batch: subprocess.Popen | None = None
+        self._memo: dict[str, object] = {}
+
+    def __enter__(self) -> GitSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the batch pipe, if one was started."""
+        proc, self._batch = self._batch, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=self.timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def run(
+        self, *args: str, timeout: int | None = None, capture: bool = True
+    ) -> subprocess.CompletedProcess | None:
+        """``run_git`` with the session's env; same return contract."""
+        try:
+            with (
+                trace.span(f"git {args[0] if args else ''}", "git", argv=list(args)),
+                procstats.call(("git", *args)),
+            ):
+                return subprocess.run(
+                    ["git", "-C", str(self.repo_dir), *args],
+                    capture_output=capture,
+                    text=True,
+                    timeout=timeout or self.timeout,
+                    stdin=subprocess.DEVNULL,
+                    env=self.env,
+                )
+        except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+            return None
+
+    def output(self, *args: str, timeout: int | None = None) -> str | None:
+        """stdout of a successful call, else ``None``."""
+        result = self.run(*args, timeout=timeout)
+        if result is None or result.returncode != 0:
+            return None
+        return result.stdout
+
+    def rev_parse(self, *args: str) -> list[str] | None:
+        """ONE ``rev-parse`` call; its output lines, or ``None``.
+
+        git prints one line per query argument, in order, and fails the
+        whole call if any argument fails — so batch only arguments that
+        must all succeed (``--verify`` takes exactly one, so it does not
+        batch; use ``batch_check`` to test revisions).
+        """
+        out = self.output("rev-parse", *args)
+        return None if out is None else out.splitlines()
+
+    def head_and_refs(
+        self, names: list[str]
+    ) -> tuple[str | None, dict[str, bool]] | None:
+        """The current branch and which of *names* resolve, in ONE call.
+
+        ``rev-parse --revs-only --symbolic-full-name HEAD --symbolic
+        <names>``: git prints HEAD's ref, then echoes each name that
+        resolves, in order, and reads everything after the first miss
+        as a path. Names past a miss therefore go through
+        ``batch_check``, and an unborn HEAD (nothing printed at all)
+        through ``current_branch``; the common case is one fork. The
+        branch is None on a detached HEAD, as in ``current_branch``
+        (whose memo this fills). ``None`` when git could not answer.
+        """
+        exists = {name: False for name in names}
+        queries = [
+            n
+            for n in dict.fromkeys(names)
+            if n and "\n" not in n and not n.startswith("-")
+        ]
+        lines = self.rev_parse(
+            "--revs-only", "--symbolic-full-name", "HEAD", "--symbolic", *queries
         )
-    except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
-        return None
+        if lines is None:
+            return None
+        if lines:
+            head = lines[0]  # "HEAD" when detached
+            branch = (
+                head.removeprefix("refs/heads/")
+                if head.startswith("refs/heads/")
+                else None
+            )
+            self._memo["branch"] = branch
+            found = len(lines) - 1
+            exists.update((name, True) for name in queries[:found])
+            rest = queries[found + 1 :]
+        else:
+            branch = self.current_branch()
+            rest = queries
+        if rest:
+            checked = self.batch_check(rest)
+            if checked is None:
+                return None
+            exists.update((name, oid is not None) for name, oid in checked.items())
+        return branch, exists
+
+    def _batch_pipe(self) -> subprocess.Popen | None:
+        if self._batch is None:
+            try:
+                # Counted once, at spawn: the pipe then serves every
+                # batch_check of the session.
+                with procstats.call(("git", "cat-file", "--batch-check")):
+                    self._batch = subprocess.Popen(
+                        ["git", "-C", str(self.repo_dir), "cat-file", "--batch-check"],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        env=self.env,
+                    )
+            except (FileNotFoundError, OSError):
+                return None
+        return self._batch
+
+    def batch_check(self, names: list[str]) -> dict[str, str | None] | None:
+        """Resolve every revision expression in *names* over one pipe.
+
+        Returns ``{name: object id}``, with ``None`` for a name that
+        does not resolve (or contains a newline, which the line protocol
+        cannot carry). ``None`` overall when git could not answer — not
+        a repository, git absent, or no reply within the timeout (the
+        pipe is killed, so a wedged git fails the call, not the CLI).
+        """
+        answers: dict[str, str | None] = {n: None for n in names if "\n" in n}
+        queries = [n for n in dict.fromkeys(names) if "\n" not in n]
+        if not queries:
+            return answers
+        proc = self._batch_pipe()
+        if proc is None:
+            return None
+        watchdog = threading.Timer(self.timeout, proc.kill)
+        watchdog.start()
+        try:
+            with trace.span("git cat-file --batch-check", "git", names=len(queries)):
+                # Bounded chunks: cat-file answers as it reads, and writing
+                # an unbounded batch before reading could fill both pipes.
+                for i in range(0, len(queries), 64):
+                    chunk = queries[i : i + 64]
+                    proc.stdin.write("".join(f"{n}\n" for n in chunk))
+                    proc.stdin.flush()
+                    for name in chunk:
+                        line = proc.stdout.readline()
+                        if not line:
+                            raise OSError("cat-file --batch-check closed its pipe")
+                        line = line.rstrip("\n")
+                        # A hit is "<oid> <type> <size>"; a miss echoes the
+                        # name (which may hold spaces) + "missing"/"ambiguous".
+                        if line.rpartition(" ")[2] in ("missing", "ambiguous"):
+                            answers[name] = None
+                        else:
+                            answers[name] = line.partition(" ")[0]
+        except (OSError, ValueError):
+            self.close()
+            return None
+        finally:
+            watchdog.cancel()
+        return answers
+
+    def staged_paths(self, *pathspec: str) -> list[str] | None:
+        """Paths the index adds, copies, modifies or renames vs HEAD.
+
+        Repo-relative, limited to *pathspec*; deletions are left out
+        (there is nothing staged to read). Works on an unborn branch,
+        where everything in the index is new. ``None`` when git could
+        not answer.
+        """
+        out = self.output(
+            "diff",
+            "--cached",
+            "--name-only",
+            "-z",
+            "--diff-filter=ACMR",
+            "--",
+            *pathspec,
+        )
+        return None if out is None else [p for p in out.split("\0") if p]
+
+    def read_blobs(self, names: list[str]) -> dict[str, bytes | None] | None:
+        """Contents of every object in *names*, from ONE ``cat-file --batch``.
+
+        Any object name works; ``:<path>`` reads a path's copy in the
+        index (stage 0), which is what a commit would record. Returns
+        ``{name: bytes}``, with ``None`` for a name that does not
+        resolve (or contains a newline, which the line protocol cannot
+        carry). ``None`` overall when git could not answer.
+
+        A one-shot run, not the ``batch_check`` pipe: every name is
+        known up front, and ``communicate`` feeds the request while
+        draining the reply, so no batch size can fill both pipes.
+        """
+        answers: dict[str, bytes | None] = {n: None for n in names if "\n" in n}
+        queries = [n for n in dict.fromkeys(names) if "\n" not in n]
+        if not queries:
+            return answers
+        try:
+            with (
+                trace.span("git cat-file --batch", "git", names=len(queries)),
+                procstats.call(("git", "cat-file", "--batch")),
+            ):
+                result = subprocess.run(
+                    ["git", "-C", str(self.repo_dir), "cat-file", "--batch"],
+                    input="".join(f"{n}\n" for n in queries).encode("utf-8"),
+                    capture_output=True,
+                    timeout=self.timeout,
+                    env=self.env,
+                )
+        except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        out, pos = result.stdout, 0
+        for name in queries:
+            end = out.find(b"\n", pos)
+            if end < 0:
+                return None
+            # A hit is "<oid> <type> <size>" and then the content plus a
+            # newline; a miss echoes the name + "missing"/"ambiguous".
+            header = out[pos:end].rpartition(b" ")
+            pos = end + 1
+            if not header[2].isdigit():
+                answers[name] = None
+                continue
+            size = int(header[2])
+            answers[name] = out[pos : pos + size]
+            pos += size + 1
+        return answers
+
+    def _memoized(self, key: str, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def current_branch(self) -> str | None:
+        """See the module-level ``current_branch``."""
+
+        def compute() -> str | None:
+            out = self.output("branch", "--show-current")
+            return (out or "").strip() or None
+
+        return self._memoized("branch", compute)
+
+    def git_common_dir(self) -> Path | None:
+        """See the module-level ``git_common_dir``."""
+
+        def compute() -> Path | None:
+            lines = self.rev_parse("--git-common-dir")
+            if not lines or not lines[0].strip():
+                return None
+            return Path(os.path.normpath(self.repo_dir / lines[0].strip()))
+
+        return self._memoized("common_dir", compute)
+
+    def repo_url(self) -> str | None:
+        """See the module-level ``derive_repo_url``."""
+
+        def compute() -> str | None:
+            out = self.output("remote", "get-url", "origin")
+            return _github_path(out.strip()) if out else None
+
+        return self._memoized("repo_url", compute)
 
 
 def current_branch(repo_dir: Path | str) -> str | None:
@@ -106,11 +419,7 @@ def current_branch(repo_dir: Path | str) -> str | None:
     single-writer guard) treat ``None`` as NOT main — the fail-safe
     direction: when the branch cannot be established, skip the write.
     """
-    result = run_git(repo_dir, "branch", "--show-current")
-    if result is None or result.returncode != 0:
-        return None
-    branch = result.stdout.strip()
-    return branch or None
+    return GitSession(repo_dir).current_branch()
 
 
 def git_common_dir(repo_dir: Path | str) -> Path | None:
@@ -130,13 +439,19 @@ def git_common_dir(repo_dir: Path | str) -> Path | None:
     Returns ``None`` when ``repo_dir`` is not a git repository or git
     is unavailable.
     """
-    result = run_git(repo_dir, "rev-parse", "--git-common-dir")
-    if result is None or result.returncode != 0:
-        return None
-    common = result.stdout.strip()
-    if not common:
+    return GitSession(repo_dir).git_common_dir()
+
+
+def _github_path(url: str) -> str | None:
+    if url.startswith("git@"):
+        url = url.removeprefix("git@").replace(":", "/", 1)
+    elif url.startswith("https://"):
+        url = url.removeprefix("https://")
+    elif url.startswith("http://"):
+        url = url.removeprefix("http://")
+    else:
         return None
-    return Path(os.path.normpath(Path(repo_dir) / common))
+    return url.removesuffix(".git")
 
 
 def derive_repo_url(repo_dir: Path | str) -> str | None:
@@ -146,21 +461,37 @@ def derive_repo_url(repo_dir: Path | str) -> str | None:
     returns ``None`` for anything else (``ssh://``, ``git://``, local
     paths) and on any git failure.
     """
-    result = run_git(repo_dir, "remote", "get-url", "origin")
-    if result is None or result.returncode != 0:
-        return None
+    return GitSession(repo_dir).repo_url()
 
-    url = result.stdout.strip()
-    if not url:
-        return None
 
-    if url.startswith("git@"):
-        url = url.removeprefix("git@").replace(":", "/", 1)
-    elif url.startswith("https://"):
-        url = url.removeprefix("https://")
-    elif url.startswith("http://"):
-        url = url.removeprefix("http://")
-    else:
-        return None
+def list_worktrees(repo_dir: Path | str) -> list[WorktreeEntry] | None:
+    """Every worktree of the repository, from ONE porcelain call.
 
-    return url.removesuffix(".git")
+    Parses ``git worktree list --porcelain`` (stable, blank-line
+    separated records; the first is always the main worktree). Returns
+    ``None`` on any git failure.
+    """
+    result = run_git(repo_dir, "worktree", "list", "--porcelain")
+    if result is None or result.returncode != 0:
+        return None
+    entries: list[WorktreeEntry] = []
+    for record in result.stdout.split("\n\n"):
+        fields: dict[str, str] = {}
+        for line in record.splitlines():
+            key, _, value = line.partition(" ")
+            fields[key] = value
+        if "worktree" not in fields:
+            continue
+        branch = fields.get("branch")
+        entries.append(
+            WorktreeEntry(
+                path=Path(fields["worktree"]),
+                head=fields.get("HEAD"),
+                branch=branch.removeprefix("refs/heads/") if branch else None,
+                bare="bare" in fields,
+                detached="detached" in fields,
+                locked="locked" in fields,
+                prunable="prunable" in fields,
+            )
+        )
+    return entries
@@ -0,0 +1,569 @@
+"""Test-impact selection: run only the tests a change can affect.
+
+A pytest plugin, loaded with ``-p agentive_kit.impact`` and active only
+with ``--impact=DIR`` (``agentive ci-check --impact`` passes both):
+
+- RECORD: every test that runs is traced. The map notes which repo
+  files it depends on: the Python code it executes, the files it opens
+  (packaged data included), and the paths its subprocesses start with.
+  Python subprocesses are traced as well, through the
+  ``sitecustomize`` in ``impact_site/``, which is put on their
+  PYTHONPATH. Files touched while a fixture is set up are charged to
+  that fixture, and so to every test that uses it, at any scope.
+  Files touched while a test module is imported, and the modules its
+  names come from, are charged to every test in it.
+- SELECT: the next run compares the tree with the snapshot stored with
+  the map (git blob IDs). It keeps the tests whose files changed, tests
+  the map has never seen, and tests that failed last time.
+- FALL BACK to the full suite when:
+  - there is no usable map, or this plugin changed;
+  - a ``conftest.py`` or a packaging file changed;
+  - a changed file under ``scripts/``, ``packages/`` or ``tests/`` is
+    unknown to the map. No recorded test touches it, so no test can be
+    ruled out.
+
+Every run rewrites ``DIR/map.json``. A full run replaces the map. A
+selected run refreshes only the entries of the tests it ran.
+
+Under pytest-xdist every worker selects (from the same map, so
+identically) and records, but only the controller writes the map:
+workers hand their recordings back through ``workeroutput``.
+
+Blind spots, and why the fallback rules are broad:
+- files a shell script reads (``source``d libraries, ``cp``) are not
+  seen; only the script itself is;
+- a subprocess started with a hand-built environment is not traced;
+- a value a test module reads at import time from a module another
+  test module imported first (``from m import CONSTANT``) is not seen.
+
+Recording needs the tracing hook to itself, so the impact run never
+collects coverage. The CI-identical run stays ``agentive ci-check``
+without ``--impact``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import types
+from pathlib import Path
+from typing import Any, Iterable
+
+import pytest
+
+from agentive_kit import gitio
+
+MAP_VERSION = 1
+MAP_FILE = "map.json"
+SITE_DIR = Path(__file__).resolve().parent / "impact_site"
+
+# Environment read by impact_site/sitecustomize.py in child processes.
+LOG_ENV = "AGENTIVE_IMPACT_LOG"
+ROOT_ENV = "AGENTIVE_IMPACT_ROOT"
+
+# A change to any of these can alter collection or the environment of
+# every test: the whole suite runs.
+PACKAGING_FILES = {
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "tox.ini",
+    "pytest.ini",
+    "requirements.txt",
+    "requirements-dev.txt",
+}
+
+# Changed files here that the map has never seen force the full suite.
+SOURCE_DIRS = ("scripts/", "packages/", "tests/")
+
+# The workeroutput key an xdist worker returns its recordings under.
+_WORKER_KEY = "agentive_impact"
+
+# sys.monitoring tool slot (3.12+); 3 and 4 are unassigned by CPython.
+_MONITOR_TOOL = 3
+
+
+def plugin_version() -> str:
+    """Digest of the recorder itself; a map from another version is stale."""
+    digest = hashlib.sha256()
+    for path in (Path(__file__), SITE_DIR / "sitecustomize.py"):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def tree_snapshot(root: Path, exclude: str = "") -> dict[str, str] | None:
+    """Repo-relative path → git blob ID for the working tree.
+
+    Tracked files come from the index; modified and untracked files are
+    hashed from disk (deleted ones dropped). Paths under *exclude* are
+    left out. None outside a git checkout.
+    """
+    index = gitio.run_git(root, "ls-files", "-s", "-z")
+    dirty = gitio.run_git(
+        root, "ls-files", "-z", "--modified", "--others", "--exclude-standard"
+    )
+    if index is None or index.returncode or dirty is None or dirty.returncode:
+        return None
+    snapshot: dict[str, str] = {}
+    for record in index.stdout.split("\0"):
+        meta, _, path = record.partition("\t")
+        if path:
+            snapshot[path] = meta.split()[1]
+    changed = sorted({p for p in dirty.stdout.split("\0") if p})
+    present = [p for p in changed if (root / p).is_file()]
+    for path in set(changed) - set(present):
+        snapshot.pop(path, None)
+    for start in range(0, len(present), 500):
+        chunk = present[start : start + 500]
+        hashed = gitio.run_git(root, "hash-object", "--", *chunk)
+        if hashed is None or hashed.returncode:
+            return None
+        snapshot.update(zip(chunk, hashed.stdout.split()))
+    if exclude:
+        snapshot = {p: h for p, h in snapshot.items() if not p.startswith(exclude)}
+    return snapshot
+
+
+def changed_paths(old: dict[str, str], new: dict[str, str]) -> set[str]:
+    """Paths added, removed or modified between two snapshots."""
+    return {p for p in old.keys() | new.keys() if old.get(p) != new.get(p)}
+
+
+def load_map(cache_dir: Path) -> dict[str, Any] | None:
+    """The stored map, or None when absent, unreadable or stale."""
+    try:
+        data = json.loads((cache_dir / MAP_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MAP_VERSION
+        or data.get("plugin") != plugin_version()
+        or not all(
+            isinstance(data.get(key), dict)
+            for key in ("snapshot", "tests", "fixtures", "modules")
+        )
+    ):
+        return None
+    return data
+
+
+def save_map(cache_dir: Path, data: dict[str, Any]) -> None:
+    """Write the map atomically."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / MAP_FILE
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _is_test_module(path: str) -> bool:
+    return path.startswith("tests/") and Path(path).name.startswith("test_")
+
+
+def full_run_reason(
+    impact_map: dict[str, Any] | None, changed: set[str], present: Iterable[str] = ()
+) -> str:
+    """Why *changed* needs the whole suite; "" when selection is safe.
+
+    *present* is the current tree: an unknown file that was deleted
+    cannot be depended on, so only present ones force a full run.
+    """
+    if impact_map is None:
+        return "no impact map for this plugin version"
+    present = set(present)
+    known = set().union(
+        *impact_map["tests"].values(),
+        *impact_map["fixtures"].values(),
+        *impact_map["modules"].values(),
+    )
+    for path in sorted(changed):
+        name = Path(path).name
+        if name == "conftest.py":
+            return f"{path} changed"
+        if name in PACKAGING_FILES or name.startswith("requirements"):
+            return f"{path} changed"
+        if (
+            path.startswith(SOURCE_DIRS)
+            and path not in known
+            and path in present
+            and not _is_test_module(path)
+        ):
+            return f"{path} is not in the impact map"
+    return ""
+
+
+def fixture_key(argname: str, baseid: str) -> str:
+    return f"{baseid}::{argname}"
+
+
+def fixtures_by_name(impact_map: dict[str, Any]) -> dict[str, list[str]]:
+    """Recorded fixture argname → the baseids it was defined at."""
+    by_name: dict[str, list[str]] = {}
+    for key in impact_map["fixtures"]:
+        baseid, _, argname = key.rpartition("::")
+        by_name.setdefault(argname, []).append(baseid)
+    return by_name
+
+
+def test_dependencies(
+    nodeid: str,
+    fixturenames: Iterable[str],
+    impact_map: dict[str, Any],
+    by_name: dict[str, list[str]],
+) -> set[str]:
+    """Files *nodeid* depends on: its own, its module's, its fixtures'.
+
+    A fixture name resolves to the recorded definition with the longest
+    ``baseid`` that prefixes the test's node ID — the one pytest would
+    pick (a closer conftest or class overrides a farther one).
+    """
+    files = set(impact_map["tests"].get(nodeid, ()))
+    files.update(impact_map["modules"].get(nodeid.split("::")[0], ()))
+    for name in fixturenames:
+        candidates = [b for b in by_name.get(name, ()) if nodeid.startswith(b)]
+        if candidates:
+            files.update(impact_map["fixtures"][fixture_key(name, max(candidates))])
+    return files
+
+
+class _Recorder:
+    """Collects touched paths into the innermost open frame.
+
+    A frame is a test or a fixture setup. Python code is seen through
+    ``sys.monitoring`` (3.12+) or a call-only ``sys.settrace`` hook,
+    file opens and process starts through an audit hook, and child
+    Python processes through a per-frame log file they append to
+    (``impact_site/sitecustomize.py`` carries the child half).
+    """
+
+    def __init__(self, root: Path):
+        self.root = os.path.realpath(root)
+        self.frames: list[tuple[set[str], str, str | None]] = []
+        self.active = False
+        self._lock = threading.Lock()
+        self._monitoring = False
+
+    # -- hooks ----------------------------------------------------------
+    def _add(self, path: Any) -> None:
+        # "<frozen os>", "<string>": code with no file behind it.
+        if self.active and self.frames and isinstance(path, str):
+            if not path.startswith("<"):
+                self.frames[-1][0].add(os.path.abspath(path))
+
+    def _audit(self, event: str, args: tuple) -> None:
+        if not self.active:
+            return
+        if event == "open":
+            self._add(args[0] if args and isinstance(args[0], str) else None)
+        elif event in ("subprocess.Popen", "os.posix_spawn", "os.exec"):
+            argv = args[1] if len(args) > 1 else ()
+            if isinstance(argv, (str, bytes, os.PathLike)):
+                argv = [argv]
+            for arg in list(argv or ()):
+                if isinstance(arg, os.PathLike):
+                    arg = os.fspath(arg)
+                if isinstance(arg, str) and os.sep in arg:
+                    self._add(arg)
+
+    def add_namespace(self, namespace: dict[str, Any]) -> None:
+        """Charge the source of every module *namespace* refers to."""
+        for value in list(namespace.values()):
+            try:
+                if isinstance(value, types.ModuleType):
+                    self._add(getattr(value, "__file__", None))
+                else:
+                    module = sys.modules.get(getattr(value, "__module__", None))
+                    self._add(getattr(module, "__file__", None))
+            except Exception:  # an exotic __getattr__; not a dependency
+                continue
+
+    def _trace(self, frame: Any, event: str, arg: Any) -> None:
+        if event == "call":
+            self._add(frame.f_code.co_filename)
+        return None
+
+    def _on_start(self, code: Any, offset: int) -> Any:
+        self._add(code.co_filename)
+        return sys.monitoring.DISABLE
+
+    def start(self) -> None:
+        sys.addaudithook(self._audit)  # cannot be removed; gated by .active
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is not None and monitoring.get_tool(_MONITOR_TOOL) is None:
+            monitoring.use_tool_id(_MONITOR_TOOL, "agentive-impact")
+            monitoring.register_callback(
+                _MONITOR_TOOL, monitoring.events.PY_START, self._on_start
+            )
+            monitoring.set_events(_MONITOR_TOOL, monitoring.events.PY_START)
+            self._monitoring = True
+        else:
+            sys.settrace(self._trace)
+            threading.settrace(self._trace)
+        self.active = True
+
+    def stop(self) -> None:
+        self.active = False
+        if self._monitoring:
+            sys.monitoring.set_events(_MONITOR_TOOL, 0)
+            sys.monitoring.free_tool_id(_MONITOR_TOOL)
+        else:
+            sys.settrace(None)
+            threading.settrace(None)  # type: ignore[arg-type]
+
+    # -- frames ---------------------------------------------------------
+    def push(self) -> None:
+        fd, log = tempfile.mkstemp(prefix="impact-", suffix=".log")
+        os.close(fd)
+        self.frames.append((set(), log, os.environ.get(LOG_ENV)))
+        os.environ[LOG_ENV] = log
+        if self._monitoring:
+            sys.monitoring.restart_events()  # re-arm code already seen
+
+    def pop(self) -> set[str]:
+        """Close the innermost frame; its repo-relative paths."""
+        touched, log, previous = self.frames.pop()
+        if previous is None:
+            os.environ.pop(LOG_ENV, None)
+        else:
+            os.environ[LOG_ENV] = previous
+        try:
+            with open(log, encoding="utf-8", errors="replace") as handle:
+                touched.update(line.rstrip("\n") for line in handle)
+            os.unlink(log)
+        except OSError:
+            pass
+        if self._monitoring:
+            sys.monitoring.restart_events()
+        return self.relative(touched)
+
+    def relative(self, paths: Iterable[str]) -> set[str]:
+        """The *paths* inside the repo, repo-relative, caches dropped."""
+        result = set()
+        prefix = self.root + os.sep
+        for path in paths:
+            real = os.path.realpath(path)
+            if not real.startswith(prefix):
+                continue
+            rel = real[len(prefix) :].replace(os.sep, "/")
+            if rel.startswith(".git/") or "/__pycache__/" in f"/{rel}":
+                continue
+            result.add(rel)
+        return result
+
+
+class ImpactPlugin:
+    """The pytest side: selection at collection, recording per test."""
+
+    def __init__(self, config: pytest.Config, cache_dir: Path):
+        self.config = config
+        self.root = Path(config.rootpath)
+        self.cache_dir = cache_dir if cache_dir.is_absolute() else self.root / cache_dir
+        self.recorder = _Recorder(self.root)
+        self.snapshot: dict[str, str] | None = None
+        self.old: dict[str, Any] | None = None
+        self.selected_mode = False
+        self.summary = ""
+        self.ran: dict[str, list[str]] = {}
+        self.fixtures: dict[str, list[str]] = {}
+        self.modules: dict[str, list[str]] = {}
+        self.failed: set[str] = set()
+        self.passed: set[str] = set()
+        # xdist: a worker records, the controller merges and saves.
+        self.worker = hasattr(config, "workerinput")
+        self.controller = not self.worker and (
+            getattr(config.option, "dist", "no") != "no"
+        )
+
+    def _exclude(self) -> str:
+        try:
+            rel = self.cache_dir.resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return ""
+        return rel.as_posix() + "/"
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        self.snapshot = tree_snapshot(self.root, exclude=self._exclude())
+        if self.snapshot is None:
+            self.summary = "impact: not a git checkout — running everything"
+            return
+        if self.controller:
+            # Workers collect and select; the controller only needs to
+            # know which kind of run this is, to merge the map right.
+            self.old = load_map(self.cache_dir)
+            changed: set[str] = set()
+            if self.old is not None:
+                changed = changed_paths(self.old["snapshot"], self.snapshot)
+            reason = full_run_reason(self.old, changed, self.snapshot)
+            self.selected_mode = not reason
+            self.summary = (
+                f"impact: full suite — {reason}"
+                if reason
+                else f"impact: tests selected per worker ({len(changed)} file(s) "
+                "changed since the map)"
+            )
+            return
+        os.environ[ROOT_ENV] = str(self.root)
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(SITE_DIR), os.environ.get("PYTHONPATH")) if p
+        )
+        self.recorder.start()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        if self.snapshot is None:
+            return
+        self.old = load_map(self.cache_dir)
+        changed: set[str] = set()
+        if self.old is not None:
+            changed = changed_paths(self.old["snapshot"], self.snapshot)
+        reason = full_run_reason(self.old, changed, self.snapshot)
+        if reason:
+            self.summary = f"impact: full suite — {reason}"
+            return
+        failed = set(self.old.get("failed", ()))
+        by_name = fixtures_by_name(self.old)
+        keep, drop = [], []
+        for item in items:
+            names = getattr(item, "fixturenames", ())
+            if (
+                item.nodeid not in self.old["tests"]
+                or item.nodeid in failed
+                or changed & test_dependencies(item.nodeid, names, self.old, by_name)
+            ):
+                keep.append(item)
+            else:
+                drop.append(item)
+        self.selected_mode = True
+        self.summary = (
+            f"impact: {len(keep)} of {len(items)} test(s) selected "
+            f"({len(changed)} file(s) changed since the map)"
+        )
+        if drop:
+            config.hook.pytest_deselected(items=drop)
+            items[:] = keep
+
+    def pytest_report_collectionfinish(self, config: pytest.Config) -> str:
+        return self.summary
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        # Under xdist, collection (and its report) happens in workers.
+        if self.controller and self.summary:
+            terminalreporter.write_line(self.summary)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:
+        """xdist controller: fold in one worker's recordings."""
+        payload = getattr(node, "workeroutput", {}).get(_WORKER_KEY)
+        if not payload:
+            return
+        self.ran.update(payload["tests"])
+        self.modules.update(payload["modules"])
+        for key, files in payload["fixtures"].items():
+            self.fixtures[key] = sorted(set(files) | set(self.fixtures.get(key, ())))
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_make_collect_report(self, collector: pytest.Collector):
+        if not self.recorder.active or not isinstance(collector, pytest.Module):
+            return (yield)
+        self.recorder.push()
+        try:
+            report = yield
+            if report.passed:
+                self.recorder.add_namespace(vars(collector.obj))
+            return report
+        finally:
+            self.modules[collector.nodeid] = sorted(self.recorder.pop())
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: Any):
+        if not self.recorder.active:
+            return (yield)
+        self.recorder.push()
+        try:
+            return (yield)
+        finally:
+            self.ran[item.nodeid] = sorted(self.recorder.pop())
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(self, fixturedef: Any, request: Any):
+        if not self.recorder.active:
+            return (yield)
+        self.recorder.push()
+        try:
+            return (yield)
+        finally:
+            touched = self.recorder.pop()
+            key = fixture_key(fixturedef.argname, fixturedef.baseid)
+            self.fixtures[key] = sorted(touched | set(self.fixtures.get(key, ())))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.failed:
+            self.failed.add(report.nodeid)
+        elif report.when == "call" and report.passed:
+            self.passed.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if self.recorder.active:
+            self.recorder.stop()
+        elif not (self.controller and self.snapshot is not None):
+            return
+        if self.worker:
+            self.config.workeroutput[_WORKER_KEY] = {
+                "tests": self.ran,
+                "fixtures": self.fixtures,
+                "modules": self.modules,
+            }
+            return
+        tests: dict[str, list[str]] = {}
+        fixtures: dict[str, list[str]] = {}
+        modules: dict[str, list[str]] = {}
+        failed: set[str] = set()
+        if self.selected_mode and self.old is not None:
+            tests.update(self.old["tests"])
+            fixtures.update(self.old["fixtures"])
+            modules.update(self.old["modules"])
+            failed = set(self.old.get("failed", ())) - self.passed
+        tests.update(self.ran)
+        fixtures.update(self.fixtures)
+        modules.update(self.modules)
+        failed |= self.failed
+        try:
+            save_map(
+                self.cache_dir,
+                {
+                    "version": MAP_VERSION,
+                    "plugin": plugin_version(),
+                    "snapshot": self.snapshot,
+                    "tests": tests,
+                    "fixtures": fixtures,
+                    "modules": modules,
+                    "failed": sorted(failed),
+                },
+            )
+        except OSError as e:
+            print(f"⚠️  Could not write the impact map: {e}", file=sys.stderr)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--impact",
+        metavar="DIR",
+        default=None,
+        help="record a per-test impact map in DIR and run only the tests "
+        "affected by changes since the last run (agentive_kit.impact)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    cache_dir = config.getoption("impact")
+    if cache_dir:
+        config.pluginmanager.register(
+            ImpactPlugin(config, Path(cache_dir)), "agentive-impact"
+        )
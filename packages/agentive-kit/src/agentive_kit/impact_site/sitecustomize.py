@@ -0,0 +1,99 @@
+"""Child half of ``agentive_kit.impact``: trace this Python process.
+
+``agentive_kit.impact`` puts this directory first on PYTHONPATH, so
+every Python process a recorded test starts imports this module at
+startup. When ``AGENTIVE_IMPACT_LOG`` and ``AGENTIVE_IMPACT_ROOT`` are
+set, the code it runs and the files it opens or executes under the
+root are appended to the log at exit; the parent charges them to the
+test (or fixture) that owns the log.
+
+Self-contained on purpose: the child may be another interpreter, and
+importing the plugin would import pytest into every child. A
+``sitecustomize`` this one shadows is still imported afterwards.
+"""
+
+import atexit
+import importlib
+import os
+import sys
+
+
+def _chain():
+    """Import the ``sitecustomize`` this module shadows, if any."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    ours = sys.modules.pop(__name__, None)
+    saved = sys.path[:]
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != here]
+    try:
+        importlib.import_module("sitecustomize")
+    except ImportError:
+        pass
+    finally:
+        sys.path[:] = saved
+        if ours is not None:
+            sys.modules[__name__] = ours
+
+
+def _install(log, root):
+    prefix = os.path.realpath(root) + os.sep
+    seen = set()
+    state = {"on": True}
+
+    def add(path):
+        if state["on"] and isinstance(path, str) and not path.startswith("<"):
+            seen.add(os.path.abspath(path))
+
+    def audit(event, args):
+        if event == "open":
+            add(args[0] if args else None)
+        elif event in ("subprocess.Popen", "os.posix_spawn", "os.exec"):
+            argv = args[1] if len(args) > 1 else ()
+            if isinstance(argv, (str, bytes, os.PathLike)):
+                argv = [argv]
+            for arg in list(argv or ()):
+                if isinstance(arg, os.PathLike):
+                    arg = os.fspath(arg)
+                if isinstance(arg, str) and os.sep in arg:
+                    add(arg)
+
+    def flush():
+        state["on"] = False
+        lines = sorted(
+            path for path in map(os.path.realpath, seen) if path.startswith(prefix)
+        )
+        if not lines:
+            return
+        try:
+            with open(log, "a", encoding="utf-8") as handle:
+                handle.write("".join(line + "\n" for line in lines))
+        except OSError:
+            pass
+
+    sys.addaudithook(audit)
+    monitoring = getattr(sys, "monitoring", None)
+    # Tool slot 3, as in the parent (impact._MONITOR_TOOL).
+    if monitoring is not None and monitoring.get_tool(3) is None:
+
+        def on_start(code, offset):
+            add(code.co_filename)
+            return monitoring.DISABLE
+
+        monitoring.use_tool_id(3, "agentive-impact")
+        monitoring.register_callback(3, monitoring.events.PY_START, on_start)
+        monitoring.set_events(3, monitoring.events.PY_START)
+    else:
+        import threading
+
+        def trace(frame, event, arg):
+            if event == "call":
+                add(frame.f_code.co_filename)
+            return None
+
+        sys.settrace(trace)
+        threading.settrace(trace)
+    atexit.register(flush)
+
+
+_chain()
+if os.environ.get("AGENTIVE_IMPACT_LOG") and os.environ.get("AGENTIVE_IMPACT_ROOT"):
+    _install(os.environ["AGENTIVE_IMPACT_LOG"], os.environ["AGENTIVE_IMPACT_ROOT"])
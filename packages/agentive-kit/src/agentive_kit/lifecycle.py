@@ -12,11 +12,12 @@ a falsy value; they never raise (matching the legacy script, and
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 from pathlib import Path
 
-from agentive_kit import gitio
+from agentive_kit import gitio, trace
 from agentive_kit.models import (
     MetadataSyncNote,
     StatusIssue,
@@ -46,6 +47,14 @@ FOLDER_STATUS_MAP = {
     "7-blocked": "Blocked",
 }
 
+# Folders whose tasks carry no Status contract.
+UNCHECKED_FOLDERS = ("8-archive", "9-reference")
+
+# The Status field of a task file ("**Status**: In Progress"): one
+# compiled pattern for every reader and writer of the field. Group 1 is
+# the label (kept on rewrite), group 2 the value.
+STATUS_FIELD = re.compile(r"(\*\*Status\*\*:\s*)(\w+(?:\s+\w+)?)")
+
 # The one branch on which lifecycle commands may write the shared
 # coordination JSON (KIT-0086 F1): the planner runs lifecycle moves on
 # main; every other writer is a feature-branch session, and those stop
@@ -53,6 +62,48 @@ FOLDER_STATUS_MAP = {
 HANDOFFS_WRITE_BRANCH = "main"
 
 
+# Folders whose tasks are finished — nothing more will be committed for
+# them, so their per-task worktrees are collectable.
+CLOSED_FOLDERS = ("5-done", "6-canceled")
+
+# A task file name (or branch suffix) begins with its ID.
+TASK_ID_PREFIX = re.compile(r"^([A-Za-z]+-[0-9]+)(?![0-9A-Za-z])")
+
+
+@trace.traced("scan")
+def task_files(project_dir: Path) -> dict[str, Path]:
+    """Task ID (uppercased) → task file, from one scan of the tree.
+
+    The batch counterpart of :func:`find_task_file` for callers that
+    join many IDs at once (the worktree inventory, batched moves).
+    Archive/reference folders are skipped like ``validate_all_tasks``
+    skips them; a duplicate ID keeps its first file in sorted order.
+    """
+    tasks_dir = project_dir / ".kit" / "tasks"
+    files: dict[str, Path] = {}
+    if not tasks_dir.is_dir():
+        return files
+    try:
+        children = sorted(tasks_dir.iterdir())
+    except OSError:
+        return files
+    for folder in children:
+        if not folder.is_dir() or folder.name not in FOLDER_STATUS_MAP:
+            continue
+        for file in sorted(folder.glob("*.md")):
+            match = TASK_ID_PREFIX.match(file.name)
+            if match:
+                files.setdefault(match.group(1).upper(), file)
+    return files
+
+
+def task_folders(project_dir: Path) -> dict[str, str]:
+    """Task ID (uppercased) → status folder (see :func:`task_files`)."""
+    return {
+        task_id: file.parent.name for task_id, file in task_files(project_dir).items()
+    }
+
+
 def find_task_file(task_id: str, project_dir: Path) -> Path | None:
     """Find a task file by ID across all workflow folders."""
     tasks_dir = project_dir / ".kit" / "tasks"
@@ -83,6 +134,32 @@ def find_task_file(task_id: str, project_dir: Path) -> Path | None:
     return None
 
 
+def parse_status(content: str) -> str | None:
+    """The Status value in a task file's *content*, or ``None``."""
+    match = STATUS_FIELD.search(content)
+    return match.group(2).strip() if match else None
+
+
+def status_issue(folder: str, file_name: str, content: str) -> StatusIssue | None:
+    """The finding for one task file in *folder*, or ``None`` if it matches.
+
+    The single folder/Status rule, shared by the working-tree sweep
+    (``validate_all_tasks``) and the staged check
+    (``validate_staged_tasks``). Unchecked and unknown folders pass.
+    """
+    expected_status = FOLDER_STATUS_MAP.get(folder)
+    if expected_status is None or folder in UNCHECKED_FOLDERS:
+        return None
+    actual_status = parse_status(content)
+    if actual_status is None:
+        return StatusIssue(file_name, "No Status field found")
+    if actual_status != expected_status:
+        return StatusIssue(
+            file_name, f"Status '{actual_status}' != folder '{expected_status}'"
+        )
+    return None
+
+
 def update_status_in_file(file_path: Path, new_status: str) -> bool | None:
     """Update the Status field in a task file.
 
@@ -93,13 +170,12 @@ def update_status_in_file(file_path: Path, new_status: str) -> bool | None:
     """
     try:
         content = file_path.read_text(encoding="utf-8")
-        pattern = re.compile(r"(\*\*Status\*\*:\s*)(\w+(?:\s+\w+)?)")
-        if not pattern.search(content):
+        if not STATUS_FIELD.search(content):
             return None
         # Replacement via lambda, not a template string: a status value
         # containing backslashes or group refs must never be
         # re-interpreted by re.sub (claude-code review, PR 1 trio).
-        new_content = pattern.sub(
+        new_content = STATUS_FIELD.sub(
             lambda m: m.group(1) + new_status,
             content,
             count=1,
@@ -114,7 +190,11 @@ def update_status_in_file(file_path: Path, new_status: str) -> bool | None:
 
 
 def sync_coordination_metadata(
-    task_id: str, file_name: str, target_folder: str, project_dir: Path
+    task_id: str,
+    file_name: str,
+    target_folder: str,
+    project_dir: Path,
+    branch: str | None = None,
 ) -> list[MetadataSyncNote]:
     """Rewrite the moved task's path in coordination metadata (KIT-0040 F2).
 
@@ -131,7 +211,9 @@ def sync_coordination_metadata(
     feature-branch lifecycle moves must produce zero diff in it (the
     KIT-0084 / PR #105 squash-merge conflict class). An undeterminable
     branch (not a git repo, detached HEAD, git absent) skips the write
-    too: fail-safe over fail-open. The task's own ``HANDOFF-*.md``
+    too: fail-safe over fail-open. A batch caller passes the *branch*
+    it already resolved ("" when undeterminable) instead of one git
+    call per task. The task's own ``HANDOFF-*.md``
     files are same-branch artifacts with no cross-branch writer, so
     they are rewritten regardless of branch. Stale-path drift in the
     skipped JSON is surfaced by a doctor check (KIT-0086 F2), not here.
@@ -146,7 +228,9 @@ def sync_coordination_metadata(
 
     handoffs_json = context_dir / "agent-handoffs.json"
     targets = []
-    if gitio.current_branch(project_dir) == HANDOFFS_WRITE_BRANCH:
+    if branch is None:
+        branch = gitio.current_branch(project_dir)
+    if branch == HANDOFFS_WRITE_BRANCH:
         targets.append(handoffs_json)
     else:
         notes.append(
@@ -178,12 +262,9 @@ def sync_coordination_metadata(
     return notes
 
 
-def move_task(task_id: str, target_status: str, project_dir: Path) -> TaskMove | None:
-    """Move a task to a new folder and update its Status field.
-
-    Returns a :class:`TaskMove` (truthy) on success, ``None`` on any
-    failure — callers that only need pass/fail keep working unchanged.
-    """
+def _target_folder(target_status: str) -> str | None:
+    """Status folder for a user-typed status; prints and returns None
+    for an unknown one."""
     # Normalize target status
     target_lower = target_status.lower().replace("_", "-").replace(" ", "-")
 
@@ -192,15 +273,65 @@ def move_task(task_id: str, target_status: str, project_dir: Path) -> TaskMove |
         print(f"❌ Unknown status: {target_status}")
         print(f"   Valid statuses: {', '.join(STATUS_FOLDER_MAP.keys())}")
         return None
+    return STATUS_FOLDER_MAP[target_lower]
 
-    target_folder = STATUS_FOLDER_MAP[target_lower]
-    linear_status = FOLDER_STATUS_MAP[target_folder]
+
+def move_task(task_id: str, target_status: str, project_dir: Path) -> TaskMove | None:
+    """Move a task to a new folder and update its Status field.
+
+    Returns a :class:`TaskMove` (truthy) on success, ``None`` on any
+    failure — callers that only need pass/fail keep working unchanged.
+    """
+    target_folder = _target_folder(target_status)
+    if target_folder is None:
+        return None
 
     task_file = find_task_file(task_id, project_dir)
     if not task_file:
         print(f"❌ Task not found: {task_id}")
         return None
+    return _move_file(task_id, task_file, target_folder, project_dir)
+
+
+def move_tasks(
+    moves: list[tuple[str, str]], project_dir: Path
+) -> list[TaskMove | None]:
+    """Apply many ``(task_id, target_status)`` moves in one batch.
 
+    Same per-task behavior and output as :func:`move_task`, but the
+    task tree is scanned once (:func:`task_files`) and the branch for
+    the coordination-metadata guard is resolved once — not once per
+    task. Returns one result per move, in order (``None`` = failed).
+    """
+    files = task_files(project_dir)
+    branch: str | None = None
+    results: list[TaskMove | None] = []
+    for task_id, target_status in moves:
+        target_folder = _target_folder(target_status)
+        task_file = files.get(task_id.upper()) if target_folder else None
+        if target_folder and not task_file:
+            print(f"❌ Task not found: {task_id}")
+        if target_folder is None or task_file is None:
+            results.append(None)
+            continue
+        if branch is None:
+            branch = gitio.current_branch(project_dir) or ""
+        move = _move_file(task_id, task_file, target_folder, project_dir, branch)
+        if move:  # a later move of the same task starts from its new home
+            tasks_dir = task_file.parent.parent
+            files[task_id.upper()] = tasks_dir / move.to_folder / move.file_name
+        results.append(move)
+    return results
+
+
+def _move_file(
+    task_id: str,
+    task_file: Path,
+    target_folder: str,
+    project_dir: Path,
+    branch: str | None = None,
+) -> TaskMove | None:
+    linear_status = FOLDER_STATUS_MAP[target_folder]
     current_folder = task_file.parent.name
 
     if current_folder == target_folder:
@@ -211,7 +342,9 @@ def move_task(task_id: str, target_status: str, project_dir: Path) -> TaskMove |
             print(f"⚠️  Status field not updated in {task_file.name}")
         # Re-running a move doubles as a repair action for metadata that
         # drifted out of sync with the task's folder.
-        sync_coordination_metadata(task_id, task_file.name, target_folder, project_dir)
+        sync_coordination_metadata(
+            task_id, task_file.name, target_folder, project_dir, branch
+        )
         return TaskMove(
             task_id=task_id,
             file_name=task_file.name,
@@ -246,7 +379,9 @@ def move_task(task_id: str, target_status: str, project_dir: Path) -> TaskMove |
         # the CLI exits nonzero (CodeRabbit, PR #108).
         print(f"⚠️  Status field not updated in {target_path.name}")
 
-    sync_coordination_metadata(task_id, target_path.name, target_folder, project_dir)
+    sync_coordination_metadata(
+        task_id, target_path.name, target_folder, project_dir, branch
+    )
 
     if field_updated is None:
         # No ✅ on a partial failure — the summary line must not
@@ -269,6 +404,7 @@ def move_task(task_id: str, target_status: str, project_dir: Path) -> TaskMove |
     )
 
 
+@trace.traced("scan")
 def validate_all_tasks(project_dir: Path) -> ValidationReport:
     """Validate all task files have matching Status and folder.
 
@@ -300,13 +436,11 @@ def validate_all_tasks(project_dir: Path) -> ValidationReport:
             continue
         # membership: folder-name vocabulary checks against fixed
         # sets, not identifier equality
-        if folder.name in ["8-archive", "9-reference"]:
+        if folder.name in UNCHECKED_FOLDERS:
             continue
         if folder.name not in FOLDER_STATUS_MAP:
             continue
 
-        expected_status = FOLDER_STATUS_MAP[folder.name]
-
         for file in folder.glob("*.md"):
             checked += 1
             try:
@@ -316,26 +450,100 @@ def validate_all_tasks(project_dir: Path) -> ValidationReport:
                 # the same tolerance sync_coordination_metadata applies.
                 issues.append(StatusIssue(file.name, f"Unreadable file ({e})"))
                 continue
-            match = re.search(r"\*\*Status\*\*:\s*(\w+(?:\s+\w+)?)", content)
+            issue = status_issue(folder.name, file.name, content)
+            if issue is not None:
+                issues.append(issue)
 
-            if not match:
-                issues.append(StatusIssue(file.name, "No Status field found"))
-                continue
+    return _report(checked, issues)
 
-            actual_status = match.group(1).strip()
-            if actual_status != expected_status:
-                issues.append(
-                    StatusIssue(
-                        file.name,
-                        f"Status '{actual_status}' != folder '{expected_status}'",
-                    )
-                )
 
+def _report(
+    checked: int, issues: list[StatusIssue], what: str = "tasks"
+) -> ValidationReport:
+    """Print a validation outcome; return it as a ValidationReport."""
     if issues:
         print(f"❌ Found {len(issues)} status mismatches:\n")
         for issue in issues:
             print(f"  • {issue.file_name}: {issue.detail}")
         print("\nTo fix, use: ./scripts/core/project move <task-id> <status>")
     else:
-        print(f"✅ All {checked} tasks have matching Status and folder")
+        print(f"✅ All {checked} {what} have matching Status and folder")
     return ValidationReport(checked=checked, issues=tuple(issues))
+
+
+@trace.traced("scan")
+def _staged_task_path(project_dir: Path, path: str) -> tuple[str, str] | None:
+    """``(project-relative path, status folder)`` when *path* is a task file.
+
+    *path* may be absolute or relative to *project_dir*. The folder is
+    the first component under ``.kit/tasks/``: a file nested deeper in
+    a status folder is checked against that folder, as the pre-commit
+    hook always read it.
+    """
+    head, name = os.path.split(os.path.abspath(os.path.join(project_dir, path)))
+    rel = Path(
+        os.path.relpath(
+            os.path.join(os.path.realpath(head), name), os.path.realpath(project_dir)
+        )
+    )
+    parts = rel.parts
+    if len(parts) >= 4 and parts[:2] == (".kit", "tasks") and name.endswith(".md"):
+        return rel.as_posix(), parts[2]
+    return None
+
+
+def validate_staged_tasks(
+    project_dir: Path, paths: list[str] | None = None
+) -> ValidationReport | None:
+    """Validate the STAGED copy of task files — what the commit records.
+
+    The pre-commit form of ``validate_all_tasks``: the working tree
+    may differ from the index (a partial ``git add -p``, an edit after
+    staging), so the blobs are read from the index, all of them in one
+    ``git cat-file --batch`` run. *paths* (repo-relative, as pre-commit
+    passes them, or absolute) narrows the check; by default it covers
+    every task file the index changes under ``.kit/tasks/``. A file's
+    folder is the first component under ``.kit/tasks/``
+    (``_staged_task_path``).
+
+    Under a git hook the index is the one git exported in
+    ``GIT_INDEX_FILE`` (``git commit <paths>`` commits a temporary
+    index). Returns ``None`` when git cannot read the index (not a
+    repository, git absent).
+    """
+    with gitio.GitSession(
+        project_dir, index_file=os.environ.get("GIT_INDEX_FILE")
+    ) as git:
+        if paths is None:
+            paths = git.staged_paths(".kit/tasks")
+            if paths is None:
+                print("❌ Cannot read the git index")
+                return None
+        tasks: dict[str, str] = {}
+        for path in paths:
+            found = _staged_task_path(project_dir, path)
+            if found is not None:
+                tasks[found[0]] = found[1]
+        blobs = git.read_blobs([f":{path}" for path in tasks])
+    if blobs is None:
+        print("❌ Cannot read the git index")
+        return None
+
+    issues: list[StatusIssue] = []
+    checked = 0
+    for path, folder in tasks.items():
+        blob = blobs[f":{path}"]
+        # Not in the index: nothing of it is being committed.
+        if blob is None or folder not in FOLDER_STATUS_MAP:
+            continue
+        checked += 1
+        name = Path(path).name
+        try:
+            content = blob.decode("utf-8")
+        except UnicodeDecodeError as e:
+            issues.append(StatusIssue(name, f"Unreadable file ({e})"))
+            continue
+        issue = status_issue(folder, name, content)
+        if issue is not None:
+            issues.append(issue)
+    return _report(checked, issues, what="staged tasks")
@@ -0,0 +1,324 @@
+"""Pull Linear issue states back into the task tree (``agentive linear pull``).
+
+The Linear integration pushes (``scripts/optional/sync_tasks_to_linear.py``);
+this is the other direction. One run:
+
+- reads every issue UPDATED SINCE the stored cursor — a paginated
+  ``issues(filter: {updatedAt: {gte: cursor}})`` query, 100 per page,
+  optionally narrowed to ``LINEAR_TEAM_ID`` — so a quiet day costs one
+  request, not one per task;
+- maps each issue to its task (the push ledger's issue ID, else the
+  ``[TASK-ID]`` title prefix the push writes) and its workflow state
+  back to a folder through ``lifecycle.FOLDER_STATUS_MAP``;
+- applies every resulting move in ONE ``lifecycle.move_tasks`` batch.
+
+Conflicts: the push ledger (``.kit/.cache/linear-sync.json``) records
+the status each task had when it was last pushed — the last state both
+sides agreed on. Per task, with ``base`` that status:
+
+- remote == local: nothing to do;
+- local == base: only Linear moved — the move is applied;
+- remote == base: only the file moved — left for the next push;
+- otherwise both moved (or there is no base yet): a CONFLICT, reported
+  and never applied. Resolve by moving the task, or changing the issue,
+  then push.
+
+The cursor lives in the same ledger (``pull_cursor``). It advances to
+the newest ``updatedAt`` seen, but never past an unresolved conflict,
+so a conflict is re-reported on every pull until it is settled.
+
+Standard library only: one ``urllib`` POST per page — the package does
+not depend on gql. Error strategy matches ``worktree_pool``: refusals
+print to stderr and exit nonzero; the helpers return None on failure.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from agentive_kit import lifecycle
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Written by the push script (linear_sync_utils.SYNC_LEDGER_PATH).
+SYNC_LEDGER = Path(".kit") / ".cache" / "linear-sync.json"
+SYNC_LEDGER_VERSION = 1
+
+PAGE_SIZE = 100
+REQUEST_TIMEOUT = 30
+
+# "[KIT-0042] Title" — the prefix sync_tasks_to_linear writes.
+_TITLE_TASK_ID = re.compile(r"\[([A-Z][A-Z0-9]{0,5}-\d{4})\]")
+
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+# Linear state name → task folder (the inverse of FOLDER_STATUS_MAP).
+STATE_FOLDER_MAP = {
+    status: folder for folder, status in lifecycle.FOLDER_STATUS_MAP.items()
+}
+
+_ISSUES_QUERY = """\
+query PullIssues($filter: IssueFilter, $first: Int!, $after: String) {
+  issues(filter: $filter, first: $first, after: $after, orderBy: updatedAt) {
+    nodes { id identifier title updatedAt state { name } }
+    pageInfo { hasNextPage endCursor }
+  }
+}"""
+
+_USAGE = """\
+Usage: agentive linear pull [--dry-run]
+
+  Move task files to match the Linear issue states changed since the
+  last pull. Tasks changed on BOTH sides since the last push are
+  reported as conflicts and left alone.
+
+  --dry-run    Show the moves and conflicts; change nothing
+
+Needs LINEAR_API_KEY (environment or .env); LINEAR_TEAM_ID (UUID or
+team key) narrows the read to one team. Exit codes: 0 in sync, 1 error,
+3 conflicts reported (the other moves were applied).
+"""
+
+
+@dataclass(frozen=True)
+class PullPlan:
+    """What one pull found: moves to apply, conflicts to report."""
+
+    moves: list[tuple[str, str]]  # (task ID, target folder)
+    conflicts: list[str]  # one human-readable line each
+    cursor: str | None  # the pull_cursor to store afterwards
+    agreed: dict[str, str]  # task ID → status both sides now share
+
+
+def load_ledger(project_dir: Path) -> dict[str, Any]:
+    """The push ledger; an empty one when absent, unreadable or foreign."""
+    empty: dict[str, Any] = {
+        "version": SYNC_LEDGER_VERSION,
+        "commit": None,
+        "tasks": {},
+    }
+    try:
+        data = json.loads((project_dir / SYNC_LEDGER).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != SYNC_LEDGER_VERSION:
+        return empty
+    if not isinstance(data.get("tasks"), dict):
+        return empty
+    return data
+
+
+def save_ledger(ledger: dict[str, Any], project_dir: Path) -> None:
+    """Write the ledger atomically, in the push script's format."""
+    path = project_dir / SYNC_LEDGER
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps(ledger, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    os.replace(tmp, path)
+
+
+def _setting(project_dir: Path, name: str) -> str | None:
+    """*name* from the environment, else from the project's ``.env``."""
+    value = os.environ.get(name)
+    if value:
+        return value
+    try:
+        lines = (project_dir / ".env").read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    for line in lines:
+        key, sep, value = line.strip().removeprefix("export ").partition("=")
+        if sep and key.strip() == name:
+            return value.strip().strip("'\"") or None
+    return None
+
+
+def _graphql(
+    url: str, api_key: str, query: str, variables: dict[str, Any]
+) -> dict[str, Any] | None:
+    """POST one GraphQL request; its ``data``, or None (reason printed)."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps({"query": query, "variables": variables}).encode(),
+        headers={"Authorization": api_key, "Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            payload = json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        print(f"❌ Linear API error: HTTP {e.code}", file=sys.stderr)
+        return None
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        print(f"❌ Could not reach Linear: {e}", file=sys.stderr)
+        return None
+    if payload.get("errors"):
+        messages = "; ".join(str(err.get("message")) for err in payload["errors"])
+        print(f"❌ Linear API error: {messages}", file=sys.stderr)
+        return None
+    return payload.get("data")
+
+
+def fetch_updated_issues(
+    url: str, api_key: str, since: str | None, team: str | None = None
+) -> list[dict[str, Any]] | None:
+    """Every issue updated at or after *since* (all issues when None).
+
+    Follows ``pageInfo`` to the end; None when any page fails.
+    """
+    issue_filter: dict[str, Any] = {}
+    if since:
+        issue_filter["updatedAt"] = {"gte": since}
+    if team:
+        field = "id" if _UUID.match(team) else "key"
+        issue_filter["team"] = {field: {"eq": team}}
+    issues: list[dict[str, Any]] = []
+    after = None
+    while True:
+        data = _graphql(
+            url,
+            api_key,
+            _ISSUES_QUERY,
+            {"filter": issue_filter or None, "first": PAGE_SIZE, "after": after},
+        )
+        if data is None:
+            return None
+        page = data["issues"]
+        issues.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        after = page["pageInfo"]["endCursor"]
+
+
+def plan_pull(
+    issues: list[dict[str, Any]],
+    ledger: dict[str, Any],
+    folders: dict[str, str],
+) -> PullPlan:
+    """Decide every move and conflict — pure, no I/O.
+
+    Args:
+        issues: Issues from :func:`fetch_updated_issues`
+        ledger: The push ledger (see module doc)
+        folders: Task ID → current folder (``lifecycle.task_folders``)
+    """
+    known = ledger["tasks"]
+    by_issue = {
+        entry["issue_id"]: task_id
+        for task_id, entry in known.items()
+        if isinstance(entry, dict) and entry.get("issue_id")
+    }
+    moves: list[tuple[str, str]] = []
+    conflicts: list[str] = []
+    agreed: dict[str, str] = {}
+    newest = ledger.get("pull_cursor")
+    oldest_conflict = None
+    for issue in issues:
+        if newest is None or issue["updatedAt"] > newest:
+            newest = issue["updatedAt"]
+        task_id = by_issue.get(issue["id"])
+        if task_id is None:
+            match = _TITLE_TASK_ID.search(issue.get("title") or "")
+            task_id = match.group(1) if match else None
+        if task_id is None or task_id not in folders:
+            continue  # not one of ours, or no local task file
+        remote = (issue.get("state") or {}).get("name")
+        if remote not in STATE_FOLDER_MAP:
+            continue  # a team-specific state with no folder
+        local = lifecycle.FOLDER_STATUS_MAP[folders[task_id]]
+        base = (known.get(task_id) or {}).get("status")
+        if remote == local:
+            agreed[task_id] = remote
+        elif local == base:
+            moves.append((task_id, STATE_FOLDER_MAP[remote]))
+            agreed[task_id] = remote
+        elif remote != base:
+            why = f"last synced as {base}" if base else "never pushed with a status"
+            conflicts.append(
+                f"{task_id}: local {local}, Linear {remote} "
+                f"({issue.get('identifier') or issue['id']}; {why})"
+            )
+            if oldest_conflict is None or issue["updatedAt"] < oldest_conflict:
+                oldest_conflict = issue["updatedAt"]
+    # gte filter: a cursor AT the oldest conflict re-reads it next time.
+    cursor = oldest_conflict or newest
+    return PullPlan(moves=moves, conflicts=conflicts, cursor=cursor, agreed=agreed)
+
+
+def pull(
+    project_dir: Path, api_key: str, url: str = LINEAR_API_URL, dry_run: bool = False
+) -> int:
+    """One pull (see module doc). Returns the exit code."""
+    ledger = load_ledger(project_dir)
+    since = ledger.get("pull_cursor")
+    print(f"🔄 Reading Linear issues updated since {since or 'the beginning'}...")
+    issues = fetch_updated_issues(
+        url, api_key, since, _setting(project_dir, "LINEAR_TEAM_ID")
+    )
+    if issues is None:
+        return 1
+    plan = plan_pull(issues, ledger, lifecycle.task_folders(project_dir))
+    print(
+        f"   {len(issues)} issue(s) changed; {len(plan.moves)} move(s), "
+        f"{len(plan.conflicts)} conflict(s)"
+    )
+    for line in plan.conflicts:
+        print(f"⚠️  Conflict — {line}")
+    if dry_run:
+        for task_id, folder in plan.moves:
+            print(f"Would move {task_id} → {folder}")
+        return 3 if plan.conflicts else 0
+
+    results = lifecycle.move_tasks(
+        [
+            (task_id, lifecycle.FOLDER_STATUS_MAP[folder])
+            for task_id, folder in plan.moves
+        ],
+        project_dir,
+    )
+    failed = {task_id for (task_id, _), move in zip(plan.moves, results) if not move}
+    for task_id, status in plan.agreed.items():
+        if task_id not in failed:
+            ledger["tasks"].setdefault(task_id, {})["status"] = status
+    if not failed:
+        ledger["pull_cursor"] = plan.cursor
+    try:
+        save_ledger(ledger, project_dir)
+    except OSError as e:
+        print(f"⚠️  Could not write the sync ledger: {e}", file=sys.stderr)
+    if failed:
+        print(f"❌ {len(failed)} move(s) failed: {', '.join(sorted(failed))}")
+        return 1
+    if plan.conflicts:
+        print("Resolve each conflict (move the task or change the issue), then push.")
+        return 3
+    print("✅ Task tree matches Linear.")
+    return 0
+
+
+def main(argv: list[str], project_dir: Path) -> None:
+    """``agentive linear`` dispatcher; always exits."""
+    args = list(argv)
+    if not args or args[0] in ("help", "-h", "--help"):
+        print(_USAGE)
+        sys.exit(0 if args else 1)
+    if args[0] != "pull" or not set(args[1:]) <= {"--dry-run"}:
+        print(_USAGE, file=sys.stderr)
+        sys.exit(1)
+    api_key = _setting(project_dir, "LINEAR_API_KEY")
+    if not api_key:
+        print("❌ LINEAR_API_KEY is not set (environment or .env)", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(
+        pull(project_dir, api_key, url=LINEAR_API_URL, dry_run="--dry-run" in args)
+    )
@@ -3,11 +3,17 @@
 A minimal, read-only port of the region grammar from
 ``scripts/local/kit_markers.py`` — the repo-resident tool stays the
 one WRITER (merge/replace); the package only ever needs to READ a
-region (preflight's ``bots:`` declaration). The pattern below is
-byte-for-byte the reader half of that tool's ``_region_pattern``, and
+region (preflight's ``bots:`` declaration, the door's ``kit-install``
+record). The code below is byte-for-byte the reader half of that tool
+(``_region_pattern``, ``region_index``), and
 ``tests/agentive_kit/test_markers.py`` pins the two against each other
 so they cannot drift apart silently.
 
+Reads are cheap to repeat: compiled patterns are LRU-cached per name,
+and ``region_index`` finds every region of a document in one scan,
+cached per text — doctor, preflight and the door read several regions
+of the same CLAUDE.md per run.
+
 Grammar notes carried over verbatim: markers are matched as whole
 lines, tolerating benign whitespace drift inside the comment
 (``[ \\t]`` only — never ``\\s``, so tolerance can't cross a line
@@ -16,11 +22,56 @@ break), and ``\\r?\\n`` keeps CRLF files parsing.
 
 from __future__ import annotations
 
+import functools
 import re
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+# Any BEGIN/END marker line, with everything after the colon. One
+# finditer over a document yields every marker; region_index pairs them
+# per name with the same rules _region_pattern encodes.
+_MARKER_LINE_RE = re.compile(
+    r"^[ \t]*<!--[ \t]*(?P<kind>BEGIN|END)[ \t]+KIT-LOCAL:[ \t]*(?P<rest>[^\n]*)",
+    re.MULTILINE,
+)
+# A BEGIN marker's rest is exactly name + "-->" (a newline must follow);
+# an END marker's rest is name + "-->" + anything.
+_BEGIN_TAIL_RE = re.compile(r"(?P<name>.*?)[ \t]*-->[ \t]*\r?")
+_END_TAIL_RE = re.compile(r"[ \t]*-->")
+
+
+class Region(NamedTuple):
+    """Offsets of one BEGIN/END pair in its document.
+
+    ``text[start:body_start]`` is the BEGIN line with its newline,
+    ``text[body_start:body_end]`` the body, and ``text[body_end:end]``
+    the newline before END plus the END marker — the begin/body/end
+    groups of :func:`_region_pattern`.
+    """
 
+    start: int
+    body_start: int
+    body_end: int
+    end: int
 
+
+@functools.lru_cache(maxsize=64)
 def _region_pattern(name: str) -> re.Pattern[str]:
+    """Compile a DOTALL pattern capturing the inner content of one region.
+
+    Group 'body' is everything between the newline after BEGIN and the
+    newline before END — never the marker lines themselves — so an
+    extract/replace round-trip is byte-identical. Drifted marker lines are
+    captured and re-emitted verbatim, never normalized.
+
+    This is the reference grammar: :func:`region_index` must find exactly
+    the spans this pattern's ``finditer`` does, and serves the names it
+    cannot index (see :func:`_indexable`).
+    """
     esc = re.escape(name)
+    # \r?\n so files with CRLF line endings (Windows / git autocrlf) parse
+    # too. The newline is captured inside begin/end and re-emitted verbatim,
+    # and the body group is preserved byte-for-byte regardless of ending.
     return re.compile(
         r"(?P<begin>^[ \t]*<!--[ \t]*BEGIN[ \t]+KIT-LOCAL:[ \t]*"
         + esc
@@ -31,9 +82,82 @@ def _region_pattern(name: str) -> re.Pattern[str]:
     )
 
 
+def _indexable(name: str) -> bool:
+    """Whether :func:`region_index` can answer for *name*.
+
+    A name with edge whitespace or a line break is ambiguous once the
+    marker's own ``[ \\t]*`` padding has been stripped; those (never
+    used in practice) go through :func:`_region_pattern` instead.
+    """
+    return name == name.strip(" \t") and "\n" not in name and "\r" not in name
+
+
+@functools.lru_cache(maxsize=16)
+def region_index(text: str) -> Mapping[str, tuple[Region, ...]]:
+    """Every BEGIN/END pair in *text*, by region name, from one scan.
+
+    Names appear in first-BEGIN order; a name whose BEGIN has no
+    matching END is absent. Pairing follows :func:`_region_pattern`
+    exactly: a BEGIN line must end in a newline, the body runs to the
+    FIRST later END of the same name (never the line right after BEGIN
+    — that newline belongs to BEGIN), and repeated regions are
+    non-overlapping, left to right. Read-only and cached per text, so
+    several lookups against one document scan it once.
+    """
+    begins: dict[str, list[tuple[int, int]]] = {}
+    ends: list[tuple[int, int, str]] = []  # (line start, rest start, rest)
+    for match in _MARKER_LINE_RE.finditer(text):
+        rest = match.group("rest")
+        if match.group("kind") == "END":
+            if match.start() > 0:  # END needs the newline before it
+                ends.append((match.start(), match.start("rest"), rest))
+            continue
+        tail = _BEGIN_TAIL_RE.fullmatch(rest)
+        if tail is None or match.end() == len(text):
+            continue  # not a well-formed BEGIN, or no newline after it
+        begins.setdefault(tail.group("name"), []).append(
+            (match.start(), match.end() + 1)
+        )
+
+    index: dict[str, tuple[Region, ...]] = {}
+    for name, lines in begins.items():
+        closers = []
+        for line_start, rest_start, rest in ends:
+            tail = _END_TAIL_RE.match(rest, len(name))
+            if tail is None or not rest.startswith(name):
+                continue
+            body_end = line_start - 1
+            if text[body_end - 1 : body_end] == "\r":
+                body_end -= 1
+            closers.append((body_end, rest_start + tail.end()))
+        regions = []
+        pos = 0
+        for start, body_start in lines:
+            if start < pos:
+                continue
+            closer = next((c for c in closers if c[0] >= body_start), None)
+            if closer is None:
+                break  # no END after this BEGIN, so none after later ones
+            regions.append(Region(start, body_start, *closer))
+            pos = closer[1]
+        if regions:
+            index[name] = tuple(regions)
+    return MappingProxyType(index)
+
+
+def _regions(text: str, name: str) -> tuple[Region, ...]:
+    """Every region *name* spans in *text*, in order."""
+    if _indexable(name):
+        return region_index(text).get(name, ())
+    return tuple(
+        Region(m.start(), m.end("begin"), m.start("end"), m.end())
+        for m in _region_pattern(name).finditer(text)
+    )
+
+
 def extract_region(text: str, name: str) -> str | None:
     """Return the inner content of region *name*, or ``None`` if absent."""
-    match = _region_pattern(name).search(text)
-    if match is None:
+    regions = _regions(text, name)
+    if not regions:
         return None
-    return match.group("body")
+    return text[regions[0].body_start : regions[0].body_end]
@@ -11,6 +11,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 
 @dataclass(frozen=True)
@@ -82,3 +84,64 @@ class MetadataSyncNote:
     path: Path
     action: str  # "updated" | "skipped" | "warned"
     detail: str = ""
+
+
+@dataclass(frozen=True)
+class WorktreeEntry:
+    """One record of ``git worktree list --porcelain`` (gitio → callers).
+
+    ``branch`` is the short name (``feature/KIT-0001-x``), ``None`` on a
+    detached HEAD or a bare entry. ``path`` is exactly what git
+    recorded — callers comparing it against a path of their own must
+    normalize both sides.
+    """
+
+    path: Path
+    head: str | None
+    branch: str | None
+    bare: bool = False
+    detached: bool = False
+    locked: bool = False
+    prunable: bool = False
+
+
+@dataclass(frozen=True)
+class WorktreeReport:
+    """One task worktree joined against its task (inventory → CLI)."""
+
+    path: Path
+    branch: str | None
+    task_id: str | None
+    task_folder: str | None  # None when no task file matches
+    venv_bytes: int
+    # Closed task (lifecycle.CLOSED_FOLDERS) or a registration whose
+    # directory is already gone.
+    collectable: bool
+    prunable: bool = False
+
+
+@dataclass(frozen=True)
+class ClaudeMd:
+    """A project's CLAUDE.md, read and scanned once (claude_md → readers).
+
+    ``sections`` maps each level-2 heading's title (``## Target
+    Repository`` -> ``"Target Repository"``) to its body lines, up to
+    the next level-2 heading. ``regions`` maps each KIT-LOCAL region's
+    name to its body. For a repeated heading or region the first one
+    wins, as it did for every reader before. Both mappings are
+    read-only views.
+    """
+
+    path: Path
+    exists: bool = False
+    text: str = ""
+    # Exception class name when the file exists but could not be read.
+    error: str | None = None
+    sections: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    regions: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    def section(self, title: str) -> str | None:
+        return self.sections.get(title)
+
+    def region(self, name: str) -> str | None:
+        return self.regions.get(name)
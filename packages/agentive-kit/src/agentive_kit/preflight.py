@@ -33,9 +33,10 @@ Verdict semantics carried over intact:
 Documented divergences from the bash original (each named in the
 KIT-0091 PR body; everything else is matrix-pinned):
 
-- The ``bots:`` declaration is read in-package (``agentive_kit
-  .markers``, conformance-pinned to ``scripts/local/kit_markers.py``)
-  instead of shelling out to that script — the bash version silently
+- The ``bots:`` declaration is read in-package (the ``claude_md``
+  model's regions, from ``agentive_kit.markers``, conformance-pinned
+  to ``scripts/local/kit_markers.py``) instead of shelling out to that
+  script — the bash version silently
   skipped the declaration when the script or python3 was missing.
 - Gate 5's multi-match pick is sorted (deterministic) where the bash
   ``find | head -1`` was filesystem-order arbitrary; Gate 7 already
@@ -61,9 +62,9 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 
-from agentive_kit import ghio, gitio, markers, target_repo
+from agentive_kit import claude_md, ghio, gitio, target_repo, trace
 from agentive_kit.models import GateResult
-from agentive_kit.root import RootNotFoundError, find_project_root
+from agentive_kit.root import ProjectContext, RootNotFoundError
 
 # Seam for the test harness (it replaced the bash script's stubbable
 # `sleep` binary): tests patch this to keep PENDING re-poll scenarios
@@ -211,14 +212,7 @@ def _read_bots_declaration(root: Path) -> tuple[str, bool]:
     (door normalize_bots, project _normalize_bots): one declaration must
     never be valid to one reader and invalid to another.
     """
-    claude_md = root / "CLAUDE.md"
-    if not claude_md.is_file():
-        return "", False
-    try:
-        text = claude_md.read_text(encoding="utf-8")
-    except OSError:
-        return "", False
-    region = markers.extract_region(text, "kit-install")
+    region = claude_md.load(root).region("kit-install")
     if region is None:
         return "", False
     declared = ""
@@ -314,6 +308,7 @@ def _gh_text(result: subprocess.CompletedProcess | None) -> str:
     return result.stdout.rstrip("\n")
 
 
+@trace.traced("gate")
 def _gate_1_ci(latest_sha: str, repo_flag: str | None) -> GateResult:
     """CI green — every workflow run for the head commit (KIT-0034/0043).
 
@@ -487,6 +482,7 @@ def _last_review_on(reviews: list[dict], author_re: str, shas: tuple[str, ...])
     return found
 
 
+@trace.traced("gate")
 def _gate_2_coderabbit(
     *,
     declared: str,
@@ -578,6 +574,7 @@ def _gate_2_coderabbit(
     )
 
 
+@trace.traced("gate")
 def _gate_3_bugbot(
     *,
     declared: str,
@@ -663,6 +660,7 @@ def _gate_3_bugbot(
     )
 
 
+@trace.traced("gate")
 def _gate_4_threads(
     pr_data: dict | None,
     total: int | None,
@@ -702,6 +700,7 @@ def _first_nonempty_file(candidates: list[Path]) -> Path | None:
     return None
 
 
+@trace.traced("gate")
 def _gate_5_evaluator(root: Path, task_id: str) -> GateResult:
     """Evaluator review persisted — canonical output naming patterns;
     an empty file (botched write, bare touch) is not a persisted review
@@ -731,6 +730,7 @@ def _gate_5_evaluator(root: Path, task_id: str) -> GateResult:
     )
 
 
+@trace.traced("gate")
 def _gate_6_starter(root: Path, task_id: str) -> GateResult:
     context_dir = root / ".kit" / "context"
     candidates = (
@@ -752,6 +752,7 @@ def _gate_6_starter(root: Path, task_id: str) -> GateResult:
     )
 
 
+@trace.traced("gate")
 def _gate_7_task_folder(root: Path, task_id: str) -> GateResult:
     """Task in 3-in-progress or 4-in-review. "{task}-*": the "-" is the
     boundary that stops KIT-4 matching KIT-40's file (KIT-0043 F3);
@@ -810,7 +811,7 @@ def _emit_dispatch_event(
         pass
 
 
-def main(argv: list[str] | None = None) -> None:
+def main(argv: list[str] | None = None, ctx: ProjectContext | None = None) -> None:
     args = _parse_args(sys.argv[1:] if argv is None else argv)
 
     if not ghio.gh_available():
@@ -823,7 +824,7 @@ def main(argv: list[str] | None = None) -> None:
         sys.exit(1)
 
     try:
-        root = find_project_root()
+        root = (ctx or ProjectContext()).root
     except RootNotFoundError as exc:
         print(exc)
         sys.exit(1)
@@ -849,7 +850,11 @@ def main(argv: list[str] | None = None) -> None:
     repo_flag = target.repo or None
     git_dir = Path(root, target.path) if target.path else root
 
-    branch = gitio.current_branch(git_dir)
+    # One rev-parse answers the branch AND the origin/main check below.
+    git = gitio.GitSession(git_dir)
+    head = git.head_and_refs(["origin/main"])
+    git.close()
+    branch = head[0] if head else None
     if not branch:
         print("ERROR: Could not determine current branch")
         sys.exit(1)
@@ -910,8 +915,7 @@ def main(argv: list[str] | None = None) -> None:
     # Latest code commit for the bot gates: bots don't re-review
     # markdown-only pushes, so Gates 2-3 check the newest commit that
     # touched non-markdown, non-planner files. Gate 1 still checks HEAD.
-    origin_main = gitio.run_git(git_dir, "rev-parse", "--verify", "origin/main")
-    if origin_main is None or origin_main.returncode != 0:
+    if not head[1]["origin/main"]:
         print("ERROR: origin/main not found. Run: git fetch origin main")
         # Guard on target.path (not target.repo) — a --repo override
         # leaves the path empty, and "(target repo path: )" would
@@ -920,8 +924,7 @@ def main(argv: list[str] | None = None) -> None:
             print(f"       (target repo path: {target.path})")
         sys.exit(1)
 
-    code_log = gitio.run_git(
-        git_dir,
+    code_log = git.run(
         "log",
         "--diff-filter=ACDMR",
         "--format=%H",
@@ -0,0 +1,187 @@
+"""Subprocess accounting: how many processes a command spawns, and how long.
+
+The package's external calls funnel through three choke points:
+``gitio`` (``GitSession.run`` and its ``cat-file`` readers),
+``ghio.run_gh`` and the door's ``_run``. Each wraps its child in
+:func:`call`. While accounting is on, every call is added to a
+counter keyed by its argv prefix (``git rev-parse``, ``gh pr``,
+``claude plugin``). The counter keeps the call count, the total and
+max latency, and the number of timeouts.
+
+Two ways to turn it on:
+
+- ``agentive --stats <command>`` prints a summary table on stderr at
+  the end of the run, sorted by total time.
+- Tests use ``with procstats.counting() as calls:`` to set spawn
+  budgets, e.g. ``assert calls.count("git") <= 2``.
+
+Only this process is counted. A Python child the command starts (the
+door's nested CLI run) is one entry here; the calls that child makes
+itself are not added. Disabled cost is the same as
+``agentive_kit.trace``: one module-global check that returns a shared
+no-op.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import subprocess
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence
+
+# Options whose next argv element is their value, not a subcommand.
+_VALUED_OPTIONS = frozenset({"-C", "-c", "--repo", "-R"})
+
+
+@dataclass
+class CallStats:
+    """Counters for one argv prefix; latencies in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    timeouts: int = 0
+
+    def add(self, elapsed: float, timed_out: bool) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.timeouts += timed_out
+
+
+@dataclass
+class Accounting:
+    """Every call recorded while accounting was on, by argv prefix."""
+
+    by_prefix: dict[str, CallStats] = field(default_factory=dict)
+
+    def add(self, key: str, elapsed: float, timed_out: bool = False) -> None:
+        self.by_prefix.setdefault(key, CallStats()).add(elapsed, timed_out)
+
+    def merge(self, other: Accounting) -> None:
+        for key, stats in other.by_prefix.items():
+            mine = self.by_prefix.setdefault(key, CallStats())
+            mine.count += stats.count
+            mine.total += stats.total
+            mine.max = max(mine.max, stats.max)
+            mine.timeouts += stats.timeouts
+
+    def count(self, prefix: str = "") -> int:
+        """Calls whose key is *prefix* or starts with ``prefix + " "``."""
+        return sum(
+            s.count
+            for key, s in self.by_prefix.items()
+            if not prefix or key == prefix or key.startswith(prefix + " ")
+        )
+
+    def summary(self) -> str:
+        """The ``--stats`` table, slowest prefix first."""
+        total = sum(s.total for s in self.by_prefix.values())
+        lines = [f"subprocess calls: {self.count()} ({total:.3f}s)"]
+        if self.by_prefix:
+            lines.append(
+                f"  {'calls':>5}  {'total':>8}  {'max':>8}  {'timeouts':>8}  command"
+            )
+        ranked = sorted(self.by_prefix.items(), key=lambda kv: -kv[1].total)
+        for key, s in ranked:
+            lines.append(
+                f"  {s.count:>5}  {s.total:>7.3f}s  {s.max:>7.3f}s"
+                f"  {s.timeouts:>8}  {key}"
+            )
+        return "\n".join(lines)
+
+
+# The accounting in progress; None while off.
+_active: Accounting | None = None
+
+
+class _NullCall:
+    """The disabled call: a reusable context manager that does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_CALL = _NullCall()
+
+
+class _Call:
+    __slots__ = ("key", "start")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        accounting = _active
+        if accounting is not None:
+            elapsed = time.perf_counter() - self.start
+            timed_out = isinstance(exc, subprocess.TimeoutExpired)
+            accounting.add(self.key, elapsed, timed_out)
+
+
+def command_key(argv: Sequence[str], depth: int = 2) -> str:
+    """The argv prefix a call is counted under.
+
+    The program's basename plus up to *depth* - 1 following words,
+    skipping options (and the value of ``-C``/``--repo``-style ones):
+    ``git -C /x rev-parse HEAD`` -> ``git rev-parse``. A script path
+    is shortened to its basename (``bash /kit/engine.sh`` ->
+    ``bash engine.sh``).
+    """
+    if not argv:
+        return ""
+    words = [os.path.basename(argv[0])]
+    rest = iter(argv[1:])
+    for arg in rest:
+        if len(words) >= depth:
+            break
+        if arg in _VALUED_OPTIONS:
+            next(rest, None)
+        elif not arg.startswith("-"):
+            words.append(os.path.basename(arg) if "/" in arg else arg)
+    return " ".join(words)
+
+
+def enabled() -> bool:
+    """True while calls are being counted."""
+    return _active is not None
+
+
+def call(argv: Sequence[str]) -> _Call | _NullCall:
+    """Context manager counting its block as one run of *argv*.
+
+    A ``subprocess.TimeoutExpired`` leaving the block is counted as a
+    timeout and propagates unchanged.
+    """
+    if _active is None:
+        return _NULL_CALL
+    return _Call(command_key(argv))
+
+
+@contextlib.contextmanager
+def counting() -> Iterator[Accounting]:
+    """Count the calls made inside the block.
+
+    Nests: an enclosing accounting also receives the inner block's
+    calls when the block ends.
+    """
+    global _active
+    outer, inner = _active, Accounting()
+    _active = inner
+    try:
+        yield inner
+    finally:
+        _active = outer
+        if outer is not None:
+            outer.merge(inner)
@@ -34,7 +34,7 @@ import sys
 from pathlib import Path
 
 from agentive_kit import ghio, gitio, target_repo
-from agentive_kit.root import RootNotFoundError, find_project_root
+from agentive_kit.root import ProjectContext, RootNotFoundError
 
 # ── prepare-review-input ─────────────────────────────────────────────────
 
@@ -174,9 +174,9 @@ def _parse_main_args(argv: list[str]) -> tuple[str, str, str]:
     return task_id, base_branch, fmt
 
 
-def _git_out(repo_dir: Path, *args: str) -> str | None:
+def _git_out(git: gitio.GitSession, *args: str) -> str | None:
     """stdout of a successful git call, else None (surfacing stderr)."""
-    result = gitio.run_git(repo_dir, *args, timeout=60)
+    result = git.run(*args, timeout=60)
     if result is None:
         return None
     if result.returncode != 0:
@@ -240,7 +240,7 @@ def _file_section(file_path: str, fs_path: Path) -> str:
     return header + f"````{lang}\n{content}````\n\n"
 
 
-def main(argv: list[str] | None = None) -> None:
+def main(argv: list[str] | None = None, ctx: ProjectContext | None = None) -> None:
     task_id, base_branch, fmt = _parse_main_args(sys.argv[1:] if argv is None else argv)
 
     if not task_id:
@@ -256,7 +256,7 @@ def main(argv: list[str] | None = None) -> None:
         sys.exit(1)
 
     try:
-        root = find_project_root()
+        root = (ctx or ProjectContext()).root
     except RootNotFoundError as exc:
         print(exc, file=sys.stderr)
         sys.exit(1)
@@ -290,12 +290,13 @@ def main(argv: list[str] | None = None) -> None:
         diff_source_label = target.path
         diff_dir = tree
 
-    head_branch = gitio.current_branch(diff_dir) or "(detached HEAD)"
-
-    verify = gitio.run_git(
-        diff_dir, "rev-parse", "--verify", "--quiet", base_branch, timeout=60
-    )
-    if verify is None or verify.returncode != 0:
+    # One session for the whole diff: the scrubbed env is built once, and
+    # one rev-parse answers both the branch and the base check.
+    git = gitio.GitSession(diff_dir, timeout=60)
+    head = git.head_and_refs([base_branch])
+    git.close()
+    head_branch = (head[0] if head else None) or "(detached HEAD)"
+    if not head or not head[1][base_branch]:
         _err(
             f"ERROR: base branch '{base_branch}' not found in {diff_source_label}",
             "Pass --base <branch> to pick a different base.",
@@ -304,7 +305,7 @@ def main(argv: list[str] | None = None) -> None:
 
     # `A...B` (three dots): diff HEAD against the merge-base, excluding
     # base-branch changes after the feature branched off.
-    diff_content = _git_out(diff_dir, "diff", f"{base_branch}...HEAD")
+    diff_content = _git_out(git, "diff", f"{base_branch}...HEAD")
     if diff_content is None:
         _err(f"ERROR: git diff '{base_branch}...HEAD' failed in {diff_source_label}")
         sys.exit(1)
@@ -312,9 +313,7 @@ def main(argv: list[str] | None = None) -> None:
         _err(f"WARNING: No diff between {base_branch} and HEAD in {diff_source_label}")
         _err("Have you committed your changes?")
 
-    changed_status = _git_out(
-        diff_dir, "diff", "--name-status", f"{base_branch}...HEAD"
-    )
+    changed_status = _git_out(git, "diff", "--name-status", f"{base_branch}...HEAD")
     if changed_status is None:
         _err(
             f"ERROR: git diff --name-status '{base_branch}...HEAD' failed "
@@ -550,7 +549,9 @@ def _detect_helper_repo(root: Path, override: str) -> str:
     return repo
 
 
-def helper_main(argv: list[str] | None = None) -> None:
+def helper_main(
+    argv: list[str] | None = None, ctx: ProjectContext | None = None
+) -> None:
     args = list(sys.argv[1:] if argv is None else argv)
 
     repo_override = ""
@@ -593,7 +594,7 @@ def helper_main(argv: list[str] | None = None) -> None:
         sys.exit(0)
 
     try:
-        root = find_project_root()
+        root = (ctx or ProjectContext()).root
     except RootNotFoundError as exc:
         print(exc, file=sys.stderr)
         sys.exit(2)
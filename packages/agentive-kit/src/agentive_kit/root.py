@@ -17,6 +17,19 @@ consumer, carries no ``kit-install`` marker region in its CLAUDE.md.
 That is why the marker alone is NOT the discovery test; the marker
 stays what it always was — the shape/profile record that doctor reads
 once a root is found.
+
+The walk stats two markers per ancestor. That adds up on slow
+(NFS-mounted) home directories, so discovery is cheap on repeat:
+
+- ``AGENTIVE_ROOT`` names the root up front. When the start directory
+  is at or below it, the hint costs only the validation of its own two
+  markers. It is trusted as given: a nested kit project below it is not
+  looked for. A hint that is not a root, or that does not contain the
+  start directory, is ignored, and the walk runs as usual.
+- Each process remembers the root found for each start directory, so
+  rediscovery is free. Refusals are not remembered.
+- :class:`ProjectContext` is the one discovery a command shares. The
+  CLI builds it once per run and hands it to every subcommand.
 """
 
 from __future__ import annotations
@@ -24,6 +37,11 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+ROOT_ENV = "AGENTIVE_ROOT"
+
+# start directory (absolute) -> the root found for it, this process.
+_found: dict[Path, Path] = {}
+
 
 class RootNotFoundError(Exception):
     """Raised when no kit project root exists at or above the start dir.
@@ -54,6 +72,9 @@ def find_project_root(start: Path | None = None) -> Path:
     invoked through a relative path or a symlinked working directory;
     a worktree checkout needs nothing special — it carries the full
     tree, so the walk finds its own root, never the primary clone's.
+
+    Checks the per-process memo first, then the ``AGENTIVE_ROOT``
+    hint, then walks (see the module docstring).
     """
     if start is None:
         # Path.cwd() raises FileNotFoundError if the CWD was deleted
@@ -61,12 +82,53 @@ def find_project_root(start: Path | None = None) -> Path:
         # sensible root to discover from a nonexistent directory.
         start = Path.cwd()
     current = Path(os.path.abspath(start))
+    root = _found.get(current)
+    if root is None:
+        root = _from_hint(current) or _walk(current)
+        _found[current] = root
+    return root
+
+
+def _from_hint(current: Path) -> Path | None:
+    """The ``AGENTIVE_ROOT`` root when it is one and contains *current*."""
+    hint = os.environ.get(ROOT_ENV)
+    if not hint:
+        return None
+    root = Path(os.path.abspath(hint))
+    if (current == root or root in current.parents) and _is_project_root(root):
+        return root
+    return None
+
+
+def _walk(current: Path) -> Path:
     for candidate in (current, *current.parents):
         if _is_project_root(candidate):
             return candidate
     raise RootNotFoundError(current)
 
 
+class ProjectContext:
+    """One command's project root, discovered on first use and shared.
+
+    Built once per CLI run and passed to each subcommand. A subcommand
+    that never needs the root (``new``, ``help``) never pays for it.
+    The ones that do, read :attr:`root` at the point they always
+    discovered it. So the order of their own checks and messages is
+    unchanged.
+    """
+
+    def __init__(self, start: Path | None = None):
+        self.start = start
+        self._root: Path | None = None
+
+    @property
+    def root(self) -> Path:
+        """The project root; raises :class:`RootNotFoundError`."""
+        if self._root is None:
+            self._root = find_project_root(self.start)
+        return self._root
+
+
 def _is_project_root(candidate: Path) -> bool:
     """True when ``candidate`` carries both root markers.
 
@@ -9,7 +9,9 @@ backticks) unless an explicit ``--repo`` override wins.
 Behavior pinned by the preflight and review-input parity matrices:
 
 - CRLF-checked-out CLAUDE.md parses (the bash awk header pattern's
-  ``[[:space:]]*`` swallowed a CR — o3, PR 1 round 2).
+  ``[[:space:]]*`` swallowed a CR — o3, PR 1 round 2). The section
+  itself comes from the shared ``claude_md`` model, whose heading rule
+  also ignores the CR.
 - Bullet values are matched per-LINE, mirroring the sed originals
   (greedy last-backtick-span on the line, first matching line wins);
   a multiline regex would let ``[^`]*`` cross newlines and capture
@@ -31,6 +33,8 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+from agentive_kit import claude_md
+
 
 @dataclass
 class TargetRepo:
@@ -54,27 +58,17 @@ def resolve(root: Path, override: str = "") -> TargetRepo:
         # Path stays empty on override: the caller knows the repo but
         # not necessarily the local working tree.
     else:
-        claude_md = root / "CLAUDE.md"
-        if claude_md.is_file():
-            try:
-                text = claude_md.read_text(encoding="utf-8")
-            except OSError:
-                text = ""
-            section_match = re.search(
-                r"^## Target Repository[ \t]*\r?$(.*?)(?=^## |\Z)",
-                text,
-                re.MULTILINE | re.DOTALL,
-            )
-            if section_match:
-                for line in section_match.group(1).splitlines():
-                    if not target.repo:
-                        gh_match = re.match(r"- \*\*GitHub\*\*:.*`([^`]*)`", line)
-                        if gh_match:
-                            target.repo = gh_match.group(1)
-                    if not target.path:
-                        path_match = re.match(r"- \*\*Path\*\*:.*`([^`]*)`", line)
-                        if path_match:
-                            target.path = path_match.group(1)
+        section = claude_md.load(root).section("Target Repository")
+        if section is not None:
+            for line in section.splitlines():
+                if not target.repo:
+                    gh_match = re.match(r"- \*\*GitHub\*\*:.*`([^`]*)`", line)
+                    if gh_match:
+                        target.repo = gh_match.group(1)
+                if not target.path:
+                    path_match = re.match(r"- \*\*Path\*\*:.*`([^`]*)`", line)
+                    if path_match:
+                        target.path = path_match.group(1)
 
     if target.repo and not re.match(r"^[^/\s]+/[^/\s]+$", target.repo):
         print(
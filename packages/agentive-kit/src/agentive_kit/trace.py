@@ -0,0 +1,199 @@
+"""Opt-in performance tracing: Chrome trace-event JSON (``AGENTIVE_TRACE``).
+
+``AGENTIVE_TRACE=/tmp/doctor.json agentive doctor`` records a span
+for every git and gh call, every preflight gate, every doctor check
+and every task-tree scan, then writes them at exit. Open the file in
+https://ui.perfetto.dev or ``chrome://tracing`` to see where a slow
+command spends its time.
+
+File format: the trace-event "JSON Array Format", written
+append-only. The first writer creates the file holding just ``[``,
+and every process then appends its events as one ``write`` of
+``{...},`` lines at exit. The closing ``]`` and the trailing comma are
+both optional in that format. So a command and the Python processes
+it starts (doctor checks, the door's engines) all share one trace.
+Tracing the same path again adds to it; delete the file to start over.
+
+Disabled cost: ``span()`` checks one module global and returns a
+shared no-op context manager, with no clock read and no allocation
+beyond the call's own arguments. Error strategy: tracing never fails
+the command; an unwritable trace file is reported on stderr at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+TRACE_ENV = "AGENTIVE_TRACE"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The trace file and this process's buffered events; both None while
+# tracing is off. Events are plain dicts appended under the GIL.
+_path: str | None = None
+_events: list[dict[str, Any]] | None = None
+
+
+class _NullSpan:
+    """The disabled span: a reusable context manager that does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """One complete ("ph": "X") event, timed from enter to exit."""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict[str, Any]):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        end = time.perf_counter_ns()
+        events = _events
+        if events is None:  # tracing stopped inside the span
+            return
+        if isinstance(exc, SystemExit):
+            self.args["exit"] = exc.code
+        elif exc_type is not None:
+            self.args["error"] = getattr(exc_type, "__name__", str(exc_type))
+        event = {
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+        }
+        if self.args:
+            event["args"] = self.args
+        events.append(event)
+
+
+def enabled() -> bool:
+    """True while this process is recording."""
+    return _events is not None
+
+
+def span(name: str, cat: str = "agentive", **args: Any) -> _Span | _NullSpan:
+    """Context manager timing its block as one trace event.
+
+    *cat* groups events in the viewer (``git``, ``gh``, ``gate``,
+    ``check``, ``scan``, ``command``); keyword *args* are shown with the
+    event. An exception leaving the block propagates unchanged and is
+    recorded as ``args.error`` (a ``SystemExit`` as ``args.exit``).
+    """
+    if _events is None:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+
+def traced(cat: str = "agentive", name: str | None = None) -> Callable[[F], F]:
+    """Decorator form of :func:`span`, named after the function."""
+
+    def decorate(func: F) -> F:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _events is None:
+                return func(*args, **kwargs)
+            with _Span(label, cat, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def start(path: str | os.PathLike[str]) -> None:
+    """Record from now on; events go to *path* at :func:`flush`/exit."""
+    global _path, _events
+    if _events is None:
+        atexit.register(flush)
+    _path = os.fspath(path)
+    _events = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": " ".join(_command_name())},
+        }
+    ]
+
+
+def stop() -> None:
+    """Write what was recorded and stop recording."""
+    global _path, _events
+    flush()
+    atexit.unregister(flush)
+    _path = _events = None
+
+
+def _command_name() -> list[str]:
+    argv = sys.argv or ["python"]
+    return [os.path.basename(argv[0]), *argv[1:3]]
+
+
+def _create(path: str) -> None:
+    """Create *path* holding ``[``, unless it exists — atomically, so two
+    processes starting a trace together cannot both write the header."""
+    if os.path.exists(path):
+        return
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as handle:
+        handle.write("[\n")
+    try:
+        os.link(tmp, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.unlink(tmp)
+
+
+def flush() -> None:
+    """Append the buffered events to the trace file (one write)."""
+    if _path is None or not _events:
+        return
+    events = _events[:]
+    del _events[:]
+    payload = "".join(json.dumps(e, separators=(",", ":")) + ",\n" for e in events)
+    try:
+        _create(_path)
+        fd = os.open(_path, os.O_WRONLY | os.O_APPEND)
+        try:
+            data = payload.encode("utf-8")
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        print(f"agentive: cannot write trace {_path}: {exc}", file=sys.stderr)
+
+
+if os.environ.get(TRACE_ENV):
+    start(os.environ[TRACE_ENV])
@@ -18,6 +18,11 @@ Provisioning contract carried over verbatim:
   primary's). A real per-worktree venv is provisioned via the
   checkout's own ``project setup --no-hooks`` (hooks live in the
   SHARED common dir); failure is non-fatal by design.
+- The venv template cache (``VENV_TEMPLATE_DIR`` in the primary) is a
+  COPY source, never a link target: a clone gets real files (hardlinks
+  for immutable payload, rewritten copies for anything that names the
+  venv's path), so a worktree rebuilding its venv can never reach
+  back into the template — the KIT-0065 rule, kept.
 - Serena gets a worktree-local project.yml with a per-worktree name —
   name-based activation resolves to the PRIMARY clone (KIT-0069), so
   sessions must activate by absolute path.
@@ -28,8 +33,12 @@ Provisioning contract carried over verbatim:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 import shlex
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -48,6 +57,40 @@ PROVISION_LINKS = (
 )
 
 
+# Per-dependency-hash venv templates, kept in the PRIMARY clone (under
+# the gitignored .kit/.cache). A worktree whose dependency inputs hash
+# to an existing template gets a cloned venv in seconds; a new hash
+# falls back to the full `project setup --no-hooks` and seeds the
+# template from its result.
+VENV_TEMPLATE_DIR = Path(".kit") / ".cache" / "venv-templates"
+
+# The files that decide what `project setup` installs. Enumerated like
+# PROVISION_LINKS: a lockfile format this list does not name keys
+# nothing, so a project using one silently gets the full setup —
+# slower, never wrong. The kit repo's setup also dev-installs the
+# in-repo agentive-kit package, so its pyproject.toml is an input too.
+VENV_TEMPLATE_INPUTS = (
+    "pyproject.toml",
+    "uv.lock",
+    "poetry.lock",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "packages/agentive-kit/pyproject.toml",
+)
+
+# Bumped whenever the clone recipe changes shape, so templates seeded
+# by an older recipe are never cloned by a newer one.
+_VENV_TEMPLATE_FORMAT = "1"
+
+# Written into every venv provisioned under a template key, so a pooled
+# worktree can tell whether its venv still matches its checkout.
+VENV_KEY_MARKER = "agentive-venv-key"
+
+# Written last into a seeded template: a directory without it is a
+# half-seeded leftover and is never cloned from.
+_VENV_TEMPLATE_META = "agentive-template.json"
+
+
 def _fail(*lines: str) -> NoReturn:
     for line in lines:
         print(line, file=sys.stderr)
@@ -108,10 +151,10 @@ def derive_slug(primary_root: Path, task_id: str) -> str:
 
 
 def _recovery_lines(primary_root: Path, worktree_path: Path, branch: str) -> list[str]:
-    return [
-        f"  git -C {primary_root} worktree remove --force {worktree_path}",
-        f"  git -C {primary_root} branch -D {branch}",
-    ]
+    lines = [f"  git -C {primary_root} worktree remove --force {worktree_path}"]
+    if branch:  # pool slots sit on a detached HEAD — no branch to drop
+        lines.append(f"  git -C {primary_root} branch -D {branch}")
+    return lines
 
 
 def _provision_links(primary_root: Path, worktree_path: Path, branch: str) -> None:
@@ -160,13 +203,207 @@ def _generate_serena_config(
     print(f"Serena config generated (project_name: {serena_name})")
 
 
-def _provision_venv(worktree_path: Path) -> None:
-    """Real per-worktree venv via the checkout's own project script
-    (KIT-0065: never a symlink; KIT-0071: --no-hooks because hooks are
-    shared with the primary). Non-fatal: a network hiccup must not
-    scrap the worktree."""
-    print()
-    print("Provisioning per-worktree venv (real venv, never a symlink)...")
+def venv_template_key(checkout: Path) -> str | None:
+    """Dependency hash a venv template is keyed by, or ``None``.
+
+    Covers every present ``VENV_TEMPLATE_INPUTS`` file (name and
+    content), the interpreter tag (a template built by 3.12 is useless
+    to 3.13) and the clone-recipe format. ``None`` when the checkout
+    carries none of the inputs — nothing to key on, so no caching.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"format={_VENV_TEMPLATE_FORMAT}\n".encode())
+    digest.update(f"python={sys.implementation.cache_tag}\n".encode())
+    found = False
+    for name in VENV_TEMPLATE_INPUTS:
+        path = checkout / name
+        if not path.is_file():
+            continue
+        found = True
+        digest.update(f"{name}\0".encode())
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16] if found else None
+
+
+def _needs_rewrite(rel: Path) -> bool:
+    """True for venv files that may embed the venv's absolute path.
+
+    ``bin/`` (console-script shebangs, activate scripts), ``pyvenv.cfg``
+    (its ``command =`` line), and the editable-install plumbing at the
+    top of site-packages (``*.pth``, ``__editable__*`` finders,
+    ``direct_url.json``). Everything else is path-free payload and is
+    hardlinked.
+    """
+    parts = rel.parts
+    if parts == ("pyvenv.cfg",) or parts[0] in ("bin", "Scripts"):
+        return True
+    if rel.name == "direct_url.json":
+        return True
+    if len(parts) >= 2 and parts[-2] == "site-packages":
+        return rel.suffix == ".pth" or rel.name.startswith("__editable__")
+    return False
+
+
+def _clone_tree(
+    src: Path, dst: Path, old_root: str, new_root: str, *, link: bool = True
+) -> None:
+    """Copy the venv at *src* to *dst*, rewriting *old_root* paths.
+
+    Symlinks are recreated verbatim (``bin/python`` points at the base
+    interpreter), path-bearing files are rewritten into fresh copies,
+    and with *link* the rest is hardlinked — falling back to a plain
+    copy where hardlinks are unavailable (cross-device cache, odd
+    filesystem). Seeding passes ``link=False``: the template must never
+    share inodes with a live worktree venv.
+    """
+    old = old_root.encode()
+    new = new_root.encode()
+    for dirpath, subdirs, filenames in os.walk(src):
+        here = Path(dirpath)
+        rel_dir = here.relative_to(src)
+        (dst / rel_dir).mkdir(parents=True, exist_ok=True)
+        for name in subdirs + filenames:
+            source = here / name
+            target = dst / rel_dir / name
+            if source.is_symlink():
+                pointer = os.readlink(source)
+                target.symlink_to(pointer.replace(old_root, new_root))
+                if name in subdirs:
+                    subdirs.remove(name)
+                continue
+            if name in subdirs:
+                continue
+            rel = rel_dir / name
+            if _needs_rewrite(rel):
+                data = source.read_bytes()
+                target.write_bytes(data.replace(old, new))
+                shutil.copymode(source, target)
+                continue
+            if link:
+                try:
+                    os.link(source, target)
+                    continue
+                except OSError:
+                    pass
+            shutil.copy2(source, target)
+
+
+def relocate_venv(venv_dir: Path, old_root: str, new_root: str) -> None:
+    """Rewrite a venv's path-bearing files after its checkout moved.
+
+    The in-place twin of the template clone: the same files
+    ``_needs_rewrite`` names are rewritten (through a fresh file, so a
+    hardlink shared with a template is broken, never written through)
+    and symlinks naming *old_root* are re-pointed.
+    """
+    if not venv_dir.is_dir() or venv_dir.is_symlink():
+        return
+    old = old_root.encode()
+    new = new_root.encode()
+    for dirpath, subdirs, filenames in os.walk(venv_dir):
+        here = Path(dirpath)
+        rel_dir = here.relative_to(venv_dir)
+        for name in subdirs + filenames:
+            path = here / name
+            if path.is_symlink():
+                pointer = os.readlink(path)
+                if old_root in pointer:
+                    path.unlink()
+                    path.symlink_to(pointer.replace(old_root, new_root))
+                continue
+            if name in subdirs or not _needs_rewrite(rel_dir / name):
+                continue
+            data = path.read_bytes()
+            if old not in data:
+                continue
+            staged = path.with_name(f".{name}.relocate")
+            staged.write_bytes(data.replace(old, new))
+            shutil.copymode(path, staged)
+            os.replace(staged, path)
+
+
+def venv_matches_checkout(worktree_path: Path) -> bool:
+    """True when the worktree's venv was provisioned for its current
+    dependency hash (the marker ``_provision_venv`` writes)."""
+    key = venv_template_key(worktree_path)
+    try:
+        recorded = (worktree_path / ".venv" / VENV_KEY_MARKER).read_text(
+            encoding="utf-8"
+        )
+    except OSError:
+        return False
+    return key is not None and recorded.strip() == key
+
+
+def _clone_venv_template(template: Path, worktree_path: Path) -> bool:
+    """Materialize ``<worktree>/.venv`` from *template*; True on success.
+
+    A failed clone removes its partial ``.venv`` so the full-setup
+    fallback starts from nothing (``project setup`` refuses nothing
+    here, but a half venv with a valid ``bin/python`` would pass its
+    corruption check).
+    """
+    try:
+        meta = json.loads((template / _VENV_TEMPLATE_META).read_text(encoding="utf-8"))
+        source_root = meta["source_root"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    venv_dir = worktree_path / ".venv"
+    try:
+        _clone_tree(template / "venv", venv_dir, source_root, str(worktree_path))
+    except OSError:
+        shutil.rmtree(venv_dir, ignore_errors=True)
+        return False
+    if (venv_dir / "bin" / "python").exists():
+        return True
+    shutil.rmtree(venv_dir, ignore_errors=True)
+    return False
+
+
+def _seed_venv_template(templates_dir: Path, key: str, worktree_path: Path) -> None:
+    """Store a copy of a freshly built worktree venv as template *key*.
+
+    Best-effort: any failure leaves the worktree untouched and simply
+    means the next worktree runs the full setup too. Built under a
+    unique staging name and renamed into place, so concurrent seeders
+    race safely (the loser discards its copy) and a crash never
+    leaves a complete-looking template behind.
+    """
+    venv_dir = worktree_path / ".venv"
+    if venv_dir.is_symlink() or not (venv_dir / "bin" / "python").exists():
+        return
+    final = templates_dir / key
+    if final.exists():
+        return
+    staging = templates_dir / f".{key}.{os.getpid()}.tmp"
+    try:
+        templates_dir.mkdir(parents=True, exist_ok=True)
+        # Paths stay as built (no rewrite): the metadata records the
+        # root they name, and every clone rewrites from there.
+        _clone_tree(venv_dir, staging / "venv", "", "", link=False)
+        (staging / _VENV_TEMPLATE_META).write_text(
+            json.dumps({"source_root": str(worktree_path), "key": key}) + "\n",
+            encoding="utf-8",
+        )
+        staging.rename(final)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+    print(f"Venv template cached: {final}")
+
+
+def _record_venv_key(worktree_path: Path, key: str) -> None:
+    venv_dir = worktree_path / ".venv"
+    if venv_dir.is_dir() and not venv_dir.is_symlink():
+        try:
+            (venv_dir / VENV_KEY_MARKER).write_text(key + "\n", encoding="utf-8")
+        except OSError:
+            pass
+
+
+def _run_project_setup(worktree_path: Path) -> bool:
+    """The full ``project setup --no-hooks``; True on success."""
     try:
         result = subprocess.run(
             [
@@ -178,11 +415,41 @@ def _provision_venv(worktree_path: Path) -> None:
             stdin=subprocess.DEVNULL,
             timeout=600,
         )
-        ok = result.returncode == 0
+        return result.returncode == 0
     except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
-        ok = False
+        return False
+
+
+def _provision_venv(worktree_path: Path, primary_root: Path | None = None) -> None:
+    """Real per-worktree venv via the checkout's own project script
+    (KIT-0065: never a symlink; KIT-0071: --no-hooks because hooks are
+    shared with the primary). Non-fatal: a network hiccup must not
+    scrap the worktree.
+
+    With *primary_root*, the venv template cache is consulted first: a
+    template matching the checkout's dependency hash is cloned (seconds
+    instead of a full install); a miss runs the full setup and seeds
+    the template from its result for the next worktree.
+    """
+    print()
+    print("Provisioning per-worktree venv (real venv, never a symlink)...")
+    key = venv_template_key(worktree_path) if primary_root else None
+    templates_dir = primary_root / VENV_TEMPLATE_DIR if primary_root else None
+    if key and templates_dir is not None:
+        template = templates_dir / key
+        if (template / _VENV_TEMPLATE_META).is_file():
+            if _clone_venv_template(template, worktree_path):
+                _record_venv_key(worktree_path, key)
+                print(f"Venv ready: {worktree_path / '.venv'} (from template {key})")
+                return
+            print("Venv template clone failed — falling back to full setup.")
+
+    ok = _run_project_setup(worktree_path)
     if ok:
         print(f"Venv ready: {worktree_path / '.venv'}")
+        if key and templates_dir is not None:
+            _record_venv_key(worktree_path, key)
+            _seed_venv_template(templates_dir, key, worktree_path)
     else:
         print(
             "⚠️  venv provisioning failed — the worktree is still usable.",
@@ -202,6 +469,76 @@ def _provision_venv(worktree_path: Path) -> None:
         )
 
 
+def _provisioning_failed(
+    primary_root: Path, worktree_path: Path, branch: str, exc: OSError
+) -> NoReturn:
+    print("Provisioning failed — to retry from scratch:", file=sys.stderr)
+    for line in _recovery_lines(primary_root, worktree_path, branch):
+        print(line, file=sys.stderr)
+    print(f"  (cause: {exc})", file=sys.stderr)
+    sys.exit(1)
+
+
+def _create_worktree(
+    primary_root: Path, worktree_path: Path, branch: str, task_id: str
+) -> None:
+    """The cold path: ``worktree add`` from origin/main, then the full
+    provisioning recipe (links, Serena config, venv)."""
+    print(f"Creating worktree {worktree_path} on {branch} (from origin/main)...")
+    add = gitio.run_git(
+        primary_root,
+        "worktree",
+        "add",
+        str(worktree_path),
+        "-b",
+        branch,
+        "origin/main",
+        timeout=300,
+    )
+    if add is None or add.returncode != 0:
+        if add is not None and add.stderr:
+            sys.stderr.write(add.stderr)
+        _fail(f"Error: git worktree add failed for {worktree_path}")
+
+    # From here on a failure leaves a half-provisioned worktree — tell
+    # the operator how to reset (the bash ERR trap), never delete
+    # automatically.
+    try:
+        _provision_links(primary_root, worktree_path, branch)
+        _generate_serena_config(primary_root, worktree_path, task_id)
+    except OSError as exc:
+        _provisioning_failed(primary_root, worktree_path, branch, exc)
+
+    _provision_venv(worktree_path, primary_root)
+
+
+def provision_detached(primary_root: Path, worktree_path: Path) -> None:
+    """Provision a branchless worktree (a pool slot): the links and the
+    venv, but no Serena config — that carries a task ID, so it is
+    generated when the slot is claimed."""
+    try:
+        _provision_links(primary_root, worktree_path, "")
+    except OSError as exc:
+        _provisioning_failed(primary_root, worktree_path, "", exc)
+    _provision_venv(worktree_path, primary_root)
+
+
+def _refresh_pooled_venv(worktree_path: Path, primary_root: Path) -> None:
+    """Keep a claimed slot's venv when it still matches the checkout;
+    rebuild it (template first) when the slot never got one or the
+    dependency hash moved since the slot was warmed."""
+    venv_dir = worktree_path / ".venv"
+    stale = venv_template_key(worktree_path) is not None and not (
+        venv_matches_checkout(worktree_path)
+    )
+    if venv_dir.is_dir() and not venv_dir.is_symlink() and not stale:
+        print(f"Venv ready: {venv_dir} (pre-warmed)")
+        return
+    if venv_dir.is_dir() and not venv_dir.is_symlink():
+        shutil.rmtree(venv_dir, ignore_errors=True)
+    _provision_venv(worktree_path, primary_root)
+
+
 def main(argv: list[str] | None = None, anchor: Path | None = None) -> None:
     """Create a fully-provisioned per-task worktree.
 
@@ -275,38 +612,18 @@ def main(argv: list[str] | None = None, anchor: Path | None = None) -> None:
         )
 
     worktrees_dir.mkdir(parents=True, exist_ok=True)
-    print(f"Creating worktree {worktree_path} on {branch} (from origin/main)...")
-    add = gitio.run_git(
-        primary_root,
-        "worktree",
-        "add",
-        str(worktree_path),
-        "-b",
-        branch,
-        "origin/main",
-        timeout=300,
-    )
-    if add is None or add.returncode != 0:
-        if add is not None and add.stderr:
-            sys.stderr.write(add.stderr)
-        _fail(f"Error: git worktree add failed for {worktree_path}")
-
-    # From here on a failure leaves a half-provisioned worktree — tell
-    # the operator how to reset (the bash ERR trap), never delete
-    # automatically.
-    try:
-        _provision_links(primary_root, worktree_path, branch)
-        _generate_serena_config(primary_root, worktree_path, task_id)
-    except SystemExit:
-        raise
-    except OSError as exc:
-        print("Provisioning failed — to retry from scratch:", file=sys.stderr)
-        for line in _recovery_lines(primary_root, worktree_path, branch):
-            print(line, file=sys.stderr)
-        print(f"  (cause: {exc})", file=sys.stderr)
-        sys.exit(1)
-
-    _provision_venv(worktree_path)
+    # A pre-warmed pool slot, when one is idle, stands in for the add +
+    # provisioning below (agentive_kit.worktree_pool; no pool, no-op).
+    from agentive_kit import worktree_pool
+
+    if worktree_pool.claim(primary_root, worktree_path, branch):
+        try:
+            _generate_serena_config(primary_root, worktree_path, task_id)
+        except OSError as exc:
+            _provisioning_failed(primary_root, worktree_path, branch, exc)
+        _refresh_pooled_venv(worktree_path, primary_root)
+    else:
+        _create_worktree(primary_root, worktree_path, branch, task_id)
 
     print()
     print(f"✅ Worktree ready: {worktree_path} (branch: {branch})")
@@ -0,0 +1,258 @@
+"""Inventory and batch cleanup of per-task worktrees (``agentive worktrees``).
+
+``worktree.main`` creates one worktree per task under
+``ask-worktrees/``, each with a full venv; nothing removed them, and
+finished tasks' checkouts piled up. This module answers "which of
+these can go?" and removes them in one batch:
+
+- ONE ``git worktree list --porcelain`` call enumerates every worktree
+  (``gitio.list_worktrees``), and ONE scan of the primary's
+  ``.kit/tasks`` (``lifecycle.task_folders``) supplies every task's
+  folder — the join is in memory, never a lookup per worktree.
+- A worktree is collectable when its task sits in a closed folder
+  (``lifecycle.CLOSED_FOLDERS``: done, canceled) or its directory is
+  already gone. The task ID comes from the ``feature/<TASK>-<slug>``
+  branch, falling back to the directory name. Unknown tasks are never
+  collectable, and pool slots belong to ``worktree-pool gc``.
+- Removal is ``git worktree remove`` WITHOUT ``--force``: git's own
+  clean-tree check refuses a worktree with modified or untracked work
+  (the gitignored venv and provisioning links do not count), and that
+  refusal is reported, not overridden. Branches go in one ``git branch
+  -D`` call, and only when nothing would be lost: an upstream that is
+  in sync, or one the remote deleted once the branch was merged into
+  ``origin/main``. A never-pushed, ahead, or gone-but-unmerged branch
+  is kept and named.
+
+Reads the task tree of the PRIMARY clone (where the planner moves
+tasks to done), wherever the command runs from.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+from agentive_kit import gitio, lifecycle, worktree, worktree_pool
+from agentive_kit.models import WorktreeEntry, WorktreeReport
+
+_USAGE = """\
+Usage: agentive worktrees <command>
+
+  list                 Every task worktree with its task status and
+                       venv disk usage (collectable ones are marked)
+  gc [--dry-run]       Remove collectable worktrees (task done or
+                       canceled) and their pushed branches in one batch
+"""
+
+
+def _task_id(entry: WorktreeEntry) -> str | None:
+    if entry.branch and entry.branch.startswith("feature/"):
+        match = lifecycle.TASK_ID_PREFIX.match(entry.branch.removeprefix("feature/"))
+        if match:
+            return match.group(1).upper()
+    match = lifecycle.TASK_ID_PREFIX.match(entry.path.name)
+    return match.group(1).upper() if match else None
+
+
+def dir_bytes(path: Path) -> int:
+    """Disk usage of *path* (allocated blocks), symlinks not followed.
+
+    A hardlinked file counts once per tree — a venv cloned from a
+    template reports its full footprint, of which the shared payload is
+    only freed when the last link goes.
+    """
+    total = 0
+    seen: set[tuple[int, int]] = set()
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) in seen:
+                continue
+            seen.add((st.st_dev, st.st_ino))
+            total += getattr(st, "st_blocks", 0) * 512 or st.st_size
+    return total
+
+
+def _human(n: int) -> str:
+    if n < 1024:
+        return f"{n} B"
+    size = n / 1024
+    for unit in ("KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def inventory(primary_root: Path) -> list[WorktreeReport]:
+    """Every linked, non-pool worktree joined against its task."""
+    entries = gitio.list_worktrees(primary_root)
+    if entries is None:
+        return []
+    folders = lifecycle.task_folders(primary_root)
+    pool = os.path.realpath(worktree_pool.pool_dir(primary_root))
+    reports = []
+    for entry in entries[1:]:  # the first record is the primary itself
+        if entry.bare or os.path.realpath(entry.path.parent) == pool:
+            continue
+        task_id = _task_id(entry)
+        folder = folders.get(task_id) if task_id else None
+        venv = entry.path / ".venv"
+        venv_bytes = dir_bytes(venv) if venv.is_dir() and not venv.is_symlink() else 0
+        reports.append(
+            WorktreeReport(
+                path=entry.path,
+                branch=entry.branch,
+                task_id=task_id,
+                task_folder=folder,
+                venv_bytes=venv_bytes,
+                collectable=entry.prunable or folder in lifecycle.CLOSED_FOLDERS,
+                prunable=entry.prunable,
+            )
+        )
+    return reports
+
+
+def print_inventory(reports: list[WorktreeReport]) -> None:
+    if not reports:
+        print("No task worktrees.")
+        return
+    for r in reports:
+        mark = "✗ collectable" if r.collectable else "  active"
+        folder = "gone" if r.prunable else (r.task_folder or "no task file")
+        print(
+            f"{mark}  {r.task_id or '?':<10} {folder:<14} "
+            f"venv {_human(r.venv_bytes):>9}  {r.branch or '(detached)'}  {r.path}"
+        )
+    collectable = [r for r in reports if r.collectable]
+    total = sum(r.venv_bytes for r in collectable)
+    print()
+    print(
+        f"{len(reports)} worktree(s), {len(collectable)} collectable "
+        f"({_human(total)} of venvs)."
+    )
+
+
+# Task branches start from here (``worktree.main``), so a finished one
+# whose commits are all in it has nothing left to lose.
+BASE_REF = "origin/main"
+
+
+def _deletable_branches(
+    primary_root: Path, branches: list[str]
+) -> tuple[set[str], set[str]]:
+    """Split *branches* by whether their commits are safe elsewhere.
+
+    Returns ``(safe, gone_unmerged)``. Safe: an upstream in sync, or
+    one the remote deleted after the branch was merged into
+    ``BASE_REF``. A ``[gone]`` upstream alone proves nothing (the
+    remote branch may have been deleted unmerged); those branches are
+    the second set. Two ``for-each-ref`` calls cover them all.
+    """
+    result = gitio.run_git(
+        primary_root,
+        "for-each-ref",
+        "--format=%(refname:short)\t%(upstream)\t%(upstream:track)",
+        "refs/heads/",
+    )
+    if result is None or result.returncode != 0:
+        return set(), set()
+    wanted = set(branches)
+    safe, gone = set(), set()
+    for line in result.stdout.splitlines():
+        name, _, rest = line.partition("\t")
+        upstream, _, track = rest.partition("\t")
+        if name not in wanted or not upstream:
+            continue
+        if track == "":
+            safe.add(name)
+        elif track == "[gone]":
+            gone.add(name)
+    if gone:
+        merged = gitio.run_git(
+            primary_root,
+            "for-each-ref",
+            "--format=%(refname:short)",
+            f"--merged={BASE_REF}",
+            "refs/heads/",
+        )
+        if merged is not None and merged.returncode == 0:
+            safe |= gone & set(merged.stdout.splitlines())
+    return safe, gone - safe
+
+
+def gc(primary_root: Path, dry_run: bool = False) -> int:
+    """Remove every collectable worktree and its safe branch.
+
+    Returns the number of failures: worktrees that could not be
+    removed, plus one when the batch branch deletion failed (0 means
+    everything collectable went, or a dry run).
+    """
+    reports = [r for r in inventory(primary_root) if r.collectable]
+    if not reports:
+        print("Nothing to collect.")
+        return 0
+    branches = [r.branch for r in reports if r.branch]
+    safe, gone_unmerged = _deletable_branches(primary_root, branches)
+    verb = "Would remove" if dry_run else "Removing"
+    kept = 0
+    removed_branches = []
+    for r in reports:
+        print(f"{verb} {r.path} ({r.task_id or '?'}, venv {_human(r.venv_bytes)})")
+        if dry_run:
+            continue
+        if not r.prunable:
+            result = gitio.run_git(
+                primary_root, "worktree", "remove", str(r.path), timeout=120
+            )
+            if result is None or result.returncode != 0:
+                detail = (result.stderr.strip() if result else "") or "git failed"
+                print(f"  ⚠️  kept: {detail}", file=sys.stderr)
+                kept += 1
+                continue
+        if r.branch in safe:
+            removed_branches.append(r.branch)
+    for r in reports:
+        if r.branch in gone_unmerged:
+            print(
+                f"  ℹ️  branch {r.branch} kept — upstream deleted, "
+                f"but not merged into {BASE_REF}"
+            )
+        elif r.branch and r.branch not in safe:
+            print(f"  ℹ️  branch {r.branch} kept — not pushed or ahead of upstream")
+    if dry_run:
+        planned = sorted(b for b in branches if b in safe)
+        if planned:
+            print(f"Would delete branches: {' '.join(planned)}")
+        return 0
+    gitio.run_git(primary_root, "worktree", "prune")
+    branch_failed = 0
+    if removed_branches:
+        result = gitio.run_git(primary_root, "branch", "-D", *removed_branches)
+        if result is not None and result.returncode == 0:
+            print(f"Deleted branches: {' '.join(removed_branches)}")
+        else:
+            print("  ⚠️  branch deletion failed", file=sys.stderr)
+            branch_failed = 1
+    print(f"✅ Collected {len(reports) - kept} worktree(s).")
+    return kept + branch_failed
+
+
+def main(argv: list[str], anchor: Path | None = None) -> None:
+    """``agentive worktrees`` dispatcher; always exits."""
+    args = list(argv)
+    if not args or args[0] in ("help", "-h", "--help"):
+        print(_USAGE)
+        sys.exit(0 if args else 1)
+    primary_root = worktree.resolve_primary_root(anchor or Path.cwd())
+    if args == ["list"]:
+        print_inventory(inventory(primary_root))
+        sys.exit(0)
+    if args[0] == "gc" and set(args[1:]) <= {"--dry-run"}:
+        sys.exit(1 if gc(primary_root, dry_run="--dry-run" in args) else 0)
+    print(_USAGE, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,316 @@
+"""Pre-warmed worktree pool (``agentive worktree-pool``).
+
+``worktree.main`` builds and provisions a task worktree while the
+session waits. The pool moves that work off the critical path: N idle
+worktrees live under ``ask-worktrees/.pool/`` on detached HEADs, each
+already carrying the provisioning links and a venv. Starting a task
+CLAIMS one — ``git worktree move`` to ``ask-worktrees/<TASK>``, then a
+fresh ``feature/<TASK>-<slug>`` branch from origin/main — and a
+finished task's worktree can be RELEASED back: reset to a clean
+detached origin/main and moved into a free slot.
+
+Design points:
+
+- The claim's atomic step is ``git worktree move`` (a rename): two
+  sessions racing for one slot cannot both win — the loser's move
+  fails because the source is gone, and it tries the next slot. No
+  lock files to go stale.
+- Moving a worktree moves its venv, whose shebangs and ``pyvenv.cfg``
+  name the old path — ``worktree.relocate_venv`` rewrites them on
+  every move. A slot whose dependency hash drifted since it was warmed
+  gets its venv rebuilt at claim time (``worktree`` owns that check).
+- Release refuses a worktree with uncommitted or untracked work, and
+  never deletes the feature branch: recycling a checkout must not be
+  able to lose anything a session produced.
+- The pool size is configuration, not inference: it lives in
+  ``.kit/.cache/worktree-pool.json`` in the primary clone. ``refill``
+  tops the pool up to it; ``gc`` prunes stale registrations and
+  removes idle slots beyond it.
+
+Error strategy matches ``worktree``: user-facing refusals print to
+stderr and exit 1; ``claim`` is the library entry ``worktree.main``
+uses and never exits — it returns False and the caller takes the cold
+path.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import NoReturn
+
+from agentive_kit import gitio, worktree
+from agentive_kit.models import WorktreeEntry
+
+POOL_STATE = Path(".kit") / ".cache" / "worktree-pool.json"
+
+_SLOT_PREFIX = "slot-"
+
+_USAGE = """\
+Usage: agentive worktree-pool <command>
+
+  status           Show the pool size and every slot
+  size <N>         Set the pool size (then run refill or gc)
+  refill           Create and provision slots up to the pool size
+  release <TASK>   Reset a finished task's worktree and return it to
+                   the pool (refuses uncommitted work; keeps the branch)
+  gc               Prune stale registrations and remove idle slots
+                   beyond the pool size
+"""
+
+
+def pool_dir(primary_root: Path) -> Path:
+    """``ask-worktrees/.pool`` beside the primary clone."""
+    return primary_root.parent / "ask-worktrees" / ".pool"
+
+
+def pool_size(primary_root: Path) -> int:
+    """Configured pool size; 0 (no pool) when unset or unreadable."""
+    try:
+        state = json.loads((primary_root / POOL_STATE).read_text(encoding="utf-8"))
+        return max(0, int(state.get("size", 0)))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def set_pool_size(primary_root: Path, size: int) -> None:
+    path = primary_root / POOL_STATE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"size": size}) + "\n", encoding="utf-8")
+
+
+def _same_path(a: Path, b: Path) -> bool:
+    return os.path.realpath(a) == os.path.realpath(b)
+
+
+def slots(primary_root: Path) -> list[WorktreeEntry]:
+    """Registered worktrees that live in the pool dir, by slot name."""
+    entries = gitio.list_worktrees(primary_root) or []
+    root = pool_dir(primary_root)
+    found = [
+        e
+        for e in entries
+        if e.path.name.startswith(_SLOT_PREFIX) and _same_path(e.path.parent, root)
+    ]
+    return sorted(found, key=lambda e: e.path.name)
+
+
+def idle_slots(primary_root: Path) -> list[WorktreeEntry]:
+    """Slots ready to claim: present on disk, detached, unlocked."""
+    return [
+        e
+        for e in slots(primary_root)
+        if e.detached and not e.locked and not e.prunable and e.path.is_dir()
+    ]
+
+
+def _free_slot_path(primary_root: Path) -> Path:
+    root = pool_dir(primary_root)
+    n = 1
+    while (root / f"{_SLOT_PREFIX}{n:02d}").exists():
+        n += 1
+    return root / f"{_SLOT_PREFIX}{n:02d}"
+
+
+def _move(primary_root: Path, src: Path, dst: Path) -> bool:
+    """``git worktree move`` plus the venv path rewrite it requires."""
+    result = gitio.run_git(primary_root, "worktree", "move", str(src), str(dst))
+    if result is None or result.returncode != 0:
+        return False
+    worktree.relocate_venv(dst / ".venv", str(src), str(dst))
+    return True
+
+
+def claim(primary_root: Path, worktree_path: Path, branch: str) -> bool:
+    """Turn an idle slot into *worktree_path* on a new *branch*.
+
+    The caller has already fetched origin and verified origin/main.
+    Returns False (nothing changed) when no slot could be claimed — an
+    empty pool, or every slot lost to a concurrent claimer.
+    """
+    if not pool_dir(primary_root).is_dir():
+        return False  # never pooled: skip the worktree listing
+    for slot in idle_slots(primary_root):
+        if not _move(primary_root, slot.path, worktree_path):
+            continue
+        checkout = gitio.run_git(
+            worktree_path, "checkout", "-q", "-b", branch, "origin/main", timeout=300
+        )
+        if checkout is not None and checkout.returncode == 0:
+            print(
+                f"Claimed pooled worktree {slot.path.name} as {worktree_path} "
+                f"on {branch} (from origin/main)..."
+            )
+            return True
+        # Put the slot back untouched; the cold path takes over.
+        _move(primary_root, worktree_path, slot.path)
+    return False
+
+
+def _fail(*lines: str) -> NoReturn:
+    for line in lines:
+        print(line, file=sys.stderr)
+    sys.exit(1)
+
+
+def _fetch_origin_main(primary_root: Path) -> None:
+    print("Fetching origin...")
+    fetch = gitio.run_git(primary_root, "fetch", "origin", timeout=300, capture=False)
+    if fetch is None or fetch.returncode != 0:
+        _fail("Error: git fetch origin failed")
+    origin_main = gitio.run_git(
+        primary_root, "show-ref", "--verify", "--quiet", "refs/remotes/origin/main"
+    )
+    if origin_main is None or origin_main.returncode != 0:
+        _fail(
+            "Error: origin/main does not exist after fetch —",
+            "       check the remote's default branch.",
+        )
+
+
+def refill(primary_root: Path) -> int:
+    """Create and provision slots until the pool holds its size.
+
+    Returns the number of slots added. Sources for the provisioning
+    links are checked first, exactly like ``worktree.main`` — a slot
+    is never warmed half-way.
+    """
+    missing = pool_size(primary_root) - len(slots(primary_root))
+    if missing <= 0:
+        print("Pool is full — nothing to refill.")
+        return 0
+    for rel in worktree.PROVISION_LINKS:
+        if not (primary_root / rel).exists():
+            _fail(f"Error: required artifact missing in primary clone: {rel}")
+    _fetch_origin_main(primary_root)
+    pool_dir(primary_root).mkdir(parents=True, exist_ok=True)
+    added = 0
+    for _ in range(missing):
+        slot = _free_slot_path(primary_root)
+        print(f"Warming pool slot {slot} (detached at origin/main)...")
+        add = gitio.run_git(
+            primary_root,
+            "worktree",
+            "add",
+            "--detach",
+            str(slot),
+            "origin/main",
+            timeout=300,
+        )
+        if add is None or add.returncode != 0:
+            if add is not None and add.stderr:
+                sys.stderr.write(add.stderr)
+            _fail(f"Error: git worktree add failed for {slot}")
+        worktree.provision_detached(primary_root, slot)
+        added += 1
+    print(f"✅ Pool refilled: {added} slot(s) added.")
+    return added
+
+
+def release(primary_root: Path, task_id: str) -> None:
+    """Return a finished task's worktree to the pool (see module doc)."""
+    task_id = task_id.upper()
+    worktree_path = primary_root.parent / "ask-worktrees" / task_id
+    entries = gitio.list_worktrees(primary_root) or []
+    entry = next((e for e in entries if _same_path(e.path, worktree_path)), None)
+    if entry is None:
+        _fail(f"Error: no registered worktree at {worktree_path}")
+    status = gitio.run_git(worktree_path, "status", "--porcelain")
+    if status is None or status.returncode != 0:
+        _fail(f"Error: git status failed in {worktree_path}")
+    if status.stdout.strip():
+        _fail(
+            f"Error: {worktree_path} has uncommitted or untracked work —",
+            "       commit, push or discard it before releasing.",
+        )
+    if len(idle_slots(primary_root)) >= pool_size(primary_root):
+        print(f"Pool is full (size {pool_size(primary_root)}) — not recycled.")
+        print("  Remove it once its branch is pushed:")
+        print(f"  git -C {primary_root} worktree remove --force {worktree_path}")
+        return
+
+    detach = gitio.run_git(
+        worktree_path, "checkout", "-q", "--detach", "origin/main", timeout=300
+    )
+    if detach is None or detach.returncode != 0:
+        _fail(f"Error: could not reset {worktree_path} to origin/main")
+    # Session leftovers go (Serena config, caches, build output); the
+    # warm state a slot exists for stays.
+    keep = [".venv", *worktree.PROVISION_LINKS]
+    exclude = [arg for rel in keep for arg in ("-e", f"/{rel}")]
+    gitio.run_git(worktree_path, "clean", "-fdxq", *exclude, timeout=120)
+
+    slot = _free_slot_path(primary_root)
+    pool_dir(primary_root).mkdir(parents=True, exist_ok=True)
+    if not _move(primary_root, worktree_path, slot):
+        _fail(f"Error: git worktree move failed for {worktree_path}")
+    print(f"✅ Released {task_id} into pool slot {slot.name}")
+    if entry.branch:
+        print(f"   Branch {entry.branch} is kept (delete it once merged).")
+
+
+def gc(primary_root: Path) -> int:
+    """Prune stale registrations; remove idle slots beyond the size.
+
+    Returns the number of slots removed. Unregistered leftovers under
+    the pool dir are REPORTED, never deleted — they are not provably
+    ours to delete.
+    """
+    gitio.run_git(primary_root, "worktree", "prune")
+    size = pool_size(primary_root)
+    removed = 0
+    for slot in idle_slots(primary_root)[size:]:
+        # --force: the slot's venv is untracked by design.
+        result = gitio.run_git(
+            primary_root, "worktree", "remove", "--force", str(slot.path), timeout=120
+        )
+        if result is not None and result.returncode == 0:
+            print(f"Removed pool slot {slot.path.name}")
+            removed += 1
+    registered = {os.path.realpath(e.path) for e in slots(primary_root)}
+    root = pool_dir(primary_root)
+    if root.is_dir():
+        for child in sorted(root.iterdir()):
+            if os.path.realpath(child) not in registered:
+                print(f"⚠️  {child} is not a registered worktree — remove by hand")
+    print(f"✅ Pool gc: {removed} slot(s) removed (size {size}).")
+    return removed
+
+
+def status(primary_root: Path) -> None:
+    size = pool_size(primary_root)
+    pooled = slots(primary_root)
+    idle = {e.path for e in idle_slots(primary_root)}
+    print(f"Pool size: {size} ({len(idle)} idle)")
+    for entry in pooled:
+        state = "idle" if entry.path in idle else "unavailable"
+        print(f"  {entry.path.name}  {state}  {entry.head or '-'}")
+
+
+def main(argv: list[str], anchor: Path | None = None) -> None:
+    """``agentive worktree-pool`` dispatcher; always exits."""
+    args = list(argv)
+    if not args or args[0] in ("help", "-h", "--help"):
+        print(_USAGE)
+        sys.exit(0 if args else 1)
+    primary_root = worktree.resolve_primary_root(anchor or Path.cwd())
+    command = args[0]
+    if command == "status" and len(args) == 1:
+        status(primary_root)
+    elif command == "size" and len(args) == 2:
+        if not args[1].isdigit():
+            _fail(f"Error: pool size must be a non-negative integer (got: {args[1]})")
+        set_pool_size(primary_root, int(args[1]))
+        print(f"Pool size set to {int(args[1])} — run refill or gc to apply.")
+    elif command == "refill" and len(args) == 1:
+        refill(primary_root)
+    elif command == "release" and len(args) == 2:
+        release(primary_root, args[1])
+    elif command == "gc" and len(args) == 1:
+        gc(primary_root)
+    else:
+        print(_USAGE, file=sys.stderr)
+        sys.exit(1)
+    sys.exit(0)
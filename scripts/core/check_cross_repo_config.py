@@ -43,6 +43,8 @@ import sys
 from pathlib import Path
 from typing import NamedTuple
 
+from kit_import import import_kit_module
+
 # A concrete sibling-code path like ``../label-maker-code`` or ``../foo-web``.
 # Captures the project stem so placeholder examples can be filtered out.
 SIBLING_RE = re.compile(r"\.\./([A-Za-z0-9_.-]+)-(?:code|web)\b")
@@ -103,15 +105,9 @@ def declares_cross_repo(text: str) -> bool:
     return False
 
 
-def parse_target_section(claude_md: str):
-    """
-    Parse the ``## Target Repository`` section of CLAUDE.md.
-
-    Returns:
-        None                          - heading absent
-        MALFORMED                     - heading present, Path or GitHub missing
-        {"path": ..., "github": ...}  - parseable section
-    """
+def _section_body(claude_md: str):
+    """The ``## Target Repository`` body, or None when the heading is
+    absent — the inline twin of the package's claude_md section rule."""
     lines = claude_md.splitlines()
     start = None
     for i, line in enumerate(lines):
@@ -127,7 +123,26 @@ def parse_target_section(claude_md: str):
         if re.match(r"^##\s+\S", line):
             break
         body.append(line)
-    section_text = "\n".join(body)
+    return "\n".join(body)
+
+
+def parse_target_section(claude_md: str):
+    """
+    Parse the ``## Target Repository`` section of CLAUDE.md.
+
+    Returns:
+        None                          - heading absent
+        MALFORMED                     - heading present, Path or GitHub missing
+        {"path": ..., "github": ...}  - parseable section
+    """
+    return _parse_section_body(_section_body(claude_md))
+
+
+def _parse_section_body(section_text):
+    """Apply the runtime bullet contract to a section body (None = no
+    heading); same return values as :func:`parse_target_section`."""
+    if section_text is None:
+        return None
 
     # Match the runtime contract in scripts/core/lib/target_repo.sh: values
     # MUST be backticked, and GitHub MUST be an `owner/name` slug. Accepting
@@ -163,10 +178,18 @@ def parse_target_section(claude_md: str):
 def check(repo_root: Path) -> Result:
     """Run the cross-repo config check against a repo root."""
     readme = _read(repo_root / "README.md")
-    claude = _read(repo_root / "CLAUDE.md")
+    kit = import_kit_module("claude_md")
+    if kit is not None:
+        # The package's parsed model: the same read and section scan
+        # target_repo.resolve uses at runtime.
+        doc = kit.load(repo_root)
+        claude, body = doc.text, doc.section("Target Repository")
+    else:
+        claude = _read(repo_root / "CLAUDE.md")
+        body = _section_body(claude)
 
     declared = declares_cross_repo(readme) or declares_cross_repo(claude)
-    section = parse_target_section(claude)
+    section = _parse_section_body(body)
 
     if section is None or section == MALFORMED:
         if declared:
@@ -0,0 +1,35 @@
+"""
+Kit Package Import
+==================
+
+``import_kit_module`` for the core scripts that delegate to agentive-kit
+when it is importable: the installed copy first, then the kit repo's own
+source under ``packages/agentive-kit/src``. None when neither exists —
+package-less consumers and planning repos on system python3 — and the
+caller runs its inline fallback.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+
+PKG_SRC = (
+    Path(__file__).resolve().parent.parent.parent / "packages" / "agentive-kit" / "src"
+)
+
+
+def import_kit_module(name: str) -> Optional[ModuleType]:
+    """Import ``agentive_kit.<name>``; None when the package is absent."""
+    try:
+        return importlib.import_module(f"agentive_kit.{name}")
+    except ModuleNotFoundError:
+        pass
+    if PKG_SRC.is_dir() and str(PKG_SRC) not in sys.path:
+        sys.path.insert(0, str(PKG_SRC))
+        try:
+            return importlib.import_module(f"agentive_kit.{name}")
+        except ModuleNotFoundError:
+            pass
+    return None
@@ -5,9 +5,12 @@ Logging Configuration
 Configurable logging infrastructure for the agentive-starter-kit.
 
 Features:
-    - Environment variable configuration (LOG_LEVEL, LOG_FILE)
+    - Environment variable configuration (LOG_LEVEL, LOG_FILE, LOG_JSON,
+      LOG_ASYNC)
     - Console output with timestamp formatting
     - Optional file logging with rotation (10MB, 5 backups)
+    - Optional JSON-lines output for log ingestion
+    - Optional queue mode: handlers run on a listener thread
     - Performance decorator for timing slow operations
 
 Usage:
@@ -23,20 +26,110 @@ Usage:
 Environment Variables:
     LOG_LEVEL: DEBUG, INFO, WARNING, ERROR (default: INFO)
     LOG_FILE: Path to log file (enables file logging with rotation)
+    LOG_JSON: true to write one JSON object per line (default: false)
+    LOG_ASYNC: true to write through a QueueHandler (default: false)
+
+Queue mode keeps console and file I/O off the caller's thread, which
+matters in the Linear sync loops. The caller's thread still merges the
+message with its arguments. A QueueListener thread formats and writes
+the record. The queue is drained at interpreter exit, and also by
+shutdown_logging(), after which the logger writes directly again.
 
 See: ADR-0009 Logging & Observability
 """
 
+import atexit
+import copy
 import functools
+import json
 import logging
 import os
+import queue
 import time
-from logging.handlers import RotatingFileHandler
-from typing import Callable, TypeVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Callable, List, TypeVar
 
 # Type variable for preserving function signatures
 F = TypeVar("F", bound=Callable)
 
+# Running listeners (LOG_ASYNC); stopped — and so drained — at exit.
+_listeners: List[QueueListener] = []
+
+
+def _env_flag(name: str) -> bool:
+    """True when an environment flag is set to 1/true/yes/on."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as one JSON object per line (LOG_JSON=true).
+
+    Keys: ts (ISO 8601, UTC, milliseconds), level, logger, message, and
+    exc (the formatted traceback) when the record carries one.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class ExcTextQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps a record's traceback apart from its message.
+
+    The stock prepare() formats the whole record into msg, traceback
+    included, and clears exc_info. A JsonFormatter on the listener side
+    would then put the traceback inside "message" and write no "exc".
+    Here msg is only merged with its arguments, and the traceback
+    crosses the queue as exc_text (exc_info holds live frames).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def shutdown_logging() -> None:
+    """
+    Stop every LOG_ASYNC listener, writing out the records still queued.
+
+    The logger's QueueHandler is swapped for the listener's own handlers
+    first, so records logged after shutdown are still written (on the
+    caller's thread) instead of queued for a listener that is gone.
+    Runs at interpreter exit; safe to call more than once.
+    """
+    while _listeners:
+        listener = _listeners.pop()
+        logger = listener._agentive_logger
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
+        listener.stop()
+
+
+atexit.register(shutdown_logging)
+
 
 def setup_logging(name: str = "agentive") -> logging.Logger:
     """
@@ -51,6 +144,8 @@ def setup_logging(name: str = "agentive") -> logging.Logger:
     Environment Variables:
         LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR). Default: INFO
         LOG_FILE: Path to log file. If set, enables file logging with rotation.
+        LOG_JSON: true for JSON-lines output on every handler.
+        LOG_ASYNC: true to log through a queue drained by a listener thread.
 
     Example:
         logger = setup_logging("agentive.sync")
@@ -71,6 +166,9 @@ def setup_logging(name: str = "agentive") -> logging.Logger:
     level = getattr(logging, level_str, logging.INFO)
     logger.setLevel(level)
 
+    use_json = _env_flag("LOG_JSON")
+    handlers: List[logging.Handler] = []
+
     # Console handler - always enabled
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
@@ -78,9 +176,8 @@ def setup_logging(name: str = "agentive") -> logging.Logger:
         "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%H:%M:%S",
     )
-    console_handler.setFormatter(console_formatter)
-    console_handler._agentive_managed = True
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(JsonFormatter() if use_json else console_formatter)
+    handlers.append(console_handler)
 
     # File handler - optional, enabled via LOG_FILE env var
     log_file = os.getenv("LOG_FILE")
@@ -102,9 +199,24 @@ def setup_logging(name: str = "agentive") -> logging.Logger:
             "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-        file_handler.setFormatter(file_formatter)
-        file_handler._agentive_managed = True
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(JsonFormatter() if use_json else file_formatter)
+        handlers.append(file_handler)
+
+    if _env_flag("LOG_ASYNC"):
+        # The logger gets one QueueHandler; the listener thread owns the
+        # real handlers and applies their levels.
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        for handler in handlers:
+            handler._agentive_managed = True  # handed back by shutdown_logging
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener._agentive_logger = logger
+        listener.start()
+        _listeners.append(listener)
+        handlers = [ExcTextQueueHandler(log_queue)]
+
+    for handler in handlers:
+        handler._agentive_managed = True
+        logger.addHandler(handler)
 
     # Prevent propagation to root logger (avoid duplicate logs)
     logger.propagate = False
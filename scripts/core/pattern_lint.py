@@ -2,15 +2,46 @@
 """Project-specific lint rules that catch recurring bot-finding patterns.
 
 Metadata:
-    version: 1.2.0
+    version: 1.4.0
     origin: dispatch-kit
     origin-version: 0.3.2
-    last-updated: 2026-03-01
+    last-updated: 2026-10-19
     created-by: "@movito with planner2"
 
 Runs as a pre-commit hook and in CI. Returns exit code 1 if any violations
 are found. Operates on AST for accuracy — no regex hacks.
 
+Each file is parsed once and walked once: a single ``ast.NodeVisitor``
+dispatches every node to the rules that subscribed to its type. Files
+are linted on a process pool, and results are cached per file in
+``.kit/.cache/pattern-lint.json`` (keyed on the path and the content
+hash, plus the rule-set version), so a pre-commit run or a
+``ci-check.sh`` run over a large tree only re-lints files that changed.
+
+Project rules: every ``.kit/lint-rules/*.py`` file, and every module
+named by a ``pattern_lint.rules`` entry point, is imported before
+linting and registers its rules with the ``register`` decorator::
+
+    import ast
+    from pattern_lint import Violation, register
+
+    @register("PRJ001", ast.Call)
+    def no_print(node, source_lines, path):
+        if isinstance(node.func, ast.Name) and node.func.id == "print":
+            return Violation("PRJ001", path, node.lineno, "print() call")
+
+A rule sees only the node types it subscribed to and returns a
+Violation, a list of them, or None; ``# noqa: <CODE>`` on the line
+suppresses any rule. Changing a rule file invalidates the cache.
+
+Usage:
+  pattern_lint.py <file.py> ...          lint the given files
+  pattern_lint.py --tree [pathspec ...]  lint every Python file git
+                                         tracks or would track
+                                         (``git ls-files``; honors
+                                         .gitignore)
+  Options: --jobs N, --no-cache
+
 Rules:
   DK001  str.replace() used for extension/suffix removal
   DK002  open() without explicit encoding= kwarg (text mode only)
@@ -21,10 +52,53 @@ Rules:
 from __future__ import annotations
 
 import ast
+import hashlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import subprocess
 import sys
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+# Per-file result cache (created only inside a kit project).
+CACHE_PATH = Path(".kit") / ".cache" / "pattern-lint.json"
+# Project rule files, imported before linting.
+RULES_DIR = Path(".kit") / "lint-rules"
+# Entry-point group naming modules that register rules on import.
+ENTRY_POINT_GROUP = "pattern_lint.rules"
+# Past this many entries the cache keeps only the current run's files.
+CACHE_MAX_ENTRIES = 20000
+# Below this many files to lint, a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 16
+
+EXTENSION_PATTERNS = {".md", ".py", ".yml", ".yaml", ".json", ".txt", ".toml"}
+IDENTIFIER_HINTS = {"id", "name", "type", "key", "status", "state", "mode", "login"}
+# Right-side names suggesting a collection (not a string)
+COLLECTION_SUFFIXES = (
+    "_set",
+    "_list",
+    "_dict",
+    "_map",
+    "_tuple",
+    "_frozenset",
+    "_types",
+    "_names",
+    "_ids",
+    "_keys",
+    "_values",
+    "_items",
+    "_transitions",
+    "_auto",
+    "_counts",
+    "_sessions",
+    "_statuses",
+)
+BROAD_EXCEPTIONS = {"Exception", "BaseException"}
+
 
 @dataclass
 class Violation:
@@ -37,62 +111,287 @@ class Violation:
         return f"{self.path}:{self.line}: {self.rule} {self.message}"
 
 
-def check_dk001(tree: ast.AST, source_lines: list[str], path: str) -> list[Violation]:
-    """DK001: str.replace() used for extension/suffix removal.
+RuleResult = Violation | list[Violation] | None
 
-    Detects patterns like:
-      filename.replace(".md", "")
-      name.replace(".py", "")
-      s.replace(".yml", "")
 
-    Fix: use str.removesuffix(".ext") instead.
+@dataclass(frozen=True)
+class Rule:
+    """A registered rule: *check* runs on every node of the *nodes* types."""
+
+    code: str
+    nodes: tuple[type[ast.AST], ...]
+    check: Callable[[ast.AST, list[str], str], RuleResult]
+
+
+# Every known rule by code: the built-in DK rules, then project rules.
+RULES: dict[str, Rule] = {}
+# Origin of every loaded rule source (feeds rules_version()).
+_RULE_SOURCES: list[str] = []
+_LOADED: set[str] = set()
+_LOADED_DIRS: list[str] = []
+
+
+def register(code: str, *nodes: type[ast.AST]) -> Callable:
+    """Decorator registering a check as rule *code* for the *nodes* types.
+
+    Registering an existing code replaces that rule.
     """
+    if not nodes:
+        raise ValueError(f"rule {code} must subscribe to at least one node type")
+
+    def decorator(check: Callable[[ast.AST, list[str], str], RuleResult]) -> Callable:
+        RULES[code] = Rule(code=code, nodes=tuple(nodes), check=check)
+        return check
+
+    return decorator
+
+
+def _line(source_lines: list[str], lineno: int) -> str:
+    return source_lines[lineno - 1] if lineno <= len(source_lines) else ""
+
+
+@register("DK001", ast.Call)
+def _dk001(node: ast.Call, source_lines: list[str], path: str) -> Violation | None:
+    """DK001 check for one Call node (see check_dk001)."""
+    if not isinstance(node.func, ast.Attribute):
+        return None
+    if node.func.attr != "replace":
+        return None
+    if len(node.args) < 2:
+        return None
+
+    first_arg = node.args[0]
+    second_arg = node.args[1]
+
+    # Check: .replace(".ext", "")
+    if not (
+        isinstance(first_arg, ast.Constant)
+        and isinstance(first_arg.value, str)
+        and first_arg.value in EXTENSION_PATTERNS
+        and isinstance(second_arg, ast.Constant)
+        and second_arg.value == ""
+    ):
+        return None
+    if "# noqa: DK001" in _line(source_lines, node.lineno):
+        return None
+    return Violation(
+        rule="DK001",
+        path=path,
+        line=node.lineno,
+        message=(
+            f'str.replace("{first_arg.value}", "")'
+            f" removes all occurrences."
+            f' Use removesuffix("{first_arg.value}").'
+        ),
+    )
+
+
+@register("DK002", ast.Call)
+def _dk002(node: ast.Call, source_lines: list[str], path: str) -> Violation | None:
+    """DK002 check for one Call node (see check_dk002)."""
+    # Check for .read_text() / .write_text() without encoding=
+    if isinstance(node.func, ast.Attribute) and node.func.attr in {
+        "read_text",
+        "write_text",
+    }:
+        if any(kw.arg == "encoding" for kw in node.keywords):
+            return None
+        if "# noqa: DK002" in _line(source_lines, node.lineno):
+            return None
+        return Violation(
+            rule="DK002",
+            path=path,
+            line=node.lineno,
+            message=(
+                f".{node.func.attr}() without explicit encoding= kwarg."
+                ' Add encoding="utf-8" for consistent behavior.'
+            ),
+        )
+
+    # Only match bare `open(...)`, not `os.open(...)`, `os.fdopen(...)`, etc.
+    if not (isinstance(node.func, ast.Name) and node.func.id == "open"):
+        return None
+    # Skip if `encoding=` kwarg is present
+    if any(kw.arg == "encoding" for kw in node.keywords):
+        return None
+    # Skip binary mode: 2nd positional arg contains 'b'
+    if len(node.args) >= 2:
+        mode_arg = node.args[1]
+        if (
+            isinstance(mode_arg, ast.Constant)
+            and isinstance(mode_arg.value, str)
+            and "b" in mode_arg.value
+        ):
+            return None
+    # Check mode kwarg as well (e.g., open("f", mode="rb"))
+    for kw in node.keywords:
+        if (
+            kw.arg == "mode"
+            and isinstance(kw.value, ast.Constant)
+            and isinstance(kw.value.value, str)
+            and "b" in kw.value.value
+        ):
+            return None
+    # No binary mode found — this is a text-mode open() without encoding
+    if "# noqa: DK002" in _line(source_lines, node.lineno):
+        return None
+    return Violation(
+        rule="DK002",
+        path=path,
+        line=node.lineno,
+        message=(
+            "open() without explicit encoding= kwarg."
+            ' Add encoding="utf-8" for consistent behavior.'
+        ),
+    )
+
+
+@register("DK003", ast.Compare)
+def _dk003(node: ast.Compare, source_lines: list[str], path: str) -> list[Violation]:
+    """DK003 checks for one Compare node (see check_dk003)."""
     violations = []
-    extension_patterns = {".md", ".py", ".yml", ".yaml", ".json", ".txt", ".toml"}
+    for op, comparator in zip(node.ops, node.comparators, strict=False):
+        if not isinstance(op, ast.In):
+            continue
 
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
+        # Skip collection literals — set, list, tuple, dict on the right
+        if isinstance(comparator, (ast.Set, ast.List, ast.Tuple, ast.Dict)):
             continue
-        if not isinstance(node.func, ast.Attribute):
+        # Skip set/frozenset/list/dict/tuple constructor calls
+        if isinstance(comparator, ast.Call):
+            func_name = _extract_name(comparator.func)
+            if func_name in {"set", "frozenset", "list", "dict", "tuple"}:
+                continue
+
+        left = node.left
+        left_name = _extract_name(left)
+        right_name = _extract_name(comparator)
+
+        if not left_name or not right_name:
             continue
-        if node.func.attr != "replace":
+
+        # Skip if right side looks like a collection variable
+        right_lower = right_name.lower().split(".")[-1]  # last segment
+        if any(right_lower.endswith(s) for s in COLLECTION_SUFFIXES):
             continue
-        if len(node.args) < 2:
+
+        # Both sides must look like identifier variables
+        left_is_id = any(hint in left_name.lower() for hint in IDENTIFIER_HINTS)
+        right_is_id = any(hint in right_name.lower() for hint in IDENTIFIER_HINTS)
+
+        if not (left_is_id and right_is_id):
             continue
 
-        first_arg = node.args[0]
-        second_arg = node.args[1]
+        line = _line(source_lines, node.lineno)
 
-        # Check: .replace(".ext", "")
-        if (
-            isinstance(first_arg, ast.Constant)
-            and isinstance(first_arg.value, str)
-            and first_arg.value in extension_patterns
-            and isinstance(second_arg, ast.Constant)
-            and second_arg.value == ""
-        ):
-            line = (
-                source_lines[node.lineno - 1]
-                if node.lineno <= len(source_lines)
-                else ""
-            )
-            if "# noqa: DK001" not in line:
-                violations.append(
-                    Violation(
-                        rule="DK001",
-                        path=path,
-                        line=node.lineno,
-                        message=(
-                            f'str.replace("{first_arg.value}", "")'
-                            f" removes all occurrences."
-                            f' Use removesuffix("{first_arg.value}").'
-                        ),
-                    )
-                )
+        # Suppressed by '# substring:' comment
+        if "# substring:" in line or "# noqa: DK003" in line:
+            continue
 
+        violations.append(
+            Violation(
+                rule="DK003",
+                path=path,
+                line=node.lineno,
+                message=(
+                    f"'{left_name} in {right_name}'"
+                    " looks like string containment."
+                    " Use == or add '# substring: <reason>'."
+                ),
+            )
+        )
     return violations
 
 
+@register("DK004", ast.ExceptHandler)
+def _dk004(
+    node: ast.ExceptHandler, source_lines: list[str], path: str
+) -> Violation | None:
+    """DK004 check for one ExceptHandler node (see check_dk004)."""
+    # Only flag broad exception types (Exception, BaseException)
+    if node.type is None:
+        # Bare 'except:' without a type — not in scope
+        return None
+    if not isinstance(node.type, ast.Name):
+        return None
+    if node.type.id not in BROAD_EXCEPTIONS:
+        return None
+
+    # Check if body is pass-only or empty
+    if not _is_swallowed(node.body):
+        return None
+
+    # Check for noqa suppression
+    if "# noqa: DK004" in _line(source_lines, node.lineno):
+        return None
+
+    return Violation(
+        rule="DK004",
+        path=path,
+        line=node.lineno,
+        message=(
+            f"Bare 'except {node.type.id}' with pass/empty body"
+            " silently swallows errors."
+            " Log, re-raise, or add '# noqa: DK004'."
+        ),
+    )
+
+
+def _subclasses(node_type: type[ast.AST]) -> list[type[ast.AST]]:
+    found = [node_type]
+    for sub in node_type.__subclasses__():
+        found.extend(_subclasses(sub))
+    return found
+
+
+class _RuleVisitor(ast.NodeVisitor):
+    """One traversal, every rule: each node is dispatched only to the
+    rules subscribed to its type (an abstract type such as ``ast.expr``
+    subscribes to all of its concrete node types)."""
+
+    def __init__(self, source_lines: list[str], path: str, rules: Iterable[Rule]):
+        self.source_lines = source_lines
+        self.path = path
+        self.violations: list[Violation] = []
+        self.dispatch: dict[type[ast.AST], list[Rule]] = {}
+        for rule in rules:
+            for node_type in rule.nodes:
+                for concrete in _subclasses(node_type):
+                    self.dispatch.setdefault(concrete, []).append(rule)
+
+    def visit(self, node: ast.AST) -> None:
+        for rule in self.dispatch.get(type(node), ()):
+            found = rule.check(node, self.source_lines, self.path)
+            if found is None:
+                continue
+            for violation in found if isinstance(found, list) else [found]:
+                noqa = f"# noqa: {violation.rule}"
+                if noqa not in _line(self.source_lines, violation.line):
+                    self.violations.append(violation)
+        self.generic_visit(node)
+
+
+def _check(
+    tree: ast.AST, source_lines: list[str], path: str, codes: Iterable[str]
+) -> list[Violation]:
+    visitor = _RuleVisitor(source_lines, path, [RULES[code] for code in codes])
+    visitor.visit(tree)
+    return visitor.violations
+
+
+def check_dk001(tree: ast.AST, source_lines: list[str], path: str) -> list[Violation]:
+    """DK001: str.replace() used for extension/suffix removal.
+
+    Detects patterns like:
+      filename.replace(".md", "")
+      name.replace(".py", "")
+      s.replace(".yml", "")
+
+    Fix: use str.removesuffix(".ext") instead.
+    """
+    return _check(tree, source_lines, path, ["DK001"])
+
+
 def check_dk002(tree: ast.AST, source_lines: list[str], path: str) -> list[Violation]:
     """DK002: open() / .read_text() / .write_text() without explicit encoding= kwarg.
 
@@ -111,82 +410,7 @@ def check_dk002(tree: ast.AST, source_lines: list[str], path: str) -> list[Viola
 
     Fix: add encoding="utf-8" to all text-mode I/O calls.
     """
-    violations = []
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
-        # Check for .read_text() / .write_text() without encoding=
-        if isinstance(node.func, ast.Attribute) and node.func.attr in {
-            "read_text",
-            "write_text",
-        }:
-            if any(kw.arg == "encoding" for kw in node.keywords):
-                continue
-            line = (
-                source_lines[node.lineno - 1]
-                if node.lineno <= len(source_lines)
-                else ""
-            )
-            if "# noqa: DK002" not in line:
-                violations.append(
-                    Violation(
-                        rule="DK002",
-                        path=path,
-                        line=node.lineno,
-                        message=(
-                            f".{node.func.attr}() without explicit encoding= kwarg."
-                            ' Add encoding="utf-8" for consistent behavior.'
-                        ),
-                    )
-                )
-            continue
-
-        # Only match bare `open(...)`, not `os.open(...)`, `os.fdopen(...)`, etc.
-        if not (isinstance(node.func, ast.Name) and node.func.id == "open"):
-            continue
-        # Skip if `encoding=` kwarg is present
-        if any(kw.arg == "encoding" for kw in node.keywords):
-            continue
-        # Skip binary mode: 2nd positional arg contains 'b'
-        if len(node.args) >= 2:
-            mode_arg = node.args[1]
-            if (
-                isinstance(mode_arg, ast.Constant)
-                and isinstance(mode_arg.value, str)
-                and "b" in mode_arg.value
-            ):
-                continue
-        # Check mode kwarg as well (e.g., open("f", mode="rb"))
-        for kw in node.keywords:
-            if (
-                kw.arg == "mode"
-                and isinstance(kw.value, ast.Constant)
-                and isinstance(kw.value.value, str)
-                and "b" in kw.value.value
-            ):
-                break
-        else:
-            # No binary mode kwarg found — this is a text-mode open() without encoding
-            line = (
-                source_lines[node.lineno - 1]
-                if node.lineno <= len(source_lines)
-                else ""
-            )
-            if "# noqa: DK002" not in line:
-                violations.append(
-                    Violation(
-                        rule="DK002",
-                        path=path,
-                        line=node.lineno,
-                        message=(
-                            "open() without explicit encoding= kwarg."
-                            ' Add encoding="utf-8" for consistent behavior.'
-                        ),
-                    )
-                )
-
-    return violations
+    return _check(tree, source_lines, path, ["DK002"])
 
 
 def check_dk003(tree: ast.AST, source_lines: list[str], path: str) -> list[Violation]:
@@ -203,89 +427,7 @@ def check_dk003(tree: ast.AST, source_lines: list[str], path: str) -> list[Viola
 
     Suppressed by '# substring:' comment on the same line.
     """
-    violations = []
-    identifier_hints = {"id", "name", "type", "key", "status", "state", "mode", "login"}
-    # Right-side names suggesting a collection (not a string)
-    collection_suffixes = (
-        "_set",
-        "_list",
-        "_dict",
-        "_map",
-        "_tuple",
-        "_frozenset",
-        "_types",
-        "_names",
-        "_ids",
-        "_keys",
-        "_values",
-        "_items",
-        "_transitions",
-        "_auto",
-        "_counts",
-        "_sessions",
-        "_statuses",
-    )
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Compare):
-            continue
-
-        for op, comparator in zip(node.ops, node.comparators, strict=False):
-            if not isinstance(op, ast.In):
-                continue
-
-            # Skip collection literals — set, list, tuple, dict on the right
-            if isinstance(comparator, (ast.Set, ast.List, ast.Tuple, ast.Dict)):
-                continue
-            # Skip set/frozenset/list/dict/tuple constructor calls
-            if isinstance(comparator, ast.Call):
-                func_name = _extract_name(comparator.func)
-                if func_name in {"set", "frozenset", "list", "dict", "tuple"}:
-                    continue
-
-            left = node.left
-            left_name = _extract_name(left)
-            right_name = _extract_name(comparator)
-
-            if not left_name or not right_name:
-                continue
-
-            # Skip if right side looks like a collection variable
-            right_lower = right_name.lower().split(".")[-1]  # last segment
-            if any(right_lower.endswith(s) for s in collection_suffixes):
-                continue
-
-            # Both sides must look like identifier variables
-            left_is_id = any(hint in left_name.lower() for hint in identifier_hints)
-            right_is_id = any(hint in right_name.lower() for hint in identifier_hints)
-
-            if not (left_is_id and right_is_id):
-                continue
-
-            line = (
-                source_lines[node.lineno - 1]
-                if node.lineno <= len(source_lines)
-                else ""
-            )
-
-            # Suppressed by '# substring:' comment
-            if "# substring:" in line or "# noqa: DK003" in line:
-                continue
-
-            violations.append(
-                Violation(
-                    rule="DK003",
-                    path=path,
-                    line=node.lineno,
-                    message=(
-                        f"'{left_name} in {right_name}'"
-                        " looks like string containment."
-                        " Use == or add '# substring: <reason>'."
-                    ),
-                )
-            )
-
-    return violations
+    return _check(tree, source_lines, path, ["DK003"])
 
 
 def check_dk004(tree: ast.AST, source_lines: list[str], path: str) -> list[Violation]:
@@ -305,45 +447,7 @@ def check_dk004(tree: ast.AST, source_lines: list[str], path: str) -> list[Viola
 
     Suppressed by '# noqa: DK004' comment on the except line.
     """
-    violations = []
-    broad_exceptions = {"Exception", "BaseException"}
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ExceptHandler):
-            continue
-
-        # Only flag broad exception types (Exception, BaseException)
-        if node.type is None:
-            # Bare 'except:' without a type — not in scope
-            continue
-        if not isinstance(node.type, ast.Name):
-            continue
-        if node.type.id not in broad_exceptions:
-            continue
-
-        # Check if body is pass-only or empty
-        if not _is_swallowed(node.body):
-            continue
-
-        # Check for noqa suppression
-        line = source_lines[node.lineno - 1] if node.lineno <= len(source_lines) else ""
-        if "# noqa: DK004" in line:
-            continue
-
-        violations.append(
-            Violation(
-                rule="DK004",
-                path=path,
-                line=node.lineno,
-                message=(
-                    f"Bare 'except {node.type.id}' with pass/empty body"
-                    " silently swallows errors."
-                    " Log, re-raise, or add '# noqa: DK004'."
-                ),
-            )
-        )
-
-    return violations
+    return _check(tree, source_lines, path, ["DK004"])
 
 
 def _is_swallowed(body: list[ast.stmt]) -> bool:
@@ -370,40 +474,253 @@ def _extract_name(node: ast.AST) -> str | None:
     return None
 
 
+def lint_source(source: str, path: str) -> list[Violation]:
+    """Run all lint rules on one file's source: one parse, one walk."""
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError:
+        return []
+    violations = _check(tree, source.splitlines(), path, list(RULES))
+    return sorted(violations, key=lambda v: (v.line, v.rule))
+
+
 def lint_file(path: str) -> list[Violation]:
     """Run all lint rules on a single Python file."""
     try:
         source = Path(path).read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return []
+    return lint_source(source, path)
+
+
+def load_project_rules(rules_dir: Path | None = RULES_DIR) -> list[str]:
+    """Import project rule files and ``pattern_lint.rules`` entry points.
+
+    Each source is imported once per process. Returns one error line
+    per source that failed to import (its rules are then missing, so
+    the caller must not report a clean run).
+    """
+    # Rule files import this module by name; when it runs as a script
+    # that name must resolve to THIS module, not a second copy.
+    sys.modules.setdefault("pattern_lint", sys.modules[__name__])
+    errors: list[str] = []
+    sources: list[tuple[str, Callable[[], object]]] = []
+    if rules_dir is not None and rules_dir.is_dir():
+        if str(rules_dir.resolve()) not in _LOADED_DIRS:
+            _LOADED_DIRS.append(str(rules_dir.resolve()))
+        for path in sorted(rules_dir.glob("*.py")):
+            sources.append((str(path.resolve()), lambda p=path: _import_rule_file(p)))
+    for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        origin = f"{entry_point.name}={entry_point.value}"
+        if entry_point.dist is not None:
+            origin += f"@{entry_point.dist.version}"
+        sources.append((origin, entry_point.load))
+    for origin, load in sources:
+        if origin in _LOADED:
+            continue
+        _LOADED.add(origin)
+        try:
+            load()
+        except Exception as e:
+            errors.append(f"pattern_lint: could not load rules from {origin}: {e}")
+            continue
+        if os.path.isfile(origin):
+            digest = hashlib.sha256(Path(origin).read_bytes()).hexdigest()
+            _RULE_SOURCES.append(f"{origin}:{digest}")
+        else:
+            _RULE_SOURCES.append(origin)
+    return errors
 
+
+def _import_rule_file(path: Path) -> None:
+    name = f"pattern_lint_rules.{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"not importable: {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+
+def rules_version() -> str:
+    """Version of the rule set: the hash of this script's own source and
+    of every loaded project rule source, so ANY rule change invalidates
+    every cached result."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for source in sorted(_RULE_SOURCES):
+        digest.update(source.encode())
+    return digest.hexdigest()[:16]
+
+
+def tree_files(pathspecs: list[str] | None = None) -> list[str] | None:
+    """Python files git tracks or would track under *pathspecs*.
+
+    One ``git ls-files`` call: tracked files plus untracked ones not
+    excluded by ``.gitignore`` (or the other standard excludes), minus
+    tracked files deleted from the worktree. None outside a git
+    checkout.
+    """
     try:
-        tree = ast.parse(source, filename=path)
-    except SyntaxError:
-        return []
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+            + ["--", *(pathspecs or ["."])],
+            capture_output=True,
+            timeout=60,
+            stdin=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    names = result.stdout.decode("utf-8", "surrogateescape").split("\0")
+    return sorted({n for n in names if n.endswith(".py") and os.path.isfile(n)})
 
-    source_lines = source.splitlines()
 
-    violations = []
-    violations.extend(check_dk001(tree, source_lines, path))
-    violations.extend(check_dk002(tree, source_lines, path))
-    violations.extend(check_dk003(tree, source_lines, path))
-    violations.extend(check_dk004(tree, source_lines, path))
+def _load_cache(cache_path: Path, version: str) -> dict[str, list[dict]]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("rules_version") != version:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
 
-    return violations
 
+def _save_cache(cache_path: Path, version: str, entries: dict[str, list[dict]]) -> None:
+    """Atomic write; a lost race with a parallel hook only costs a re-lint."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"rules_version": version, "entries": entries}) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp, cache_path)
+    except OSError as e:
+        print(f"pattern_lint: cache not written: {e}", file=sys.stderr)
 
-def main() -> int:
-    """Entry point. Accepts file paths as arguments."""
-    if len(sys.argv) < 2:
-        print("Usage: pattern_lint.py <file1.py> [file2.py ...]", file=sys.stderr)
-        return 0  # No files = no violations
 
-    all_violations = []
-    for path in sys.argv[1:]:
-        if not path.endswith(".py"):
+def _init_worker(loaded: list[str], rules_dirs: list[str]) -> None:
+    """Pool initializer: a spawned worker re-imports the project rules
+    and the entry-point rules (a forked one inherits them and this is a
+    no-op)."""
+    if loaded and not _LOADED:
+        load_project_rules(None)
+        for rules_dir in rules_dirs:
+            load_project_rules(Path(rules_dir))
+
+
+def _lint_job(job: tuple[str, str]) -> list[Violation]:
+    path, source = job
+    return lint_source(source, path)
+
+
+def lint_paths(
+    paths: list[str], cache_path: Path | None = None, jobs: int | None = None
+) -> list[Violation]:
+    """Lint many files: cached results first, the rest on a process pool.
+
+    Args:
+        paths: Python files to lint (unreadable ones are skipped)
+        cache_path: Result cache file; None disables caching
+        jobs: Worker processes (default: CPU count); 1 lints in-process
+    """
+    version = rules_version() if cache_path else ""
+    cache = _load_cache(cache_path, version) if cache_path else {}
+    used: dict[str, list[dict]] = {}
+    violations: list[Violation] = []
+    pending: list[tuple[str, str]] = []
+    pending_keys: list[str] = []
+    for path in paths:
+        try:
+            raw = Path(path).read_bytes()
+            source = raw.decode("utf-8")
+        except (OSError, UnicodeDecodeError):
             continue
-        all_violations.extend(lint_file(path))
+        # Rules see the path (a project rule may skip tests/), so the
+        # same content elsewhere is a different entry.
+        key = f"{path}:{hashlib.sha256(raw).hexdigest()}"
+        if key in cache:
+            used[key] = cache[key]
+            violations.extend(Violation(path=path, **fields) for fields in cache[key])
+        else:
+            pending.append((path, source))
+            pending_keys.append(key)
+
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(sorted(_LOADED), list(_LOADED_DIRS)),
+        ) as pool:
+            chunk = max(1, len(pending) // (workers * 4))
+            results = list(pool.map(_lint_job, pending, chunksize=chunk))
+    else:
+        results = [_lint_job(job) for job in pending]
+
+    for key, found in zip(pending_keys, results, strict=True):
+        violations.extend(found)
+        # The path is in the key; the entry is just the findings.
+        used[key] = [
+            {k: v for k, v in asdict(violation).items() if k != "path"}
+            for violation in found
+        ]
+    if cache_path and pending:
+        entries = {**cache, **used} if len(cache) < CACHE_MAX_ENTRIES else used
+        _save_cache(cache_path, version, entries)
+    return violations
+
+
+_USAGE = (
+    "Usage: pattern_lint.py [--jobs N] [--no-cache] <file.py> ...\n"
+    "       pattern_lint.py [--jobs N] [--no-cache] --tree [pathspec ...]"
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point. Accepts file paths, or ``--tree [pathspec ...]``.
+
+    Options: ``--no-cache`` (lint everything, touch no cache) and
+    ``--jobs N`` (worker processes; 1 = serial). Exit codes: 0 clean,
+    1 violations, 2 usage error, unloadable rule or ``--tree`` outside
+    a git checkout.
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+    use_cache = "--no-cache" not in args
+    args = [a for a in args if a != "--no-cache"]
+    jobs = None
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        try:
+            jobs = max(1, int(args[i + 1]))
+        except (IndexError, ValueError):
+            print(_USAGE, file=sys.stderr)
+            return 2
+        del args[i : i + 2]
+    tree = "--tree" in args
+    args = [a for a in args if a != "--tree"]
+    if tree:
+        found = tree_files(args)
+        if found is None:
+            print("pattern_lint: --tree needs a git checkout", file=sys.stderr)
+            return 2
+        paths = found
+    elif not args:
+        print(_USAGE, file=sys.stderr)
+        return 0  # No files = no violations
+    else:
+        paths = [path for path in args if path.endswith(".py")]
+
+    errors = load_project_rules(RULES_DIR)
+    if errors:
+        for line in errors:
+            print(line, file=sys.stderr)
+        return 2
+
+    # The cache lives in the kit project's .kit/.cache; elsewhere, none.
+    cache_path = CACHE_PATH if use_cache and Path(".kit").is_dir() else None
+    all_violations = lint_paths(paths, cache_path=cache_path, jobs=jobs)
 
     if all_violations:
         for v in sorted(all_violations, key=lambda v: (v.path, v.line)):
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Test Shard Plan
+===============
+
+Split the test suite into N shards of about equal wall time, so N
+pytest processes (CI jobs, or ``CI_CHECK_SHARDS=N ./scripts/core/ci-check.sh``
+on one machine) finish together instead of waiting on the unlucky one.
+
+The plan is a committed JSON file (default ``tests/shard_plan.json``)
+of per-test-file durations in seconds. The unit is the test FILE, not
+the test: module- and class-scoped fixtures are paid once per file, so
+splitting a file would pay them once per shard.
+
+Semantics:
+
+* ``files K/N`` prints shard K's test files (1-based), one per line.
+  Files are placed longest first, each on the currently lightest shard
+  (LPT scheduling; ties go to the lower shard). The split is a pure
+  function of the plan and the file list, so every shard process
+  computes the same partition independently. A file the plan does not
+  know weighs the mean known duration (1s with no plan), so new tests
+  still spread out; a missing plan degrades to an even split by count.
+* ``record REPORT.xml`` refreshes the plan from a pytest JUnit report
+  (``pytest --junitxml=REPORT.xml``): per file, the sum of its test
+  cases' times (setup + call + teardown). Files absent from the report
+  keep their old duration; files that no longer exist are dropped.
+
+Usage:
+    python scripts/core/shard_plan.py files K/N [--plan PATH] [--tests DIR]
+    python scripts/core/shard_plan.py record REPORT.xml [--plan PATH] [--tests DIR]
+
+Exit codes:
+    0 - success
+    1 - usage error, unreadable report, or unwritable plan
+"""
+
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+PLAN_VERSION = 1
+DEFAULT_PLAN = Path("tests") / "shard_plan.json"
+DEFAULT_TESTS = Path("tests")
+
+# Weight of a file when the plan knows no file at all.
+UNKNOWN_SECONDS = 1.0
+
+
+def suite_files(tests_dir: Path) -> list[str]:
+    """Every ``test_*.py`` under *tests_dir*, as sorted posix paths."""
+    return sorted(
+        path.as_posix()
+        for path in tests_dir.rglob("test_*.py")
+        if "__pycache__" not in path.parts
+    )
+
+
+def load_plan(plan_path: Path) -> dict[str, float]:
+    """File → seconds from the plan; empty when absent or unreadable."""
+    try:
+        data = json.loads(plan_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != PLAN_VERSION:
+        return {}
+    durations = data.get("durations")
+    if not isinstance(durations, dict):
+        return {}
+    return {
+        str(name): float(seconds)
+        for name, seconds in durations.items()
+        if isinstance(seconds, (int, float))
+    }
+
+
+def save_plan(plan_path: Path, durations: dict[str, float]) -> None:
+    """Write the plan atomically, sorted, to the centisecond."""
+    data = {
+        "version": PLAN_VERSION,
+        "durations": {name: round(s, 2) for name, s in sorted(durations.items())},
+    }
+    plan_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = plan_path.with_name(f".{plan_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, plan_path)
+
+
+def split(
+    files: list[str], durations: dict[str, float], shards: int
+) -> list[list[str]]:
+    """Partition *files* into *shards* lists of about equal total time."""
+    known = [durations[f] for f in files if f in durations]
+    default = sum(known) / len(known) if known else UNKNOWN_SECONDS
+    weighted = sorted(
+        ((durations.get(f, default), f) for f in files), key=lambda p: (-p[0], p[1])
+    )
+    totals = [0.0] * shards
+    plan: list[list[str]] = [[] for _ in range(shards)]
+    for seconds, name in weighted:
+        lightest = min(range(shards), key=lambda k: (totals[k], k))
+        totals[lightest] += seconds
+        plan[lightest].append(name)
+    return [sorted(files) for files in plan]
+
+
+def _file_of(classname: str, files: set[str]) -> str | None:
+    """The test file a JUnit ``classname`` (``tests.test_x.TestY``) is in."""
+    parts = classname.split(".")
+    for end in range(len(parts), 0, -1):
+        candidate = "/".join(parts[:end]) + ".py"
+        if candidate in files:
+            return candidate
+    return None
+
+
+def durations_from_junit(report: Path, files: list[str]) -> dict[str, float]:
+    """Per-file total test-case time from a pytest JUnit XML report."""
+    known = set(files)
+    totals: dict[str, float] = {}
+    for case in ET.parse(report).iter("testcase"):
+        name = case.get("file") or _file_of(case.get("classname", ""), known)
+        if name in known:
+            totals[name] = totals.get(name, 0.0) + float(case.get("time") or 0)
+    return totals
+
+
+def _usage(message: str = "") -> int:
+    if message:
+        print(f"shard_plan: {message}", file=sys.stderr)
+    print(
+        "Usage: shard_plan.py files K/N [--plan PATH] [--tests DIR]\n"
+        "       shard_plan.py record REPORT.xml [--plan PATH] [--tests DIR]",
+        file=sys.stderr,
+    )
+    return 1
+
+
+def main(argv: list[str]) -> int:
+    args = list(argv)
+    options = {"--plan": DEFAULT_PLAN, "--tests": DEFAULT_TESTS}
+    for flag in options:
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                return _usage(f"{flag} needs a value")
+            options[flag] = Path(args[i + 1])
+            del args[i : i + 2]
+    if len(args) != 2 or args[0] not in ("files", "record"):
+        return _usage()
+    command, operand = args
+    files = suite_files(options["--tests"])
+
+    if command == "files":
+        index, _, count = operand.partition("/")
+        if not (index.isdigit() and count.isdigit() and 1 <= int(index) <= int(count)):
+            return _usage(f"bad shard {operand!r} (expected K/N, 1 <= K <= N)")
+        shard = split(files, load_plan(options["--plan"]), int(count))[int(index) - 1]
+        for name in shard:
+            print(name)
+        return 0
+
+    try:
+        measured = durations_from_junit(Path(operand), files)
+    except (OSError, ET.ParseError) as e:
+        print(f"❌ Cannot read JUnit report {operand}: {e}", file=sys.stderr)
+        return 1
+    present = set(files)
+    durations = {
+        name: seconds
+        for name, seconds in load_plan(options["--plan"]).items()
+        if name in present
+    }
+    durations.update(measured)
+    try:
+        save_plan(options["--plan"], durations)
+    except OSError as e:
+        print(f"❌ Cannot write {options['--plan']}: {e}", file=sys.stderr)
+        return 1
+    print(
+        f"✅ {options['--plan']}: {len(measured)} file(s) timed, "
+        f"{len(durations)} in the plan ({sum(durations.values()):.0f}s total)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
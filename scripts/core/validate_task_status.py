@@ -5,6 +5,15 @@ Validate Task Status
 
 Pre-commit hook to validate that task Status field matches folder location.
 
+Delegates to agentive_kit.lifecycle.validate_staged_tasks when the
+package is importable (installed, or the kit repo's own source): that
+reads the STAGED copy of every task file from the index in one
+``git cat-file --batch`` run, with the same status rule as
+``agentive validate``. Without the package (package-less consumers,
+planning repos on system python3) the inline working-tree check below
+runs instead — recorded duplication, like the inline doctor in
+scripts/core/project.
+
 Usage:
     python scripts/core/validate_task_status.py [file1.md file2.md ...]
 
@@ -18,6 +27,8 @@ import sys
 from pathlib import Path
 from typing import Optional, Tuple
 
+from kit_import import import_kit_module
+
 # Folder to expected status mapping
 FOLDER_STATUS_MAP = {
     "1-backlog": "Backlog",
@@ -95,17 +106,31 @@ def main():
         print("Usage: validate_task_status.py [file1.md file2.md ...]")
         sys.exit(0)
 
-    errors = []
+    # Only validate task files
+    task_files = [
+        Path(arg)
+        for arg in sys.argv[1:]
+        if arg.endswith(".md") and ".kit/tasks/" in Path(arg).as_posix()
+    ]
+    if not task_files:
+        sys.exit(0)
 
-    for arg in sys.argv[1:]:
-        file_path = Path(arg)
+    # An installed agentive-kit older than these scripts (consumers sync
+    # scripts/core separately) has no validate_staged_tasks: check inline.
+    lifecycle = import_kit_module("lifecycle")
+    validate_staged_tasks = getattr(lifecycle, "validate_staged_tasks", None)
+    if validate_staged_tasks is not None:
+        report = validate_staged_tasks(
+            Path.cwd(), [path.as_posix() for path in task_files]
+        )
+        # None: no readable index (not a git checkout) — check the
+        # working tree instead.
+        if report is not None:
+            sys.exit(0 if report.ok else 1)
 
-        # Only validate task files
-        if not file_path.name.endswith(".md"):
-            continue
-        if ".kit/tasks/" not in str(file_path):
-            continue
+    errors = []
 
+    for file_path in task_files:
         is_valid, error = validate_task(file_path)
         if not is_valid:
             errors.append(error)
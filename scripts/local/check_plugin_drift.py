@@ -32,18 +32,28 @@ bump-hashes-forget-bodies release is caught there, not here (KIT-0109
 retro: this guard alone goes green over stale published content).
 
 Runs in CI only — it fetches the roster over the network by default, so it
-must never be wired into pre-commit. Exit codes follow the kit convention:
-``0`` in sync, ``1`` drift detected, ``2`` usage/environment error,
-``4`` roster fetch/parse error.
+must never be wired into pre-commit. The fetched roster is cached under
+``.kit/.cache/plugin-roster/`` with its ``ETag``/``Last-Modified``: the
+next run revalidates with ``If-None-Match``/``If-Modified-Since`` (a 304
+costs no body), ``--offline`` uses the cached copy without touching the
+network, and a failed fetch (after ``--retries`` retries, each bounded by
+``--timeout``) falls back to the cached copy with a warning. Exit codes
+follow the kit convention: ``0`` in sync, ``1`` drift detected, ``2``
+usage/environment error, ``4`` no valid roster — neither the network nor
+the cache could supply one.
 """
 
 from __future__ import annotations
 
 import argparse
 import hashlib
+import json
+import os
 import sys
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
 
 DEFAULT_ROSTER_URL = (
@@ -64,13 +74,64 @@ EXIT_DRIFT = 1
 EXIT_USAGE = 2
 EXIT_ROSTER_IO = 4
 
+# Cached roster copies, relative to the kit root.
+DEFAULT_CACHE_DIR = Path(".kit") / ".cache" / "plugin-roster"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 2
+# Seconds before the first retry; doubled for each one after.
+RETRY_BACKOFF = 1.0
+
+# Read size for streaming hashes: a file is never held whole in memory.
+HASH_CHUNK = 1 << 16
+# Hashing threads: hashlib and file reads release the GIL, so threads
+# overlap the I/O of a full roster without a process pool.
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def sha256_of(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(paths: list[Path]) -> dict[Path, str | OSError]:
+    """sha256 of every path, hashed concurrently with streaming reads.
+
+    A file that cannot be read maps to its OSError, so one unreadable
+    source is a per-component finding, not a crash.
+    """
+
+    def one(path: Path) -> str | OSError:
+        try:
+            return sha256_of(path)
+        except OSError as exc:
+            return exc
+
+    unique = list(dict.fromkeys(paths))
+    if len(unique) < 2:
+        return {path: one(path) for path in unique}
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        return dict(zip(unique, pool.map(one, unique)))
+
+
+class RosterError(Exception):
+    """A roster that cannot be parsed or trusted (message is printable)."""
 
 
-def load_roster_text(roster_file: str | None, roster_url: str) -> str:
-    """Return roster YAML text from a local file or over HTTP."""
+def load_roster_text(
+    roster_file: str | None,
+    roster_url: str,
+    cache_dir: Path | None = None,
+    offline: bool = False,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> str:
+    """Return roster YAML text from a local file, the network or the cache.
+
+    A local file is read as-is. Otherwise see ``fetch_roster``.
+    """
     if roster_file is not None:
         path = Path(roster_file)
         try:
@@ -78,16 +139,128 @@ def load_roster_text(roster_file: str | None, roster_url: str) -> str:
         except OSError as exc:
             print(f"ERROR: cannot read roster file {path}: {exc}")
             raise SystemExit(EXIT_ROSTER_IO) from exc
+    return fetch_roster(roster_url, cache_dir, offline, timeout, retries)
+
+
+def _cache_paths(cache_dir: Path, url: str) -> tuple[Path, Path]:
+    """(body, metadata) cache files for *url*."""
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return cache_dir / f"roster-{key}.yaml", cache_dir / f"roster-{key}.json"
+
+
+def _read_cache(cache_dir: Path | None, url: str) -> tuple[str, dict] | None:
+    """The cached roster for *url* and its metadata, when present AND valid."""
+    if cache_dir is None:
+        return None
+    body, meta = _cache_paths(cache_dir, url)
     try:
-        with urllib.request.urlopen(roster_url, timeout=30) as resp:
-            return resp.read().decode("utf-8")
-    except (urllib.error.URLError, OSError, ValueError) as exc:
-        print(f"ERROR: cannot fetch roster from {roster_url}: {exc}")
-        raise SystemExit(EXIT_ROSTER_IO) from exc
+        text = body.read_text(encoding="utf-8")
+        info = json.loads(meta.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(info, dict) or info.get("url") != url:
+        return None
+    try:
+        read_roster(text)
+    except RosterError:
+        return None
+    return text, info
+
+
+def _write_cache(cache_dir: Path, url: str, text: str, headers) -> None:
+    """Store a fetched roster with its validators; a failure only warns."""
+    body, meta = _cache_paths(cache_dir, url)
+    info = {
+        "url": url,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for path, data in ((body, text), (meta, json.dumps(info, indent=2) + "\n")):
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(data, encoding="utf-8")
+            os.replace(tmp, path)
+    except OSError as exc:
+        print(f"WARNING: cannot cache the roster in {cache_dir}: {exc}")
+
+
+def fetch_roster(
+    url: str,
+    cache_dir: Path | None,
+    offline: bool = False,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> str:
+    """Roster text from *url*, revalidating and falling back to the cache.
+
+    With a valid cached copy the request is conditional, and a 304 reuses
+    it. Connection failures, timeouts, 429 and 5xx answers are retried
+    with exponential backoff; other HTTP errors and an invalid roster
+    body are not (a retry would get the same answer). Whatever the
+    failure, a valid cached copy is used with a warning; exits
+    EXIT_ROSTER_IO only when there is none. ``offline`` never touches
+    the network.
+    """
+    cached = _read_cache(cache_dir, url)
+    if offline:
+        if cached is None:
+            print(f"ERROR: --offline but no valid cached roster for {url}")
+            raise SystemExit(EXIT_ROSTER_IO)
+        print(f"roster: offline — using the copy cached {cached[1]['fetched_at']}")
+        return cached[0]
+
+    headers = {}
+    if cached is not None:
+        if cached[1].get("etag"):
+            headers["If-None-Match"] = cached[1]["etag"]
+        if cached[1].get("last_modified"):
+            headers["If-Modified-Since"] = cached[1]["last_modified"]
+    error = "no attempt made"
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as resp:
+                text = resp.read().decode("utf-8")
+                response_headers = resp.headers
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and cached is not None:
+                print("roster: not modified since the cached copy")
+                return cached[0]
+            error = f"HTTP {exc.code}"
+            if exc.code == 429 or exc.code >= 500:
+                continue
+            break
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            error = str(exc)
+            continue
+        try:
+            read_roster(text)
+        except RosterError as exc:
+            error = f"the served roster is invalid: {exc}"
+            break
+        if cache_dir is not None:
+            _write_cache(cache_dir, url, text, response_headers)
+        return text
+
+    if cached is not None:
+        print(
+            f"WARNING: cannot fetch roster from {url} ({error}) — using the "
+            f"copy cached {cached[1]['fetched_at']}"
+        )
+        return cached[0]
+    print(f"ERROR: cannot fetch roster from {url}: {error}")
+    raise SystemExit(EXIT_ROSTER_IO)
 
 
-def parse_roster(text: str) -> list[dict]:
-    """Parse roster YAML and return the components list."""
+def read_roster(text: str) -> list[dict]:
+    """Parse roster YAML and return the components list.
+
+    Raises RosterError for anything but a valid roster.
+    """
     try:
         import yaml
     except ImportError as exc:  # pragma: no cover - environment guard
@@ -99,16 +272,26 @@ def parse_roster(text: str) -> list[dict]:
     try:
         data = yaml.safe_load(text)
     except yaml.YAMLError as exc:
-        print(f"ERROR: roster is not valid YAML: {exc}")
-        raise SystemExit(EXIT_ROSTER_IO) from exc
+        raise RosterError(f"roster is not valid YAML: {exc}") from exc
     if not isinstance(data, dict) or not isinstance(data.get("components"), list):
-        print("ERROR: roster has no 'components' list.")
-        raise SystemExit(EXIT_ROSTER_IO)
+        raise RosterError("roster has no 'components' list.")
     components = data["components"]
     _validate_components(components)
     return components
 
 
+def parse_roster(text: str) -> list[dict]:
+    """Parse roster YAML and return the components list.
+
+    An invalid roster prints the reason and exits EXIT_ROSTER_IO.
+    """
+    try:
+        return read_roster(text)
+    except RosterError as exc:
+        print(f"ERROR: {exc}")
+        raise SystemExit(EXIT_ROSTER_IO) from exc
+
+
 def _validate_components(components: list) -> None:
     """Reject malformed roster records before any field access.
 
@@ -117,6 +300,7 @@ def _validate_components(components: list) -> None:
     crash mid-check instead of taking the documented invalid-roster exit.
     Lexical source validation runs here for EVERY entry (including
     ships:false) so a traversal path never enters any later logic.
+    Raises RosterError listing every problem.
     """
     problems: list[str] = []
     for i, comp in enumerate(components):
@@ -144,10 +328,9 @@ def _validate_components(components: list) -> None:
         if not isinstance(comp.get("ships", False), bool):
             problems.append(f"{label}: non-boolean ships")
     if problems:
-        print("ERROR: roster records are malformed:")
-        for p in problems:
-            print(f"  - {p}")
-        raise SystemExit(EXIT_ROSTER_IO)
+        raise RosterError(
+            "roster records are malformed:\n" + "\n".join(f"  - {p}" for p in problems)
+        )
 
 
 def _contained_source(kit_root: Path, source: str) -> Path | None:
@@ -168,9 +351,15 @@ def _contained_source(kit_root: Path, source: str) -> Path | None:
 
 
 def check_drift(kit_root: Path, components: list[dict]) -> list[str]:
-    """Return a list of drift findings (empty = in sync)."""
+    """Return a list of drift findings (empty = in sync).
+
+    Shipped sources are hashed together (``hash_files``) after the roster
+    walk; their findings keep their roster position.
+    """
     findings: list[str] = []
     rostered_sources: set[str] = set()
+    # findings index -> (name, source, path, recorded) awaiting its hash
+    pending: dict[int, tuple[str, str, Path, str]] = {}
 
     for comp in components:
         name = comp.get("name", "<unnamed>")
@@ -207,16 +396,20 @@ def check_drift(kit_root: Path, components: list[dict]) -> list[str]:
         if recorded is None:
             findings.append(f"{name}: ships=true but no kit_sha256 in roster")
             continue
-        try:
-            actual = sha256_of(path)
-        except OSError as exc:
-            findings.append(f"{name}: cannot read {source} for hashing: {exc}")
-            continue
-        if actual != recorded:
-            findings.append(
+        pending[len(findings)] = (name, source, path, recorded)
+        findings.append("")  # filled in (or dropped) once hashed
+
+    hashes = hash_files([path for _, _, path, _ in pending.values()])
+    for i, (name, source, path, recorded) in pending.items():
+        actual = hashes[path]
+        if isinstance(actual, OSError):
+            findings[i] = f"{name}: cannot read {source} for hashing: {actual}"
+        elif actual != recorded:
+            findings[i] = (
                 f"{name}: kit content is newer than the published release "
                 f"({source}: {actual[:12]}… != rostered {recorded[:12]}…)"
             )
+    findings = [f for f in findings if f]
 
     for pattern in COMPONENT_GLOBS:
         for path in sorted(kit_root.glob(pattern)):
@@ -252,14 +445,59 @@ def main(argv: list[str] | None = None) -> int:
         default=str(Path(__file__).resolve().parent.parent.parent),
         help="kit repo root (default: this checkout)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"roster cache directory (default: <kit-root>/{DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="neither read nor write the roster cache",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="use the cached roster; never touch the network",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"seconds per fetch attempt (default: {DEFAULT_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="retries after a failed fetch, with exponential backoff "
+        f"(default: {DEFAULT_RETRIES})",
+    )
     args = parser.parse_args(argv)
 
     kit_root = Path(args.kit_root)
     if not (kit_root / ".claude").is_dir():
         print(f"ERROR: {kit_root} has no .claude/ directory — wrong --kit-root?")
         return EXIT_USAGE
+    if args.timeout <= 0 or args.retries < 0:
+        print("ERROR: --timeout must be positive and --retries non-negative.")
+        return EXIT_USAGE
+    if args.no_cache and args.offline:
+        print("ERROR: --offline needs the cache; drop --no-cache.")
+        return EXIT_USAGE
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = (
+            Path(args.cache_dir) if args.cache_dir else kit_root / DEFAULT_CACHE_DIR
+        )
 
-    text = load_roster_text(args.roster_file, args.roster_url)
+    text = load_roster_text(
+        args.roster_file,
+        args.roster_url,
+        cache_dir=cache_dir,
+        offline=args.offline,
+        timeout=args.timeout,
+        retries=args.retries,
+    )
     components = parse_roster(text)
     findings = check_drift(kit_root, components)
 
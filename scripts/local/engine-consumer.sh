@@ -340,6 +340,7 @@ PLANNING_CORE=(
     __init__.py
     check-bots.sh
     check_cross_repo_config.py
+    kit_import.py
     lib/target_repo.sh
     logging_config.py
     project
@@ -13,9 +13,10 @@ component in ``plugins/agentive-workflow/roster.yaml``:
    tree, ours = the published plugin body. A straight copy would flatten
    the KIT-ADR-0025 generalization the plugin bodies legitimately carry.
    ``kit_sha256`` is a CONTENT hash, not a git blob id — the base is
-   found by walking the kit file's history and hashing each version
-   until it matches (``find_base_content``). No historical match is a
-   loud per-component failure (exit 3), never a silent copy.
+   found by hashing every historical version of the drifted sources
+   (``build_history_index``: one ``git log --raw`` plus one ``git
+   cat-file --batch`` pipe for the whole work-list). No historical match
+   is a loud per-component failure (exit 3), never a silent copy.
 3. **Conflicts are surfaced, not solved**: a conflicting merge leaves
    the published body untouched and writes the conflict-marked result
    next to it as ``<body>.conflict`` for the human (exit 1).
@@ -26,6 +27,10 @@ component in ``plugins/agentive-workflow/roster.yaml``:
    marketplace-side CI check verifies (the drift guard's blind half;
    see the division-of-verification note in ``check_plugin_drift.py``).
 
+The merge runs in-process (``merge_in_process``, a port of git's xdiff
+merge producing ``git merge-file``'s exact output); ``--git-merge-file``
+forks ``git merge-file`` per component instead.
+
 Modes: default = full resync; ``--dry-run`` emits the work-list only;
 ``--hashes-only`` skips all body writes and only refreshes the
 ``plugin_sha256`` column (used to populate the column without touching
@@ -75,6 +80,9 @@ EXIT_USAGE = 2
 EXIT_INTEGRITY = 3
 EXIT_ROSTER_IO = 4
 
+# Seconds one git call may take; a wedged git must fail the run, not hang it.
+GIT_TIMEOUT = 120
+
 
 class ResyncError(Exception):
     """A per-component or environment failure worth naming loudly."""
@@ -89,9 +97,14 @@ def _git(repo: Path, *args: str) -> subprocess.CompletedProcess:
         return subprocess.run(
             ["git", "-C", str(repo), *args],
             capture_output=True,
+            timeout=GIT_TIMEOUT,
         )
     except FileNotFoundError as exc:
         raise ResyncError("git is not on PATH — the resync needs it") from exc
+    except subprocess.TimeoutExpired as exc:
+        raise ResyncError(
+            f"git {args[0]} timed out after {GIT_TIMEOUT}s in {repo}"
+        ) from exc
 
 
 def plugin_body_relpath(comp: dict) -> str:
@@ -132,15 +145,136 @@ def validate_shipped(components: list[dict]) -> None:
         raise SystemExit(EXIT_ROSTER_IO)
 
 
-def find_base_content(kit_root: Path, source: str, want_sha256: str) -> bytes | None:
+# source path -> {content sha256 -> content}, for every committed version.
+HistoryIndex = dict[str, dict[str, bytes]]
+
+
+def _history_blobs(kit_root: Path, sources: list[str]) -> dict[str, set[str]]:
+    """Blob ids of every committed version of *sources*, per source.
+
+    One ``git log --raw`` over all paths: each commit that touched a
+    source lists the blob it left there (``-m``: merge commits too, so
+    a version created while resolving a merge is not missed).
+    """
+    proc = _git(
+        kit_root,
+        "-c",
+        "core.quotePath=false",
+        "log",
+        "--format=%H",
+        "--raw",
+        "--no-abbrev",
+        "--no-renames",
+        "-m",
+        "--",
+        *sources,
+    )
+    if proc.returncode != 0:
+        raise ResyncError(
+            f"git log failed for {', '.join(sources)} in {kit_root}: "
+            f"{proc.stderr.decode('utf-8', 'replace').strip()}"
+        )
+    wanted = set(sources)
+    blobs: dict[str, set[str]] = {source: set() for source in sources}
+    for line in proc.stdout.decode("utf-8", "replace").splitlines():
+        # :<old mode> <new mode> <old oid> <new oid> <status>\t<path>
+        if not line.startswith(":"):
+            continue
+        meta, _, path = line.partition("\t")
+        fields = meta.split()
+        if len(fields) < 5 or path not in wanted:
+            continue
+        new_mode, new_oid = fields[1], fields[3]
+        if new_oid.strip("0") and new_mode != "160000":
+            blobs[path].add(new_oid)
+    return blobs
+
+
+def _cat_blobs(kit_root: Path, oids: list[str]) -> dict[str, bytes] | None:
+    """Contents of *oids*, read through one ``git cat-file --batch`` pipe.
+
+    None when the read does not finish within ``GIT_TIMEOUT``.
+    """
+    if not oids:
+        return {}
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(kit_root), "cat-file", "--batch"],
+            input="".join(f"{oid}\n" for oid in oids).encode(),
+            capture_output=True,
+            timeout=GIT_TIMEOUT,
+        )
+    except FileNotFoundError as exc:
+        raise ResyncError("git is not on PATH — the resync needs it") from exc
+    except subprocess.TimeoutExpired:
+        return None
+    if proc.returncode != 0:
+        raise ResyncError(
+            f"git cat-file failed in {kit_root}: "
+            f"{proc.stderr.decode('utf-8', 'replace').strip()}"
+        )
+    out = proc.stdout
+    contents: dict[str, bytes] = {}
+    pos = 0
+    while pos < len(out):
+        end = out.index(b"\n", pos)
+        header = out[pos:end].decode("ascii", "replace").split()
+        pos = end + 1
+        if len(header) != 3:
+            continue  # "<oid> missing"
+        oid, _, size = header
+        contents[oid] = out[pos : pos + int(size)]
+        pos += int(size) + 1  # the content is followed by a newline
+    return contents
+
+
+def build_history_index(kit_root: Path, sources: list[str]) -> HistoryIndex:
+    """Hash every committed version of every source in one pass.
+
+    Two processes in all, however many sources and revisions: the
+    ``git log --raw`` enumeration and the ``cat-file --batch`` read.
+    An empty index when the read times out (no history index: lookups
+    fall back to ``find_base_content``'s per-revision walk).
+    """
+    sources = list(dict.fromkeys(sources))
+    if not sources:
+        return {}
+    blobs = _history_blobs(kit_root, sources)
+    contents = _cat_blobs(kit_root, sorted(set().union(*blobs.values())))
+    if contents is None:
+        return {}
+    index: HistoryIndex = {}
+    for source, oids in blobs.items():
+        index[source] = {
+            sha256_bytes(contents[oid]): contents[oid]
+            for oid in oids
+            if oid in contents
+        }
+    return index
+
+
+def find_base_content(
+    kit_root: Path,
+    source: str,
+    want_sha256: str,
+    index: HistoryIndex | None = None,
+) -> bytes | None:
     """Return the historical kit content whose sha256 matches the roster.
 
     ``kit_sha256`` is a content hash, not a git blob id, so the base is
-    found by walking the file's history (``git log --format=%H --
-    <path>``) and hashing each version (``git show <rev>:<path>``) until
-    one matches. Returns None when no historical version matches — the
-    caller must fail loud, never fall back to a copy.
+    looked up in a history index of every committed version of the file
+    (built for just this source unless the caller passes a shared
+    *index*). When the index lacks the source (its batch read timed
+    out), the file's revisions are hashed one ``git show`` at a time
+    until one matches; a shared index is never rebuilt, so one wedged
+    git costs one timeout, not one per source.
+    Returns None when no historical version matches — the caller must
+    fail loud, never fall back to a copy.
     """
+    if index is None:
+        index = build_history_index(kit_root, [source])
+    if source in index:
+        return index[source].get(want_sha256)
     proc = _git(kit_root, "log", "--format=%H", "--", source)
     if proc.returncode != 0:
         raise ResyncError(
@@ -156,12 +290,618 @@ def find_base_content(kit_root: Path, source: str, want_sha256: str) -> bytes |
     return None
 
 
-def merge_three_way(ours: bytes, base: bytes, theirs: bytes) -> tuple[bytes, bool]:
-    """git merge-file: apply base→theirs (kit) changes onto ours (plugin).
+# ---- In-process three-way merge (a port of git's xdiff merge) ----
+#
+# ``merge_three_way`` used to fork ``git merge-file`` per component with
+# its three inputs in a temp dir. The engine below produces the same
+# bytes in-process: xdiff's Myers diff (record preparation, divide and
+# conquer, change compaction), its merge walk, and ``merge-file``'s
+# default ZEALOUS_ALNUM refinement with merge-style markers. Parity with
+# ``git merge-file`` is pinned by tests; ``--git-merge-file`` keeps the
+# subprocess path for a differential check.
+
+_MARKER_SIZE = 7
+_SNAKE_CNT = 20  # XDL_SNAKE_CNT
+_HEUR_MIN_COST = 256  # XDL_HEUR_MIN_COST
+_MAX_COST_MIN = 256  # XDL_MAX_COST_MIN
+_K_HEUR = 4  # XDL_K_HEUR
+_MAX_EQLIMIT = 1024  # XDL_MAX_EQLIMIT
+_SIMSCAN_WINDOW = 100  # XDL_SIMSCAN_WINDOW
+_KPDIS_RUN = 4  # XDL_KPDIS_RUN
+_LINE_MAX = sys.maxsize
+_ALNUM = re.compile(rb"[A-Za-z0-9]")  # C-locale isalnum
+
+# One edit-script hunk: (base start, base count, side start, side count).
+_Change = tuple[int, int, int, int]
+
+
+def _records(data: bytes) -> list[bytes]:
+    """xdiff records: lines WITH their newline; a last line may lack one."""
+    lines = data.split(b"\n")
+    records = [line + b"\n" for line in lines[:-1]]
+    if lines[-1]:
+        records.append(lines[-1])
+    return records
+
+
+def _bogosqrt(n: int) -> int:
+    i = 1
+    while n > 0:
+        i <<= 1
+        n >>= 2
+    return i
+
+
+def _discards(
+    ha: list[int], dstart: int, dend: int, other_counts: dict[int, int]
+) -> list[int]:
+    """xdl_cleanup_records classification: 0 no match in the other file,
+    1 matched, 2 matched too often to be a useful anchor."""
+    mlim = min(_bogosqrt(len(ha)), _MAX_EQLIMIT)
+    dis = [0] * (len(ha) + 1)
+    for i in range(dstart, dend + 1):
+        nm = other_counts.get(ha[i], 0)
+        dis[i] = 0 if nm == 0 else 2 if nm >= mlim else 1
+    return dis
+
+
+def _clean_mmatch(dis: list[int], i: int, s: int, e: int) -> bool:
+    """Whether multimatch line *i* sits inside a run of unmatched lines
+    (and so is discarded from the diff's core)."""
+    s = max(s, i - _SIMSCAN_WINDOW)
+    e = min(e, i + _SIMSCAN_WINDOW)
+    rdis0, rpdis0 = 0, 1
+    r = 1
+    while i - r >= s:
+        if not dis[i - r]:
+            rdis0 += 1
+        elif dis[i - r] == 2:
+            rpdis0 += 1
+        else:
+            break
+        r += 1
+    if rdis0 == 0:
+        return False
+    rdis1, rpdis1 = 0, 1
+    r = 1
+    while i + r <= e:
+        if not dis[i + r]:
+            rdis1 += 1
+        elif dis[i + r] == 2:
+            rpdis1 += 1
+        else:
+            break
+        r += 1
+    if rdis1 == 0:
+        return False
+    rdis1 += rdis0
+    rpdis1 += rpdis0
+    return rpdis1 * _KPDIS_RUN < rpdis1 + rdis1
+
+
+def _split(
+    ha1: list[int],
+    off1: int,
+    lim1: int,
+    ha2: list[int],
+    off2: int,
+    lim2: int,
+    kvdf: list[int],
+    kvdb: list[int],
+    koff: int,
+    need_min: bool,
+    mxcost: int,
+) -> tuple[int, int, bool, bool]:
+    """xdl_split: the middle snake of a box, as (i1, i2, min_lo, min_hi)."""
+    dmin, dmax = off1 - lim2, lim1 - off2
+    fmid, bmid = off1 - off2, lim1 - lim2
+    odd = (fmid - bmid) & 1
+    fmin = fmax = fmid
+    bmin = bmax = bmid
+    kvdf[fmid + koff] = off1
+    kvdb[bmid + koff] = lim1
+    ec = 0
+    while True:
+        ec += 1
+        got_snake = False
+        if fmin > dmin:
+            fmin -= 1
+            kvdf[fmin - 1 + koff] = -1
+        else:
+            fmin += 1
+        if fmax < dmax:
+            fmax += 1
+            kvdf[fmax + 1 + koff] = -1
+        else:
+            fmax -= 1
+        for d in range(fmax, fmin - 1, -2):
+            if kvdf[d - 1 + koff] >= kvdf[d + 1 + koff]:
+                i1 = kvdf[d - 1 + koff] + 1
+            else:
+                i1 = kvdf[d + 1 + koff]
+            prev1 = i1
+            i2 = i1 - d
+            while i1 < lim1 and i2 < lim2 and ha1[i1] == ha2[i2]:
+                i1 += 1
+                i2 += 1
+            if i1 - prev1 > _SNAKE_CNT:
+                got_snake = True
+            kvdf[d + koff] = i1
+            if odd and bmin <= d <= bmax and kvdb[d + koff] <= i1:
+                return i1, i2, True, True
+
+        if bmin > dmin:
+            bmin -= 1
+            kvdb[bmin - 1 + koff] = _LINE_MAX
+        else:
+            bmin += 1
+        if bmax < dmax:
+            bmax += 1
+            kvdb[bmax + 1 + koff] = _LINE_MAX
+        else:
+            bmax -= 1
+        for d in range(bmax, bmin - 1, -2):
+            if kvdb[d - 1 + koff] < kvdb[d + 1 + koff]:
+                i1 = kvdb[d - 1 + koff]
+            else:
+                i1 = kvdb[d + 1 + koff] - 1
+            prev1 = i1
+            i2 = i1 - d
+            while i1 > off1 and i2 > off2 and ha1[i1 - 1] == ha2[i2 - 1]:
+                i1 -= 1
+                i2 -= 1
+            if prev1 - i1 > _SNAKE_CNT:
+                got_snake = True
+            kvdb[d + koff] = i1
+            if not odd and fmin <= d <= fmax and i1 <= kvdf[d + koff]:
+                return i1, i2, True, True
+
+        if need_min:
+            continue
+
+        # Costly diff: settle for a long-enough snake far from the corner.
+        if got_snake and ec > _HEUR_MIN_COST:
+            best = 0
+            for d in range(fmax, fmin - 1, -2):
+                dd = abs(d - fmid)
+                i1 = kvdf[d + koff]
+                i2 = i1 - d
+                v = (i1 - off1) + (i2 - off2) - dd
+                if (
+                    v > _K_HEUR * ec
+                    and v > best
+                    and off1 + _SNAKE_CNT <= i1 < lim1
+                    and off2 + _SNAKE_CNT <= i2 < lim2
+                ):
+                    k = 1
+                    while ha1[i1 - k] == ha2[i2 - k]:
+                        if k == _SNAKE_CNT:
+                            best = v
+                            split = (i1, i2)
+                            break
+                        k += 1
+            if best > 0:
+                return split[0], split[1], True, False
+            best = 0
+            for d in range(bmax, bmin - 1, -2):
+                dd = abs(d - bmid)
+                i1 = kvdb[d + koff]
+                i2 = i1 - d
+                v = (lim1 - i1) + (lim2 - i2) - dd
+                if (
+                    v > _K_HEUR * ec
+                    and v > best
+                    and off1 < i1 <= lim1 - _SNAKE_CNT
+                    and off2 < i2 <= lim2 - _SNAKE_CNT
+                ):
+                    k = 0
+                    while ha1[i1 + k] == ha2[i2 + k]:
+                        if k == _SNAKE_CNT - 1:
+                            best = v
+                            split = (i1, i2)
+                            break
+                        k += 1
+            if best > 0:
+                return split[0], split[1], False, True
+
+        # Enough is enough: take the furthest-reaching path.
+        if ec >= mxcost:
+            fbest = fbest1 = -1
+            for d in range(fmax, fmin - 1, -2):
+                i1 = min(kvdf[d + koff], lim1)
+                i2 = i1 - d
+                if lim2 < i2:
+                    i1, i2 = lim2 + d, lim2
+                if fbest < i1 + i2:
+                    fbest, fbest1 = i1 + i2, i1
+            bbest = bbest1 = _LINE_MAX
+            for d in range(bmax, bmin - 1, -2):
+                i1 = max(off1, kvdb[d + koff])
+                i2 = i1 - d
+                if i2 < off2:
+                    i1, i2 = off2 + d, off2
+                if i1 + i2 < bbest:
+                    bbest, bbest1 = i1 + i2, i1
+            if (lim1 + lim2) - bbest < fbest - (off1 + off2):
+                return fbest1, fbest - fbest1, True, False
+            return bbest1, bbest - bbest1, False, True
+
+
+def _compact(
+    ha: list[int], rchg: list[bool], ha_o: list[int], rchg_o: list[bool]
+) -> None:
+    """xdl_change_compact: slide each change group as far down as it
+    goes, then back up to line up with a change in the other file.
+
+    ``rchg`` carries a sentinel at each end: line ``i`` is ``rchg[i + 1]``.
+    """
+    n, n_o = len(ha), len(ha_o)
+
+    def init(rc: list[bool]) -> list[int]:
+        end = 0
+        while rc[end + 1]:
+            end += 1
+        return [0, end]
+
+    def next_group(rc: list[bool], size: int, g: list[int]) -> bool:
+        if g[1] == size:
+            return False
+        g[0] = g[1] + 1
+        g[1] = g[0]
+        while rc[g[1] + 1]:
+            g[1] += 1
+        return True
+
+    def previous_group(rc: list[bool], g: list[int]) -> bool:
+        if g[0] == 0:
+            return False
+        g[1] = g[0] - 1
+        g[0] = g[1]
+        while rc[g[0]]:  # line g[0] - 1
+            g[0] -= 1
+        return True
+
+    def slide_up(g: list[int]) -> bool:
+        if g[0] > 0 and ha[g[0] - 1] == ha[g[1] - 1]:
+            g[0] -= 1
+            rchg[g[0] + 1] = True
+            g[1] -= 1
+            rchg[g[1] + 1] = False
+            while rchg[g[0]]:
+                g[0] -= 1
+            return True
+        return False
+
+    def slide_down(g: list[int]) -> bool:
+        if g[1] < n and ha[g[0]] == ha[g[1]]:
+            rchg[g[0] + 1] = False
+            g[0] += 1
+            rchg[g[1] + 1] = True
+            g[1] += 1
+            while rchg[g[1] + 1]:
+                g[1] += 1
+            return True
+        return False
+
+    g, go = init(rchg), init(rchg_o)
+    while True:
+        if g[1] != g[0]:
+            while True:
+                groupsize = g[1] - g[0]
+                end_matching_other = -1
+                while slide_up(g):
+                    previous_group(rchg_o, go)
+                earliest_end = g[1]
+                if go[1] > go[0]:
+                    end_matching_other = g[1]
+                while slide_down(g):
+                    next_group(rchg_o, n_o, go)
+                    if go[1] > go[0]:
+                        end_matching_other = g[1]
+                if groupsize == g[1] - g[0]:
+                    break
+            if g[1] != earliest_end and end_matching_other != -1:
+                while go[1] == go[0]:
+                    slide_up(g)
+                    previous_group(rchg_o, go)
+        if not next_group(rchg, n, g):
+            break
+        next_group(rchg_o, n_o, go)
+
+
+def _diff(recs1: list[bytes], recs2: list[bytes]) -> list[_Change]:
+    """xdiff's Myers diff of two record lists, as an edit script."""
+    classes: dict[bytes, int] = {}
+    ha1 = [classes.setdefault(r, len(classes)) for r in recs1]
+    ha2 = [classes.setdefault(r, len(classes)) for r in recs2]
+    n1, n2 = len(ha1), len(ha2)
+    rchg1 = [False] * (n1 + 2)
+    rchg2 = [False] * (n2 + 2)
+
+    # xdl_trim_ends + xdl_cleanup_records: the common head and tail are
+    # never part of the core; lines with no counterpart are changed
+    # outright and dropped from it.
+    lim = min(n1, n2)
+    start = 0
+    while start < lim and ha1[start] == ha2[start]:
+        start += 1
+    tail = 0
+    while tail < lim - start and ha1[n1 - 1 - tail] == ha2[n2 - 1 - tail]:
+        tail += 1
+    dend1, dend2 = n1 - tail - 1, n2 - tail - 1
+    counts1: dict[int, int] = {}
+    counts2: dict[int, int] = {}
+    for h in ha1:
+        counts1[h] = counts1.get(h, 0) + 1
+    for h in ha2:
+        counts2[h] = counts2.get(h, 0) + 1
+    dis1 = _discards(ha1, start, dend1, counts2)
+    dis2 = _discards(ha2, start, dend2, counts1)
+    cores = []
+    for ha, dis, dend, rchg in (
+        (ha1, dis1, dend1, rchg1),
+        (ha2, dis2, dend2, rchg2),
+    ):
+        rindex, core = [], []
+        for i in range(start, dend + 1):
+            if dis[i] == 1 or (dis[i] == 2 and not _clean_mmatch(dis, i, start, dend)):
+                rindex.append(i)
+                core.append(ha[i])
+            else:
+                rchg[i + 1] = True
+        cores.append((rindex, core))
+    (rindex1, core1), (rindex2, core2) = cores
+
+    # xdl_recs_cmp: divide and conquer on the middle snake, lower box
+    # first (the K vectors are shared, as in xdiff).
+    nreff1, nreff2 = len(core1), len(core2)
+    koff = nreff2 + 1
+    kvdf = [0] * (nreff1 + nreff2 + 3)
+    kvdb = [0] * (nreff1 + nreff2 + 3)
+    mxcost = max(_bogosqrt(nreff1 + nreff2 + 3), _MAX_COST_MIN)
+    stack = [(0, nreff1, 0, nreff2, False)]
+    while stack:
+        off1, lim1, off2, lim2, need_min = stack.pop()
+        while off1 < lim1 and off2 < lim2 and core1[off1] == core2[off2]:
+            off1 += 1
+            off2 += 1
+        while off1 < lim1 and off2 < lim2 and core1[lim1 - 1] == core2[lim2 - 1]:
+            lim1 -= 1
+            lim2 -= 1
+        if off1 == lim1:
+            for k in range(off2, lim2):
+                rchg2[rindex2[k] + 1] = True
+        elif off2 == lim2:
+            for k in range(off1, lim1):
+                rchg1[rindex1[k] + 1] = True
+        else:
+            i1, i2, min_lo, min_hi = _split(
+                core1, off1, lim1, core2, off2, lim2, kvdf, kvdb, koff, need_min, mxcost
+            )
+            stack.append((i1, lim1, i2, lim2, min_hi))
+            stack.append((off1, i1, off2, i2, min_lo))
+
+    _compact(ha1, rchg1, ha2, rchg2)
+    _compact(ha2, rchg2, ha1, rchg1)
+
+    # xdl_build_script
+    script: list[_Change] = []
+    i1, i2 = n1, n2
+    while i1 >= 0 or i2 >= 0:
+        if (i1 > 0 and rchg1[i1]) or (i2 > 0 and rchg2[i2]):
+            l1, l2 = i1, i2
+            while i1 > 0 and rchg1[i1]:
+                i1 -= 1
+            while i2 > 0 and rchg2[i2]:
+                i2 -= 1
+            script.append((i1, l1 - i1, i2, l2 - i2))
+        i1 -= 1
+        i2 -= 1
+    script.reverse()
+    return script
+
+
+def _append_merge(
+    hunks: list[list[int]],
+    mode: int,
+    i0: int,
+    c0: int,
+    i1: int,
+    c1: int,
+    i2: int,
+    c2: int,
+) -> None:
+    """xdl_append_merge: overlapping or touching hunks fuse; fused
+    hunks from different sides become a conflict (mode 0)."""
+    if hunks:
+        m = hunks[-1]
+        if i1 <= m[3] + m[4] or i2 <= m[5] + m[6]:
+            if mode != m[0]:
+                m[0] = 0
+            m[2] = i0 + c0 - m[1]
+            m[4] = i1 + c1 - m[3]
+            m[6] = i2 + c2 - m[5]
+            return
+    hunks.append([mode, i0, c0, i1, c1, i2, c2])
+
+
+def _is_eol_crlf(recs: list[bytes], i: int) -> int:
+    if i < len(recs) - 1:
+        return int(recs[i].endswith(b"\r\n"))
+    if not recs:
+        return -1
+    if recs[i].endswith(b"\n"):
+        return int(recs[i].endswith(b"\r\n"))
+    if not i:
+        return -1
+    return int(recs[i - 1].endswith(b"\r\n"))
+
 
-    Returns (merged_bytes, clean). git merge-file exits with the number
-    of conflicts (0..127) or 255 on error.
+def merge_in_process(
+    ours: bytes,
+    base: bytes,
+    theirs: bytes,
+    labels: tuple[str, str, str],
+) -> tuple[bytes, int]:
+    """Three-way merge, byte-identical to ``git merge-file --stdout``
+    (merge-style markers, default ZEALOUS_ALNUM level).
+
+    Returns (merged_bytes, conflict_count).
+    """
+    if any(b"\0" in data[:8000] for data in (ours, base, theirs)):
+        raise ResyncError("cannot merge binary files")
+    base_recs, ours_recs, theirs_recs = _records(base), _records(ours), _records(theirs)
+    script1 = _diff(base_recs, ours_recs)
+    script2 = _diff(base_recs, theirs_recs)
+    if not script1:
+        return theirs, 0
+    if not script2:
+        return ours, 0
+
+    # xdl_do_merge: walk both edit scripts (indices into base, then the
+    # side) into hunks [mode, i0, chg0, i1, chg1, i2, chg2], where mode
+    # 1 = ours only, 2 = theirs only, 0 = conflict, 4 = same change.
+    hunks: list[list[int]] = []
+    x1 = x2 = 0
+    while x1 < len(script1) and x2 < len(script2):
+        b1, c1b, o1, c1o = script1[x1]
+        b2, c2b, t2, c2t = script2[x2]
+        if b1 + c1b < b2:
+            _append_merge(hunks, 1, b1, c1b, o1, c1o, t2 - b2 + b1, c1b)
+            x1 += 1
+            continue
+        if b2 + c2b < b1:
+            _append_merge(hunks, 2, b2, c2b, o1 - b1 + b2, c2b, t2, c2t)
+            x2 += 1
+            continue
+        if (
+            b1 != b2
+            or c1b != c2b
+            or c1o != c2t
+            or ours_recs[o1 : o1 + c1o] != theirs_recs[t2 : t2 + c2t]
+        ):
+            off = b1 - b2
+            ffo = off + c1b - c2b
+            i0, i1, i2 = b1, o1, t2
+            if off > 0:
+                i0 -= off
+                i1 -= off
+            else:
+                i2 += off
+            chg0 = b1 + c1b - i0
+            chg1 = o1 + c1o - i1
+            chg2 = t2 + c2t - i2
+            if ffo < 0:
+                chg0 -= ffo
+                chg1 -= ffo
+            else:
+                chg2 += ffo
+            _append_merge(hunks, 0, i0, chg0, i1, chg1, i2, chg2)
+        end1, end2 = b1 + c1b, b2 + c2b
+        if end1 >= end2:
+            x2 += 1
+        if end2 >= end1:
+            x1 += 1
+    # Past the other side's last change, the offset is the length delta.
+    shift2 = len(theirs_recs) - len(base_recs)
+    for b1, c1b, o1, c1o in script1[x1:]:
+        _append_merge(hunks, 1, b1, c1b, o1, c1o, b1 + shift2, c1b)
+    shift1 = len(ours_recs) - len(base_recs)
+    for b2, c2b, t2, c2t in script2[x2:]:
+        _append_merge(hunks, 2, b2, c2b, b2 + shift1, c2b, t2, c2t)
+
+    # xdl_refine_conflicts: diff the two sides of each conflict; equal
+    # lines leave it, and each remaining difference is its own conflict.
+    refined: list[list[int]] = []
+    for m in hunks:
+        mode, i0, c0, i1, c1, i2, c2 = m
+        if mode or not c1 or not c2:
+            refined.append(m)
+            continue
+        inner = _diff(ours_recs[i1 : i1 + c1], theirs_recs[i2 : i2 + c2])
+        if not inner:
+            refined.append([4, i0, c0, i1, c1, i2, c2])
+            continue
+        for a, ca, b, cb in inner:
+            refined.append([0, i0, c0, i1 + a, ca, i2 + b, cb])
+    hunks = refined
+
+    # xdl_simplify_non_conflicts (ALNUM): conflicts separated by at most
+    # three lines, or by lines without a letter or digit, fuse.
+    k = 0
+    while k + 1 < len(hunks):
+        m, nxt = hunks[k], hunks[k + 1]
+        begin, end = m[3] + m[4], nxt[3]
+        if (
+            m[0] != 0
+            or nxt[0] != 0
+            or (
+                end - begin > 3
+                and any(_ALNUM.search(rec) for rec in ours_recs[begin:end])
+            )
+        ):
+            k += 1
+            continue
+        m[4] = nxt[3] + nxt[4] - m[3]
+        m[6] = nxt[5] + nxt[6] - m[5]
+        del hunks[k + 1]
+
+    # xdl_fill_merge_buffer: ours between hunks, markers around conflicts.
+    out: list[bytes] = []
+    conflicts = 0
+    i = 0
+    for mode, _i0, _c0, i1, c1, i2, c2 in hunks:
+        if mode == 0:
+            conflicts += 1
+            crlf = _is_eol_crlf(ours_recs, i1 - 1 if i1 else 0)
+            if crlf:
+                crlf = _is_eol_crlf(theirs_recs, i2 - 1 if i2 else 0)
+            if crlf:
+                crlf = _is_eol_crlf(base_recs, 0)
+            eol = b"\r\n" if crlf > 0 else b"\n"
+            out.extend(ours_recs[i:i1])
+            out.append(b"<" * _MARKER_SIZE + b" " + labels[0].encode() + eol)
+            out.extend(_with_eol(ours_recs[i1 : i1 + c1], eol))
+            out.append(b"=" * _MARKER_SIZE + eol)
+            out.extend(_with_eol(theirs_recs[i2 : i2 + c2], eol))
+            out.append(b">" * _MARKER_SIZE + b" " + labels[2].encode() + eol)
+        elif mode in (1, 2):
+            out.extend(ours_recs[i:i1])
+            out.extend(
+                ours_recs[i1 : i1 + c1] if mode == 1 else theirs_recs[i2 : i2 + c2]
+            )
+        else:
+            continue
+        i = i1 + c1
+    out.extend(ours_recs[i:])
+    return b"".join(out), conflicts
+
+
+def _with_eol(recs: list[bytes], eol: bytes) -> list[bytes]:
+    """*recs*, the last one newline-terminated so a marker can follow."""
+    if recs and not recs[-1].endswith(b"\n"):
+        return [*recs[:-1], recs[-1] + eol]
+    return recs
+
+
+# Conflict-marker labels: ours, base (unused in merge style), theirs.
+MERGE_LABELS = ("plugin (published)", "base (rostered kit)", "kit (current)")
+
+
+def merge_three_way(
+    ours: bytes, base: bytes, theirs: bytes, use_git: bool = False
+) -> tuple[bytes, bool]:
+    """Apply base→theirs (kit) changes onto ours (plugin).
+
+    Returns (merged_bytes, clean). In-process by default
+    (``merge_in_process``); *use_git* forks ``git merge-file`` instead,
+    which exits with the number of conflicts (0..127) or 255 on error.
+    Both pin merge-style markers, so a ``merge.conflictStyle`` setting
+    cannot make them disagree.
     """
+    if not use_git:
+        merged, conflicts = merge_in_process(ours, base, theirs, MERGE_LABELS)
+        return merged, conflicts == 0
     with tempfile.TemporaryDirectory() as td:
         tdp = Path(td)
         paths = (tdp / "ours", tdp / "base", tdp / "theirs")
@@ -169,14 +909,11 @@ def merge_three_way(ours: bytes, base: bytes, theirs: bytes) -> tuple[bytes, boo
             path.write_bytes(data)
         cmd = [
             "git",
+            "-c",
+            "merge.conflictStyle=merge",
             "merge-file",
             "--stdout",
-            "-L",
-            "plugin (published)",
-            "-L",
-            "base (rostered kit)",
-            "-L",
-            "kit (current)",
+            *(arg for label in MERGE_LABELS for arg in ("-L", label)),
             *(str(p) for p in paths),
         ]
         try:
@@ -296,6 +1033,12 @@ def _main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="skip all body writes; only refresh the plugin_sha256 column",
     )
+    parser.add_argument(
+        "--git-merge-file",
+        action="store_true",
+        help="merge with a git merge-file subprocess per component instead "
+        "of the in-process engine (same output; a differential check)",
+    )
     args = parser.parse_args(argv)
 
     kit_root = Path(args.kit_root)
@@ -321,6 +1064,7 @@ def _main(argv: list[str] | None = None) -> int:
 
     # ---- Work-list: roster-hash delta, never git diff (KIT-0099) ----
     drifted: list[dict] = []
+    current: list[tuple[dict, Path]] = []
     for comp in shipped:
         source = comp.get("source")
         recorded = comp.get("kit_sha256")
@@ -338,7 +1082,13 @@ def _main(argv: list[str] | None = None) -> int:
                 "from the kit — resolve the rename/deletion before resyncing."
             )
             return EXIT_INTEGRITY
-        if sha256_bytes(kit_file.read_bytes()) != recorded:
+        current.append((comp, kit_file))
+    hashes = _guard.hash_files([kit_file for _, kit_file in current])
+    for comp, kit_file in current:
+        actual = hashes[kit_file]
+        if isinstance(actual, OSError):
+            raise ResyncError(f"{comp['name']}: cannot read {kit_file}: {actual}")
+        if actual != comp["kit_sha256"]:
             drifted.append(comp)
 
     if drifted:
@@ -405,12 +1155,22 @@ def _main(argv: list[str] | None = None) -> int:
     # partial state would be worse than the drift.)
     bases: dict[str, bytes | None] = {}
     not_found: list[str] = []
+    history = build_history_index(
+        kit_root,
+        [
+            comp["source"]
+            for comp in drifted
+            if (plugin_dir / plugin_body_relpath(comp)).is_file()
+        ],
+    )
     for comp in drifted:
         body = plugin_dir / plugin_body_relpath(comp)
         if not body.is_file():
             bases[comp["name"]] = None  # new component: copy, no merge needed
             continue
-        base = find_base_content(kit_root, comp["source"], comp["kit_sha256"])
+        base = find_base_content(
+            kit_root, comp["source"], comp["kit_sha256"], index=history
+        )
         if base is None:
             not_found.append(
                 f"{comp['name']}: no version of {comp['source']} in kit "
@@ -437,7 +1197,9 @@ def _main(argv: list[str] | None = None) -> int:
             body.write_bytes(theirs)
             print(f"  {name}: COPIED (new component, no published body yet)")
         else:
-            merged, clean = merge_three_way(body.read_bytes(), bases[name], theirs)
+            merged, clean = merge_three_way(
+                body.read_bytes(), bases[name], theirs, use_git=args.git_merge_file
+            )
             if not clean:
                 conflict_path = body.with_name(body.name + ".conflict")
                 conflict_path.write_bytes(merged)
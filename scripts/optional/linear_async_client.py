@@ -0,0 +1,322 @@
+"""
+Async Linear Client
+===================
+
+Concurrent, rate-limit-aware access to the Linear GraphQL API.
+
+The synchronous LinearClient (sync_tasks_to_linear.py) sends strictly one
+request at a time, and without a schema_path downloads the whole Linear
+schema on every run. This client:
+
+    - runs up to ``max_concurrency`` requests at once over one HTTP/1.1
+      connection pool (gql's HTTPX async transport)
+    - paces them with a token bucket that Linear's own rate-limit response
+      headers keep honest (X-RateLimit-Requests-*, X-RateLimit-Complexity-*),
+      pausing until the advertised reset when a budget runs out, and
+      retrying requests Linear rejected as RATELIMITED
+    - validates documents against an optional LOCAL schema file
+      (.kit/.cache/linear-schema.graphql): fetched by introspection once,
+      then read from disk — or no schema and no download at all
+
+Usage:
+    async with AsyncLinearClient(api_key) as linear:
+        results = await linear.execute_many([(query, variables), ...])
+
+The URL is a parameter so tests can point it at a local stub server.
+Requires: pip install "gql[httpx]"
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Import logging configuration - support both package import and direct execution
+try:
+    from scripts.core.logging_config import setup_logging
+except ImportError:
+    import logging
+
+    def setup_logging(name):
+        return logging.getLogger(name)
+
+
+logger = setup_logging("agentive.linear")
+
+# gql + httpx are optional - checked when a client is opened
+ASYNC_GQL_AVAILABLE = False
+try:
+    from gql import Client, GraphQLRequest
+    from gql.transport.exceptions import TransportQueryError, TransportServerError
+    from gql.transport.httpx import HTTPXAsyncTransport
+    from graphql import print_schema
+
+    ASYNC_GQL_AVAILABLE = True
+except ImportError:
+    pass
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Local copy of the Linear schema (SDL). Delete it to re-fetch.
+SCHEMA_CACHE_PATH = Path(".kit") / ".cache" / "linear-schema.graphql"
+
+# Requests in flight at once. Linear's limits are per hour, so more
+# concurrency mostly buys latency hiding — a handful is plenty.
+DEFAULT_CONCURRENCY = 8
+
+# Linear's documented API-key budget, used until the first response
+# reports the real one.
+DEFAULT_REQUESTS_PER_HOUR = 1500
+RATE_LIMIT_WINDOW = 3600.0
+
+# Attempts for a request Linear rejects as rate limited.
+RATE_LIMIT_RETRIES = 3
+
+
+def _header_int(headers: Any, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token bucket fed by Linear's rate-limit response headers.
+
+    Starts full at the documented budget and refills continuously across
+    the one-hour window. Every response then corrects it: the bucket
+    never holds more tokens than the server says remain, and an
+    exhausted budget (remaining 0, or HTTP 429) pauses all callers until
+    the reset time the server advertised.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_REQUESTS_PER_HOUR,
+        window: float = RATE_LIMIT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = float(capacity)
+        self.window = window
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def rate(self) -> float:
+        """Tokens regained per second."""
+        return self.capacity / self.window
+
+    def _refill(self, now: float) -> None:
+        if self._paused_until and now >= self._paused_until:
+            # The advertised reset has passed: the server's budget is full.
+            self.tokens = self.capacity
+            self._paused_until = 0.0
+        else:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._updated) * self.rate
+            )
+        self._updated = now
+
+    def delay(self) -> float:
+        """
+        Take a token if one is available now.
+
+        Returns:
+            0.0 when a token was taken, else seconds to wait before asking
+            again
+        """
+        now = self._clock()
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait for, then take, one token."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:  # FIFO: waiters are served in order
+            while True:
+                wait = self.delay()
+                if not wait:
+                    return
+                await asyncio.sleep(wait)
+
+    def observe(self, headers: Any, status: int = 200) -> None:
+        """
+        Correct the bucket from one response's headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            status: HTTP status code of the response
+        """
+        now = self._clock()
+        self._refill(now)
+        limit = _header_int(headers, "x-ratelimit-requests-limit")
+        if limit:
+            self.capacity = float(limit)
+        remaining = _header_int(headers, "x-ratelimit-requests-remaining")
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+        exhausted = status == 429 or remaining == 0
+        reset = _header_int(headers, "x-ratelimit-requests-reset")
+        if _header_int(headers, "x-ratelimit-complexity-remaining") == 0:
+            exhausted = True
+            reset = _header_int(headers, "x-ratelimit-complexity-reset") or reset
+        if exhausted:
+            # Reset is a UTC epoch in milliseconds; convert to our clock.
+            wait = max(0.0, reset / 1000 - time.time()) if reset else 60.0
+            self._paused_until = max(self._paused_until, now + wait)
+            logger.warning("⏳ Linear rate limit reached — pausing %.0fs", wait)
+
+
+def load_cached_schema(schema_path: Optional[Path]) -> Optional[str]:
+    """The cached schema SDL, or None when absent or unreadable."""
+    if schema_path is None:
+        return None
+    try:
+        return Path(schema_path).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def save_schema(schema_path: Path, schema: Any) -> None:
+    """Write *schema* to *schema_path* as SDL; a failure is only logged."""
+    try:
+        schema_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = schema_path.with_suffix(".tmp")
+        tmp.write_text(print_schema(schema) + "\n", encoding="utf-8")
+        tmp.replace(schema_path)
+        logger.info("📋 Cached the Linear schema at %s", schema_path)
+    except OSError as e:
+        logger.warning("⚠️  Could not cache the Linear schema: %s", e)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    if isinstance(error, TransportServerError):
+        return error.code == 429
+    if isinstance(error, TransportQueryError):
+        for item in error.errors or []:
+            extensions = (
+                (item.get("extensions") or {}) if isinstance(item, dict) else {}
+            )
+            if extensions.get("code") == "RATELIMITED":
+                return True
+    return False
+
+
+class AsyncLinearClient:
+    """Async Linear GraphQL client with bounded concurrency."""
+
+    def __init__(
+        self,
+        api_key: str,
+        url: str = LINEAR_API_URL,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        schema_path: Optional[Path] = None,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Configure the client; the connection opens in ``__aenter__``.
+
+        Args:
+            api_key: Linear API key
+            url: GraphQL endpoint (a local stub server in tests)
+            max_concurrency: Requests in flight at once
+            schema_path: Local schema file. Read when present; fetched by
+                introspection and written there when missing. None skips
+                schema validation (and the download) entirely.
+            limiter: Shared RateLimiter (a fresh one by default)
+        """
+        if not ASYNC_GQL_AVAILABLE:
+            raise ImportError(
+                "gql with the httpx transport is not installed. "
+                'Run: pip install "gql[httpx]"'
+            )
+        self.api_key = api_key
+        self.url = url
+        self.max_concurrency = max(1, max_concurrency)
+        self.schema_path = Path(schema_path) if schema_path else None
+        self.limiter = limiter or RateLimiter()
+        self.requests_sent = 0
+        self._client = None
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncLinearClient":
+        schema = load_cached_schema(self.schema_path)
+        transport = HTTPXAsyncTransport(
+            url=self.url,
+            headers={"Authorization": self.api_key},
+            timeout=30.0,
+            # Event hooks see EVERY response, so concurrent requests
+            # cannot race each other for the transport's last headers.
+            event_hooks={"response": [self._on_response]},
+        )
+        self._client = Client(
+            transport=transport,
+            schema=schema,
+            fetch_schema_from_transport=schema is None and self.schema_path is not None,
+        )
+        self._session = await self._client.connect_async()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if schema is None and self.schema_path is not None and self._client.schema:
+            save_schema(self.schema_path, self._client.schema)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._client is not None:
+            await self._client.close_async()
+        self._client = self._session = None
+
+    async def _on_response(self, response: Any) -> None:
+        self.limiter.observe(response.headers, response.status_code)
+
+    async def execute(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run one GraphQL document, paced and bounded.
+
+        Raises:
+            The transport's error after RATE_LIMIT_RETRIES rate-limited
+            attempts, or at once for any other failure
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncLinearClient used outside 'async with'")
+        request = GraphQLRequest(query, variable_values=variables)
+        async with self._semaphore:
+            for attempt in range(RATE_LIMIT_RETRIES):
+                await self.limiter.acquire()
+                self.requests_sent += 1
+                try:
+                    return await self._session.execute(request)
+                except (TransportQueryError, TransportServerError) as e:
+                    if not _is_rate_limited(e) or attempt == RATE_LIMIT_RETRIES - 1:
+                        raise
+                    logger.warning("⏳ Rate limited — retrying (%d)", attempt + 1)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def execute_many(
+        self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Run many documents concurrently.
+
+        Returns:
+            One entry per request, in order: the result data, or the
+            exception that request raised (one failure never cancels the
+            others)
+        """
+        return await asyncio.gather(
+            *(self.execute(query, variables) for query, variables in requests),
+            return_exceptions=True,
+        )
@@ -12,13 +12,18 @@ Functions:
     - should_sync_task: Check if task should be synced
     - parse_task_metadata: Extract metadata from task file
     - get_github_file_url: Generate GitHub URL for task file
+    - load_sync_ledger / save_sync_ledger: Incremental-sync ledger
+    - sync_content_hash: Hash of the fields a sync pushes
+    - changed_task_files: Task files git reports changed since a commit
 """
 
+import hashlib
+import json
 import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 # Import logging configuration - support both package import and direct execution
 try:
@@ -427,3 +432,108 @@ def get_github_file_url(task_file: Path) -> str:
         rel_path = task_file
 
     return f"{repo_url}/blob/main/{rel_path}"
+
+
+# =============================================================================
+# INCREMENTAL SYNC LEDGER
+# =============================================================================
+
+# Per-clone record of what the last sync pushed: task ID → Linear issue
+# and the content hash of the synced fields, plus the commit the sync
+# ran at. Lives with the other kit caches — never committed, and safe to
+# delete (the next sync is then a full one).
+SYNC_LEDGER_PATH = Path(".kit") / ".cache" / "linear-sync.json"
+SYNC_LEDGER_VERSION = 1
+
+
+def sync_content_hash(title: str, status: str, priority: int, description: str) -> str:
+    """
+    Hash exactly what a sync sends to Linear.
+
+    Two runs that would send identical title/status/priority/description
+    hash identically, so an unchanged task is never re-pushed.
+
+    Returns:
+        Hex sha256 digest
+    """
+    payload = json.dumps([title, status, priority, description], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_sync_ledger(root: Path = Path(".")) -> Dict[str, Any]:
+    """
+    Load the sync ledger; an empty ledger when absent or unreadable.
+
+    A ledger from another format version is discarded rather than
+    trusted — the cost is one full sync.
+    """
+    empty: Dict[str, Any] = {
+        "version": SYNC_LEDGER_VERSION,
+        "commit": None,
+        "tasks": {},
+    }
+    try:
+        data = json.loads((root / SYNC_LEDGER_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(data, dict) or data.get("version") != SYNC_LEDGER_VERSION:
+        return empty
+    if not isinstance(data.get("tasks"), dict):
+        return empty
+    return data
+
+
+def save_sync_ledger(ledger: Dict[str, Any], root: Path = Path(".")) -> None:
+    """Write the ledger atomically (temp file + rename)."""
+    path = root / SYNC_LEDGER_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps(ledger, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    os.replace(tmp, path)
+
+
+def current_commit(root: Path = Path(".")) -> Optional[str]:
+    """HEAD's commit ID, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            stdin=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def changed_task_files(root: Path, since_commit: str) -> Optional[Set[Path]]:
+    """
+    Task files git reports changed since *since_commit*.
+
+    Covers commits since then, uncommitted edits and untracked files
+    under .kit/tasks/ — two git calls for the whole tree. Returns paths
+    relative to *root*, or None when git cannot answer (no repo, the
+    commit is gone after a rebase): the caller then checks every task.
+    """
+    changed: Set[Path] = set()
+    for args in (
+        ["diff", "--name-only", "--relative", since_commit, "--", ".kit/tasks"],
+        ["ls-files", "--others", "--exclude-standard", "--", ".kit/tasks"],
+    ):
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(root), *args],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                stdin=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        changed.update(Path(line) for line in result.stdout.splitlines() if line)
+    return changed
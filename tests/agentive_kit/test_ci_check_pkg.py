@@ -0,0 +1,229 @@
+"""Tests for agentive_kit.ci_check — ``agentive ci-check``.
+
+The script's own behavior is pinned by tests/test_ci_check.py; this
+module covers the package runner: CI parity of the full-mode commands,
+changed-file scoping against a real git repo, and the concurrent
+runner (driven with small ``python -c`` steps, never the real tools).
+"""
+
+from __future__ import annotations
+
+import re
+import shlex
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import ci_check  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+TEST_YML = REPO_ROOT / ".github" / "workflows" / "test.yml"
+CI_CHECK = REPO_ROOT / "scripts" / "core" / "ci-check.sh"
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    ).stdout
+
+
+def _py(name: str, code: str) -> ci_check.Step:
+    return ci_check.Step(name, "·", (sys.executable, "-c", code), scoped=False)
+
+
+@pytest.mark.skipif(not TEST_YML.exists(), reason="CI workflow absent")
+class TestFullModeMatchesCI:
+    def _ci_commands(self):
+        text = TEST_YML.read_text(encoding="utf-8")
+        return {
+            line.split()[0]: line.strip()
+            for line in re.findall(r"run: \|\n\s+(.+)", text)
+            if line.split()[0] in ("black", "isort", "flake8", "ruff", "pytest")
+        }
+
+    def test_lint_commands_byte_match(self):
+        ci = self._ci_commands()
+        for step in ci_check.lint_steps(REPO_ROOT):
+            if step.name in ci:
+                assert shlex.join(step.argv) == ci[step.name]
+        assert {"black", "isort", "flake8", "ruff"} <= set(ci)
+
+    def test_test_command_byte_matches(self):
+        assert shlex.join(ci_check.TEST_STEP.argv) == self._ci_commands()["pytest"]
+
+    def test_local_only_steps_match_ci_check_sh(self):
+        script = CI_CHECK.read_text(encoding="utf-8")
+        steps = {s.name: s for s in ci_check.lint_steps(REPO_ROOT)}
+        assert '/pattern_lint.py" --tree scripts/ tests/' in script
+        assert steps["pattern-lint"].argv[2:] == ["--tree", "scripts/", "tests/"]
+        assert "check_cross_repo_config.py" in script
+        assert steps["cross-repo"].argv[-1] == str(REPO_ROOT)
+
+
+class TestScope:
+    FILES = ["README.md", "scripts/a.py", "tests/test_a.py", "tools/b.py"]
+
+    def test_formatters_take_every_python_file(self):
+        black = ci_check.lint_steps(REPO_ROOT)[0]
+        scoped = ci_check.scope(black, self.FILES)
+        assert scoped.argv == [
+            "black",
+            "--check",
+            "--diff",
+            "scripts/a.py",
+            "tests/test_a.py",
+            "tools/b.py",
+        ]
+
+    def test_linters_keep_their_targets_and_options(self):
+        flake8 = ci_check.lint_steps(REPO_ROOT)[2]
+        scoped = ci_check.scope(flake8, self.FILES)
+        assert scoped.targets == ("scripts/a.py", "tests/test_a.py")
+        assert scoped.options == flake8.options
+
+    def test_nothing_in_scope_is_none(self):
+        ruff = ci_check.lint_steps(REPO_ROOT)[3]
+        assert ci_check.scope(ruff, ["README.md", "tools/b.py"]) is None
+
+    def test_unscoped_step_is_unchanged(self):
+        step = _py("x", "pass")
+        assert ci_check.scope(step, []) is step
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _git(tmp_path, "init", "-q", "-b", "main", str(root))
+    for key, value in (("user.email", "t@example.com"), ("user.name", "t")):
+        _git(root, "config", key, value)
+    (root / ".gitignore").write_text("ignored.py\n", encoding="utf-8")
+    for name in ("kept.py", "edited.py", "gone.py"):
+        (root / name).write_text("x = 1\n", encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "base")
+    _git(root, "checkout", "-q", "-b", "feature")
+    return root
+
+
+class TestChangedFiles:
+    def test_committed_staged_unstaged_and_untracked(self, repo):
+        (repo / "committed.py").write_text("y = 2\n", encoding="utf-8")
+        _git(repo, "add", "committed.py")
+        _git(repo, "commit", "-q", "-m", "feature work")
+        (repo / "edited.py").write_text("x = 2\n", encoding="utf-8")
+        (repo / "new file.py").write_text("z = 3\n", encoding="utf-8")
+        (repo / "ignored.py").write_text("w = 4\n", encoding="utf-8")
+        (repo / "gone.py").unlink()
+        assert ci_check.changed_files(repo, "main") == [
+            "committed.py",
+            "edited.py",
+            "new file.py",
+        ]
+
+    def test_base_falls_back_to_main(self, repo):
+        assert ci_check.resolve_base(repo, None) == "main"
+        assert ci_check.resolve_base(repo, "nope") is None
+
+    def test_no_merge_base_is_none(self, repo):
+        assert ci_check.changed_files(repo, "nope") is None
+
+
+class TestRunSteps:
+    def test_steps_run_concurrently(self, tmp_path):
+        steps = [_py(f"s{n}", "import time; time.sleep(0.5)") for n in range(3)]
+        start = time.monotonic()
+        results = ci_check.run_steps(tmp_path, steps, emit=lambda block: None)
+        assert time.monotonic() - start < 1.4
+        assert [r.verdict for r in results] == ["PASS"] * 3
+
+    def test_each_block_carries_output_and_timing(self, tmp_path):
+        blocks = []
+        steps = [_py("ok", "print('fine')"), _py("bad", "raise SystemExit(3)")]
+        results = ci_check.run_steps(tmp_path, steps, emit=blocks.append)
+        assert [r.verdict for r in results] == ["PASS", "FAIL"]
+        (ok,) = [b for b in blocks if " ok " in b]
+        assert re.search(r"✅ · ok — PASS \(\d+\.\ds\)", ok)
+        assert "fine" in ok
+
+    def test_fail_fast_cancels_the_rest(self, tmp_path):
+        steps = [
+            _py("slow", "import time; time.sleep(30)"),
+            _py("bad", "raise SystemExit(1)"),
+        ]
+        start = time.monotonic()
+        results = ci_check.run_steps(
+            tmp_path, steps, fail_fast=True, emit=lambda block: None
+        )
+        assert time.monotonic() - start < 10
+        assert [r.verdict for r in results] == ["CANCELLED", "FAIL"]
+
+    def test_missing_tool_fails_the_step(self, tmp_path):
+        step = ci_check.Step("ghost", "·", ("no-such-tool-xyz",), scoped=False)
+        (result,) = ci_check.run_steps(tmp_path, [step], emit=lambda block: None)
+        assert result.verdict == "FAIL"
+        assert "no-such-tool-xyz" in result.output
+
+
+class TestChangedMode:
+    def test_nothing_changed_skips_every_scoped_step(self, repo, monkeypatch, capsys):
+        monkeypatch.setattr(ci_check, "TEST_STEP", _py("pytest", "print('suite ran')"))
+        assert ci_check.ci_check(repo, changed=True) == 0
+        out = capsys.readouterr().out
+        assert "Scoping to 0 file(s)" in out
+        assert re.search(r"black\s+SKIP", out)
+        assert "suite ran" in out
+
+    def test_unknown_base_is_an_error(self, repo, capsys):
+        assert ci_check.ci_check(repo, changed=True, base="nope") == 1
+        assert "No merge base with nope" in capsys.readouterr().err
+
+
+class TestHook:
+    def test_no_hook_runs_the_gauntlet(self, tmp_path):
+        assert ci_check.run_hook(tmp_path) is None
+
+    def test_hook_exit_code_passes_through(self, tmp_path):
+        hook = tmp_path / "scripts" / "local" / "checks.sh"
+        hook.parent.mkdir(parents=True)
+        hook.write_text('#!/bin/sh\n[ "$2" = ci ] && exit 7\n', encoding="utf-8")
+        hook.chmod(hook.stat().st_mode | stat.S_IXUSR)
+        assert ci_check.run_hook(tmp_path) == 7
+
+    def test_unusable_hook_is_loud(self, tmp_path, capsys):
+        hook = tmp_path / "scripts" / "local" / "checks.sh"
+        hook.parent.mkdir(parents=True)
+        hook.write_text("#!/bin/sh\n", encoding="utf-8")
+        hook.chmod(0o644)
+        assert ci_check.run_hook(tmp_path) == 1
+        assert "not an executable file" in capsys.readouterr().err
+
+
+class TestMain:
+    def _exit_code(self, argv, project):
+        with pytest.raises(SystemExit) as exc_info:
+            ci_check.main(argv, project)
+        return exc_info.value.code
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["--bogus"], ["--base", "main"], ["--jobs", "0"], ["--changed", "--base"]],
+    )
+    def test_usage_errors(self, argv, tmp_path, capsys):
+        assert self._exit_code(argv, tmp_path) == 1
+        assert "Usage: agentive ci-check" in capsys.readouterr().err
+
+    def test_help(self, tmp_path, capsys):
+        assert self._exit_code(["--help"], tmp_path) == 0
+        assert "--fail-fast" in capsys.readouterr().out
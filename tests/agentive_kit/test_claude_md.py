@@ -0,0 +1,100 @@
+"""Tests for agentive_kit.claude_md — one parsed CLAUDE.md for every reader."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import pathlib
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import claude_md, doctor, preflight, target_repo  # noqa: E402
+
+DOC = (
+    "# Project\r\n"
+    "\r\n"
+    "##\tTarget Repository  \r\n"
+    "- **Path**: `../app-code`\r\n"
+    "- **GitHub**: `acme/app-code`\r\n"
+    "### Notes\r\n"
+    "kept in the section\r\n"
+    "## Target Repository\r\n"
+    "- **GitHub**: `shadowed/dup`\r\n"
+    "## Install\r\n"
+    "<!-- BEGIN KIT-LOCAL: kit-install -->\r\n"
+    "shape: planning\r\n"
+    "bots: coderabbit\r\n"
+    "<!-- END KIT-LOCAL: kit-install -->\r\n"
+)
+
+
+def write_old(root: pathlib.Path, text: str) -> pathlib.Path:
+    """Write CLAUDE.md with an mtime well outside the racy window."""
+    path = root / "CLAUDE.md"
+    path.write_text(text, encoding="utf-8", newline="")
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+    return path
+
+
+class TestParse:
+    def test_sections_and_regions(self):
+        doc = claude_md.parse(DOC)
+        target = doc.section("Target Repository")
+        assert "`acme/app-code`" in target and "kept in the section" in target
+        assert "shadowed" not in target  # first heading wins
+        assert list(doc.sections) == ["Target Repository", "Install"]
+        assert doc.region("kit-install") == "shape: planning\r\nbots: coderabbit"
+        assert doc.section("Project") is None and doc.region("nope") is None
+
+    def test_model_is_immutable(self):
+        doc = claude_md.parse(DOC)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            doc.text = ""
+        with pytest.raises(TypeError):
+            doc.sections["x"] = ""
+
+
+class TestLoad:
+    def test_missing_and_unreadable(self, tmp_path):
+        assert not claude_md.load(tmp_path).exists
+        (tmp_path / "CLAUDE.md").mkdir()
+        doc = claude_md.load(tmp_path)
+        assert doc.exists and doc.error == "IsADirectoryError" and doc.text == ""
+
+    def test_cached_until_the_file_changes(self, tmp_path):
+        path = write_old(tmp_path, DOC)
+        first = claude_md.load(tmp_path)
+        assert claude_md.load(tmp_path) is first
+        # Same size, same inode: the mtime alone tells them apart.
+        path.write_text(DOC.replace("acme", "ACME"), encoding="utf-8", newline="")
+        os.utime(path, (1_600_000_001, 1_600_000_001))
+        assert "ACME" in claude_md.load(tmp_path).section("Target Repository")
+
+    def test_freshly_written_file_is_reread(self, tmp_path):
+        (tmp_path / "CLAUDE.md").write_text("## A\n", encoding="utf-8")
+        first = claude_md.load(tmp_path)
+        assert claude_md.load(tmp_path) is not first
+        assert claude_md.load(tmp_path) == first
+
+    def test_one_read_for_every_reader(self, tmp_path, monkeypatch):
+        write_old(tmp_path, DOC)
+        reads = []
+        real = pathlib.Path.read_text
+
+        def counting(self, *args, **kwargs):
+            if self.name == "CLAUDE.md":
+                reads.append(self)
+            return real(self, *args, **kwargs)
+
+        monkeypatch.setattr(pathlib.Path, "read_text", counting)
+        target = target_repo.resolve(tmp_path)
+        bots = preflight._read_bots_declaration(tmp_path)
+        install = doctor._doctor_install(tmp_path)
+        assert (target.repo, target.path) == ("acme/app-code", "../app-code")
+        assert bots == ("coderabbit", True)
+        assert install[:3] == ("planning", "none", "coderabbit")
+        assert len(reads) == 1
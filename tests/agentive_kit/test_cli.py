@@ -115,6 +115,34 @@ class TestRootDiscoveryWiring:
         wrong.write_text("**Status**: Todo\n", encoding="utf-8")
         assert run_cli(["validate"]) == 1
 
+    def test_validate_staged_exit_codes(self, tmp_path, monkeypatch):
+        root = make_kit_tree(tmp_path)
+        monkeypatch.chdir(root)
+        wrong = root / ".kit" / "tasks" / "5-done" / "KIT-0003-wrong.md"
+        wrong.write_text("**Status**: Todo\n", encoding="utf-8")
+        assert run_cli(["validate", "--staged"]) == 0  # nothing staged
+        subprocess.run(["git", "-C", str(root), "add", "-A"], check=True, timeout=30)
+        assert run_cli(["validate", "--staged"]) == 1
+        assert run_cli(["validate", "--staged", f".kit/tasks/2-todo/{TASK_FILE}"]) == 0
+
+    def test_validate_staged_paths_are_relative_to_cwd(self, tmp_path, monkeypatch):
+        root = make_kit_tree(tmp_path)
+        done = root / ".kit" / "tasks" / "5-done"
+        (done / "KIT-0003-wrong.md").write_text("**Status**: Todo\n", encoding="utf-8")
+        subprocess.run(["git", "-C", str(root), "add", "-A"], check=True, timeout=30)
+        monkeypatch.chdir(done)
+        assert run_cli(["validate", "--staged", "KIT-0003-wrong.md"]) == 1
+
+    def test_stats_summary_on_stderr(self, tmp_path, monkeypatch, capsys):
+        root = make_kit_tree(tmp_path)
+        monkeypatch.chdir(root)
+        subprocess.run(["git", "-C", str(root), "add", "-A"], check=True, timeout=30)
+        assert run_cli(["--stats", "validate", "--staged"]) == 0
+        captured = capsys.readouterr()
+        assert "subprocess calls: 2" in captured.err
+        assert "git diff" in captured.err and "git cat-file" in captured.err
+        assert "subprocess calls" not in captured.out
+
     def test_outside_kit_repo_refuses_loudly(self, tmp_path, monkeypatch, capsys):
         plain = tmp_path / "plain"
         plain.mkdir()
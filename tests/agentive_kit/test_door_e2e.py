@@ -106,35 +106,21 @@ def run_door(
 
 
 @pytest.fixture(scope="module")
-def new_single(tmp_path_factory):
-    base = tmp_path_factory.mktemp("door-new-single")
-    env = _door_env(base)
-    target = base / "fresh-single"
+def new_single(scaffold_template):
+    # the session's single+python template: one `agentive new`, run
+    # from scratch space (tests/conftest.py)
+    template = scaffold_template("single", "python")
     # AC 1, asserted not assumed: the target's whole ancestry carries
-    # no kit checkout, and the door runs from scratch space too.
-    assert not _kit_checkout_ancestors(target.parent)
-    result = run_door("new", str(target), cwd=base, env=env)
-    return target, result
+    # no kit checkout, and the door ran from scratch space too.
+    assert not _kit_checkout_ancestors(template.root.parent)
+    return template.root, template.result
 
 
 @pytest.fixture(scope="module")
-def new_planning(tmp_path_factory):
-    base = tmp_path_factory.mktemp("door-new-planning")
-    env = _door_env(base)
-    target = base / "fresh-planning"
-    result = run_door(
-        "new",
-        str(target),
-        "--shape",
-        "planning",
-        "--target-path",
-        "../product",
-        "--target-github",
-        "acme/product",
-        cwd=base,
-        env=env,
-    )
-    return target, result
+def new_planning(scaffold_template):
+    template = scaffold_template("planning", "none")
+    assert not _kit_checkout_ancestors(template.root.parent)
+    return template.root, template.result
 
 
 class TestNewSingle:
@@ -264,6 +250,53 @@ class TestNewPlanning:
         assert not (target / "tests").exists()
 
 
+class TestTemplateClone:
+    """The session template's clones are independent projects that
+    share only the (append-only) git object store."""
+
+    def test_clone_edits_never_reach_the_template(self, tmp_path, scaffold_template):
+        template = scaffold_template("single", "python")
+        before = (template.root / "CLAUDE.md").read_text(encoding="utf-8")
+        clone = template.clone(tmp_path / "clone")
+        git = ["git", "-C", str(clone)]
+        status = subprocess.run(
+            [*git, "status", "--short"], capture_output=True, text=True, timeout=30
+        )
+        assert status.stdout.strip() == "", status.stdout
+        (clone / "CLAUDE.md").write_text("# edited\n", encoding="utf-8")
+        subprocess.run(
+            [*git, "commit", "-qam", "edit"], check=True, timeout=30, env=template.env
+        )
+        assert (template.root / "CLAUDE.md").read_text(encoding="utf-8") == before
+        heads = [
+            subprocess.run(
+                ["git", "-C", str(root), "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            ).stdout
+            for root in (template.root, clone)
+        ]
+        assert heads[0] != heads[1]
+
+    def test_objects_are_shared_not_copied(self, tmp_path, scaffold_template):
+        template = scaffold_template("single", "python")
+        clone = template.clone(tmp_path / "clone")
+        src = next(
+            p for p in (template.root / ".git" / "objects").rglob("*") if p.is_file()
+        )
+        dest = clone / src.relative_to(template.root)
+        assert dest.stat().st_ino == src.stat().st_ino
+        index = ".git/index"
+        assert (clone / index).stat().st_ino != (template.root / index).stat().st_ino
+
+    def test_pair_outside_the_matrix_is_refused(self, scaffold_template):
+        with pytest.raises(ValueError, match="planning \\+ python"):
+            scaffold_template("planning", "python")
+        with pytest.raises(ValueError, match="not a scaffolding verb"):
+            scaffold_template("single", "none", verb="init")
+
+
 class TestNewNoKit:
     """KIT-0104 F4: rung 0 (KIT-ADR-0032) is reachable from the ``new``
     verb too — a blank project, not a kit install."""
@@ -405,15 +438,11 @@ class TestAdopt:
         assert not (target / ".claude").exists()
         assert not (target / "pyproject.toml").exists()
 
-    def test_readopt_preserves_regions_byte_for_byte(self, tmp_path):
+    def test_readopt_preserves_regions_byte_for_byte(self, tmp_path, scaffold_template):
         env = _door_env(tmp_path)
-        target = self._make_repo(tmp_path, "again")
-        assert (
-            run_door(
-                "adopt", str(target), "--profile", "none", cwd=tmp_path, env=env
-            ).returncode
-            == 0
-        )
+        template = scaffold_template("single", "none", verb="adopt")
+        assert template.result.returncode == 0, template.result.stderr
+        target = template.clone(tmp_path / "again")
         claude_md = target / "CLAUDE.md"
         customized = claude_md.read_text(encoding="utf-8").replace(
             "No project toolchain is configured",
@@ -428,27 +457,16 @@ class TestAdopt:
         assert text.count("BEGIN KIT-LOCAL: kit-install") == 1
         assert text.count("BEGIN KIT-LOCAL: project-rules") == 1
 
-    def test_flagless_readopt_engines_get_recorded_identity(self, tmp_path):
+    def test_flagless_readopt_engines_get_recorded_identity(
+        self, tmp_path, scaffold_template
+    ):
         """CodeRabbit, this PR: a flagless re-adopt of a recorded
         target must drive the engines with the RECORDED pair, never
         the resolved defaults (which fall to single/python)."""
         env = _door_env(tmp_path)
-        target = self._make_repo(tmp_path, "planrec")
-        assert (
-            run_door(
-                "adopt",
-                str(target),
-                "--shape",
-                "planning",
-                "--target-path",
-                "../prod",
-                "--target-github",
-                "acme/prod",
-                cwd=tmp_path,
-                env=env,
-            ).returncode
-            == 0
-        )
+        template = scaffold_template("planning", "none", verb="adopt")
+        assert template.result.returncode == 0, template.result.stderr
+        target = template.clone(tmp_path / "planrec")
         result = run_door("adopt", str(target), cwd=tmp_path, env=env)
         assert result.returncode == 0, result.stderr + result.stdout
         # the consumer engine names the pair it was invoked with
@@ -499,15 +517,11 @@ class TestAdopt:
         assert "illegal shape/profile combination" in combined
         assert "kit-install record" in combined
 
-    def test_conflicting_profile_flag_rejected(self, tmp_path):
+    def test_conflicting_profile_flag_rejected(self, tmp_path, scaffold_template):
         env = _door_env(tmp_path)
-        target = self._make_repo(tmp_path, "conflict")
-        assert (
-            run_door(
-                "adopt", str(target), "--profile", "none", cwd=tmp_path, env=env
-            ).returncode
-            == 0
-        )
+        template = scaffold_template("single", "none", verb="adopt")
+        assert template.result.returncode == 0, template.result.stderr
+        target = template.clone(tmp_path / "conflict")
         result = run_door(
             "adopt", str(target), "--profile", "python", cwd=tmp_path, env=env
         )
@@ -777,21 +791,10 @@ class TestPreset:
         assert "OPENAI_API_KEY=sk-rel" in lines
         assert "DECOY=1" not in lines
 
-    def test_record_beats_preset_on_readopt(self, tmp_path):
-        env0 = _door_env(tmp_path)
-        target = tmp_path / "recorded"
-        target.mkdir()
-        subprocess.run(
-            ["git", "init", "-q", "-b", "main", str(target)],
-            check=True,
-            timeout=30,
-        )
-        assert (
-            run_door(
-                "adopt", str(target), "--profile", "none", cwd=tmp_path, env=env0
-            ).returncode
-            == 0
-        )
+    def test_record_beats_preset_on_readopt(self, tmp_path, scaffold_template):
+        template = scaffold_template("single", "none", verb="adopt")
+        assert template.result.returncode == 0, template.result.stderr
+        target = template.clone(tmp_path / "recorded")
         cfg = self._write_preset(tmp_path, "profile: python\nvenv: yes\n")
         env = _door_env(tmp_path, config_dir=cfg)
         result = run_door("adopt", str(target), cwd=tmp_path, env=env)
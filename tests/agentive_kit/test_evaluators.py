@@ -3,11 +3,16 @@
 The legacy install/ensure behavior remains covered by
 tests/test_project_script.py against the script's inline fallback
 copy; this module covers what is NEW in the package: the KIT-0079
-config.yml-first library-pin reader (closed by reference here).
+config.yml-first library-pin reader (closed by reference here), the
+per-user library cache, and the cached CLI liveness probe.
 """
 
 from __future__ import annotations
 
+import os
+import stat
+import subprocess
+
 import pytest
 
 pytest.importorskip(
@@ -118,3 +123,139 @@ class TestLibraryPinReader:
             evaluators._get_evaluator_library_version(tmp_path)
         assert exc_info.value.code == 1
         assert "Invalid library_version" in capsys.readouterr().out
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-C", str(cwd), *args], check=True, capture_output=True, timeout=30
+    )
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """A local evaluator library tagged v1.0.0, with a branch `main`."""
+    repo = tmp_path / "library"
+    (repo / "evaluators" / "openai" / "fast").mkdir(parents=True)
+    (repo / "evaluators" / "openai" / "fast" / "evaluator.yml").write_text(
+        "model: x\n", encoding="utf-8"
+    )
+    _git(tmp_path, "init", "-q", "-b", "main", str(repo))
+    for key, value in (("user.email", "t@example.com"), ("user.name", "t")):
+        _git(repo, "config", key, value)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "library")
+    _git(repo, "tag", "v1.0.0")
+    monkeypatch.setattr(evaluators, "EVALUATOR_LIBRARY_REPO", str(repo))
+    monkeypatch.setattr(evaluators, "_ensure_adversarial_cli", lambda _p: None)
+    monkeypatch.setenv("AGENTIVE_KIT_CACHE_DIR", str(tmp_path / "cache"))
+    return repo
+
+
+def _install(project, *args):
+    project.mkdir(exist_ok=True)
+    evaluators.cmd_install_evaluators(list(args), project)
+    return (project / ".adversarial" / "evaluators" / ".installed-version").read_text(
+        encoding="utf-8"
+    )
+
+
+class TestLibraryCache:
+    def test_second_project_installs_from_cache(
+        self, tmp_path, library, monkeypatch, capsys
+    ):
+        first = _install(tmp_path / "one", "--ref", "v1.0.0")
+        assert "Cloned evaluator library" in capsys.readouterr().out
+        # The upstream is gone: only the cache can supply the second install.
+        monkeypatch.setattr(
+            evaluators, "EVALUATOR_LIBRARY_REPO", str(tmp_path / "nowhere")
+        )
+        second = _install(tmp_path / "two", "--ref", "v1.0.0")
+        assert "Using cached evaluator library" in capsys.readouterr().out
+        assert second == first  # same commit hash recorded
+        assert (
+            tmp_path / "two" / ".adversarial" / "evaluators" / "openai" / "fast"
+        ).is_dir()
+
+    def test_moving_ref_is_never_cached(self, tmp_path, library, capsys):
+        _install(tmp_path / "one", "--ref", "main")
+        assert not (tmp_path / "cache" / "evaluator-library" / "main").exists()
+        _install(tmp_path / "two", "--ref", "main")
+        assert "Using cached" not in capsys.readouterr().out
+
+    def test_no_cache_refetches_and_refreshes(self, tmp_path, library, capsys):
+        _install(tmp_path / "one", "--ref", "v1.0.0")
+        entry = tmp_path / "cache" / "evaluator-library" / "v1.0.0"
+        (entry / "evaluators" / "stale").mkdir()
+        _install(tmp_path / "two", "--ref", "v1.0.0", "--no-cache")
+        assert "Cloned evaluator library" in capsys.readouterr().out
+        assert not (entry / "evaluators" / "stale").exists()
+
+    def test_cache_hit_needs_no_git(self, tmp_path, library, monkeypatch, capsys):
+        _install(tmp_path / "one", "--ref", "v1.0.0")
+        monkeypatch.setattr(evaluators, "_git_available", lambda: False)
+        _install(tmp_path / "two", "--ref", "v1.0.0")
+        assert "Git is required" not in capsys.readouterr().out
+
+    def test_pin_error_is_reported_after_the_cli_step(
+        self, tmp_path, library, monkeypatch, capsys
+    ):
+        monkeypatch.setattr(
+            evaluators, "_ensure_adversarial_cli", lambda _p: print("CLI STEP")
+        )
+        (tmp_path / "proj").mkdir()
+        with pytest.raises(SystemExit) as exc_info:
+            evaluators.cmd_install_evaluators([], tmp_path / "proj")
+        assert exc_info.value.code == 1
+        out = capsys.readouterr().out
+        assert out.index("CLI STEP") < out.index("Could not read the evaluator")
+
+
+class TestCliProbeCache:
+    @pytest.fixture
+    def cli(self, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        calls = tmp_path / "calls.txt"
+        script = bin_dir / "adversarial"
+        script.write_text(
+            f"#!/bin/sh\necho x >> {calls}\nexit ${{PROBE_EXIT:-0}}\n",
+            encoding="utf-8",
+        )
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("AGENTIVE_KIT_CACHE_DIR", str(tmp_path / "cache"))
+        return script, calls
+
+    @staticmethod
+    def _probes(calls):
+        return (
+            len(calls.read_text(encoding="utf-8").splitlines()) if calls.exists() else 0
+        )
+
+    def test_pass_is_cached_per_binary(self, cli):
+        _script, calls = cli
+        assert evaluators._adversarial_cli_works()
+        assert evaluators._adversarial_cli_works()
+        assert self._probes(calls) == 1
+
+    def test_rewritten_binary_is_probed_again(self, cli):
+        script, calls = cli
+        assert evaluators._adversarial_cli_works()
+        st = script.stat()
+        os.utime(script, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert evaluators._adversarial_cli_works()
+        assert self._probes(calls) == 2
+
+    def test_failure_is_never_cached(self, cli, monkeypatch):
+        _script, calls = cli
+        monkeypatch.setenv("PROBE_EXIT", "1")
+        assert not evaluators._adversarial_cli_works()
+        assert not evaluators._adversarial_cli_works()
+        assert self._probes(calls) == 2
+
+    def test_expired_pass_is_probed_again(self, cli, monkeypatch):
+        _script, calls = cli
+        assert evaluators._adversarial_cli_works()
+        monkeypatch.setattr(evaluators, "CLI_PROBE_TTL", 0)
+        assert evaluators._adversarial_cli_works()
+        assert self._probes(calls) == 2
@@ -19,7 +19,7 @@ pytest.importorskip(
     "agentive_kit", reason="agentive-kit package source present only in the kit repo"
 )
 
-from agentive_kit import gitio  # noqa: E402
+from agentive_kit import gitio, procstats  # noqa: E402
 
 
 def _git(repo, *args):
@@ -190,3 +190,173 @@ class TestDeriveRepoUrl:
         repo = init_repo(tmp_path / "repo")
         _git(repo, "remote", "add", "origin", url)
         assert gitio.derive_repo_url(repo) is None
+
+
+class TestListWorktrees:
+    def test_primary_and_linked_worktrees(self, tmp_path):
+        primary = init_repo(tmp_path / "primary")
+        wt = tmp_path / "wt"
+        _git(primary, "worktree", "add", "-q", str(wt), "-b", "feature/KIT-1-x")
+        detached = tmp_path / "detached"
+        _git(primary, "worktree", "add", "-q", "--detach", str(detached))
+        entries = gitio.list_worktrees(primary)
+        # the main worktree always comes first; linked ones follow in
+        # git's own (admin-dir) order
+        assert entries[0].path.name == "primary"
+        assert entries[0].branch == "main"
+        by_name = {e.path.name: e for e in entries}
+        assert set(by_name) == {"primary", "wt", "detached"}
+        assert by_name["wt"].branch == "feature/KIT-1-x"
+        assert by_name["detached"].branch is None
+        assert by_name["detached"].detached
+        assert all(e.head for e in entries)
+
+    def test_locked_and_prunable_flags(self, tmp_path):
+        primary = init_repo(tmp_path / "primary")
+        locked = tmp_path / "locked"
+        gone = tmp_path / "gone"
+        _git(primary, "worktree", "add", "-q", "--detach", str(locked))
+        _git(primary, "worktree", "add", "-q", "--detach", str(gone))
+        _git(primary, "worktree", "lock", str(locked))
+        subprocess.run(["rm", "-rf", str(gone)], check=True, timeout=30)
+        by_name = {e.path.name: e for e in gitio.list_worktrees(primary)}
+        assert by_name["locked"].locked
+        assert by_name["gone"].prunable
+
+    def test_non_repo_is_none(self, tmp_path):
+        assert gitio.list_worktrees(tmp_path) is None
+
+
+class TestGitSession:
+    def test_batch_check_resolves_and_misses(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        head = subprocess.run(
+            ["git", "-C", str(repo), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        with gitio.GitSession(repo) as git:
+            found = git.batch_check(["HEAD", "main", "nope", "HEAD:no such"])
+            # the pipe is reused: a second batch needs no new process
+            pipe = git._batch
+            again = git.batch_check(["main^{commit}"])
+            assert git._batch is pipe
+        assert found == {
+            "HEAD": head,
+            "main": head,
+            "nope": None,
+            "HEAD:no such": None,
+        }
+        assert again == {"main^{commit}": head}
+
+    def test_batch_check_outside_a_repo_is_none(self, tmp_path):
+        with gitio.GitSession(tmp_path) as git:
+            assert git.batch_check(["HEAD"]) is None
+
+    def test_batch_check_newline_name_is_a_miss(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        with gitio.GitSession(repo) as git:
+            assert git.batch_check(["HEAD\nHEAD"]) == {"HEAD\nHEAD": None}
+            assert git._batch is None
+
+    def test_rev_parse_batches_arguments(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        with gitio.GitSession(repo) as git:
+            lines = git.rev_parse("--git-common-dir", "--abbrev-ref", "HEAD")
+        assert lines == [".git", "main"]
+
+    def test_head_and_refs_is_one_rev_parse(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        with procstats.counting() as calls, gitio.GitSession(repo) as git:
+            answer = git.head_and_refs(["main", "main~0^{commit}", "-x", ""])
+            assert git.current_branch() == "feature/x"  # memoized
+        assert answer == (
+            "feature/x",
+            {"main": True, "main~0^{commit}": True, "-x": False, "": False},
+        )
+        assert calls.count("git") == 1
+
+    def test_head_and_refs_after_a_miss_and_detached(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        _git(repo, "checkout", "-q", "--detach")
+        with gitio.GitSession(repo) as git:
+            answer = git.head_and_refs(["nope", "main", "also-nope"])
+        assert answer == (None, {"nope": False, "main": True, "also-nope": False})
+
+    def test_head_and_refs_on_an_unborn_branch(self, tmp_path):
+        repo = init_repo(tmp_path / "repo", commit=False)
+        with gitio.GitSession(repo) as git:
+            assert git.head_and_refs(["main"]) == ("main", {"main": False})
+        with gitio.GitSession(tmp_path) as git:
+            assert git.head_and_refs(["main"]) is None
+
+    def test_env_is_scrubbed_once(self, tmp_path, monkeypatch):
+        repo = init_repo(tmp_path / "repo")
+        monkeypatch.setenv("GIT_DIR", str(tmp_path / "elsewhere"))
+        git = gitio.GitSession(repo)
+        assert "GIT_DIR" not in git.env
+        assert git.current_branch() == "main"
+
+    def test_answers_are_memoized(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        git = gitio.GitSession(repo)
+        assert git.current_branch() == "main"
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        assert git.current_branch() == "main"  # one command's view
+        assert gitio.GitSession(repo).current_branch() == "feature/x"
+
+    def test_git_unfindable_is_none(self, tmp_path, monkeypatch):
+        empty = tmp_path / "empty-path"
+        empty.mkdir()
+        monkeypatch.setenv("PATH", str(empty))
+        with gitio.GitSession(tmp_path) as git:
+            assert git.batch_check(["HEAD"]) is None
+            assert git.rev_parse("HEAD") is None
+
+
+class TestIndexReads:
+    def _staged(self, tmp_path):
+        repo = init_repo(tmp_path / "repo")
+        (repo / "a.md").write_text("staged\n", encoding="utf-8")
+        (repo / "with space.md").write_bytes(b"two\nlines\n\x00bin")
+        _git(repo, "add", "a.md", "with space.md")
+        (repo / "a.md").write_text("working tree only\n", encoding="utf-8")
+        return repo
+
+    def test_read_blobs_returns_the_index_copy(self, tmp_path):
+        repo = self._staged(tmp_path)
+        with gitio.GitSession(repo) as git:
+            blobs = git.read_blobs([":a.md", ":with space.md", ":nope.md", ":a\nb"])
+        assert blobs == {
+            ":a.md": b"staged\n",
+            ":with space.md": b"two\nlines\n\x00bin",
+            ":nope.md": None,
+            ":a\nb": None,
+        }
+
+    def test_read_blobs_outside_a_repo_is_none(self, tmp_path):
+        with gitio.GitSession(tmp_path) as git:
+            assert git.read_blobs([":a.md"]) is None
+
+    def test_staged_paths_vs_head(self, tmp_path):
+        repo = self._staged(tmp_path)
+        (repo / "untracked.md").write_text("x\n", encoding="utf-8")
+        with gitio.GitSession(repo) as git:
+            assert git.staged_paths() == ["a.md", "with space.md"]
+            assert git.staged_paths("a.md") == ["a.md"]
+
+    def test_index_file_is_honored(self, tmp_path):
+        repo = self._staged(tmp_path)
+        other = tmp_path / "other-index"
+        env = {"GIT_INDEX_FILE": str(other)}
+        subprocess.run(
+            ["git", "-C", str(repo), "read-tree", "--empty"],
+            check=True,
+            timeout=30,
+            env={**gitio.clean_git_env(), **env},
+        )
+        with gitio.GitSession(repo, index_file=other) as git:
+            assert git.staged_paths() == []
+            assert git.read_blobs([":a.md"]) == {":a.md": None}
@@ -0,0 +1,278 @@
+"""Tests for agentive_kit.impact — the test-impact pytest plugin.
+
+The selection rules are tested as functions; the recorder end to end,
+by running a real ``python -m pytest -p agentive_kit.impact`` over a
+three-test suite in a temporary git repo, editing one file at a time
+and reading which tests the next run selects.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import ci_check, impact  # noqa: E402
+
+PACKAGE_PARENT = Path(impact.__file__).resolve().parent.parent
+
+SUITE = {
+    "scripts/calc.py": "def double(x):\n    return 2 * x\n",
+    "scripts/greet.py": "def hello():\n    return 'hi'\n",
+    "scripts/data.txt": "payload\n",
+    "scripts/show.py": "print(open('scripts/data.txt').read())\n",
+    "tests/conftest.py": (
+        "import sys\n"
+        "from pathlib import Path\n\n"
+        "import pytest\n\n"
+        "sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))\n\n\n"
+        "@pytest.fixture\n"
+        "def greeting():\n"
+        "    import greet\n\n"
+        "    return greet.hello()\n"
+    ),
+    "tests/test_suite.py": (
+        "import subprocess\n"
+        "import sys\n\n"
+        "import calc\n\n\n"
+        "def test_calc():\n"
+        "    assert calc.double(2) == 4\n\n\n"
+        "def test_fixture(greeting):\n"
+        "    assert greeting == 'hi'\n\n\n"
+        "def test_child():\n"
+        "    out = subprocess.run(\n"
+        "        [sys.executable, 'scripts/show.py'], capture_output=True, text=True\n"
+        "    ).stdout\n"
+        "    assert 'payload' in out\n"
+    ),
+}
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    _git(tmp_path, "init", "-q", "-b", "main", str(root))
+    for key, value in (("user.email", "t@example.com"), ("user.name", "t")):
+        _git(root, "config", key, value)
+    for rel, text in SUITE.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text, encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "base")
+    return root
+
+
+def _run(root: Path) -> tuple[str, set[str]]:
+    """One impact run; (its summary line, the tests that ran)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PACKAGE_PARENT)
+    env.pop(impact.LOG_ENV, None)
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-v",
+            "-p",
+            "no:cacheprovider",
+            "-p",
+            "agentive_kit.impact",
+            "--impact=.kit/.cache/test-impact",
+            "tests",
+        ],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode in (0, 5), proc.stdout + proc.stderr
+    (summary,) = re.findall(r"^impact: .*$", proc.stdout, re.MULTILINE)
+    ran = set(re.findall(r"::(test_\w+) PASSED", proc.stdout))
+    return summary, ran
+
+
+class TestSnapshot:
+    def test_tracks_edits_untracked_and_deletions(self, repo):
+        before = impact.tree_snapshot(repo)
+        assert set(before) == set(SUITE)
+        (repo / "scripts/calc.py").write_text("x = 1\n", encoding="utf-8")
+        (repo / "scripts/new.py").write_text("y = 2\n", encoding="utf-8")
+        (repo / "scripts/greet.py").unlink()
+        after = impact.tree_snapshot(repo)
+        assert impact.changed_paths(before, after) == {
+            "scripts/calc.py",
+            "scripts/new.py",
+            "scripts/greet.py",
+        }
+
+    def test_excluded_prefix_is_left_out(self, repo):
+        (repo / ".kit").mkdir()
+        (repo / ".kit" / "map.json").write_text("{}", encoding="utf-8")
+        assert ".kit/map.json" not in impact.tree_snapshot(repo, exclude=".kit/")
+
+    def test_outside_git_is_none(self, tmp_path):
+        assert impact.tree_snapshot(tmp_path) is None
+
+
+def _map(**tests):
+    return {"tests": tests, "fixtures": {}, "modules": {}}
+
+
+class TestFullRunReason:
+    def test_no_map(self):
+        assert "no impact map" in impact.full_run_reason(None, set())
+
+    @pytest.mark.parametrize(
+        "path", ["tests/conftest.py", "pyproject.toml", "requirements-dev.txt"]
+    )
+    def test_collection_and_packaging_files(self, path):
+        assert impact.full_run_reason(_map(), {path}, {path}) == f"{path} changed"
+
+    def test_unknown_source_file(self):
+        reason = impact.full_run_reason(_map(), {"scripts/x.py"}, {"scripts/x.py"})
+        assert reason == "scripts/x.py is not in the impact map"
+
+    def test_known_deleted_docs_and_new_tests_are_safe(self):
+        changed = {"scripts/x.py", "scripts/gone.py", "README.md", "tests/test_n.py"}
+        present = changed - {"scripts/gone.py"}
+        assert impact.full_run_reason(_map(t=["scripts/x.py"]), changed, present) == ""
+
+
+class TestDependencies:
+    def test_closest_fixture_definition_wins(self):
+        impact_map = {
+            "tests": {"tests/sub/test_a.py::test_x": ["tests/sub/test_a.py"]},
+            "fixtures": {
+                "tests::db": ["scripts/far.py"],
+                "tests/sub::db": ["scripts/near.py"],
+                "tests/other::db": ["scripts/other.py"],
+            },
+            "modules": {"tests/sub/test_a.py": ["scripts/imported.py"]},
+        }
+        deps = impact.test_dependencies(
+            "tests/sub/test_a.py::test_x",
+            ["db"],
+            impact_map,
+            impact.fixtures_by_name(impact_map),
+        )
+        assert deps == {
+            "tests/sub/test_a.py",
+            "scripts/near.py",
+            "scripts/imported.py",
+        }
+
+
+class TestEndToEnd:
+    def test_records_then_selects_by_what_changed(self, repo):
+        summary, ran = _run(repo)
+        assert "full suite — no impact map" in summary
+        assert ran == {"test_calc", "test_fixture", "test_child"}
+        data = json.loads(
+            (repo / ".kit/.cache/test-impact/map.json").read_text(encoding="utf-8")
+        )
+        assert "scripts/calc.py" in data["tests"]["tests/test_suite.py::test_calc"]
+        assert data["fixtures"]["tests::greeting"] == [
+            "scripts/greet.py",
+            "tests/conftest.py",
+        ]
+        # the child process's script and the file it read
+        child = data["tests"]["tests/test_suite.py::test_child"]
+        assert {"scripts/show.py", "scripts/data.txt"} <= set(child)
+
+        summary, ran = _run(repo)
+        assert summary.startswith("impact: 0 of 3") and ran == set()
+
+        (repo / "scripts/greet.py").write_text(
+            "def hello():\n    return 'hi'  # edited\n", encoding="utf-8"
+        )
+        assert _run(repo)[1] == {"test_fixture"}
+        (repo / "scripts/data.txt").write_text("payload, edited\n", encoding="utf-8")
+        assert _run(repo)[1] == {"test_child"}
+
+    def test_conftest_change_runs_everything(self, repo):
+        _run(repo)
+        with (repo / "tests/conftest.py").open("a", encoding="utf-8") as handle:
+            handle.write("# edited\n")
+        summary, ran = _run(repo)
+        assert "tests/conftest.py changed" in summary
+        assert len(ran) == 3
+
+    def test_failed_test_runs_again(self, repo):
+        _run(repo)
+        path = repo / ".kit/.cache/test-impact/map.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["failed"] = ["tests/test_suite.py::test_calc"]
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert _run(repo)[1] == {"test_calc"}
+        assert json.loads(path.read_text(encoding="utf-8"))["failed"] == []
+
+
+class TestXdist:
+    """Workers hand recordings to the controller; only it writes the map."""
+
+    def _plugin(self, repo, **config):
+        config.setdefault("option", SimpleNamespace(dist="no"))
+        return impact.ImpactPlugin(
+            SimpleNamespace(rootpath=repo, **config), Path(".kit/.cache/test-impact")
+        )
+
+    def test_worker_returns_recordings_instead_of_saving(self, repo, monkeypatch):
+        worker = self._plugin(repo, workerinput={}, workeroutput={})
+        monkeypatch.setattr(worker.recorder, "stop", lambda: None)
+        worker.recorder.active = True
+        worker.ran = {"tests/test_suite.py::test_calc": ["scripts/calc.py"]}
+        worker.pytest_sessionfinish(None)
+        assert worker.config.workeroutput["agentive_impact"]["tests"] == worker.ran
+        assert not (repo / ".kit/.cache/test-impact/map.json").exists()
+
+    def test_controller_merges_every_worker(self, repo):
+        controller = self._plugin(repo, option=SimpleNamespace(dist="load"))
+        controller.pytest_sessionstart(None)
+        for test, files in (("test_calc", ["a.py"]), ("test_child", ["b.py"])):
+            payload = {
+                "tests": {f"tests/test_suite.py::{test}": files},
+                "fixtures": {"tests::greeting": files},
+                "modules": {"tests/test_suite.py": ["tests/test_suite.py"]},
+            }
+            node = SimpleNamespace(workeroutput={"agentive_impact": payload})
+            controller.pytest_testnodedown(node, None)
+        controller.pytest_sessionfinish(None)
+        saved = impact.load_map(repo / ".kit/.cache/test-impact")
+        assert len(saved["tests"]) == 2
+        assert saved["fixtures"]["tests::greeting"] == ["a.py", "b.py"]
+
+
+class TestCiCheckWiring:
+    def test_impact_step_drops_coverage_and_accepts_no_tests(self, tmp_path):
+        step = ci_check.impact_step(tmp_path)
+        assert not any(arg.startswith("--cov") for arg in step.argv)
+        assert f"--impact={tmp_path / ci_check.IMPACT_DIR}" in step.argv
+        assert step.ok_codes == (0, 5)
+
+    def test_exit_5_passes(self, tmp_path):
+        step = ci_check.Step(
+            "t", "·", (sys.executable, "-c", "raise SystemExit(5)"), ok_codes=(0, 5)
+        )
+        (result,) = ci_check.run_steps(tmp_path, [step], emit=lambda block: None)
+        assert result.verdict == "PASS"
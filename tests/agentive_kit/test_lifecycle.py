@@ -19,7 +19,7 @@ pytest.importorskip(
     "agentive_kit", reason="agentive-kit package source present only in the kit repo"
 )
 
-from agentive_kit import lifecycle  # noqa: E402
+from agentive_kit import lifecycle, procstats  # noqa: E402
 
 TASK_FILE = "KIT-1234-sample-task.md"
 
@@ -277,6 +277,51 @@ class TestMoveTask:
         assert result.status_update_failed is True
 
 
+class TestMoveTasks:
+    def test_batch_applies_every_move_in_order(self, tmp_path):
+        make_project(tmp_path)
+        other = tmp_path / ".kit" / "tasks" / "2-todo" / "KIT-0002-other.md"
+        other.write_text("# Other\n\n**Status**: Todo\n", encoding="utf-8")
+        results = lifecycle.move_tasks(
+            [("KIT-1234", "In Progress"), ("KIT-0002", "done"), ("KIT-1234", "done")],
+            tmp_path,
+        )
+        assert [r.to_folder for r in results] == ["3-in-progress", "5-done", "5-done"]
+        # the second move of KIT-1234 started from where the first left it
+        assert results[2].from_folder == "3-in-progress"
+        assert lifecycle.task_folders(tmp_path) == {
+            "KIT-0002": "5-done",
+            "KIT-1234": "5-done",
+        }
+
+    def test_failures_are_none_and_do_not_stop_the_batch(self, tmp_path, capsys):
+        make_project(tmp_path)
+        results = lifecycle.move_tasks(
+            [("KIT-9999", "done"), ("KIT-1234", "bogus"), ("KIT-1234", "done")],
+            tmp_path,
+        )
+        assert results[:2] == [None, None]
+        assert results[2].moved
+        out = capsys.readouterr().out
+        assert "Task not found: KIT-9999" in out
+        assert "Unknown status: bogus" in out
+
+    def test_branch_is_resolved_once(self, tmp_path, monkeypatch):
+        make_project(tmp_path, branch="main")
+        other = tmp_path / ".kit" / "tasks" / "2-todo" / "KIT-0002-other.md"
+        other.write_text("# Other\n\n**Status**: Todo\n", encoding="utf-8")
+        calls = []
+        real = lifecycle.gitio.current_branch
+
+        def counting(project_dir):
+            calls.append(project_dir)
+            return real(project_dir)
+
+        monkeypatch.setattr(lifecycle.gitio, "current_branch", counting)
+        lifecycle.move_tasks([("KIT-1234", "done"), ("KIT-0002", "done")], tmp_path)
+        assert len(calls) == 1
+
+
 class TestUpdateStatusTriState:
     def test_updated_returns_true(self, tmp_path):
         f = tmp_path / "t.md"
@@ -401,6 +446,79 @@ class TestMissingTasksDir:
         assert "Unreadable tasks directory" in report.issues[0].detail
 
 
+class TestValidateStagedTasks:
+    """The pre-commit form: the index's copy, not the working tree."""
+
+    def _repo(self, tmp_path):
+        make_project(tmp_path, branch="main")
+        _git(tmp_path, "add", "-A")
+        return tmp_path
+
+    def test_staged_copy_wins_over_the_working_tree(self, tmp_path, capsys):
+        repo = self._repo(tmp_path)
+        task = repo / ".kit" / "tasks" / "2-todo" / TASK_FILE
+        task.write_text("**Status**: Done\n", encoding="utf-8")  # unstaged
+        report = lifecycle.validate_staged_tasks(repo)
+        assert report.ok and report.checked == 1
+        assert "All 1 staged tasks" in capsys.readouterr().out
+
+        _git(repo, "add", "-A")
+        task.write_text("**Status**: Todo\n", encoding="utf-8")  # fixed, unstaged
+        report = lifecycle.validate_staged_tasks(repo)
+        assert [i.detail for i in report.issues] == ["Status 'Done' != folder 'Todo'"]
+
+    def test_named_paths_only_and_rule_shared_with_the_sweep(self, tmp_path):
+        repo = self._repo(tmp_path)
+        tasks = repo / ".kit" / "tasks"
+        (tasks / "5-done" / "KIT-0003-wrong.md").write_text("# x\n", encoding="utf-8")
+        (tasks / "8-archive").mkdir()
+        (tasks / "8-archive" / "KIT-0009-old.md").write_text("x\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        named = [f".kit/tasks/2-todo/{TASK_FILE}", "README.md"]
+        assert lifecycle.validate_staged_tasks(repo, named).checked == 1
+        staged = lifecycle.validate_staged_tasks(repo)
+        assert staged.issues == lifecycle.validate_all_tasks(repo).issues
+        assert staged.issues[0].detail == "No Status field found"
+
+    def test_absolute_and_nested_paths_are_checked(self, tmp_path, capsys):
+        # Regression: anything but .kit/tasks/<folder>/<file>.md relative
+        # to the root was dropped, and the hook passed "All 0" tasks.
+        repo = self._repo(tmp_path)
+        todo = repo / ".kit" / "tasks" / "2-todo"
+        (todo / "T1.md").write_text("**Status**: Done\n", encoding="utf-8")
+        (todo / "sub").mkdir()
+        (todo / "sub" / "T2.md").write_text("**Status**: Done\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+
+        report = lifecycle.validate_staged_tasks(repo, [str(todo / "T1.md")])
+        assert [i.file_name for i in report.issues] == ["T1.md"]
+        report = lifecycle.validate_staged_tasks(repo, [".kit/tasks/2-todo/sub/T2.md"])
+        assert [i.detail for i in report.issues] == ["Status 'Done' != folder 'Todo'"]
+        assert "All 0" not in capsys.readouterr().out
+        assert lifecycle.validate_staged_tasks(repo).checked == 3
+
+    def test_spawn_budget_is_two_git_calls(self, tmp_path):
+        # The hook runs on every commit: one diff for the paths, one
+        # cat-file for every blob, however many tasks are staged.
+        repo = self._repo(tmp_path)
+        for n in range(5):
+            task = repo / ".kit" / "tasks" / "2-todo" / f"KIT-000{n}-t.md"
+            task.write_text("**Status**: Todo\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        with procstats.counting() as calls:
+            assert lifecycle.validate_staged_tasks(repo).checked == 6
+        assert calls.count() == calls.count("git") == 2
+
+    def test_outside_git_is_none(self, tmp_path, capsys):
+        make_project(tmp_path)
+        assert lifecycle.validate_staged_tasks(tmp_path) is None
+        assert "Cannot read the git index" in capsys.readouterr().out
+
+    def test_parse_status_is_the_one_pattern(self):
+        assert lifecycle.parse_status("**Status**: In Progress\n") == "In Progress"
+        assert lifecycle.parse_status("Status: Todo") is None
+
+
 class TestValidateAllTasks:
     def test_all_matching_reports_ok(self, tmp_path, capsys):
         make_project(tmp_path)
@@ -0,0 +1,357 @@
+"""Tests for agentive_kit.linear_pull — ``agentive linear pull``.
+
+Harness: a local ThreadingHTTPServer stands in for the Linear GraphQL
+endpoint. It serves a list of issues through the real ``issues``
+connection shape (filter on ``updatedAt``, ``first``/``after`` paging)
+and records every request's variables, so the cursor and paging are
+observable without a network. The conformance class at the end pins
+the ledger and title-prefix copies to the push script's originals.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import lifecycle, linear_pull  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+_PUSH_SCRIPT = REPO_ROOT / "scripts" / "optional" / "sync_tasks_to_linear.py"
+
+
+class LinearStub:
+    """Serves ``self.issues`` to PullIssues queries, paged by ``first``."""
+
+    def __init__(self):
+        self.issues = []
+        self.requests = []
+        self.status = 200
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append(body["variables"])
+                data = json.dumps(stub.answer(body["variables"])).encode()
+                self.send_response(stub.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/graphql"
+
+    def answer(self, variables):
+        since = ((variables.get("filter") or {}).get("updatedAt") or {}).get("gte")
+        matching = sorted(
+            (i for i in self.issues if since is None or i["updatedAt"] >= since),
+            key=lambda i: i["updatedAt"],
+        )
+        start = int(variables["after"] or 0)
+        page = matching[start : start + variables["first"]]
+        end = start + len(page)
+        return {
+            "data": {
+                "issues": {
+                    "nodes": page,
+                    "pageInfo": {
+                        "hasNextPage": end < len(matching),
+                        "endCursor": str(end),
+                    },
+                }
+            }
+        }
+
+
+@pytest.fixture
+def linear():
+    stub = LinearStub()
+    thread = threading.Thread(
+        target=stub.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.delenv("LINEAR_TEAM_ID", raising=False)
+    for task_id, folder in (
+        ("KIT-0001", "2-todo"),
+        ("KIT-0002", "2-todo"),
+        ("KIT-0003", "3-in-progress"),
+    ):
+        status = lifecycle.FOLDER_STATUS_MAP[folder]
+        path = tmp_path / ".kit" / "tasks" / folder / f"{task_id}-demo.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {task_id}\n\n**Status**: {status}\n", encoding="utf-8")
+    return tmp_path
+
+
+def _issue(task_id, state, updated, issue_id=None):
+    return {
+        "id": issue_id or f"uuid-{task_id}",
+        "identifier": f"ENG-{task_id[-1]}",
+        "title": f"[{task_id}] Demo",
+        "updatedAt": updated,
+        "state": {"name": state},
+    }
+
+
+def _ledger(statuses=None):
+    """A push ledger that last synced each task at *statuses*."""
+    return {
+        "version": 1,
+        "commit": None,
+        "tasks": {
+            task_id: {"issue_id": f"uuid-{task_id}", "hash": "h", "status": status}
+            for task_id, status in (statuses or {}).items()
+        },
+    }
+
+
+FOLDERS = {"KIT-0001": "2-todo", "KIT-0002": "2-todo", "KIT-0003": "3-in-progress"}
+
+
+class TestPlanPull:
+    def test_remote_only_change_is_a_move(self):
+        issues = [_issue("KIT-0001", "Done", "2026-01-02T00:00:00.000Z")]
+        plan = linear_pull.plan_pull(issues, _ledger({"KIT-0001": "Todo"}), FOLDERS)
+        assert plan.moves == [("KIT-0001", "5-done")]
+        assert plan.conflicts == []
+        assert plan.cursor == "2026-01-02T00:00:00.000Z"
+
+    def test_local_only_change_is_left_for_the_push(self):
+        issues = [_issue("KIT-0003", "Todo", "2026-01-02T00:00:00.000Z")]
+        plan = linear_pull.plan_pull(issues, _ledger({"KIT-0003": "Todo"}), FOLDERS)
+        assert plan.moves == [] and plan.conflicts == []
+
+    def test_both_sides_changed_is_a_conflict(self):
+        issues = [_issue("KIT-0003", "Done", "2026-01-02T00:00:00.000Z")]
+        plan = linear_pull.plan_pull(issues, _ledger({"KIT-0003": "Todo"}), FOLDERS)
+        assert plan.moves == []
+        (line,) = plan.conflicts
+        assert "KIT-0003: local In Progress, Linear Done" in line
+        assert "last synced as Todo" in line
+
+    def test_no_base_is_a_conflict_unless_both_agree(self):
+        issues = [
+            _issue("KIT-0001", "Done", "2026-01-02T00:00:00.000Z"),
+            _issue("KIT-0002", "Todo", "2026-01-02T00:00:00.000Z"),
+        ]
+        plan = linear_pull.plan_pull(issues, _ledger(), FOLDERS)
+        assert [c.split(":")[0] for c in plan.conflicts] == ["KIT-0001"]
+        assert plan.agreed == {"KIT-0002": "Todo"}
+
+    def test_cursor_never_passes_a_conflict(self):
+        issues = [
+            _issue("KIT-0003", "Done", "2026-01-02T00:00:00.000Z"),
+            _issue("KIT-0001", "Done", "2026-01-05T00:00:00.000Z"),
+        ]
+        ledger = _ledger({"KIT-0001": "Todo", "KIT-0003": "Todo"})
+        plan = linear_pull.plan_pull(issues, ledger, FOLDERS)
+        assert plan.cursor == "2026-01-02T00:00:00.000Z"
+
+    def test_ledger_issue_id_beats_a_renamed_title(self):
+        issue = _issue("KIT-0001", "Done", "2026-01-02T00:00:00.000Z")
+        issue["title"] = "Renamed in Linear"
+        plan = linear_pull.plan_pull([issue], _ledger({"KIT-0001": "Todo"}), FOLDERS)
+        assert plan.moves == [("KIT-0001", "5-done")]
+
+    def test_unmapped_states_and_foreign_issues_are_skipped(self):
+        issues = [
+            _issue("KIT-0001", "Duplicate", "2026-01-02T00:00:00.000Z"),
+            _issue("KIT-0009", "Done", "2026-01-02T00:00:00.000Z"),
+        ]
+        plan = linear_pull.plan_pull(issues, _ledger({"KIT-0001": "Todo"}), FOLDERS)
+        assert plan.moves == [] and plan.conflicts == []
+
+
+class TestFetch:
+    def test_pages_and_filters_by_cursor(self, linear, monkeypatch):
+        monkeypatch.setattr(linear_pull, "PAGE_SIZE", 2)
+        linear.issues = [
+            _issue(f"KIT-000{n}", "Todo", f"2026-01-0{n}T00:00:00.000Z")
+            for n in range(1, 6)
+        ]
+        issues = linear_pull.fetch_updated_issues(
+            linear.url, "key", "2026-01-02T00:00:00.000Z", team="ENG"
+        )
+        assert [i["updatedAt"][:10] for i in issues] == [
+            "2026-01-02",
+            "2026-01-03",
+            "2026-01-04",
+            "2026-01-05",
+        ]
+        assert [r["after"] for r in linear.requests] == [None, "2"]
+        assert linear.requests[0]["filter"] == {
+            "updatedAt": {"gte": "2026-01-02T00:00:00.000Z"},
+            "team": {"key": {"eq": "ENG"}},
+        }
+
+    def test_http_error_is_none(self, linear, capsys):
+        linear.status = 500
+        assert linear_pull.fetch_updated_issues(linear.url, "key", None) is None
+        assert "HTTP 500" in capsys.readouterr().err
+
+
+class TestPull:
+    def test_applies_moves_and_records_the_cursor(self, project, linear):
+        linear_pull.save_ledger(
+            _ledger({"KIT-0001": "Todo", "KIT-0002": "Todo"}), project
+        )
+        linear.issues = [
+            _issue("KIT-0001", "In Review", "2026-01-02T00:00:00.000Z"),
+            _issue("KIT-0002", "Todo", "2026-01-03T00:00:00.000Z"),
+        ]
+        assert linear_pull.pull(project, "key", url=linear.url) == 0
+        assert lifecycle.task_folders(project)["KIT-0001"] == "4-in-review"
+        ledger = linear_pull.load_ledger(project)
+        assert ledger["pull_cursor"] == "2026-01-03T00:00:00.000Z"
+        assert ledger["tasks"]["KIT-0001"]["status"] == "In Review"
+        assert ledger["tasks"]["KIT-0001"]["hash"] == "h"  # push fields kept
+
+        # the next pull asks only for what changed since
+        linear_pull.pull(project, "key", url=linear.url)
+        assert linear.requests[-1]["filter"] == {
+            "updatedAt": {"gte": "2026-01-03T00:00:00.000Z"}
+        }
+
+    def test_conflict_is_reported_and_not_applied(self, project, linear, capsys):
+        linear_pull.save_ledger(_ledger({"KIT-0003": "Todo"}), project)
+        linear.issues = [_issue("KIT-0003", "Done", "2026-01-02T00:00:00.000Z")]
+        assert linear_pull.pull(project, "key", url=linear.url) == 3
+        assert lifecycle.task_folders(project)["KIT-0003"] == "3-in-progress"
+        assert "Conflict — KIT-0003" in capsys.readouterr().out
+
+    def test_dry_run_changes_nothing(self, project, linear, capsys):
+        linear_pull.save_ledger(_ledger({"KIT-0001": "Todo"}), project)
+        linear.issues = [_issue("KIT-0001", "Done", "2026-01-02T00:00:00.000Z")]
+        assert linear_pull.pull(project, "key", url=linear.url, dry_run=True) == 0
+        assert lifecycle.task_folders(project)["KIT-0001"] == "2-todo"
+        assert "pull_cursor" not in linear_pull.load_ledger(project)
+        assert "Would move KIT-0001 → 5-done" in capsys.readouterr().out
+
+    def test_api_failure_keeps_the_cursor(self, project, linear):
+        ledger = _ledger()
+        ledger["pull_cursor"] = "2026-01-01T00:00:00.000Z"
+        linear_pull.save_ledger(ledger, project)
+        linear.status = 500
+        assert linear_pull.pull(project, "key", url=linear.url) == 1
+        cursor = linear_pull.load_ledger(project)["pull_cursor"]
+        assert cursor == "2026-01-01T00:00:00.000Z"
+
+
+class TestMain:
+    def _exit_code(self, argv, project):
+        with pytest.raises(SystemExit) as exc_info:
+            linear_pull.main(argv, project)
+        return exc_info.value.code
+
+    def test_missing_api_key_is_an_error(self, project, monkeypatch, capsys):
+        monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+        assert self._exit_code(["pull"], project) == 1
+        assert "LINEAR_API_KEY" in capsys.readouterr().err
+
+    def test_reads_the_key_from_dotenv(self, project, linear, monkeypatch):
+        monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+        monkeypatch.setattr(linear_pull, "LINEAR_API_URL", linear.url)
+        (project / ".env").write_text("LINEAR_API_KEY='lin_api_x'\n", encoding="utf-8")
+        assert self._exit_code(["pull"], project) == 0
+        assert len(linear.requests) == 1
+
+    def test_unknown_subcommand_is_usage_error(self, project, capsys):
+        assert self._exit_code(["push"], project) == 1
+        assert "Usage: agentive linear pull" in capsys.readouterr().err
+
+
+@pytest.fixture(scope="module")
+def push():
+    from scripts.optional import linear_sync_utils, sync_tasks_to_linear
+
+    return linear_sync_utils, sync_tasks_to_linear
+
+
+@pytest.mark.skipif(
+    not _PUSH_SCRIPT.exists(), reason="push script absent (consumer checkout)"
+)
+class TestConformanceWithPushScript:
+    """The pull reads and writes the push script's ledger; they must agree."""
+
+    def test_ledger_constants_agree(self, push):
+        utils, _ = push
+        assert linear_pull.SYNC_LEDGER == utils.SYNC_LEDGER_PATH
+        assert linear_pull.SYNC_LEDGER_VERSION == utils.SYNC_LEDGER_VERSION
+
+    def test_api_url_agrees(self, push):
+        _, script = push
+        assert linear_pull.LINEAR_API_URL == script.LINEAR_API_URL
+
+    def test_empty_ledgers_agree(self, push, tmp_path):
+        utils, _ = push
+        assert linear_pull.load_ledger(tmp_path) == utils.load_sync_ledger(tmp_path)
+
+    def test_saved_bytes_agree(self, push, tmp_path):
+        utils, _ = push
+        ledger = _ledger({"KIT-0001": "Todo", "KIT-0002": "Done"})
+        ledger["pull_cursor"] = "2026-01-01T00:00:00.000Z"
+        linear_pull.save_ledger(ledger, tmp_path / "pull")
+        utils.save_sync_ledger(ledger, tmp_path / "push")
+        pulled = (tmp_path / "pull" / linear_pull.SYNC_LEDGER).read_bytes()
+        pushed = (tmp_path / "push" / utils.SYNC_LEDGER_PATH).read_bytes()
+        assert pulled == pushed
+
+    def test_each_side_reads_the_other(self, push, tmp_path):
+        utils, _ = push
+        ledger = _ledger({"KIT-0001": "In Progress"})
+        utils.save_sync_ledger(ledger, tmp_path)
+        assert linear_pull.load_ledger(tmp_path) == ledger
+        ledger["pull_cursor"] = "2026-01-02T00:00:00.000Z"
+        linear_pull.save_ledger(ledger, tmp_path)
+        assert utils.load_sync_ledger(tmp_path) == ledger
+
+    def test_foreign_version_discarded_by_both(self, push, tmp_path):
+        utils, _ = push
+        ledger = _ledger({"KIT-0001": "Todo"})
+        ledger["version"] = linear_pull.SYNC_LEDGER_VERSION + 1
+        utils.save_sync_ledger(ledger, tmp_path)
+        assert linear_pull.load_ledger(tmp_path)["tasks"] == {}
+        assert utils.load_sync_ledger(tmp_path)["tasks"] == {}
+
+    def test_title_prefix_pattern_agrees(self, push):
+        _, script = push
+        assert linear_pull._TITLE_TASK_ID.pattern == script._TITLE_TASK_ID.pattern
+
+    @pytest.mark.parametrize(
+        "title",
+        [
+            "[KIT-0042] Title",
+            "[A1-0001] short prefix",
+            "[ABCDEF-1234] six-letter prefix",
+            "[ABCDEFG-1234] seven-letter prefix",
+            "[KIT-00421] five digits",
+            "[kit-0042] lower case",
+            "KIT-0042 unbracketed",
+            "Follow-up to [KIT-0007]",
+            "",
+        ],
+    )
+    def test_title_prefix_matches_agree(self, push, title):
+        _, script = push
+        ours = linear_pull._TITLE_TASK_ID.search(title)
+        theirs = script._TITLE_TASK_ID.search(title)
+        assert (ours and ours.group(1)) == (theirs and theirs.group(1))
@@ -10,6 +10,7 @@ where scripts/local is absent (the test_kit_markers.py pattern).
 from __future__ import annotations
 
 import importlib.util
+import random
 import sys
 from pathlib import Path
 
@@ -69,6 +70,65 @@ class TestExtractRegion:
         )
 
 
+class TestRegionIndex:
+    def test_offsets_slice_the_region(self):
+        (region,) = markers.region_index(REGION)["kit-install"]
+        assert REGION[region.start : region.body_start] == (
+            "<!-- BEGIN KIT-LOCAL: kit-install -->\n"
+        )
+        assert REGION[region.body_start : region.body_end] == (
+            "shape: single\nbots: none"
+        )
+        assert REGION[region.body_end : region.end] == (
+            "\n<!-- END KIT-LOCAL: kit-install -->"
+        )
+
+    def test_one_index_serves_every_name(self):
+        text = REGION + REGION.replace("kit-install", "stack-notes")
+        assert list(markers.region_index(text)) == ["kit-install", "stack-notes"]
+        assert markers.region_index(text) is markers.region_index(text)
+
+    def test_index_is_read_only(self):
+        with pytest.raises(TypeError):
+            markers.region_index(REGION)["x"] = ()
+
+    def test_pattern_factory_is_cached(self):
+        assert markers._region_pattern("kit-install") is markers._region_pattern(
+            "kit-install"
+        )
+
+    def test_unpaired_begin_is_absent(self):
+        assert markers.region_index("<!-- BEGIN KIT-LOCAL: a -->\nbody\n") == {}
+
+
+# Marker lines (well-formed, drifted, damaged, prefix siblings) that
+# random documents are stitched from.
+_FUZZ_LINES = [
+    "<!-- BEGIN KIT-LOCAL: a -->",
+    "<!-- END KIT-LOCAL: a -->",
+    "<!--BEGIN  KIT-LOCAL:a-->  ",
+    "  <!-- END KIT-LOCAL:\ta --> trailing",
+    "<!-- BEGIN KIT-LOCAL: a-b -->",
+    "<!-- END KIT-LOCAL: a-b -->",
+    "<!-- END KIT-LOCAL: a --> -->",
+    "<!-- BEGIN KIT-LOCAL: a-->b -->",
+    "<!-- END KIT-LOCAL: a-->b -->",
+    "<!-- BEGIN KIT-LOCAL: a -->\r",
+    "prose",
+    "",
+    "\r",
+]
+_FUZZ_NAMES = ["a", "a-b", "a-->b", "a -->", " a", "a ", ""]
+
+
+def _fuzz_texts(seed, count):
+    rng = random.Random(seed)
+    for _ in range(count):
+        newline = rng.choice(["\n", "\r\n"])
+        lines = [rng.choice(_FUZZ_LINES) for _ in range(rng.randint(0, 8))]
+        yield newline.join(lines) + rng.choice(["", newline])
+
+
 @pytest.fixture(scope="module")
 def kit_markers():
     spec = importlib.util.spec_from_file_location("_kit_markers", _KIT_MARKERS)
@@ -89,7 +149,7 @@ def kit_markers():
 class TestConformanceWithKitMarkers:
     """The package reader and the repo tool must agree byte-for-byte."""
 
-    @pytest.mark.parametrize(
+    CASES = pytest.mark.parametrize(
         "text",
         [
             REGION,
@@ -109,7 +169,30 @@ class TestConformanceWithKitMarkers:
         ],
         ids=["basic", "absent", "empty-body", "indented", "crlf", "damaged-end"],
     )
+
+    @CASES
     def test_extract_agrees(self, kit_markers, text):
         assert markers.extract_region(text, "kit-install") == (
             kit_markers.extract_region(text, "kit-install")
         )
+
+    @CASES
+    def test_index_agrees(self, kit_markers, text):
+        assert dict(markers.region_index(text)) == dict(kit_markers.region_index(text))
+
+    def test_index_matches_the_reference_pattern(self, kit_markers):
+        """The one-scan index finds exactly what the DOTALL pattern does."""
+        for text in _fuzz_texts(seed=40, count=3000):
+            for name in _FUZZ_NAMES:
+                expected = [
+                    (m.start(), m.end("begin"), m.start("end"), m.end())
+                    for m in markers._region_pattern(name).finditer(text)
+                ]
+                assert list(markers._regions(text, name)) == expected, (text, name)
+                match = markers._region_pattern(name).search(text)
+                body = match.group("body") if match else None
+                assert markers.extract_region(text, name) == body
+                assert kit_markers.extract_region(text, name) == body
+            assert dict(markers.region_index(text)) == dict(
+                kit_markers.region_index(text)
+            )
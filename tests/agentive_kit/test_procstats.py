@@ -0,0 +1,81 @@
+"""Tests for agentive_kit.procstats — per-prefix subprocess accounting."""
+
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from conftest import write_stub
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import door, ghio, gitio, procstats  # noqa: E402
+
+
+class TestCommandKey:
+    @pytest.mark.parametrize(
+        "argv, key",
+        [
+            (["git", "-C", "/x", "rev-parse", "HEAD"], "git rev-parse"),
+            (["gh", "--repo", "o/n", "pr", "view"], "gh pr"),
+            (["/usr/bin/git", "-c", "a=b", "--no-pager", "log"], "git log"),
+            (["bash", "/kit/door/engines/engine.sh", "--x"], "bash engine.sh"),
+            (["claude", "plugin", "list"], "claude plugin"),
+            (["gh"], "gh"),
+            ([], ""),
+        ],
+    )
+    def test_prefixes(self, argv, key):
+        assert procstats.command_key(argv) == key
+
+
+class TestAccounting:
+    def test_disabled_is_the_shared_no_op(self):
+        assert not procstats.enabled()
+        assert procstats.call(["git"]) is procstats.call(["gh", "pr"])
+
+    def test_counts_latency_and_timeouts(self):
+        with procstats.counting() as calls:
+            with procstats.call(["git", "status"]):
+                pass
+            with pytest.raises(subprocess.TimeoutExpired):
+                with procstats.call(["git", "status"]):
+                    raise subprocess.TimeoutExpired("git", 1)
+        status = calls.by_prefix["git status"]
+        assert (status.count, status.timeouts) == (2, 1)
+        assert 0 <= status.max <= status.total
+        assert calls.count("git") == 2 and calls.count("gi") == 0
+        assert "2  git status" not in calls.summary()  # columns, not glued
+        assert calls.summary().splitlines()[0].startswith("subprocess calls: 2 (")
+
+    def test_nested_counting_reaches_the_outer(self):
+        with procstats.counting() as outer:
+            with procstats.call(["gh", "pr"]):
+                pass
+            with procstats.counting() as inner:
+                with procstats.call(["gh", "pr"]):
+                    pass
+        assert inner.count() == 1 and outer.count("gh pr") == 2
+        assert not procstats.enabled()
+
+
+class TestChokePoints:
+    def test_git_gh_and_door_calls_are_counted(self, tmp_path, stub_bin):
+        write_stub(stub_bin, "gh", "exit 0\n")
+        with procstats.counting() as calls:
+            gitio.run_git(tmp_path, "rev-parse", "--git-dir")
+            ghio.run_gh("auth", "status", repo="o/n")
+            door._run(["git", "--version"], capture_output=True)
+        assert set(calls.by_prefix) == {"git rev-parse", "gh auth", "git"}
+
+    def test_git_timeout_is_counted(self, tmp_path, monkeypatch):
+        def timing_out(cmd, **kwargs):
+            raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+        monkeypatch.setattr(gitio.subprocess, "run", timing_out)
+        with procstats.counting() as calls:
+            assert gitio.run_git(tmp_path, "hash-object", "HEAD") is None
+        assert calls.by_prefix["git hash-object"].timeouts == 1
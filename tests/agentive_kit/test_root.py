@@ -22,7 +22,12 @@ pytest.importorskip(
     "agentive_kit", reason="agentive-kit package source present only in the kit repo"
 )
 
-from agentive_kit.root import RootNotFoundError, find_project_root  # noqa: E402
+from agentive_kit import root as root_mod  # noqa: E402
+from agentive_kit.root import (  # noqa: E402
+    ProjectContext,
+    RootNotFoundError,
+    find_project_root,
+)
 
 
 def make_kit_root(base: Path) -> Path:
@@ -155,3 +160,71 @@ class TestRefusal:
         half.mkdir()
         (half / "CLAUDE.md").write_text("# Sub\n", encoding="utf-8")
         assert find_project_root(half) == root
+
+
+@pytest.fixture
+def count_checks(monkeypatch):
+    """Record every candidate directory the discovery stats."""
+    checked = []
+    real = root_mod._is_project_root
+
+    def counting(candidate):
+        checked.append(candidate)
+        return real(candidate)
+
+    monkeypatch.setattr(root_mod, "_is_project_root", counting)
+    return checked
+
+
+class TestCache:
+    def test_repeat_discovery_is_free(self, tmp_path, count_checks):
+        root = make_kit_root(tmp_path)
+        nested = root / "a" / "b"
+        nested.mkdir(parents=True)
+        assert find_project_root(nested) == root
+        assert count_checks == [nested, root / "a", root]
+        assert find_project_root(nested) == root
+        assert len(count_checks) == 3
+
+    def test_refusals_are_not_remembered(self, tmp_path):
+        with pytest.raises(RootNotFoundError):
+            find_project_root(tmp_path)
+        make_kit_root(tmp_path)
+        assert find_project_root(tmp_path) == tmp_path
+
+    def test_hint_validated_once_instead_of_walking(
+        self, tmp_path, monkeypatch, count_checks
+    ):
+        root = make_kit_root(tmp_path)
+        deep = root / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        monkeypatch.setenv(root_mod.ROOT_ENV, str(root))
+        assert find_project_root(deep) == root
+        assert count_checks == [root]
+
+    @pytest.mark.parametrize("which", ["outside", "not-a-root"])
+    def test_unusable_hint_falls_back_to_the_walk(self, tmp_path, monkeypatch, which):
+        root = make_kit_root(tmp_path / "proj")
+        other = tmp_path / "other"
+        other.mkdir()
+        if which == "outside":
+            monkeypatch.setenv(root_mod.ROOT_ENV, str(make_kit_root(other)))
+        else:
+            monkeypatch.setenv(root_mod.ROOT_ENV, str(root / "src"))
+        (root / "src").mkdir()
+        assert find_project_root(root / "src") == root
+
+
+class TestProjectContext:
+    def test_discovers_lazily_and_once(self, tmp_path, count_checks):
+        root = make_kit_root(tmp_path)
+        ctx = ProjectContext(root)
+        assert count_checks == []
+        assert ctx.root == root and ctx.root == root
+        assert count_checks == [root]
+
+    def test_refusal_raises_on_each_read(self, tmp_path):
+        ctx = ProjectContext(tmp_path)
+        for _ in range(2):
+            with pytest.raises(RootNotFoundError):
+                ctx.root
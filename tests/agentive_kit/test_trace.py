@@ -0,0 +1,116 @@
+"""Tests for agentive_kit.trace — opt-in Chrome trace-event output."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import gitio, trace  # noqa: E402
+
+PACKAGE_PARENT = Path(trace.__file__).resolve().parent.parent
+
+
+def read_trace(path: Path) -> list[dict]:
+    """Parse the append-only array the way a trace viewer does."""
+    text = path.read_text(encoding="utf-8").rstrip().rstrip(",")
+    return json.loads(text + "]")
+
+
+@pytest.fixture
+def tracing(tmp_path):
+    path = tmp_path / "trace.json"
+    trace.start(path)
+    yield path
+    trace.stop()
+
+
+class TestDisabled:
+    def test_span_is_the_shared_no_op(self):
+        assert not trace.enabled()
+        assert trace.span("a") is trace.span("b", "git", x=1)
+        with trace.span("a") as handle:
+            assert handle is None
+
+    def test_traced_passes_through(self):
+        @trace.traced("scan")
+        def double(x):
+            return 2 * x
+
+        assert double(2) == 4
+        assert double.__name__ == "double"
+
+
+class TestEnabled:
+    def test_complete_events_with_args_and_errors(self, tracing):
+        with trace.span("outer", "check", file="a.md"):
+            with pytest.raises(ValueError):
+                with trace.span("inner"):
+                    raise ValueError("boom")
+        with pytest.raises(SystemExit):
+            with trace.span("cmd", "command"):
+                sys.exit(3)
+        trace.stop()
+        meta, inner, outer, cmd = read_trace(tracing)
+        assert meta["ph"] == "M" and meta["name"] == "process_name"
+        assert (outer["name"], outer["cat"], outer["ph"]) == ("outer", "check", "X")
+        assert outer["args"] == {"file": "a.md"}
+        assert inner["args"] == {"error": "ValueError"}
+        assert outer["ts"] <= inner["ts"] and inner["dur"] <= outer["dur"]
+        assert cmd["args"] == {"exit": 3}
+
+    def test_git_calls_are_spans(self, tracing, tmp_path):
+        gitio.run_git(tmp_path, "rev-parse", "--git-dir")
+        trace.stop()
+        (event,) = [e for e in read_trace(tracing) if e.get("cat") == "git"]
+        assert event["name"] == "git rev-parse"
+        assert event["args"]["argv"] == ["rev-parse", "--git-dir"]
+
+    def test_batch_check_is_one_span(self, tracing, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        with gitio.GitSession(tmp_path) as git:
+            assert git.batch_check(["HEAD", "nope"]) == {"HEAD": None, "nope": None}
+        trace.stop()
+        events = read_trace(tracing)
+        (event,) = [e for e in events if e["name"] == "git cat-file --batch-check"]
+        assert event["cat"] == "git" and event["args"] == {"names": 2}
+
+    def test_unwritable_trace_is_reported_not_raised(self, tmp_path, capsys):
+        trace.start(tmp_path / "no-such-dir" / "trace.json")
+        with trace.span("x"):
+            pass
+        trace.stop()
+        assert "cannot write trace" in capsys.readouterr().err
+
+
+class TestAcrossProcesses:
+    def test_command_and_children_share_one_file(self, tmp_path):
+        path = tmp_path / "trace.json"
+        root = tmp_path / "proj"
+        (root / ".kit" / "tasks" / "2-todo").mkdir(parents=True)
+        (root / "CLAUDE.md").write_text("# P\n", encoding="utf-8")
+        env = dict(os.environ, PYTHONPATH=str(PACKAGE_PARENT))
+        env[trace.TRACE_ENV] = str(path)
+        for _ in range(2):
+            subprocess.run(
+                [sys.executable, "-m", "agentive_kit.cli", "validate"],
+                cwd=root,
+                env=env,
+                check=True,
+                capture_output=True,
+                timeout=60,
+            )
+        events = read_trace(path)
+        commands = [e for e in events if e["name"] == "agentive validate"]
+        assert len(commands) == 2 and {c["args"]["exit"] for c in commands} == {0}
+        assert len({c["pid"] for c in commands}) == 2
+        scans = [e for e in events if e["name"] == "validate_all_tasks"]
+        assert [s["cat"] for s in scans] == ["scan", "scan"]
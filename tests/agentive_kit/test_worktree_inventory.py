@@ -0,0 +1,199 @@
+"""Tests for agentive_kit.worktree_inventory — ``agentive worktrees``.
+
+Fixture: a primary clone with a local bare origin and a task tree,
+plus linked worktrees created with plain git (the inventory must not
+depend on how a worktree was made).
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import lifecycle, worktree_inventory  # noqa: E402
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    ).stdout
+
+
+@pytest.fixture
+def primary(tmp_path):
+    root = tmp_path / "kit"
+    for folder, task in (
+        ("3-in-progress", "KIT-0001-active.md"),
+        ("5-done", "KIT-0002-finished.md"),
+        ("6-canceled", "KIT-0003-dropped.md"),
+    ):
+        (root / ".kit" / "tasks" / folder).mkdir(parents=True)
+        (root / ".kit" / "tasks" / folder / task).write_text("x\n", encoding="utf-8")
+    (root / ".gitignore").write_text(".venv/\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q", "-b", "main", str(root))
+    for key, value in (("user.email", "t@example.com"), ("user.name", "t")):
+        _git(root, "config", key, value)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "fixture")
+    origin = tmp_path / "origin.git"
+    _git(tmp_path, "init", "-q", "--bare", str(origin))
+    _git(root, "remote", "add", "origin", str(origin))
+    _git(root, "push", "-q", "-u", "origin", "main")
+    return root
+
+
+def _add_worktree(primary, task_id, push=True):
+    path = primary.parent / "ask-worktrees" / task_id
+    branch = f"feature/{task_id}-demo"
+    _git(primary, "worktree", "add", "-q", str(path), "-b", branch)
+    (path / ".venv" / "bin").mkdir(parents=True)
+    (path / ".venv" / "bin" / "python").write_bytes(b"\0" * 8192)
+    if push:
+        _git(path, "push", "-q", "-u", "origin", branch)
+    return path
+
+
+def _by_task(primary):
+    return {r.task_id: r for r in worktree_inventory.inventory(primary)}
+
+
+class TestTaskFolders:
+    def test_one_scan_maps_every_task(self, primary):
+        assert lifecycle.task_folders(primary) == {
+            "KIT-0001": "3-in-progress",
+            "KIT-0002": "5-done",
+            "KIT-0003": "6-canceled",
+        }
+
+    def test_missing_tasks_dir_is_empty(self, tmp_path):
+        assert lifecycle.task_folders(tmp_path) == {}
+
+
+class TestInventory:
+    def test_join_marks_closed_tasks_collectable(self, primary):
+        for task in ("KIT-0001", "KIT-0002", "KIT-0003"):
+            _add_worktree(primary, task)
+        reports = _by_task(primary)
+        assert not reports["KIT-0001"].collectable
+        assert reports["KIT-0002"].collectable
+        assert reports["KIT-0003"].collectable
+        assert reports["KIT-0002"].task_folder == "5-done"
+        assert reports["KIT-0002"].venv_bytes >= 8192
+
+    def test_unknown_task_is_never_collectable(self, primary):
+        _add_worktree(primary, "KIT-0099")
+        report = _by_task(primary)["KIT-0099"]
+        assert report.task_folder is None
+        assert not report.collectable
+
+    def test_vanished_directory_is_collectable(self, primary):
+        path = _add_worktree(primary, "KIT-0001")
+        subprocess.run(["rm", "-rf", str(path)], check=True, timeout=30)
+        report = _by_task(primary)["KIT-0001"]
+        assert report.prunable and report.collectable
+
+    def test_pool_slots_are_excluded(self, primary):
+        slot = primary.parent / "ask-worktrees" / ".pool" / "slot-01"
+        _git(primary, "worktree", "add", "-q", "--detach", str(slot))
+        assert worktree_inventory.inventory(primary) == []
+
+    def test_list_prints_summary(self, primary, capsys):
+        _add_worktree(primary, "KIT-0002")
+        worktree_inventory.print_inventory(worktree_inventory.inventory(primary))
+        out = capsys.readouterr().out
+        assert "collectable" in out
+        assert "1 worktree(s), 1 collectable" in out
+
+
+class TestGc:
+    def test_gc_removes_closed_worktrees_and_pushed_branches(self, primary):
+        active = _add_worktree(primary, "KIT-0001")
+        done = _add_worktree(primary, "KIT-0002")
+        canceled = _add_worktree(primary, "KIT-0003")
+        assert worktree_inventory.gc(primary) == 0
+        assert active.is_dir()
+        assert not done.exists() and not canceled.exists()
+        branches = _git(primary, "branch", "--list", "feature/*")
+        assert "KIT-0001" in branches
+        assert "KIT-0002" not in branches and "KIT-0003" not in branches
+
+    def test_dry_run_changes_nothing(self, primary, capsys):
+        done = _add_worktree(primary, "KIT-0002")
+        assert worktree_inventory.gc(primary, dry_run=True) == 0
+        assert done.is_dir()
+        out = capsys.readouterr().out
+        assert f"Would remove {done}" in out
+        assert "Would delete branches: feature/KIT-0002-demo" in out
+
+    def test_unpushed_branch_is_kept(self, primary, capsys):
+        done = _add_worktree(primary, "KIT-0002", push=False)
+        assert worktree_inventory.gc(primary) == 0
+        assert not done.exists()
+        assert "KIT-0002" in _git(primary, "branch", "--list", "feature/*")
+        assert "not pushed or ahead" in capsys.readouterr().out
+
+    def test_dirty_worktree_is_kept_and_reported(self, primary, capsys):
+        done = _add_worktree(primary, "KIT-0002")
+        (done / "notes.txt").write_text("unsaved\n", encoding="utf-8")
+        assert worktree_inventory.gc(primary) == 1
+        assert done.is_dir()
+        assert "kept" in capsys.readouterr().err
+        # its branch survives too: the worktree still has it checked out
+        assert "KIT-0002" in _git(primary, "branch", "--list", "feature/*")
+
+    @staticmethod
+    def _push_work(path, task_id):
+        """Commit and push work on the task branch; returns the branch."""
+        branch = f"feature/{task_id}-demo"
+        (path / "work.txt").write_text("work\n", encoding="utf-8")
+        _git(path, "add", "work.txt")
+        _git(path, "commit", "-q", "-m", "work")
+        _git(path, "push", "-q")
+        return branch
+
+    def test_gone_upstream_unmerged_branch_is_kept(self, primary, capsys):
+        done = _add_worktree(primary, "KIT-0002")
+        branch = self._push_work(done, "KIT-0002")
+        _git(primary, "push", "-q", "origin", "--delete", branch)
+        _git(primary, "fetch", "-q", "--prune")
+        assert worktree_inventory.gc(primary) == 0
+        assert not done.exists()
+        assert "KIT-0002" in _git(primary, "branch", "--list", "feature/*")
+        assert "not merged into origin/main" in capsys.readouterr().out
+
+    def test_gone_upstream_merged_branch_is_deleted(self, primary):
+        done = _add_worktree(primary, "KIT-0002")
+        branch = self._push_work(done, "KIT-0002")
+        _git(primary, "merge", "-q", "--ff-only", branch)
+        _git(primary, "push", "-q", "origin", "main")
+        _git(primary, "push", "-q", "origin", "--delete", branch)
+        _git(primary, "fetch", "-q", "--prune")
+        assert worktree_inventory.gc(primary) == 0
+        assert "KIT-0002" not in _git(primary, "branch", "--list", "feature/*")
+
+    def test_branch_deletion_failure_is_counted_apart(
+        self, primary, monkeypatch, capsys
+    ):
+        _add_worktree(primary, "KIT-0002")
+        real_run_git = worktree_inventory.gitio.run_git
+
+        def run_git(root, *args, **kwargs):
+            if args[:2] == ("branch", "-D"):
+                return subprocess.CompletedProcess(args, 1, "", "locked")
+            return real_run_git(root, *args, **kwargs)
+
+        monkeypatch.setattr(worktree_inventory.gitio, "run_git", run_git)
+        assert worktree_inventory.gc(primary) == 1
+        captured = capsys.readouterr()
+        assert "✅ Collected 1 worktree(s)." in captured.out
+        assert "branch deletion failed" in captured.err
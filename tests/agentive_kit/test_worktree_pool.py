@@ -0,0 +1,219 @@
+"""Tests for agentive_kit.worktree_pool — pre-warmed task worktrees.
+
+Fixture: a real primary clone with a local bare origin (no network),
+whose stub ``scripts/core/project`` records its argv and lays down a
+miniature venv naming its own checkout — so every move's path rewrite
+is observable, and "setup did not run" is a missing setup-args.txt.
+"""
+
+from __future__ import annotations
+
+import stat
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip(
+    "agentive_kit", reason="agentive-kit package source present only in the kit repo"
+)
+
+from agentive_kit import procstats, worktree, worktree_pool  # noqa: E402
+
+SETUP_STUB = r"""#!/usr/bin/env bash
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+printf '%s\n' "$*" >> "$ROOT/setup-args.txt"
+mkdir -p "$ROOT/.venv/bin"
+printf '#!%s/.venv/bin/python\n' "$ROOT" > "$ROOT/.venv/bin/tool"
+printf 'command = python3 -m venv %s/.venv\n' "$ROOT" > "$ROOT/.venv/pyvenv.cfg"
+ln -s "$(command -v python3)" "$ROOT/.venv/bin/python"
+"""
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    ).stdout
+
+
+@pytest.fixture
+def primary(tmp_path):
+    root = tmp_path / "kit"
+    (root / "scripts" / "core").mkdir(parents=True)
+    project = root / "scripts" / "core" / "project"
+    project.write_text(SETUP_STUB, encoding="utf-8")
+    project.chmod(project.stat().st_mode | stat.S_IXUSR)
+    (root / "pyproject.toml").write_text('[project]\nname = "kit"\n', encoding="utf-8")
+    (root / ".gitignore").write_text(
+        "setup-args.txt\n.venv/\n.env\n.adversarial/evaluators\n", encoding="utf-8"
+    )
+    _git(root.parent, "init", "-q", "-b", "main", str(root))
+    for key, value in (("user.email", "t@example.com"), ("user.name", "t")):
+        _git(root, "config", key, value)
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "fixture")
+    origin = tmp_path / "origin.git"
+    _git(tmp_path, "init", "-q", "--bare", str(origin))
+    _git(root, "remote", "add", "origin", str(origin))
+    _git(root, "push", "-q", "-u", "origin", "main")
+    (root / ".env").write_text("KEY=value\n", encoding="utf-8")
+    (root / ".adversarial" / "evaluators").mkdir(parents=True)
+    return root
+
+
+def _exit_code(fn, *args, **kwargs):
+    with pytest.raises(SystemExit) as exc_info:
+        fn(*args, **kwargs)
+    return exc_info.value.code
+
+
+def _new_worktree(primary, task_id):
+    return _exit_code(worktree.main, [task_id, "demo"], anchor=primary)
+
+
+class TestRefill:
+    def test_refill_warms_detached_provisioned_slots(self, primary):
+        worktree_pool.set_pool_size(primary, 2)
+        assert worktree_pool.refill(primary) == 2
+        idle = worktree_pool.idle_slots(primary)
+        assert [e.path.name for e in idle] == ["slot-01", "slot-02"]
+        for entry in idle:
+            assert entry.detached
+            assert (entry.path / ".env").is_symlink()
+            assert (entry.path / ".venv" / "bin" / "python").exists()
+        # the second slot cloned the venv template the first one seeded
+        assert (idle[0].path / "setup-args.txt").exists()
+        assert not (idle[1].path / "setup-args.txt").exists()
+
+    def test_refill_is_idempotent(self, primary):
+        worktree_pool.set_pool_size(primary, 1)
+        worktree_pool.refill(primary)
+        assert worktree_pool.refill(primary) == 0
+
+    def test_unset_size_means_no_pool(self, primary):
+        assert worktree_pool.pool_size(primary) == 0
+        assert worktree_pool.refill(primary) == 0
+
+
+class TestClaim:
+    def test_new_worktree_claims_an_idle_slot(self, primary, capsys):
+        worktree_pool.set_pool_size(primary, 1)
+        worktree_pool.refill(primary)
+        capsys.readouterr()
+
+        assert _new_worktree(primary, "KIT-0001") == 0
+        out = capsys.readouterr().out
+        assert "Claimed pooled worktree slot-01" in out
+        assert "pre-warmed" in out
+
+        wt = primary.parent / "ask-worktrees" / "KIT-0001"
+        assert _git(wt, "branch", "--show-current").strip() == "feature/KIT-0001-demo"
+        assert worktree_pool.idle_slots(primary) == []
+        # the moved venv names its new home, not the slot
+        tool = (wt / ".venv" / "bin" / "tool").read_text(encoding="utf-8")
+        assert str(wt) in tool
+        assert "slot-01" not in tool
+        cfg = (wt / ".venv" / "pyvenv.cfg").read_text(encoding="utf-8")
+        assert "slot-01" not in cfg
+
+    def test_empty_pool_takes_the_cold_path(self, primary, capsys):
+        assert _new_worktree(primary, "KIT-0001") == 0
+        out = capsys.readouterr().out
+        assert "Creating worktree" in out
+        assert "Claimed" not in out
+
+    def test_claim_without_a_pool_dir_runs_no_git(self, primary):
+        wt = primary.parent / "ask-worktrees" / "KIT-0001"
+        with procstats.counting() as calls:
+            assert not worktree_pool.claim(primary, wt, "feature/KIT-0001-demo")
+        assert calls.count("git") == 0
+
+    def test_stale_slot_venv_is_rebuilt_at_claim(self, primary, capsys):
+        worktree_pool.set_pool_size(primary, 1)
+        worktree_pool.refill(primary)
+        (primary / "pyproject.toml").write_text(
+            '[project]\nname = "kit"\ndependencies = ["x"]\n', encoding="utf-8"
+        )
+        _git(primary, "commit", "-q", "-am", "bump deps")
+        _git(primary, "push", "-q", "origin", "main")
+
+        assert _new_worktree(primary, "KIT-0001") == 0
+        wt = primary.parent / "ask-worktrees" / "KIT-0001"
+        assert "pre-warmed" not in capsys.readouterr().out
+        assert worktree.venv_matches_checkout(wt)
+
+
+class TestRelease:
+    def _claimed(self, primary):
+        worktree_pool.set_pool_size(primary, 1)
+        worktree_pool.refill(primary)
+        assert _new_worktree(primary, "KIT-0001") == 0
+        return primary.parent / "ask-worktrees" / "KIT-0001"
+
+    def test_release_returns_a_clean_detached_slot(self, primary):
+        wt = self._claimed(primary)
+        (wt / ".serena").mkdir(exist_ok=True)
+        (wt / ".serena" / "scratch.yml").write_text("x\n", encoding="utf-8")
+        _git(wt, "add", "-A")
+        _git(wt, "commit", "-q", "-m", "work")
+
+        worktree_pool.release(primary, "kit-0001")
+        assert not wt.exists()
+        (slot,) = worktree_pool.idle_slots(primary)
+        assert slot.detached
+        # venv and links survive; session output does not
+        assert (slot.path / ".venv" / "bin" / "python").exists()
+        assert (slot.path / ".env").is_symlink()
+        assert not (slot.path / ".serena").exists()
+        # the feature branch is kept — release never loses work
+        assert _git(primary, "branch", "--list", "feature/KIT-0001-demo").strip()
+
+    def test_release_refuses_uncommitted_work(self, primary, capsys):
+        wt = self._claimed(primary)
+        (wt / "notes.txt").write_text("unsaved\n", encoding="utf-8")
+        assert _exit_code(worktree_pool.release, primary, "KIT-0001") == 1
+        assert "uncommitted or untracked" in capsys.readouterr().err
+        assert wt.is_dir()
+
+    def test_release_into_a_full_pool_leaves_the_worktree(self, primary, capsys):
+        wt = self._claimed(primary)
+        worktree_pool.refill(primary)
+        worktree_pool.release(primary, "KIT-0001")
+        assert "not recycled" in capsys.readouterr().out
+        assert wt.is_dir()
+
+
+class TestGc:
+    def test_gc_shrinks_the_pool_to_its_size(self, primary):
+        worktree_pool.set_pool_size(primary, 2)
+        worktree_pool.refill(primary)
+        worktree_pool.set_pool_size(primary, 1)
+        assert worktree_pool.gc(primary) == 1
+        assert [e.path.name for e in worktree_pool.idle_slots(primary)] == ["slot-01"]
+
+    def test_gc_reports_but_keeps_unregistered_leftovers(self, primary, capsys):
+        stray = worktree_pool.pool_dir(primary) / "slot-09"
+        stray.mkdir(parents=True)
+        worktree_pool.gc(primary)
+        assert "not a registered worktree" in capsys.readouterr().out
+        assert stray.is_dir()
+
+
+class TestMain:
+    def test_size_rejects_non_integers(self, primary, capsys):
+        code = _exit_code(worktree_pool.main, ["size", "many"], anchor=primary)
+        assert code == 1
+        assert "non-negative integer" in capsys.readouterr().err
+
+    def test_size_then_status(self, primary, capsys):
+        assert _exit_code(worktree_pool.main, ["size", "3"], anchor=primary) == 0
+        assert _exit_code(worktree_pool.main, ["status"], anchor=primary) == 0
+        assert "Pool size: 3 (0 idle)" in capsys.readouterr().out
+
+    def test_unknown_subcommand_is_usage_error(self, primary, capsys):
+        assert _exit_code(worktree_pool.main, ["frob"], anchor=primary) == 1
+        assert "Usage: agentive worktree-pool" in capsys.readouterr().err
@@ -9,6 +9,7 @@ import sys
 import tempfile
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -31,6 +32,35 @@ _PKG_SRC = PROJECT_ROOT / "packages" / "agentive-kit" / "src"
 if _PKG_SRC.is_dir() and str(_PKG_SRC) not in sys.path:
     sys.path.insert(0, str(_PKG_SRC))
 
+# Per-worker isolation (pytest-xdist ready): every pytest process —
+# each `-n` worker, each shard from scripts/core/shard_plan.py, or a
+# plain run ("main") — gets its own scratch root. Global state the
+# suite used to share across processes lives under it: the create-agent
+# lock dir, setup_temp_project() trees, and TMPDIR for every script a
+# test starts. The PID keeps two concurrent sessions' gw0 apart.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+WORKER_TMP_ROOT = Path(tempfile.gettempdir()) / (
+    f"agentive-tests-{WORKER_ID}-{os.getpid()}"
+)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _worker_tmp_root():
+    """Create this worker's scratch root; child processes' TMPDIR.
+
+    Removed at session end, so temp projects a test forgot to clean up
+    do not outlive the run.
+    """
+    WORKER_TMP_ROOT.mkdir(parents=True, exist_ok=True)
+    saved = os.environ.get("TMPDIR")
+    os.environ["TMPDIR"] = str(WORKER_TMP_ROOT)
+    yield WORKER_TMP_ROOT
+    if saved is None:
+        os.environ.pop("TMPDIR", None)
+    else:
+        os.environ["TMPDIR"] = saved
+    shutil.rmtree(WORKER_TMP_ROOT, ignore_errors=True)
+
 
 @pytest.fixture(autouse=True, scope="session")
 def _isolate_git_env_session():
@@ -252,13 +282,15 @@ def setup_temp_project(base_dir: Path | None = None) -> Path:
     versions when running in isolated environments (CI containers, etc.).
 
     Args:
-        base_dir: Optional parent directory. If None, creates a new tempdir.
+        base_dir: Optional parent directory. If None, creates a new tempdir
+            under this worker's WORKER_TMP_ROOT.
 
     Returns:
         Path to the temporary project root directory.
     """
     if base_dir is None:
-        base_dir = Path(tempfile.mkdtemp(prefix="agent-test-"))
+        WORKER_TMP_ROOT.mkdir(parents=True, exist_ok=True)
+        base_dir = Path(tempfile.mkdtemp(prefix="agent-test-", dir=WORKER_TMP_ROOT))
 
     # Create directory structure
     agents_dir = base_dir / ".kit" / "launchers"
@@ -294,7 +326,9 @@ def setup_temp_project(base_dir: Path | None = None) -> Path:
 # Shared create-agent.sh test helper
 # ---------------------------------------------------------------------------
 CREATE_AGENT_SCRIPT = PROJECT_ROOT / "scripts" / "optional" / "create-agent.sh"
-CREATE_AGENT_LOCK_DIR = Path("/tmp/agent-creation.lock")
+# Worker-unique: concurrent workers contending for one global lock dir
+# made the lock tests in test_concurrent_agent_creation.py flaky.
+CREATE_AGENT_LOCK_DIR = WORKER_TMP_ROOT / "agent-creation.lock"
 
 
 def run_create_agent_script(
@@ -310,6 +344,7 @@ def run_create_agent_script(
     """
     if cleanup_lock and CREATE_AGENT_LOCK_DIR.exists():
         shutil.rmtree(CREATE_AGENT_LOCK_DIR)
+    CREATE_AGENT_LOCK_DIR.parent.mkdir(parents=True, exist_ok=True)
 
     run_env = os.environ.copy()
     run_env["CREATE_AGENT_PROJECT_ROOT"] = str(project_dir)
@@ -324,3 +359,174 @@ def run_create_agent_script(
         timeout=30,
         env=run_env,
     )
+
+
+# ---------------------------------------------------------------------------
+# Stub executables on PATH (the stub-gh harness pattern)
+# ---------------------------------------------------------------------------
+def write_stub(bin_dir: Path, name: str, body: str) -> Path:
+    """Write an executable bash stub *name* into *bin_dir*."""
+    stub = bin_dir / name
+    stub.write_text("#!/bin/bash\n" + body, encoding="utf-8")
+    stub.chmod(0o755)
+    return stub
+
+
+@pytest.fixture
+def stub_bin(tmp_path, monkeypatch) -> Path:
+    """A per-test stub bin dir, prepended to PATH for this test only.
+
+    It lives under the test's own tmp_path (per worker under xdist), so
+    concurrent tests never see each other's stub ``gh``; add stubs with
+    :func:`write_stub`.
+    """
+    bin_dir = tmp_path / "stub-bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    return bin_dir
+
+
+# ---------------------------------------------------------------------------
+# Session scaffold templates: the door matrix, scaffolded once
+# ---------------------------------------------------------------------------
+# A pair whose profile the door picks by itself gets no --profile flag,
+# so its template prints what a bare `agentive new` prints (the planning
+# template must say "profile none (forced ...)").
+_DEFAULT_PROFILE = {"single": "python", "planning": "none"}
+# Planning scaffolds need a target pointer; tests assert on these values.
+_PLANNING_POINTER = ("--target-path", "../product", "--target-github", "acme/product")
+
+
+@dataclass(frozen=True)
+class ScaffoldTemplate:
+    """One door scaffold, shared by the whole session.
+
+    *verb* is the door run that made it: ``new`` into a fresh
+    directory, or ``adopt`` into an empty ``git init`` repository (the
+    starting point for re-adopt tests, whose first install must be an
+    adopt).
+
+    ``root`` is read-only by contract: tests that only inspect the
+    scaffold (or the door's ``result``) use it directly, tests that
+    change anything work on a :meth:`clone`. A clone keeps the
+    template's project name (``root.name``) in its seeded files.
+    """
+
+    shape: str
+    profile: str
+    verb: str
+    root: Path
+    result: subprocess.CompletedProcess
+    env: dict[str, str]
+
+    def clone(self, dest: Path) -> Path:
+        return clone_project(self.root, dest)
+
+
+def clone_project(src: Path, dest: Path) -> Path:
+    """Copy the project at *src* to *dest*, sharing its git object store.
+
+    The working tree, index, refs and config are copied: tests edit
+    them in place, and ``write_text`` on a hard link would write
+    through into *src*. Files under ``.git/objects`` are hard-linked
+    instead. Git never rewrites an object file, it only adds and
+    unlinks them, so both repositories can share one. Falls back to a
+    copy where linking fails (e.g. *dest* on another filesystem).
+    """
+    objects = src / ".git" / "objects"
+
+    def link_or_copy(source: str, target: str) -> str:
+        if Path(source).is_relative_to(objects):
+            try:
+                os.link(source, target)
+                return target
+            except OSError:
+                pass
+        return shutil.copy2(source, target)
+
+    shutil.copytree(src, dest, symlinks=True, copy_function=link_or_copy)
+    return dest
+
+
+def _scaffold(base: Path, shape: str, profile: str, verb: str) -> ScaffoldTemplate:
+    """Run the packaged door once: ``agentive <verb>`` in scratch *base*.
+
+    Hermetic like the door E2E tests: no GIT_*, a throwaway git
+    identity, no operator preset, the in-repo package on PYTHONPATH.
+    The result is returned unchecked; the tests assert on it.
+    """
+    import agentive_kit
+
+    pkg_src = str(Path(agentive_kit.__file__).resolve().parents[1])
+    xdg = base / "xdg-config"
+    (xdg / "git").mkdir(parents=True)
+    (xdg / "git" / "config").write_text(
+        "[user]\n\tname = Kit Test\n\temail = kit-test@example.invalid\n",
+        encoding="utf-8",
+    )
+    env = {k: v for k, v in os.environ.items() if not k.startswith("GIT_")}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (pkg_src, env.get("PYTHONPATH"))))
+    env["XDG_CONFIG_HOME"] = str(xdg)
+    env["AGENTIVE_KIT_CONFIG_DIR"] = str(base / ".no-such-config-home")
+
+    root = base / f"fresh-{shape}"
+    if verb == "adopt":
+        root.mkdir()
+        subprocess.run(
+            ["git", "init", "-q", "-b", "main", str(root)],
+            check=True,
+            timeout=30,
+            env=env,
+        )
+    args = [verb, str(root)]
+    if shape != "single":
+        args += ["--shape", shape]
+    if profile != _DEFAULT_PROFILE[shape]:
+        args += ["--profile", profile]
+    if shape == "planning":
+        args += _PLANNING_POINTER
+    result = subprocess.run(
+        [sys.executable, "-m", "agentive_kit.cli", *args],
+        capture_output=True,
+        text=True,
+        timeout=300,
+        stdin=subprocess.DEVNULL,  # never a TTY — prompts must be unreachable
+        cwd=str(base),
+        env=env,
+    )
+    return ScaffoldTemplate(shape, profile, verb, root, result, env)
+
+
+@pytest.fixture(scope="session")
+def scaffold_template(tmp_path_factory):
+    """Factory: ``scaffold_template(shape, profile=None, verb="new")``.
+
+    Each legal shape × profile pair (``agentive_kit.door.LEGAL_PAIRS``)
+    is scaffolded at most once per session and verb, on first use;
+    *profile* defaults to the door's own pick for *shape*. Tests that used to
+    scaffold per test (or per module) take the template, or a clone of
+    it, instead: the scaffold is still exercised end to end, once, and
+    the per-test cost is a directory copy. Skips where the package is
+    absent (consumer checkouts).
+    """
+    door = pytest.importorskip(
+        "agentive_kit.door",
+        reason="agentive-kit package source present only in the kit repo",
+    )
+    built: dict[tuple[str, str, str], ScaffoldTemplate] = {}
+
+    def get(
+        shape: str = "single", profile: str | None = None, verb: str = "new"
+    ) -> ScaffoldTemplate:
+        pair = (shape, profile or _DEFAULT_PROFILE.get(shape, ""))
+        if pair not in door.LEGAL_PAIRS:
+            raise ValueError(f"not in the door matrix: {pair[0]} + {pair[1]}")
+        if verb not in ("new", "adopt"):
+            raise ValueError(f"not a scaffolding verb: {verb}")
+        key = (*pair, verb)
+        if key not in built:
+            base = tmp_path_factory.mktemp(f"template-{verb}-{pair[0]}-{pair[1]}")
+            built[key] = _scaffold(base, *key)
+        return built[key]
+
+    return get
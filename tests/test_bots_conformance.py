@@ -43,10 +43,11 @@ PROJECT_SCRIPT = REPO_ROOT / "scripts" / "core" / "project"
 if not DOOR.exists() or not KIT_MARKERS.exists():
     pytest.skip("scripts/local absent (consumer checkout)", allow_module_level=True)
 
-from agentive_kit import door as pkg_door  # noqa: E402  (conftest sys.path)
 from test_preflight_check import proj  # noqa: E402,F401  (fixture re-export)
 from test_preflight_check import _baseline, _gates, _graphql  # noqa: E402
 
+from agentive_kit import door as pkg_door  # noqa: E402  (conftest sys.path)
+
 # The project script is extensionless — exec it as a module, the
 # test_project_script.py pattern (distinct module name: no collision).
 _spec = importlib.util.spec_from_loader("project_script_conformance", loader=None)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "core"))
 
 from check_cross_repo_config import (  # noqa: E402
@@ -12,6 +14,7 @@ from check_cross_repo_config import (  # noqa: E402
     MALFORMED,
     PASS,
     WARN,
+    _section_body,
     check,
     declares_cross_repo,
     main,
@@ -240,3 +243,44 @@ class TestMain:
         monkeypatch.chdir(tmp_path)
         code = self._run(monkeypatch, ["prog"])
         assert code == 0
+
+
+# ── package model parity ─────────────────────────────────────────────
+
+
+class TestPackageModelParity:
+    """check() reads the package's claude_md model when it is importable;
+    the inline splitter is the fallback for consumers without it. Both
+    must find the same section body."""
+
+    @pytest.mark.parametrize(
+        "claude",
+        [
+            TARGET_SECTION,
+            "# P\r\n\r\n" + TARGET_SECTION.replace("\n", "\r\n"),
+            "##   Target Repository \n- **Path**: `../a-code`\n## Next\nx\n",
+            "### Target Repository\n- **Path**: `../a-code`\n",
+            "# Only prose\n",
+        ],
+    )
+    def test_inline_splitter_matches_the_model(self, claude):
+        claude_md = pytest.importorskip("agentive_kit.claude_md")
+        model = claude_md.parse(claude).section("Target Repository")
+        inline = _section_body(claude)
+        if inline is None:
+            assert model is None
+        else:
+            assert model.splitlines() == inline.splitlines()
+
+    def test_check_without_the_package(self, tmp_path, monkeypatch):
+        import check_cross_repo_config
+
+        (tmp_path / "my-app-code").mkdir()
+        (tmp_path / "plan").mkdir()
+        repo = _write_repo(tmp_path / "plan", DECLARING_README, TARGET_SECTION)
+        with_package = check(repo)
+        monkeypatch.setattr(
+            check_cross_repo_config, "import_kit_module", lambda name: None
+        )
+        assert check(repo) == with_package
+        assert with_package.status == PASS
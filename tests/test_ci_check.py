@@ -55,8 +55,21 @@ def make_scratch(tmp_path: Path) -> tuple[Path, Path]:
     _stub(bin_dir / "isort", 'exit "${STUB_ISORT_RC:-0}"\n')
     _stub(bin_dir / "pytest", 'exit "${STUB_PYTEST_RC:-0}"\n')
     # covers `python3 -m flake8`, pattern_lint.py, check_cross_repo_config.py
-    _stub(bin_dir / "python3", 'exit "${STUB_PYTHON3_RC:-0}"\n')
-    _stub(bin_dir / "git", 'echo "main"\n')
+    _stub(
+        bin_dir / "python3",
+        'case "$1" in *pattern_lint.py)\n'
+        '    echo "$@" >>"${STUB_PATTERN_LINT_LOG:-/dev/null}"\n'
+        '    exit "${STUB_PATTERN_LINT_RC:-0}";;\n'
+        "esac\n"
+        'exit "${STUB_PYTHON3_RC:-0}"\n',
+    )
+    _stub(
+        bin_dir / "git",
+        'if [ "$2" = "--is-inside-work-tree" ]; then\n'
+        '    exit "${STUB_GIT_WORKTREE_RC:-0}"\n'
+        "fi\n"
+        'echo "main"\n',
+    )
     return root, bin_dir
 
 
@@ -161,6 +174,41 @@ class TestCharacterization:
         assert result.returncode == 1
         assert "❌ Tests: Test failures or coverage below" in result.stdout
 
+    @pytest.mark.parametrize(
+        "rc, message",
+        [
+            ("1", "❌ Pattern lint: DK violations found"),
+            ("2", "❌ Pattern lint: could not run (exit 2; see above)"),
+        ],
+    )
+    def test_pattern_lint_exit_codes_are_told_apart(self, tmp_path, rc, message):
+        root, bin_dir = make_scratch(tmp_path)
+        result = run_ci_check(root, bin_dir, {"STUB_PATTERN_LINT_RC": rc})
+        assert result.returncode == 1
+        lines = result.stdout.splitlines()
+        assert message in lines
+        assert sum(line.startswith("❌ Pattern lint") for line in lines) == 1
+
+    def test_pattern_lint_finds_files_outside_a_git_checkout(self, tmp_path):
+        root, bin_dir = make_scratch(tmp_path)
+        log = tmp_path / "pattern_lint.log"
+        result = run_ci_check(root, bin_dir, {"STUB_PATTERN_LINT_LOG": str(log)})
+        assert result.returncode == 0, result.stdout
+        assert log.read_text(encoding="utf-8").split()[1:] == [
+            "--tree",
+            "scripts/",
+            "tests/",
+        ]
+        log.unlink()
+        result = run_ci_check(
+            root,
+            bin_dir,
+            {"STUB_PATTERN_LINT_LOG": str(log), "STUB_GIT_WORKTREE_RC": "128"},
+        )
+        assert result.returncode == 0, result.stdout
+        assert "✅ Pattern lint: No DK violations" in result.stdout
+        assert log.read_text(encoding="utf-8").split()[1:] == ["scripts/dummy.py"]
+
     def test_missing_flake8_fails_fast(self, tmp_path):
         root, bin_dir = make_scratch(tmp_path)
         result = run_ci_check(root, bin_dir, {"STUB_PYTHON3_RC": "1"})
@@ -168,6 +216,59 @@ class TestCharacterization:
         assert "flake8 not installed" in result.stderr
 
 
+class TestShardedTests:
+    """CI_CHECK_SHARDS=N: step 6 as N concurrent pytest processes, each
+    on its own coverage file, combined and gated once."""
+
+    def _scratch(self, tmp_path: Path) -> tuple[Path, Path, Path]:
+        root, bin_dir = make_scratch(tmp_path)
+        log = tmp_path / "calls.log"
+        # shard_plan.py names one file per shard; `coverage` is logged
+        _stub(
+            bin_dir / "python3",
+            'case "$1" in\n'
+            '  *shard_plan.py) echo "tests/test_shard${3%/*}.py" ;;\n'
+            f'  -m) [ "$2" = coverage ] && echo "python3 $*" >>"{log}" ;;\n'
+            "esac\n"
+            'exit "${STUB_PYTHON3_RC:-0}"\n',
+        )
+        _stub(
+            bin_dir / "pytest",
+            f'echo "$COVERAGE_FILE pytest $*" >>"{log}"\n'
+            'echo "ran $1"\n'
+            '[ "$1" = "$FAIL_SHARD" ] && exit 1\n'
+            "exit 0\n",
+        )
+        return root, bin_dir, log
+
+    def test_shards_run_on_separate_coverage_files(self, tmp_path):
+        root, bin_dir, log = self._scratch(tmp_path)
+        result = run_ci_check(root, bin_dir, {"CI_CHECK_SHARDS": "2"})
+        assert result.returncode == 0, result.stdout + result.stderr
+        calls = sorted(log.read_text(encoding="utf-8").splitlines())
+        assert calls[:2] == [
+            ".coverage.shard-1 pytest tests/test_shard1.py -v --cov=scripts "
+            "--cov-report= --cov-fail-under=0",
+            ".coverage.shard-2 pytest tests/test_shard2.py -v --cov=scripts "
+            "--cov-report= --cov-fail-under=0",
+        ]
+        assert "python3 -m coverage combine" in calls[2]
+        assert calls[3] == "python3 -m coverage report"
+        out = result.stdout
+        assert out.index("── shard 1/2 ──") < out.index("ran tests/test_shard1.py")
+        assert "✅ Tests: All tests pass" in out
+
+    def test_one_failing_shard_fails_the_step(self, tmp_path):
+        root, bin_dir, _ = self._scratch(tmp_path)
+        result = run_ci_check(
+            root,
+            bin_dir,
+            {"CI_CHECK_SHARDS": "3", "FAIL_SHARD": "tests/test_shard2.py"},
+        )
+        assert result.returncode == 1
+        assert "❌ Tests: Test failures or coverage below" in result.stdout
+
+
 def install_hook(root: Path, body: str, mode: int = 0o755) -> Path:
     hook = root / "scripts" / "local" / "checks.sh"
     hook.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,21 @@
+"""Tests for the per-worker isolation conftest provides for running
+the suite in parallel (xdist workers, ci-check shards)."""
+
+from __future__ import annotations
+
+import os
+
+from conftest import CREATE_AGENT_LOCK_DIR, WORKER_TMP_ROOT
+
+
+class TestWorkerIsolation:
+    def test_scratch_state_is_per_process(self):
+        assert WORKER_TMP_ROOT.name.endswith(f"-{os.getpid()}")
+        assert CREATE_AGENT_LOCK_DIR.parent == WORKER_TMP_ROOT
+
+    def test_children_get_the_worker_tmpdir(self):
+        assert os.environ["TMPDIR"] == str(WORKER_TMP_ROOT)
+        assert WORKER_TMP_ROOT.is_dir()
+
+    def test_stub_bin_leads_path(self, stub_bin):
+        assert os.environ["PATH"].split(os.pathsep)[0] == str(stub_bin)
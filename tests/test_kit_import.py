@@ -0,0 +1,27 @@
+"""Tests for scripts/core/kit_import.py."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "core"))
+
+from kit_import import PKG_SRC, import_kit_module  # noqa: E402
+
+
+@pytest.mark.skipif(
+    not PKG_SRC.is_dir(),
+    reason="agentive-kit package source present only in the kit repo",
+)
+def test_imports_a_package_module():
+    lifecycle = import_kit_module("lifecycle")
+    assert lifecycle is not None
+    assert lifecycle.__name__ == "agentive_kit.lifecycle"
+    assert import_kit_module("lifecycle") is lifecycle
+
+
+def test_absent_module_is_none():
+    assert import_kit_module("no_such_module") is None
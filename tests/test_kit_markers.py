@@ -8,6 +8,7 @@ structure *outside* the markers while preserving consumer content
 from __future__ import annotations
 
 import importlib.util
+import random
 from pathlib import Path
 
 import pytest
@@ -110,6 +111,79 @@ class TestReplaceRegion:
         assert "old-1" not in out and "old-2" not in out
 
 
+def _merge_one_at_a_time(upstream, consumer, placeholders):
+    """merge() as a region-by-region regex rewrite — the reference."""
+
+    def replace(text, name, content):
+        pattern = km._region_pattern(name)
+        if pattern.search(text) is None:
+            raise KeyError(name)
+        return pattern.sub(lambda m: m.group("begin") + content + m.group("end"), text)
+
+    result = upstream
+    for name in km.find_regions(upstream):
+        match = km._region_pattern(name).search(consumer)
+        if match is None and km._begin_marker_line_re(name).search(consumer):
+            raise ValueError(name)
+        if match is not None:
+            result = replace(result, name, match.group("body"))
+        elif name in placeholders:
+            result = replace(result, name, placeholders[name])
+    return result
+
+
+class TestRegionIndex:
+    def test_offsets_for_every_region_in_one_index(self):
+        index = km.region_index(SAMPLE)
+        assert list(index) == ["project-context", "stack-notes"]
+        (region,) = index["stack-notes"]
+        assert SAMPLE[region.body_start : region.body_end] == "- pytest + DK rules"
+        assert SAMPLE[region.end :].startswith("\n\n## Phase 4")
+
+    def test_body_ends_at_the_first_matching_end(self):
+        text = (
+            "<!-- BEGIN KIT-LOCAL: a -->\n"
+            "one\n"
+            "<!-- END KIT-LOCAL: a -->\n"
+            "two\n"
+            "<!-- END KIT-LOCAL: a -->\n"
+        )
+        assert km.extract_region(text, "a") == "one"
+
+    def test_merge_matches_region_by_region_rewrite(self):
+        lines = [
+            "<!-- BEGIN KIT-LOCAL: a -->",
+            "<!-- END KIT-LOCAL: a -->",
+            "<!-- BEGIN KIT-LOCAL: b -->",
+            "<!-- END KIT-LOCAL: b -->",
+            "<!-- BEGIN KIT-LOCAL: a-b -->",
+            "<!-- END KIT-LOCAL: a-b -->",
+            "<!--BEGIN  KIT-LOCAL:a-->  ",
+            "text",
+            "",
+        ]
+        rng = random.Random(40)
+
+        def doc():
+            newline = rng.choice(["\n", "\r\n"])
+            body = [rng.choice(lines) for _ in range(rng.randint(0, 8))]
+            return newline.join(body) + rng.choice(["", newline])
+
+        for _ in range(3000):
+            upstream, consumer = doc(), doc()
+            placeholders = {
+                "a": rng.choice(["P", "", "x\n<!-- END KIT-LOCAL: b -->"]),
+                "b": "Q",
+            }
+            try:
+                expected = _merge_one_at_a_time(upstream, consumer, placeholders)
+            except (KeyError, ValueError) as exc:
+                with pytest.raises(type(exc)):
+                    km.merge(upstream, consumer, placeholders)
+            else:
+                assert km.merge(upstream, consumer, placeholders) == expected
+
+
 class TestMerge:
     def test_fresh_fills_placeholders(self):
         placeholders = {"project-context": "PH-PC", "stack-notes": "PH-SN"}
@@ -10,6 +10,8 @@ Test Categories:
     3. Legacy status migration
     4. Sync exclusion rules (archive/reference folders)
     5. LinearClient operations (mocked)
+    6. Bulk and incremental sync
+    7. Async client against a local stub GraphQL server
 
 Usage:
     pytest tests/test_linear_sync.py -v
@@ -17,7 +19,14 @@ Usage:
 Fixtures model the live .kit/tasks/ layout (KIT-0069 / A79).
 """
 
+import asyncio
 import importlib.util
+import json
+import re
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -30,6 +39,13 @@ requires_gql = pytest.mark.skipif(
     reason="gql package not installed (pip install gql[requests])",
 )
 
+ASYNC_GQL_AVAILABLE = GQL_AVAILABLE and importlib.util.find_spec("httpx") is not None
+
+requires_async_gql = pytest.mark.skipif(
+    not ASYNC_GQL_AVAILABLE,
+    reason="gql httpx transport not installed (pip install gql[httpx])",
+)
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
@@ -839,3 +855,663 @@ class TestTeamResolution:
             result = client.resolve_team_id("")
 
             assert result == "uuid-default"
+
+
+# =============================================================================
+# BULK SYNC TESTS
+# =============================================================================
+
+STATES = {
+    "team": {
+        "states": {
+            "nodes": [
+                {"id": "state-todo", "name": "Todo", "type": "unstarted"},
+                {"id": "state-done", "name": "Done", "type": "completed"},
+            ]
+        }
+    }
+}
+
+
+def _bulk_client(responses):
+    """LinearClient whose transport answers by operation name."""
+    from scripts.optional.sync_tasks_to_linear import LinearClient
+
+    with patch("scripts.optional.sync_tasks_to_linear.Client"):
+        client = LinearClient("test-api-key")
+    client.client = MagicMock()
+    calls = []
+
+    def execute(document, variable_values=None):
+        # gql >= 4 wraps the parsed document in a GraphQLRequest
+        document = getattr(document, "document", document)
+        name = document.definitions[0].name.value
+        calls.append((name, variable_values))
+        answer = responses[name]
+        return answer(variable_values) if callable(answer) else answer
+
+    client.client.execute.side_effect = execute
+    return client, calls
+
+
+class TestIssueMap:
+    """Tests for build_issue_map()."""
+
+    def test_maps_bracketed_task_ids(self):
+        from scripts.optional.sync_tasks_to_linear import build_issue_map
+
+        issues = [
+            {"id": "a", "title": "[KIT-0001] First"},
+            {"id": "b", "title": "[KIT-0001] Duplicate"},
+            {"id": "c", "title": "[A-00012] Five digits"},
+            {"id": "d", "title": "No task id"},
+        ]
+        assert build_issue_map(issues) == {"KIT-0001": issues[0]}
+
+
+@requires_gql
+class TestBulkSync:
+    """Tests for the paginated read + batched mutation engine."""
+
+    def test_fetch_team_issues_follows_cursor(self):
+        pages = {
+            None: {"nodes": [{"id": "1"}], "next": "c1"},
+            "c1": {"nodes": [{"id": "2"}], "next": None},
+        }
+
+        def page(variables):
+            p = pages[variables["after"]]
+            return {
+                "issues": {
+                    "nodes": p["nodes"],
+                    "pageInfo": {
+                        "hasNextPage": bool(p["next"]),
+                        "endCursor": p["next"],
+                    },
+                }
+            }
+
+        client, calls = _bulk_client({"TeamIssues": page})
+        assert [i["id"] for i in client.fetch_team_issues("team-1")] == ["1", "2"]
+        assert [c[1]["after"] for c in calls] == [None, "c1"]
+
+    def test_workflow_states_are_fetched_once(self):
+        client, calls = _bulk_client({"GetWorkflowStates": STATES})
+        assert client._get_state_id("team-1", "Todo") == "state-todo"
+        assert client._get_state_id("team-1", "Done") == "state-done"
+        assert len(calls) == 1
+
+    def test_sync_batch_creates_and_updates_in_one_mutation(self, tmp_task_file):
+        from scripts.optional.sync_tasks_to_linear import build_task_data
+
+        task = build_task_data(tmp_task_file)
+        other = build_task_data(tmp_task_file)
+        other.task_id = "TASK-0002"
+
+        def mutate(variables):
+            return {
+                "op0": {"success": True, "issue": {"id": "i1", "identifier": "P-1"}},
+                "op1": {"success": True, "issue": {"id": "i2", "identifier": "P-2"}},
+            }
+
+        client, calls = _bulk_client({"GetWorkflowStates": STATES, "SyncBatch": mutate})
+        issues = {"TASK-0001": {"id": "i1", "title": "[TASK-0001] x"}}
+        results = client.sync_batch([task, other], "team-1", issues)
+
+        assert [c[0] for c in calls] == ["GetWorkflowStates", "SyncBatch"]
+        variables = calls[1][1]
+        assert variables["id0"] == "i1"  # update of the mapped issue
+        assert "teamId" not in variables["in0"]
+        assert variables["in1"]["teamId"] == "team-1"  # create
+        assert variables["in1"]["stateId"] == "state-todo"
+        assert results["TASK-0002"]["identifier"] == "P-2"
+        assert issues["TASK-0002"]["id"] == "i2"  # map learns the new issue
+
+    def test_partial_batch_failure_keeps_the_successes(self, tmp_task_file):
+        from scripts.optional.sync_tasks_to_linear import build_task_data
+
+        task = build_task_data(tmp_task_file)
+        other = build_task_data(tmp_task_file)
+        other.task_id = "TASK-0002"
+
+        def mutate(variables):
+            error = RuntimeError("op1 rejected")
+            error.data = {
+                "op0": {"success": True, "issue": {"id": "i1", "identifier": "P-1"}},
+                "op1": None,
+            }
+            raise error
+
+        client, _calls = _bulk_client(
+            {"GetWorkflowStates": STATES, "SyncBatch": mutate}
+        )
+        results = client.sync_batch([task, other], "team-1", {})
+        assert results["TASK-0001"]["identifier"] == "P-1"
+        assert results["TASK-0002"] is None
+
+    def test_sync_tasks_bulk_round_trips_are_fixed(self, tmp_path, task_content_valid):
+        from scripts.optional.sync_tasks_to_linear import sync_tasks_bulk
+
+        files = []
+        for n in range(1, 6):
+            f = tmp_path / ".kit" / "tasks" / "2-todo" / f"TASK-000{n}-x.md"
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text(
+                task_content_valid.replace("TASK-0001", f"TASK-000{n}"),
+                encoding="utf-8",
+            )
+            files.append(f)
+
+        def mutate(variables):
+            ops = [k for k in variables if k.startswith("in")]
+            return {
+                f"op{k[2:]}": {"success": True, "issue": {"id": k, "identifier": k}}
+                for k in ops
+            }
+
+        empty = {
+            "issues": {
+                "nodes": [],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+        client, calls = _bulk_client(
+            {"TeamIssues": empty, "GetWorkflowStates": STATES, "SyncBatch": mutate}
+        )
+        assert sync_tasks_bulk(files, client, "team-1", batch_size=2) == (5, 0, 0)
+        # 1 issue page + 1 state list + ceil(5 / 2) batches
+        assert [c[0] for c in calls].count("SyncBatch") == 3
+        assert len(calls) == 5
+
+
+# =============================================================================
+# INCREMENTAL SYNC (LEDGER) TESTS
+# =============================================================================
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-C", str(cwd), *args], check=True, capture_output=True, timeout=30
+    )
+
+
+def _write_tasks(root, content, ids):
+    files = []
+    for task_id in ids:
+        f = root / ".kit" / "tasks" / "2-todo" / f"{task_id}-x.md"
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text(content.replace("TASK-0001", task_id), encoding="utf-8")
+        files.append(f)
+    return files
+
+
+def _echo_mutation(variables):
+    return {
+        f"op{k[2:]}": {"success": True, "issue": {"id": f"issue-{k}", "identifier": k}}
+        for k in variables
+        if k.startswith("in")
+    }
+
+
+class TestSyncLedger:
+    """Tests for the ledger helpers in linear_sync_utils."""
+
+    def test_hash_covers_every_synced_field(self):
+        from scripts.optional.linear_sync_utils import sync_content_hash
+
+        base = sync_content_hash("[A-0001] t", "Todo", 2, "body")
+        assert base == sync_content_hash("[A-0001] t", "Todo", 2, "body")
+        assert base != sync_content_hash("[A-0001] t", "Done", 2, "body")
+        assert base != sync_content_hash("[A-0001] t", "Todo", 3, "body")
+        assert base != sync_content_hash("[A-0001] t", "Todo", 2, "body!")
+
+    def test_round_trip_and_version_guard(self, tmp_path):
+        from scripts.optional.linear_sync_utils import (
+            SYNC_LEDGER_PATH,
+            load_sync_ledger,
+            save_sync_ledger,
+        )
+
+        assert load_sync_ledger(tmp_path)["tasks"] == {}
+        ledger = {"version": 1, "commit": "abc", "tasks": {"A-0001": {"hash": "h"}}}
+        save_sync_ledger(ledger, tmp_path)
+        assert load_sync_ledger(tmp_path) == ledger
+        (tmp_path / SYNC_LEDGER_PATH).write_text('{"version": 99}', encoding="utf-8")
+        assert load_sync_ledger(tmp_path)["tasks"] == {}
+
+    def test_changed_task_files_sees_commits_edits_and_new_files(
+        self, tmp_path, task_content_valid
+    ):
+        from scripts.optional.linear_sync_utils import changed_task_files
+
+        a, b, c = _write_tasks(
+            tmp_path, task_content_valid, ["TASK-0001", "TASK-0002", "TASK-0003"]
+        )
+        _git(tmp_path.parent, "init", "-q", str(tmp_path))
+        _git(tmp_path, "add", "-A")
+        _git(
+            tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "x"
+        )
+        base = subprocess.run(
+            ["git", "-C", str(tmp_path), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        b.write_text(b.read_text(encoding="utf-8") + "\nmore\n", encoding="utf-8")
+        (a.parent / "TASK-0004-new.md").write_text("x", encoding="utf-8")
+
+        changed = changed_task_files(tmp_path, base)
+        assert changed == {
+            b.relative_to(tmp_path),
+            (a.parent / "TASK-0004-new.md").relative_to(tmp_path),
+        }
+        assert changed_task_files(tmp_path, "0" * 40) is None
+
+
+@requires_gql
+class TestIncrementalSync:
+    """sync_tasks_bulk with a ledger pushes only what changed."""
+
+    def test_second_run_pushes_nothing(self, tmp_path, task_content_valid):
+        from scripts.optional.sync_tasks_to_linear import sync_tasks_bulk
+
+        files = _write_tasks(tmp_path, task_content_valid, ["TASK-0001", "TASK-0002"])
+        empty = {
+            "issues": {
+                "nodes": [],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+        client, calls = _bulk_client(
+            {
+                "TeamIssues": empty,
+                "GetWorkflowStates": STATES,
+                "SyncBatch": _echo_mutation,
+            }
+        )
+        ledger = {"version": 1, "commit": None, "tasks": {}}
+        assert sync_tasks_bulk(files, client, "team-1", ledger=ledger) == (2, 0, 0)
+        assert ledger["tasks"]["TASK-0001"]["issue_id"].startswith("issue-")
+
+        calls.clear()
+        assert sync_tasks_bulk(files, client, "team-1", ledger=ledger) == (0, 2, 0)
+        assert calls == []
+
+    def test_changed_task_is_updated_without_reading_all_issues(
+        self, tmp_path, task_content_valid
+    ):
+        from scripts.optional.sync_tasks_to_linear import sync_tasks_bulk
+
+        files = _write_tasks(tmp_path, task_content_valid, ["TASK-0001", "TASK-0002"])
+        empty = {
+            "issues": {
+                "nodes": [],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+        client, calls = _bulk_client(
+            {
+                "TeamIssues": empty,
+                "GetWorkflowStates": STATES,
+                "SyncBatch": _echo_mutation,
+            }
+        )
+        ledger = {"version": 1, "commit": None, "tasks": {}}
+        sync_tasks_bulk(files, client, "team-1", ledger=ledger)
+        issue_id = ledger["tasks"]["TASK-0002"]["issue_id"]
+
+        files[1].write_text(
+            files[1]
+            .read_text(encoding="utf-8")
+            .replace("**Priority**: high", "**Priority**: low"),
+            encoding="utf-8",
+        )
+        calls.clear()
+        assert sync_tasks_bulk(files, client, "team-1", ledger=ledger) == (1, 1, 0)
+        assert [c[0] for c in calls] == ["SyncBatch"]
+        assert calls[0][1]["id0"] == issue_id  # an update, not a duplicate
+
+    def test_failed_push_is_dropped_from_the_ledger(self, tmp_path, task_content_valid):
+        from scripts.optional.sync_tasks_to_linear import sync_tasks_bulk
+
+        files = _write_tasks(tmp_path, task_content_valid, ["TASK-0001"])
+        ledger = {
+            "version": 1,
+            "commit": None,
+            "tasks": {"TASK-0001": {"issue_id": "i1", "hash": "stale"}},
+        }
+        client, _calls = _bulk_client(
+            {"GetWorkflowStates": STATES, "SyncBatch": {"op0": None}}
+        )
+        assert sync_tasks_bulk(files, client, "team-1", ledger=ledger) == (0, 0, 1)
+        assert "TASK-0001" not in ledger["tasks"]
+
+    def test_select_changed_files_skips_unchanged_known_tasks(
+        self, tmp_path, task_content_valid, monkeypatch
+    ):
+        from scripts.optional.sync_tasks_to_linear import select_changed_files
+
+        monkeypatch.chdir(tmp_path)
+        files = [
+            f.relative_to(tmp_path)
+            for f in _write_tasks(
+                tmp_path, task_content_valid, ["TASK-0001", "TASK-0002", "TASK-0003"]
+            )
+        ]
+        _git(tmp_path.parent, "init", "-q", str(tmp_path))
+        _git(tmp_path, "add", "-A")
+        _git(
+            tmp_path, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "x"
+        )
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        files[0].write_text(
+            files[0].read_text(encoding="utf-8") + "edit\n", encoding="utf-8"
+        )
+        ledger = {
+            "version": 1,
+            "commit": head,
+            "tasks": {"TASK-0001": {"hash": "h"}, "TASK-0002": {"hash": "h"}},
+        }
+        # 0001 edited, 0002 untouched and known, 0003 never synced
+        assert select_changed_files(files, ledger) == [files[0], files[2]]
+        ledger["commit"] = None
+        assert select_changed_files(files, ledger) == files
+
+
+# =============================================================================
+# ASYNC CLIENT TESTS (LOCAL STUB SERVER)
+# =============================================================================
+
+STUB_SDL = "type Query {\n  echo(n: Int): Int\n}\n"
+
+
+class _LinearStub:
+    """Local stand-in for api.linear.app/graphql.
+
+    ``answer(operation, variables)`` returns (status, payload, headers);
+    the default echoes ``$n`` back. Records every operation name and
+    the peak number of requests in flight.
+    """
+
+    def __init__(self):
+        self.answer = self._echo
+        self.latency = 0.0
+        self.operations = []
+        self.peak = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                match = re.search(r"(?:query|mutation)\s+(\w+)", body["query"])
+                operation = match.group(1) if match else None
+                with stub._lock:
+                    stub.operations.append(operation)
+                    stub._in_flight += 1
+                    stub.peak = max(stub.peak, stub._in_flight)
+                try:
+                    time.sleep(stub.latency)
+                    status, payload, headers = stub.answer(
+                        operation, body.get("variables") or {}
+                    )
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, str(value))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/graphql"
+
+    @staticmethod
+    def _echo(operation, variables):
+        return 200, {"data": {"echo": variables.get("n")}}, {}
+
+
+@pytest.fixture
+def linear_stub():
+    stub = _LinearStub()
+    thread = threading.Thread(
+        target=stub.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
+
+
+ECHO = "query Echo($n: Int) { echo(n: $n) }"
+
+
+def _run_client(stub, requests, **kwargs):
+    from scripts.optional.linear_async_client import AsyncLinearClient
+
+    async def run():
+        async with AsyncLinearClient("test-api-key", url=stub.url, **kwargs) as linear:
+            return linear, await linear.execute_many(requests)
+
+    return asyncio.run(run())
+
+
+class TestRateLimiter:
+    """Tests for the header-driven token bucket."""
+
+    def test_bucket_drains_then_asks_to_wait(self):
+        from scripts.optional.linear_async_client import RateLimiter
+
+        now = [0.0]
+        limiter = RateLimiter(capacity=2, window=10.0, clock=lambda: now[0])
+        assert limiter.delay() == 0.0
+        assert limiter.delay() == 0.0
+        assert limiter.delay() == pytest.approx(5.0)  # one token per 5s
+        now[0] = 5.0
+        assert limiter.delay() == 0.0
+
+    def test_headers_cap_the_bucket(self):
+        from scripts.optional.linear_async_client import RateLimiter
+
+        limiter = RateLimiter(capacity=1500, clock=lambda: 0.0)
+        limiter.observe(
+            {
+                "x-ratelimit-requests-limit": "5000",
+                "x-ratelimit-requests-remaining": "3",
+            }
+        )
+        assert limiter.capacity == 5000
+        assert limiter.tokens == 3
+
+    def test_exhausted_budget_pauses_until_reset(self):
+        from scripts.optional.linear_async_client import RateLimiter
+
+        limiter = RateLimiter(clock=lambda: 100.0)
+        reset_ms = int((time.time() + 30) * 1000)
+        limiter.observe(
+            {
+                "x-ratelimit-requests-remaining": "0",
+                "x-ratelimit-requests-reset": str(reset_ms),
+            }
+        )
+        assert 25 < limiter.delay() <= 30
+
+    def test_budget_is_full_again_after_the_reset(self):
+        from scripts.optional.linear_async_client import RateLimiter
+
+        now = [0.0]
+        limiter = RateLimiter(capacity=100, clock=lambda: now[0])
+        limiter.observe({"x-ratelimit-requests-remaining": "0"}, status=429)
+        now[0] = 61.0
+        assert limiter.delay() == 0.0
+        assert limiter.tokens == 99
+
+    def test_429_without_reset_pauses_a_minute(self):
+        from scripts.optional.linear_async_client import RateLimiter
+
+        limiter = RateLimiter(clock=lambda: 0.0)
+        limiter.observe({}, status=429)
+        assert limiter.delay() == pytest.approx(60.0)
+
+
+@requires_async_gql
+class TestAsyncLinearClient:
+    """Tests for AsyncLinearClient against the local stub server."""
+
+    def test_execute_many_keeps_order_and_bounds_concurrency(self, linear_stub):
+        linear_stub.latency = 0.05
+        requests = [(ECHO, {"n": n}) for n in range(6)]
+        _linear, results = _run_client(linear_stub, requests, max_concurrency=2)
+        assert results == [{"echo": n} for n in range(6)]
+        assert linear_stub.peak == 2
+
+    def test_response_headers_feed_the_limiter(self, linear_stub):
+        linear_stub.answer = lambda op, variables: (
+            200,
+            {"data": {"echo": 1}},
+            {
+                "X-RateLimit-Requests-Limit": "5000",
+                "X-RateLimit-Requests-Remaining": "42",
+            },
+        )
+        linear, _results = _run_client(linear_stub, [(ECHO, {"n": 1})])
+        assert linear.limiter.capacity == 5000
+        assert linear.limiter.tokens <= 42
+
+    def test_ratelimited_request_is_retried(self, linear_stub):
+        answers = []
+
+        def answer(operation, variables):
+            answers.append(operation)
+            if len(answers) == 1:
+                reset_ms = int((time.time() + 0.05) * 1000)
+                return (
+                    200,
+                    {
+                        "errors": [
+                            {
+                                "message": "Rate limit exceeded",
+                                "extensions": {"code": "RATELIMITED"},
+                            }
+                        ]
+                    },
+                    {
+                        "X-RateLimit-Requests-Remaining": "0",
+                        "X-RateLimit-Requests-Reset": str(reset_ms),
+                    },
+                )
+            return 200, {"data": {"echo": variables["n"]}}, {}
+
+        linear_stub.answer = answer
+        linear, results = _run_client(linear_stub, [(ECHO, {"n": 7})])
+        assert results == [{"echo": 7}]
+        assert linear.requests_sent == 2
+
+    def test_other_errors_are_returned_not_raised(self, linear_stub):
+        linear_stub.answer = lambda op, variables: (
+            200,
+            {"errors": [{"message": "bad input"}]},
+            {},
+        )
+        linear, results = _run_client(linear_stub, [(ECHO, {"n": 1})])
+        assert isinstance(results[0], Exception)
+        assert linear.requests_sent == 1
+
+    def test_schema_is_fetched_once_then_read_from_disk(self, linear_stub, tmp_path):
+        from graphql import build_schema, introspection_from_schema
+
+        def answer(operation, variables):
+            if operation == "IntrospectionQuery":
+                schema = build_schema(STUB_SDL)
+                return 200, {"data": introspection_from_schema(schema)}, {}
+            return 200, {"data": {"echo": variables.get("n")}}, {}
+
+        linear_stub.answer = answer
+        schema_path = tmp_path / ".cache" / "linear-schema.graphql"
+
+        _run_client(linear_stub, [(ECHO, {"n": 1})], schema_path=schema_path)
+        assert linear_stub.operations == ["IntrospectionQuery", "Echo"]
+        assert "echo(n: Int): Int" in schema_path.read_text(encoding="utf-8")
+
+        _run_client(linear_stub, [(ECHO, {"n": 2})], schema_path=schema_path)
+        assert linear_stub.operations[2:] == ["Echo"]  # no second download
+
+    def test_cached_schema_validates_documents_locally(self, linear_stub, tmp_path):
+        schema_path = tmp_path / "linear-schema.graphql"
+        schema_path.write_text(STUB_SDL, encoding="utf-8")
+        _linear, results = _run_client(
+            linear_stub,
+            [("query Bad { nope }", None)],
+            schema_path=schema_path,
+        )
+        assert isinstance(results[0], Exception)
+        assert linear_stub.operations == []  # rejected before any request
+
+    def test_concurrent_bulk_sync_goes_through_the_async_client(
+        self, linear_stub, tmp_path, task_content_valid, monkeypatch
+    ):
+        from scripts.optional import sync_tasks_to_linear
+        from scripts.optional.sync_tasks_to_linear import sync_tasks_bulk
+
+        monkeypatch.setattr(sync_tasks_to_linear, "SCHEMA_CACHE_PATH", None)
+        files = _write_tasks(
+            tmp_path, task_content_valid, [f"TASK-000{n}" for n in range(1, 6)]
+        )
+
+        def answer(operation, variables):
+            return 200, {"data": _echo_mutation(variables)}, {}
+
+        linear_stub.answer = answer
+        empty = {
+            "issues": {
+                "nodes": [],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+        client, calls = _bulk_client({"TeamIssues": empty, "GetWorkflowStates": STATES})
+        client.url = linear_stub.url
+        assert sync_tasks_bulk(
+            files, client, "team-1", batch_size=2, concurrency=4
+        ) == (5, 0, 0)
+        assert linear_stub.operations == ["SyncBatch"] * 3
+        assert [c[0] for c in calls] == ["TeamIssues", "GetWorkflowStates"]
+
+    def test_concurrent_run_reads_the_cached_schema(
+        self, linear_stub, tmp_path, monkeypatch
+    ):
+        from graphql import build_schema, introspection_from_schema
+
+        from scripts.optional import sync_tasks_to_linear
+        from scripts.optional.sync_tasks_to_linear import LinearClient
+
+        def answer(operation, variables):
+            schema = build_schema(STUB_SDL)
+            return 200, {"data": introspection_from_schema(schema)}, {}
+
+        def connect(api_key, **kwargs):
+            # The real client against the stub, stopped before any sync.
+            LinearClient(api_key, url=linear_stub.url, **kwargs)
+            raise RuntimeError("connected")
+
+        linear_stub.answer = answer
+        schema_path = tmp_path / ".cache" / "linear-schema.graphql"
+        monkeypatch.setattr(sync_tasks_to_linear, "SCHEMA_CACHE_PATH", schema_path)
+        monkeypatch.setattr(sync_tasks_to_linear, "LinearClient", connect)
+        monkeypatch.setenv("LINEAR_API_KEY", "test-api-key")
+
+        for _ in range(2):
+            with pytest.raises(SystemExit):
+                sync_tasks_to_linear.main(["--concurrent"])
+        assert linear_stub.operations == ["IntrospectionQuery"]  # first run only
+        assert "echo(n: Int): Int" in schema_path.read_text(encoding="utf-8")
@@ -8,7 +8,8 @@ Test Categories:
     1. Logger creation and configuration
     2. LOG_LEVEL environment variable handling
     3. LOG_FILE environment variable handling
-    4. @performance_logged decorator
+    4. LOG_JSON and LOG_ASYNC output modes
+    5. @performance_logged decorator
 
 Usage:
     pytest tests/test_logging.py -v
@@ -16,14 +17,22 @@ Usage:
 See: ADR-0009 Logging & Observability
 """
 
+import json
 import logging
 import os
+import threading
 import time
+from logging.handlers import QueueHandler
 from unittest.mock import patch
 
 import pytest
 
-from scripts.core.logging_config import performance_logged, setup_logging
+from scripts.core import logging_config
+from scripts.core.logging_config import (
+    performance_logged,
+    setup_logging,
+    shutdown_logging,
+)
 
 # =============================================================================
 # FIXTURES
@@ -39,7 +48,8 @@ def reset_loggers():
         logger.handlers = []
         logger.setLevel(logging.NOTSET)
     yield
-    # Cleanup after test
+    # Cleanup after test: stop any LOG_ASYNC listener the test started
+    shutdown_logging()
     for name in ["test.logger", "test.debug", "test.file", "agentive.perf"]:
         logger = logging.getLogger(name)
         logger.handlers = []
@@ -184,6 +194,124 @@ class TestFileLogging:
         assert "Test message" in content
 
 
+# =============================================================================
+# OUTPUT MODE TESTS (LOG_JSON, LOG_ASYNC)
+# =============================================================================
+
+
+class TestOutputModes:
+    """Tests for JSON-lines output and queue-based (async) logging."""
+
+    def test_json_lines_in_log_file(self, monkeypatch, tmp_path):
+        """LOG_JSON=true writes one parseable JSON object per record."""
+        log_file = tmp_path / "test.log"
+        monkeypatch.setenv("LOG_FILE", str(log_file))
+        monkeypatch.setenv("LOG_JSON", "true")
+
+        logger = setup_logging("test.file")
+        logger.info("✅ synced %d tasks", 3)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("sync failed")
+        for handler in logger.handlers:
+            handler.flush()
+
+        first, second = [
+            json.loads(line)
+            for line in log_file.read_text(encoding="utf-8").splitlines()
+        ]
+        assert first["message"] == "✅ synced 3 tasks"
+        assert (first["level"], first["logger"]) == ("INFO", "test.file")
+        assert first["ts"].endswith("+00:00")
+        assert "ValueError: boom" in second["exc"]
+
+    def test_async_mode_writes_off_the_caller_thread(self, monkeypatch, tmp_path):
+        """LOG_ASYNC=true installs one QueueHandler; a listener thread
+        formats and writes, and shutdown_logging drains the queue."""
+        log_file = tmp_path / "test.log"
+        monkeypatch.setenv("LOG_FILE", str(log_file))
+        monkeypatch.setenv("LOG_ASYNC", "1")
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+
+        logger = setup_logging("test.file")
+        managed = [h for h in logger.handlers if getattr(h, "_agentive_managed", False)]
+        assert [type(h) for h in managed] == [logging_config.ExcTextQueueHandler]
+        assert setup_logging("test.file").handlers == logger.handlers
+
+        writer_threads = []
+        for handler in logging_config._listeners[0].handlers:
+            handler.addFilter(
+                lambda record: writer_threads.append(threading.current_thread()) or True
+            )
+        logger.info("filtered")
+        logger.warning("queued %s", "message")
+        shutdown_logging()
+
+        content = log_file.read_text(encoding="utf-8")
+        assert "queued message" in content
+        assert "filtered" not in content
+        assert writer_threads
+        assert threading.current_thread() not in writer_threads
+        assert not logging_config._listeners
+
+    def test_logging_after_shutdown_still_writes(self, monkeypatch, tmp_path):
+        """shutdown_logging hands the listener's handlers back to the
+        logger: later records are written, and setup_logging keeps them."""
+        log_file = tmp_path / "test.log"
+        monkeypatch.setenv("LOG_FILE", str(log_file))
+        monkeypatch.setenv("LOG_ASYNC", "1")
+
+        logger = setup_logging("test.file")
+        logger.info("before shutdown")
+        shutdown_logging()
+        logger.info("after shutdown")
+        assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
+        assert setup_logging("test.file").handlers == logger.handlers
+        shutdown_logging()
+        logger.info("after second shutdown")
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert [line.rsplit(": ", 1)[1] for line in lines] == [
+            "before shutdown",
+            "after shutdown",
+            "after second shutdown",
+        ]
+
+    def test_async_json_keeps_the_traceback_separate(self, monkeypatch, tmp_path):
+        """LOG_JSON with LOG_ASYNC: logger.exception() still gives an exc
+        key, and the message stays the message."""
+        log_file = tmp_path / "test.log"
+        monkeypatch.setenv("LOG_FILE", str(log_file))
+        monkeypatch.setenv("LOG_JSON", "true")
+        monkeypatch.setenv("LOG_ASYNC", "true")
+
+        logger = setup_logging("test.file")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("sync of %s failed", "TASK-0001")
+        shutdown_logging()
+
+        (entry,) = [
+            json.loads(line)
+            for line in log_file.read_text(encoding="utf-8").splitlines()
+        ]
+        assert entry["message"] == "sync of TASK-0001 failed"
+        assert entry["exc"].startswith("Traceback (most recent call last):")
+        assert entry["exc"].endswith("ValueError: boom")
+
+    def test_flags_default_off(self, monkeypatch):
+        """Without LOG_JSON/LOG_ASYNC the handlers are the plain ones."""
+        monkeypatch.delenv("LOG_JSON", raising=False)
+        monkeypatch.delenv("LOG_ASYNC", raising=False)
+        logger = setup_logging("test.logger")
+
+        managed = [h for h in logger.handlers if getattr(h, "_agentive_managed", False)]
+        assert managed and not any(isinstance(h, QueueHandler) for h in managed)
+        assert all(type(h.formatter) is logging.Formatter for h in managed)
+
+
 # =============================================================================
 # PERFORMANCE DECORATOR TESTS
 # =============================================================================
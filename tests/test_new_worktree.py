@@ -77,13 +77,34 @@ def _make_executable(path: Path, body: str) -> None:
     path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
 
+# Appended to the stub `project` by _primary_fixture(build_venv=True):
+# a miniature venv carrying every path-bearing shape the template
+# clone must rewrite (shebang, pyvenv.cfg command line, editable .pth)
+# plus one path-free payload file it may hardlink.
+_VENV_STUB = r"""
+VENV="$ROOT/.venv"
+SP="$VENV/lib/python3/site-packages"
+mkdir -p "$VENV/bin" "$SP"
+ln -s "$(command -v python3)" "$VENV/bin/python"
+printf '#!%s/bin/python\nprint("tool")\n' "$VENV" > "$VENV/bin/tool"
+chmod +x "$VENV/bin/tool"
+printf 'command = python3 -m venv %s\n' "$VENV" > "$VENV/pyvenv.cfg"
+printf '%s\n' "$ROOT" > "$SP/_editable.pth"
+printf 'payload\n' > "$SP/payload.py"
+"""
+
+
 def _primary_fixture(
-    tmp_path: Path, setup_stub_exit: int = 0, primary_name: str = "kit"
+    tmp_path: Path,
+    setup_stub_exit: int = 0,
+    primary_name: str = "kit",
+    build_venv: bool = False,
 ) -> Path:
     """A primary clone (default name kit/) with a local bare origin,
     carrying the real helper, the real Serena template, and a stub
     `project` that records its argv to setup-args.txt in its own
-    checkout."""
+    checkout (and, with *build_venv*, lays down a miniature venv plus
+    a pyproject.toml for the venv template cache to key on)."""
     primary = tmp_path / primary_name
     (primary / "scripts" / "local").mkdir(parents=True)
     (primary / "scripts" / "core").mkdir(parents=True)
@@ -100,8 +121,13 @@ def _primary_fixture(
         'SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"\n'
         'ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"\n'
         'printf \'%s\\n\' "$*" >> "$ROOT/setup-args.txt"\n'
-        f"exit {setup_stub_exit}\n",
+        + (_VENV_STUB if build_venv else "")
+        + f"exit {setup_stub_exit}\n",
     )
+    if build_venv:
+        (primary / "pyproject.toml").write_text(
+            '[project]\nname = "kit"\n', encoding="utf-8"
+        )
 
     _git(primary, "init", "--quiet", "-b", "main")
     for key, value in (("user.email", "t@example.com"), ("user.name", "t")):
@@ -228,6 +254,132 @@ class TestProvisioning:
         assert 'project_name: "kit&co-KIT-1234"' in serena
 
 
+class TestVenvTemplate:
+    """The venv template cache: the first worktree for a dependency
+    hash runs the full setup and seeds the template; later worktrees
+    clone it without running setup at all."""
+
+    def test_second_worktree_clones_the_template(self, tmp_path):
+        primary = _primary_fixture(tmp_path, build_venv=True)
+        first = _run_helper(primary, "KIT-0001", "demo")
+        assert first.returncode == 0, first.stdout + first.stderr
+        assert "Venv template cached" in first.stdout
+        templates = primary / ".kit" / ".cache" / "venv-templates"
+        assert len(list(templates.iterdir())) == 1
+
+        second = _run_helper(primary, "KIT-0002", "demo")
+        assert second.returncode == 0, second.stdout + second.stderr
+        wt = tmp_path / "ask-worktrees" / "KIT-0002"
+        # no setup ran: the venv came from the template
+        assert not (wt / "setup-args.txt").exists()
+        assert "from template" in second.stdout
+
+        venv = wt / ".venv"
+        assert venv.is_dir() and not venv.is_symlink()
+        assert (venv / "bin" / "python").is_symlink()
+        # every path-bearing file names THIS worktree, never the seeder
+        old = str(tmp_path / "ask-worktrees" / "KIT-0001")
+        for rel in (
+            "bin/tool",
+            "pyvenv.cfg",
+            "lib/python3/site-packages/_editable.pth",
+        ):
+            text = (venv / rel).read_text(encoding="utf-8")
+            assert str(wt) in text, rel
+            assert old not in text, rel
+        assert os.access(venv / "bin" / "tool", os.X_OK)
+        # path-free payload is shared with the template, not copied
+        payload = venv / "lib" / "python3" / "site-packages" / "payload.py"
+        assert payload.stat().st_nlink == 2
+
+    def test_template_is_independent_of_the_seeding_worktree(self, tmp_path):
+        primary = _primary_fixture(tmp_path, build_venv=True)
+        assert _run_helper(primary, "KIT-0001", "demo").returncode == 0
+        seeder = tmp_path / "ask-worktrees" / "KIT-0001" / ".venv"
+        payload = seeder / "lib" / "python3" / "site-packages" / "payload.py"
+        assert payload.stat().st_nlink == 1
+
+    def test_changed_dependencies_fall_back_to_full_setup(self, tmp_path):
+        primary = _primary_fixture(tmp_path, build_venv=True)
+        assert _run_helper(primary, "KIT-0001", "demo").returncode == 0
+        (primary / "pyproject.toml").write_text(
+            '[project]\nname = "kit"\ndependencies = ["x"]\n', encoding="utf-8"
+        )
+        _git(primary, "commit", "--quiet", "-am", "bump deps")
+        _git(primary, "push", "--quiet", "origin", "main")
+
+        result = _run_helper(primary, "KIT-0002", "demo")
+        assert result.returncode == 0, result.stdout + result.stderr
+        wt = tmp_path / "ask-worktrees" / "KIT-0002"
+        assert (wt / "setup-args.txt").read_text(
+            encoding="utf-8"
+        ).strip() == "setup --no-hooks"
+        templates = primary / ".kit" / ".cache" / "venv-templates"
+        assert len(list(templates.iterdir())) == 2
+
+    def test_changed_package_metadata_falls_back_to_full_setup(self, tmp_path):
+        # the kit repo's setup dev-installs packages/agentive-kit, so its
+        # pyproject.toml is part of the key like the root one
+        primary = _primary_fixture(tmp_path, build_venv=True)
+        pkg = primary / "packages" / "agentive-kit"
+        pkg.mkdir(parents=True)
+        (pkg / "pyproject.toml").write_text(
+            '[project]\nname = "agentive-kit"\n', encoding="utf-8"
+        )
+        _git(primary, "add", "packages")
+        _git(primary, "commit", "--quiet", "-m", "add package")
+        _git(primary, "push", "--quiet", "origin", "main")
+        assert _run_helper(primary, "KIT-0001", "demo").returncode == 0
+        (pkg / "pyproject.toml").write_text(
+            '[project]\nname = "agentive-kit"\ndependencies = ["x"]\n',
+            encoding="utf-8",
+        )
+        _git(primary, "commit", "--quiet", "-am", "bump package deps")
+        _git(primary, "push", "--quiet", "origin", "main")
+
+        result = _run_helper(primary, "KIT-0002", "demo")
+        assert result.returncode == 0, result.stdout + result.stderr
+        wt = tmp_path / "ask-worktrees" / "KIT-0002"
+        assert (wt / "setup-args.txt").exists()
+        templates = primary / ".kit" / ".cache" / "venv-templates"
+        assert len(list(templates.iterdir())) == 2
+
+    def test_half_seeded_template_is_never_cloned(self, tmp_path):
+        primary = _primary_fixture(tmp_path, build_venv=True)
+        assert _run_helper(primary, "KIT-0001", "demo").returncode == 0
+        templates = primary / ".kit" / ".cache" / "venv-templates"
+        (template,) = templates.iterdir()
+        (template / "agentive-template.json").unlink()
+
+        result = _run_helper(primary, "KIT-0002", "demo")
+        assert result.returncode == 0, result.stdout + result.stderr
+        wt = tmp_path / "ask-worktrees" / "KIT-0002"
+        assert (wt / "setup-args.txt").exists()
+
+    def test_failed_clone_leaves_no_partial_venv(self, tmp_path):
+        primary = _primary_fixture(tmp_path, build_venv=True)
+        assert _run_helper(primary, "KIT-0001", "demo").returncode == 0
+        templates = primary / ".kit" / ".cache" / "venv-templates"
+        (template,) = templates.iterdir()
+        # a clone without an interpreter is a failed clone
+        (template / "venv" / "bin" / "python").unlink()
+        (template / "venv" / "stale.txt").write_text("x\n", encoding="utf-8")
+
+        result = _run_helper(primary, "KIT-0002", "demo")
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Venv template clone failed" in result.stdout
+        wt = tmp_path / "ask-worktrees" / "KIT-0002"
+        assert (wt / "setup-args.txt").exists()
+        # the full setup started from nothing, not from the half clone
+        assert not (wt / ".venv" / "stale.txt").exists()
+
+    def test_failed_setup_seeds_nothing(self, tmp_path):
+        primary = _primary_fixture(tmp_path, setup_stub_exit=1, build_venv=True)
+        result = _run_helper(primary, "KIT-0001", "demo")
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert not (primary / ".kit" / ".cache" / "venv-templates").exists()
+
+
 # ─────────────────────────────────────────────────────────────────────
 # KIT-0080 / S4: the helper must resolve the primary clone on old git
 # ─────────────────────────────────────────────────────────────────────
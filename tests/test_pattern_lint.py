@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import ast
+import functools
+import multiprocessing
+import subprocess
 
 # Import the lint functions directly
 import sys
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "core"))
 
+import pattern_lint
 from pattern_lint import check_dk001, check_dk002, check_dk003, check_dk004
 
 
@@ -375,3 +382,291 @@ class TestIntegration:
         assert len(v2) == 0
         assert len(v3) == 0
         assert len(v4) == 0
+
+
+# ── Single pass, process pool, result cache ─────────────────────────
+
+MIXED = textwrap.dedent("""\
+    x = f.replace(".md", "")
+    y = open("file.txt")
+    if task_id in event_id: pass
+    try:
+        risky()
+    except Exception:
+        pass
+""")
+
+
+def _write_files(tmp_path, count):
+    paths = []
+    for n in range(count):
+        path = tmp_path / f"mod{n}.py"
+        path.write_text(MIXED + f"z = {n}\n", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+class TestSinglePass:
+    def test_one_walk_finds_what_the_four_rules_find(self):
+        tree = ast.parse(MIXED)
+        lines = MIXED.splitlines()
+        separate = [
+            (v.line, v.rule)
+            for check in (check_dk001, check_dk002, check_dk003, check_dk004)
+            for v in check(tree, lines, "test.py")
+        ]
+        combined = pattern_lint.lint_source(MIXED, "test.py")
+        assert [(v.line, v.rule) for v in combined] == sorted(separate)
+
+    def test_nested_nodes_are_still_visited(self):
+        code = "def f():\n    return [open(p) for p in g(x.replace('.py', ''))]\n"
+        rules = {v.rule for v in pattern_lint.lint_source(code, "t.py")}
+        assert rules == {"DK001", "DK002"}
+
+    def test_syntax_error_is_no_violations(self):
+        assert pattern_lint.lint_source("def (:\n", "t.py") == []
+
+
+class TestLintPaths:
+    def test_process_pool_matches_serial(self, tmp_path, monkeypatch):
+        paths = _write_files(tmp_path, 6)
+        serial = pattern_lint.lint_paths(paths, jobs=1)
+        monkeypatch.setattr(pattern_lint, "PARALLEL_THRESHOLD", 2)
+        parallel = pattern_lint.lint_paths(paths, jobs=2)
+        assert [str(v) for v in parallel] == [str(v) for v in serial]
+        assert len(serial) == 6 * 4
+
+    def test_cache_skips_unchanged_files(self, tmp_path, monkeypatch):
+        paths = _write_files(tmp_path, 3)
+        cache = tmp_path / "cache.json"
+        first = pattern_lint.lint_paths(paths, cache_path=cache, jobs=1)
+
+        linted = []
+        real = pattern_lint.lint_source
+        monkeypatch.setattr(
+            pattern_lint,
+            "lint_source",
+            lambda source, path: linted.append(path) or real(source, path),
+        )
+        again = pattern_lint.lint_paths(paths, cache_path=cache, jobs=1)
+        assert linted == []
+        assert [str(v) for v in again] == [str(v) for v in first]
+
+        Path(paths[1]).write_text("x = 1\n", encoding="utf-8")
+        pattern_lint.lint_paths(paths, cache_path=cache, jobs=1)
+        assert linted == [paths[1]]
+
+    def test_rule_set_change_invalidates_the_cache(self, tmp_path, monkeypatch):
+        paths = _write_files(tmp_path, 1)
+        cache = tmp_path / "cache.json"
+        pattern_lint.lint_paths(paths, cache_path=cache, jobs=1)
+        monkeypatch.setattr(pattern_lint, "rules_version", lambda: "other")
+        linted = []
+        real = pattern_lint.lint_source
+        monkeypatch.setattr(
+            pattern_lint,
+            "lint_source",
+            lambda source, path: linted.append(path) or real(source, path),
+        )
+        pattern_lint.lint_paths(paths, cache_path=cache, jobs=1)
+        assert linted == paths
+
+
+class TestMain:
+    def test_cache_written_only_inside_a_kit_project(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        monkeypatch.chdir(tmp_path)
+        paths = _write_files(tmp_path, 1)
+        assert pattern_lint.main(paths) == 1
+        assert not (tmp_path / ".kit").exists()
+        (tmp_path / ".kit").mkdir()
+        assert pattern_lint.main(paths) == 1
+        assert (tmp_path / pattern_lint.CACHE_PATH).is_file()
+        assert "4 pattern violation(s) found." in capsys.readouterr().err
+
+    def test_no_cache_flag(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".kit").mkdir()
+        paths = _write_files(tmp_path, 1)
+        assert pattern_lint.main(["--no-cache", "--jobs", "1", *paths]) == 1
+        assert not (tmp_path / pattern_lint.CACHE_PATH).exists()
+
+    def test_bad_jobs_value_is_usage_error(self, capsys):
+        assert pattern_lint.main(["--jobs", "many", "x.py"]) == 2
+        assert "Usage" in capsys.readouterr().err
+
+
+# ── Rule registry and --tree ─────────────────────────────────────────
+
+PRINT_RULE = """\
+import ast
+
+from pattern_lint import Violation, register
+
+SEEN = []
+
+
+@register("PRJ001", ast.Call)
+def no_print(node, source_lines, path):
+    SEEN.append(type(node).__name__)
+    if isinstance(node.func, ast.Name) and node.func.id == "print":
+        return Violation("PRJ001", path, node.lineno, "print() call")
+    return None
+"""
+
+
+SKIP_TESTS_RULE = """\
+import ast
+
+from pattern_lint import Violation, register
+
+
+@register("PX001", ast.Call)
+def no_print_outside_tests(node, source_lines, path):
+    if path.startswith("tests/"):
+        return None
+    if isinstance(node.func, ast.Name) and node.func.id == "print":
+        return Violation("PX001", path, node.lineno, "print() call")
+    return None
+"""
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Project rules registered by a test vanish after it."""
+    monkeypatch.setattr(pattern_lint, "RULES", dict(pattern_lint.RULES))
+    monkeypatch.setattr(pattern_lint, "_RULE_SOURCES", [])
+    monkeypatch.setattr(pattern_lint, "_LOADED", set())
+    monkeypatch.setattr(pattern_lint, "_LOADED_DIRS", [])
+    return pattern_lint.RULES
+
+
+def _rules_dir(tmp_path, source=PRINT_RULE):
+    rules_dir = tmp_path / ".kit" / "lint-rules"
+    rules_dir.mkdir(parents=True, exist_ok=True)
+    (rules_dir / "no_print.py").write_text(source, encoding="utf-8")
+    return rules_dir
+
+
+class TestRegistry:
+    def test_rule_file_registers_and_sees_only_its_nodes(self, tmp_path, registry):
+        assert pattern_lint.load_project_rules(_rules_dir(tmp_path)) == []
+        assert "PRJ001" in registry
+        source = "x = 1\nif x == 1:\n    print(len('a'))\n"
+        violations = pattern_lint.lint_source(source, "demo.py")
+        assert [(v.rule, v.line) for v in violations] == [("PRJ001", 3)]
+        seen = registry["PRJ001"].check.__globals__["SEEN"]
+        assert seen == ["Call", "Call"]  # never the Compare or the Assign
+
+    def test_noqa_suppresses_a_project_rule(self, registry):
+        @pattern_lint.register("PRJ002", ast.Name)
+        def every_name(node, source_lines, path):
+            return pattern_lint.Violation("PRJ002", path, node.lineno, node.id)
+
+        source = "a = b\nc = d  # noqa: PRJ002\n"
+        violations = pattern_lint.lint_source(source, "demo.py")
+        assert [v.line for v in violations] == [1, 1]
+
+    def test_abstract_node_type_covers_its_subclasses(self, registry):
+        @pattern_lint.register("PRJ003", ast.stmt)
+        def every_statement(node, source_lines, path):
+            return pattern_lint.Violation("PRJ003", path, node.lineno, "stmt")
+
+        violations = pattern_lint.lint_source("a = 1\nif a:\n    pass\n", "demo.py")
+        assert [v.line for v in violations] == [1, 2, 3]
+
+    def test_register_needs_a_node_type(self):
+        with pytest.raises(ValueError):
+            pattern_lint.register("PRJ004")
+
+    def test_rule_file_change_invalidates_the_cache(self, tmp_path, registry):
+        before = pattern_lint.rules_version()
+        rules_dir = _rules_dir(tmp_path)
+        pattern_lint.load_project_rules(rules_dir)
+        loaded = pattern_lint.rules_version()
+        assert loaded != before
+        (rules_dir / "no_print.py").write_text(PRINT_RULE + "\n", encoding="utf-8")
+        pattern_lint._LOADED.clear()
+        pattern_lint._RULE_SOURCES.clear()
+        pattern_lint.load_project_rules(rules_dir)
+        assert pattern_lint.rules_version() not in (before, loaded)
+
+    def test_cache_keeps_path_dependent_results_apart(
+        self, tmp_path, monkeypatch, registry
+    ):
+        monkeypatch.chdir(tmp_path)
+        _rules_dir(tmp_path, SKIP_TESTS_RULE)
+        for name in ("tests/t.py", "a/m.py"):
+            (tmp_path / name).parent.mkdir()
+            (tmp_path / name).write_text("print(1)\n", encoding="utf-8")
+        assert pattern_lint.main(["--jobs", "1", "tests/t.py"]) == 0
+        # same bytes, but the rule applies here: no cache hit
+        assert pattern_lint.main(["--jobs", "1", "a/m.py"]) == 1
+
+    def test_spawned_workers_load_entry_point_rules(
+        self, tmp_path, monkeypatch, registry
+    ):
+        site = tmp_path / "site"
+        (site / "prj_rules-0.1.dist-info").mkdir(parents=True)
+        (site / "prj_rules-0.1.dist-info" / "METADATA").write_text(
+            "Metadata-Version: 2.1\nName: prj-rules\nVersion: 0.1\n",
+            encoding="utf-8",
+        )
+        (site / "prj_rules-0.1.dist-info" / "entry_points.txt").write_text(
+            "[pattern_lint.rules]\nprj = prj_rules\n", encoding="utf-8"
+        )
+        (site / "prj_rules.py").write_text(PRINT_RULE, encoding="utf-8")
+        monkeypatch.syspath_prepend(str(site))
+        assert pattern_lint.load_project_rules(None) == []
+
+        # spawn (the macOS default) starts workers with nothing loaded
+        spawn = multiprocessing.get_context("spawn")
+        monkeypatch.setattr(
+            pattern_lint,
+            "ProcessPoolExecutor",
+            functools.partial(ProcessPoolExecutor, mp_context=spawn),
+        )
+        monkeypatch.setattr(pattern_lint, "PARALLEL_THRESHOLD", 2)
+        paths = []
+        for n in range(4):
+            (tmp_path / f"p{n}.py").write_text(f"print({n})\n", encoding="utf-8")
+            paths.append(str(tmp_path / f"p{n}.py"))
+        violations = pattern_lint.lint_paths(paths, jobs=2)
+        assert sorted(v.path for v in violations if v.rule == "PRJ001") == paths
+
+    def test_broken_rule_file_is_exit_2(self, tmp_path, monkeypatch, registry, capsys):
+        monkeypatch.chdir(tmp_path)
+        _rules_dir(tmp_path, "raise RuntimeError('boom')\n")
+        (tmp_path / "ok.py").write_text("x = 1\n", encoding="utf-8")
+        assert pattern_lint.main(["ok.py"]) == 2
+        assert "could not load rules" in capsys.readouterr().err
+
+
+class TestTree:
+    def test_tree_lints_tracked_and_unignored_files(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        monkeypatch.chdir(tmp_path)
+        subprocess.run(["git", "init", "-q"], check=True, timeout=30)
+        bad = 'open("f")\n'
+        (tmp_path / "scripts").mkdir()
+        (tmp_path / "scripts" / "tracked.py").write_text(bad, encoding="utf-8")
+        (tmp_path / "scripts" / "new.py").write_text(bad, encoding="utf-8")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "gen.py").write_text(bad, encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("x\n", encoding="utf-8")
+        (tmp_path / ".gitignore").write_text("build/\n", encoding="utf-8")
+        subprocess.run(["git", "add", "scripts/tracked.py"], check=True, timeout=30)
+
+        assert pattern_lint.tree_files() == ["scripts/new.py", "scripts/tracked.py"]
+        assert pattern_lint.tree_files(["build/"]) == []
+        assert pattern_lint.main(["--tree", "scripts/"]) == 1
+        err = capsys.readouterr().err
+        assert "scripts/new.py" in err and "build/gen.py" not in err
+
+    def test_tree_outside_git_is_exit_2(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        assert pattern_lint.main(["--tree"]) == 2
+        assert "git checkout" in capsys.readouterr().err
@@ -10,6 +10,9 @@ from __future__ import annotations
 
 import hashlib
 import importlib.util
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -233,6 +236,18 @@ class TestDrift:
         assert "no kit_sha256" in capsys.readouterr().out
 
 
+class TestHashing:
+    def test_hash_files_matches_whole_file_sha(self, kit, monkeypatch):
+        monkeypatch.setattr(cpd, "HASH_CHUNK", 7)  # force many chunks
+        paths = sorted(kit.glob(".claude/**/*.md"))
+        assert cpd.hash_files(paths) == {path: _sha(path) for path in paths}
+
+    def test_read_error_maps_to_its_exception(self, tmp_path):
+        missing = tmp_path / "gone.md"
+        (result,) = cpd.hash_files([missing]).values()
+        assert isinstance(result, OSError)
+
+
 class TestErrors:
     def test_invalid_yaml_exits_roster_io(self, kit, tmp_path):
         roster = tmp_path / "roster.yaml"
@@ -260,3 +275,147 @@ class TestErrors:
         roster.write_text("components: []\n", encoding="utf-8")
         code = cpd.main(["--roster-file", str(roster), "--kit-root", str(tmp_path)])
         assert code == cpd.EXIT_USAGE
+
+
+class RosterServer:
+    """Local stand-in for raw.githubusercontent.com: serves ``self.body``
+    with an ETag and honors ``If-None-Match``. ``self.failures`` queues
+    status codes to answer first; ``self.delay`` stalls each answer."""
+
+    def __init__(self):
+        self.body = ""
+        self.failures: list[int] = []
+        self.delay = 0.0
+        self.requests: list[dict] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                time.sleep(server.delay)
+                if server.failures:
+                    self.send_response(server.failures.pop(0))
+                    self.end_headers()
+                    return
+                etag = '"' + hashlib.sha256(server.body.encode()).hexdigest()[:8] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                data = server.body.encode()
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Mon, 12 Oct 2026 06:00:00 GMT")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/roster.yaml"
+
+
+@pytest.fixture
+def roster_server(monkeypatch):
+    monkeypatch.setattr(cpd, "RETRY_BACKOFF", 0.0)
+    server = RosterServer()
+    thread = threading.Thread(
+        target=server.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+def _fetch(kit_root: Path, server: RosterServer, *flags: str) -> int:
+    return cpd.main(["--roster-url", server.url, "--kit-root", str(kit_root), *flags])
+
+
+class TestRemoteRoster:
+    def test_fetch_caches_and_revalidates(self, kit, roster_server, capsys):
+        roster_server.body = _roster_for(kit)
+        assert _fetch(kit, roster_server) == cpd.EXIT_IN_SYNC
+        assert "If-None-Match" not in roster_server.requests[0]
+        cached = list((kit / cpd.DEFAULT_CACHE_DIR).glob("roster-*.yaml"))
+        assert len(cached) == 1
+
+        assert _fetch(kit, roster_server) == cpd.EXIT_IN_SYNC
+        second = roster_server.requests[1]
+        assert second["If-None-Match"].startswith('"')
+        assert second["If-Modified-Since"] == "Mon, 12 Oct 2026 06:00:00 GMT"
+        assert "not modified" in capsys.readouterr().out
+
+    def test_changed_roster_replaces_the_cache(self, kit, roster_server):
+        roster_server.body = _roster_for(kit)
+        _fetch(kit, roster_server)
+        roster_server.body = _roster_for(kit) + "# re-released\n"
+        assert _fetch(kit, roster_server) == cpd.EXIT_IN_SYNC
+        (cached,) = (kit / cpd.DEFAULT_CACHE_DIR).glob("roster-*.yaml")
+        assert cached.read_text(encoding="utf-8").endswith("# re-released\n")
+
+    def test_transient_failures_are_retried(self, kit, roster_server):
+        roster_server.body = _roster_for(kit)
+        roster_server.failures = [503, 500]
+        assert _fetch(kit, roster_server, "--retries", "2") == cpd.EXIT_IN_SYNC
+        assert len(roster_server.requests) == 3
+
+    def test_client_error_is_not_retried(self, kit, roster_server, capsys):
+        roster_server.failures = [404]
+        with pytest.raises(SystemExit) as exc:
+            _fetch(kit, roster_server, "--retries", "3")
+        assert exc.value.code == cpd.EXIT_ROSTER_IO
+        assert len(roster_server.requests) == 1
+        assert "HTTP 404" in capsys.readouterr().out
+
+    def test_network_failure_falls_back_to_the_cache(self, kit, roster_server, capsys):
+        roster_server.body = _roster_for(kit)
+        _fetch(kit, roster_server)
+        roster_server.failures = [502, 502]
+        assert _fetch(kit, roster_server, "--retries", "1") == cpd.EXIT_IN_SYNC
+        assert "WARNING: cannot fetch roster" in capsys.readouterr().out
+
+    def test_timeout_falls_back_to_the_cache(self, kit, roster_server, capsys):
+        roster_server.body = _roster_for(kit)
+        _fetch(kit, roster_server)
+        roster_server.delay = 0.5
+        args = ("--timeout", "0.1", "--retries", "0")
+        assert _fetch(kit, roster_server, *args) == cpd.EXIT_IN_SYNC
+        assert "using the copy cached" in capsys.readouterr().out
+
+    def test_invalid_served_roster_never_replaces_the_cache(
+        self, kit, roster_server, capsys
+    ):
+        roster_server.body = _roster_for(kit)
+        _fetch(kit, roster_server)
+        roster_server.body = "<html>captive portal</html>\n"
+        assert _fetch(kit, roster_server) == cpd.EXIT_IN_SYNC
+        assert "served roster is invalid" in capsys.readouterr().out
+        (cached,) = (kit / cpd.DEFAULT_CACHE_DIR).glob("roster-*.yaml")
+        assert cached.read_text(encoding="utf-8") == _roster_for(kit)
+
+    def test_no_network_and_no_cache_exits_roster_io(self, kit, roster_server):
+        roster_server.failures = [500, 500, 500]
+        with pytest.raises(SystemExit) as exc:
+            _fetch(kit, roster_server)
+        assert exc.value.code == cpd.EXIT_ROSTER_IO
+
+    def test_offline_uses_the_cache_without_a_request(self, kit, roster_server):
+        roster_server.body = _roster_for(kit)
+        _fetch(kit, roster_server)
+        assert _fetch(kit, roster_server, "--offline") == cpd.EXIT_IN_SYNC
+        assert len(roster_server.requests) == 1
+
+    def test_offline_without_cache_exits_roster_io(self, kit, roster_server, capsys):
+        with pytest.raises(SystemExit) as exc:
+            _fetch(kit, roster_server, "--offline")
+        assert exc.value.code == cpd.EXIT_ROSTER_IO
+        assert roster_server.requests == []
+        assert "no valid cached roster" in capsys.readouterr().out
+
+    def test_no_cache_writes_nothing(self, kit, roster_server):
+        roster_server.body = _roster_for(kit)
+        assert _fetch(kit, roster_server, "--no-cache") == cpd.EXIT_IN_SYNC
+        assert not (kit / cpd.DEFAULT_CACHE_DIR).exists()
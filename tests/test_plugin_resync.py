@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import hashlib
 import importlib.util
+import random
 import subprocess
 from pathlib import Path
 
@@ -269,6 +270,93 @@ class TestThreeWayMerge:
         assert copied.read_text(encoding="utf-8").endswith("new body\n")
 
 
+def _random_case(rng: random.Random) -> tuple[bytes, bytes, bytes]:
+    """A small base plus two independent edits of it, drawn from a tiny
+    vocabulary so repeats, blank lines and punctuation-only lines (the
+    ALNUM rule) are common."""
+    vocab = [b"a\n", b"b\n", b"c\n", b"\n", b"---\n", b"x = 1\n", b"}\n", b"## H\n"]
+    base = [rng.choice(vocab) for _ in range(rng.randint(0, 25))]
+
+    def edit(lines: list[bytes]) -> bytes:
+        lines = list(lines)
+        for _ in range(rng.randint(0, 4)):
+            pos = rng.randint(0, len(lines))
+            op = rng.random()
+            if op < 0.4:
+                lines[pos:pos] = [rng.choice(vocab) for _ in range(rng.randint(1, 3))]
+            elif op < 0.7:
+                del lines[pos : pos + rng.randint(1, 3)]
+            elif lines:
+                lines[min(pos, len(lines) - 1)] = rng.choice(vocab)
+        data = b"".join(lines)
+        return data.rstrip(b"\n") if rng.random() < 0.2 else data
+
+    return edit(base), b"".join(base), edit(base)
+
+
+class TestInProcessMerge:
+    """The in-process engine must be byte-identical to git merge-file."""
+
+    def test_parity_with_git_merge_file(self):
+        rng = random.Random(20261019)
+        for _ in range(300):
+            ours, base, theirs = _random_case(rng)
+            assert prs.merge_three_way(ours, base, theirs) == prs.merge_three_way(
+                ours, base, theirs, use_git=True
+            ), (ours, base, theirs)
+
+    def test_parity_on_the_fixture_bodies(self):
+        conflicted = V2_BODY.replace("Kit-specific", "Canon-specific")
+        for theirs in (V2_BODY, conflicted):
+            args = (PLUGIN_BODY.encode(), V1_BODY.encode(), theirs.encode())
+            assert prs.merge_three_way(*args) == prs.merge_three_way(
+                *args, use_git=True
+            )
+
+    def test_parity_with_crlf_and_missing_final_newline(self):
+        base = b"one\r\ntwo\r\nthree\r\n"
+        ours = b"one\r\nTWO\r\nthree"
+        theirs = b"one\r\n2\r\nthree\r\n"
+        merged, clean = prs.merge_three_way(ours, base, theirs)
+        assert not clean
+        assert b"<<<<<<< plugin (published)\r\n" in merged
+        assert (merged, clean) == prs.merge_three_way(ours, base, theirs, use_git=True)
+
+    def test_conflict_markers_and_count(self):
+        merged, conflicts = prs.merge_in_process(
+            b"x\nours\ny\n", b"x\nbase\ny\n", b"x\ntheirs\ny\n", prs.MERGE_LABELS
+        )
+        assert conflicts == 1
+        assert merged == (
+            b"x\n<<<<<<< plugin (published)\nours\n=======\n"
+            b"theirs\n>>>>>>> kit (current)\ny\n"
+        )
+
+    def test_no_process_is_spawned(self, monkeypatch):
+        def refuse(*args, **kwargs):
+            raise AssertionError("subprocess spawned")
+
+        monkeypatch.setattr(prs.subprocess, "run", refuse)
+        merged, clean = prs.merge_three_way(
+            PLUGIN_BODY.encode(), V1_BODY.encode(), V2_BODY.encode()
+        )
+        assert clean and b"Step two" in merged
+
+    def test_binary_input_is_refused(self):
+        with pytest.raises(prs.ResyncError, match="binary"):
+            prs.merge_three_way(b"a\0\n", b"a\n", b"b\n")
+
+    def test_git_merge_file_flag_gives_the_same_resync(self, kit, marketplace):
+        _write_roster(marketplace, _sha(V1_BODY.encode()))
+        assert _run(kit, marketplace, "--git-merge-file") == prs.EXIT_OK
+        body = marketplace / "plugins" / "agentive-workflow" / "agents"
+        via_git = (body / "demo-agent.md").read_bytes()
+        (body / "demo-agent.md").write_text(PLUGIN_BODY, encoding="utf-8")
+        _write_roster(marketplace, _sha(V1_BODY.encode()))
+        assert _run(kit, marketplace) == prs.EXIT_OK
+        assert (body / "demo-agent.md").read_bytes() == via_git
+
+
 class TestBaseNotFound:
     def test_unmatchable_hash_fails_loud_and_writes_nothing(
         self, kit, marketplace, capsys
@@ -454,3 +542,79 @@ class TestHelpers:
     def test_skill_body_path(self):
         comp = {"name": "self-review", "kind": "skill"}
         assert prs.plugin_body_relpath(comp) == "skills/self-review/SKILL.md"
+
+
+class TestHistoryIndex:
+    def test_every_version_of_every_source_in_two_processes(self, kit, monkeypatch):
+        other = kit / ".claude" / "agents" / "other.md"
+        for n in range(3):
+            other.write_text(f"other v{n}\n", encoding="utf-8")
+            _git(kit, "add", ".")
+            _git(kit, "commit", "-q", "-m", f"other v{n}")
+        calls = []
+        real_run = subprocess.run
+        monkeypatch.setattr(
+            prs.subprocess,
+            "run",
+            lambda cmd, **kw: calls.append(cmd) or real_run(cmd, **kw),
+        )
+        sources = [".claude/agents/demo-agent.md", ".claude/agents/other.md"]
+        index = prs.build_history_index(kit, sources)
+        assert len(calls) == 2
+        assert set(index[sources[0]].values()) == {
+            V1_BODY.encode(),
+            V2_BODY.encode(),
+        }
+        assert len(index[sources[1]]) == 3
+        assert index[sources[1]][_sha(b"other v0\n")] == b"other v0\n"
+
+    def test_find_base_uses_a_shared_index(self, kit):
+        source = ".claude/agents/demo-agent.md"
+        index = prs.build_history_index(kit, [source])
+        want = _sha(V1_BODY.encode())
+        assert prs.find_base_content(kit, source, want, index=index) == (
+            V1_BODY.encode()
+        )
+        assert prs.find_base_content(kit, source, want) == V1_BODY.encode()
+        assert prs.find_base_content(kit, source, "f" * 64, index=index) is None
+
+    def test_version_made_in_a_merge_is_indexed(self, kit):
+        source = ".claude/agents/demo-agent.md"
+        agent = kit / source
+        _git(kit, "checkout", "-q", "-b", "side", "HEAD~1")
+        agent.write_text(V1_BODY + "side\n", encoding="utf-8")
+        _git(kit, "commit", "-q", "-am", "side")
+        _git(kit, "checkout", "-q", "-")
+        subprocess.run(
+            ["git", "-C", str(kit), "merge", "-q", "side"], capture_output=True
+        )
+        resolved = V2_BODY + "side\n"
+        agent.write_text(resolved, encoding="utf-8")
+        _git(kit, "commit", "-q", "-am", "merge side")
+        index = prs.build_history_index(kit, [source])
+        assert index[source][_sha(resolved.encode())] == resolved.encode()
+
+    def test_unknown_path_has_no_versions(self, kit):
+        assert prs.build_history_index(kit, ["nope.md"]) == {"nope.md": {}}
+
+    def test_batch_read_timeout_falls_back_to_the_revision_walk(self, kit, monkeypatch):
+        real_run = subprocess.run
+        runs, batches = [], []
+
+        def run(cmd, **kw):
+            runs.append(kw.get("timeout"))
+            if "--batch" in cmd:
+                batches.append(cmd)
+                raise subprocess.TimeoutExpired(cmd, kw["timeout"])
+            return real_run(cmd, **kw)
+
+        monkeypatch.setattr(prs.subprocess, "run", run)
+        source = ".claude/agents/demo-agent.md"
+        assert prs.build_history_index(kit, [source]) == {}
+        want = _sha(V1_BODY.encode())
+        assert prs.find_base_content(kit, source, want, index={}) == V1_BODY.encode()
+        assert prs.find_base_content(kit, source, want) == V1_BODY.encode()
+        assert set(runs) == {prs.GIT_TIMEOUT}
+        # the shared (timed-out) index is not rebuilt per source; only
+        # the lookup without one tries its own batch read
+        assert len(batches) == 2
@@ -186,6 +186,15 @@ class TestFullFormat:
         result = proj.run(TASK)
         assert "Files changed: 1" in result.stdout
 
+    def test_git_forks_are_budgeted(self, proj):
+        from agentive_kit import procstats
+
+        with procstats.counting() as calls:
+            result = proj.run(TASK)
+        assert result.returncode == 0, result.stdout + result.stderr
+        # one rev-parse (head branch + base check), then the two diffs
+        assert calls.count("git") == 3, calls.summary()
+
 
 # ── Argument validation ──────────────────────────────────────────────────
 class TestArgValidation:
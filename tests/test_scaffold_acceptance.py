@@ -1,8 +1,11 @@
 """Scaffold acceptance test — the door's output must demonstrably work.
 
-KIT-0093 F5 (absorbing KIT-0082): a fresh ``bootstrap --new`` run per
-shape is exercised end-to-end and its output asserted USABLE — not
-merely that the install steps ran. Two assertion tiers:
+KIT-0093 F5 (absorbing KIT-0082): a fresh ``new`` run per shape is
+exercised end-to-end and its output asserted USABLE — not merely that
+the install steps ran. The single scaffold is a ``bootstrap --new`` run
+through the shim, so the shim's path is asserted usable too; the
+planning scaffold is the session's template (tests/conftest.py),
+shared with the packaged-door E2E tests. Two assertion tiers:
 
 - ``TestScaffoldInvariants``: must hold in BOTH the copying world
   (today) and the packaged world (after the KIT-0093 PR 2 door
@@ -69,20 +72,9 @@ def single_scaffold(tmp_path_factory):
 
 
 @pytest.fixture(scope="module")
-def planning_scaffold(tmp_path_factory):
-    base = tmp_path_factory.mktemp("accept-planning")
-    env = _scrubbed_env(XDG_CONFIG_HOME=str(_git_identity(base)))
-    target = base / "fresh-planning"
-    result = run_door(
-        "--new",
-        str(target),
-        "--shape",
-        "planning",
-        "--target-path",
-        "../product",
-        env=env,
-    )
-    return target, result, env
+def planning_scaffold(scaffold_template):
+    template = scaffold_template("planning")
+    return template.root, template.result, template.env
 
 
 def _scaffold(request, shape):
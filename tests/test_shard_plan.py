@@ -0,0 +1,107 @@
+"""Tests for scripts/core/shard_plan.py."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "core"))
+
+from shard_plan import (  # noqa: E402
+    DEFAULT_PLAN,
+    durations_from_junit,
+    load_plan,
+    main,
+    split,
+    suite_files,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">
+<testcase classname="tests.test_a.TestX" name="test_1" time="2.5"/>
+<testcase classname="tests.test_a" name="test_2" time="0.5"/>
+<testcase classname="tests.sub.test_b" name="test_3" time="1.25"/>
+<testcase classname="tests.test_gone" name="test_4" time="9"/>
+</testsuite></testsuites>
+"""
+
+
+def _suite(root: Path) -> Path:
+    for rel in ("tests/test_a.py", "tests/sub/test_b.py", "tests/helpers.py"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).touch()
+    return root
+
+
+class TestSplit:
+    def test_balances_by_duration(self):
+        durations = {"a": 6.0, "b": 3.0, "c": 3.0, "d": 2.0, "e": 2.0, "f": 2.0}
+        shards = split(sorted(durations), durations, 2)
+        totals = [sum(durations[f] for f in shard) for shard in shards]
+        # greedy, not optimal: within one file's duration of even
+        assert max(totals) - min(totals) <= 2.0
+        assert sorted(f for shard in shards for f in shard) == sorted(durations)
+
+    def test_unknown_files_weigh_the_mean(self):
+        shards = split(["new", "old1", "old2"], {"old1": 4.0, "old2": 4.0}, 3)
+        assert sorted(len(shard) for shard in shards) == [1, 1, 1]
+
+    def test_no_plan_is_an_even_split_by_count(self):
+        shards = split([f"t{n}" for n in range(7)], {}, 3)
+        assert sorted(len(shard) for shard in shards) == [2, 2, 3]
+
+    def test_more_shards_than_files_leaves_some_empty(self):
+        assert split(["only"], {}, 3) == [["only"], [], []]
+
+
+class TestJunit:
+    def test_sums_per_file_and_ignores_unknown(self, tmp_path):
+        report = tmp_path / "report.xml"
+        report.write_text(JUNIT, encoding="utf-8")
+        files = ["tests/test_a.py", "tests/sub/test_b.py"]
+        assert durations_from_junit(report, files) == {
+            "tests/test_a.py": 3.0,
+            "tests/sub/test_b.py": 1.25,
+        }
+
+
+class TestMain:
+    def test_record_then_files(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(_suite(tmp_path))
+        plan = tmp_path / DEFAULT_PLAN
+        plan.write_text(
+            json.dumps({"version": 1, "durations": {"tests/test_deleted.py": 5}}),
+            encoding="utf-8",
+        )
+        (tmp_path / "report.xml").write_text(JUNIT, encoding="utf-8")
+        assert main(["record", "report.xml"]) == 0
+        assert load_plan(plan) == {"tests/test_a.py": 3.0, "tests/sub/test_b.py": 1.25}
+        capsys.readouterr()
+
+        assert main(["files", "1/2"]) == 0
+        assert capsys.readouterr().out == "tests/test_a.py\n"
+        assert main(["files", "2/2"]) == 0
+        assert capsys.readouterr().out == "tests/sub/test_b.py\n"
+
+    def test_bad_shard_is_a_usage_error(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        assert main(["files", "3/2"]) == 1
+        assert "Usage: shard_plan.py" in capsys.readouterr().err
+
+    def test_unreadable_report_fails(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(_suite(tmp_path))
+        (tmp_path / "report.xml").write_text("<testsuites", encoding="utf-8")
+        assert main(["record", "report.xml"]) == 1
+        assert "Cannot read JUnit report" in capsys.readouterr().err
+
+
+class TestCommittedPlan:
+    def test_covers_the_suite(self):
+        plan = load_plan(REPO_ROOT / DEFAULT_PLAN)
+        files = suite_files(REPO_ROOT / "tests")
+        files = [str(Path(f).relative_to(REPO_ROOT).as_posix()) for f in files]
+        assert plan, "tests/shard_plan.json is missing or unreadable"
+        assert set(plan) <= set(files), "plan names deleted files; re-record it"
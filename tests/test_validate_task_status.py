@@ -0,0 +1,79 @@
+"""Tests for scripts/core/validate_task_status.py (the pre-commit hook)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = (
+    Path(__file__).resolve().parent.parent
+    / "scripts"
+    / "core"
+    / "validate_task_status.py"
+)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-C", str(repo), *args], check=True, capture_output=True, timeout=30
+    )
+
+
+def _hook(
+    repo: Path, *paths: str, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *paths],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env=env,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    todo = tmp_path / ".kit" / "tasks" / "2-todo"
+    (todo / "sub").mkdir(parents=True)
+    (todo / "T1.md").write_text("**Status**: Done\n", encoding="utf-8")
+    (todo / "sub" / "T2.md").write_text("**Status**: Done\n", encoding="utf-8")
+    (todo / "T3.md").write_text("**Status**: Todo\n", encoding="utf-8")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["{repo}/.kit/tasks/2-todo/T1.md", ".kit/tasks/2-todo/sub/T2.md"],
+    ids=["absolute", "nested"],
+)
+def test_mismatch_fails_the_hook(repo, path):
+    result = _hook(repo, path.format(repo=repo))
+    assert result.returncode == 1, result.stdout + result.stderr
+    assert "All 0" not in result.stdout
+
+
+def test_matching_task_passes(repo):
+    result = _hook(repo, ".kit/tasks/2-todo/T3.md")
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_older_installed_package_falls_back_to_the_inline_check(repo, tmp_path):
+    old = tmp_path / "site" / "agentive_kit"
+    old.mkdir(parents=True)
+    (old / "__init__.py").touch()
+    (old / "lifecycle.py").write_text(
+        "# predates validate_staged_tasks\n", encoding="utf-8"
+    )
+    env = dict(os.environ, PYTHONPATH=str(old.parent))
+    result = _hook(repo, ".kit/tasks/2-todo/T3.md", env=env)
+    assert result.returncode == 0, result.stdout + result.stderr
+    result = _hook(repo, ".kit/tasks/2-todo/T1.md", env=env)
+    assert result.returncode == 1
+    assert "Task status validation failed" in result.stdout